@@ -7,10 +7,22 @@ import sys
 
 from module.install import install_agent
 from module.update import update_agent
-from module.backup import backup_agent, recover_agent
+from module.backup import (
+    backup_agent, recover_agent, list_backup, list_backups, verify_backup, add_retention_arguments,
+    get_retention_policy
+)
+from utils.backup_utils import RestoreFilter
+from utils.backup_codecs import CODEC_CHOICES
+from utils.progress import PROGRESS_MODES
+from utils.postgres_dump import restore_pending_postgres_dumps
+from utils.qdrant_snapshot import restore_pending_qdrant_snapshots
 from utils.helpers import get_command_prefix, get_version_info, set_default_data_dir, get_default_data_dir, show_default_data_dir, confirm_use_default_data_dir
 import utils.i18n as i18n
 from conf.icons import LOGO
+from conf.backup_settings import (
+    BACKUP_COMPRESS_LEVEL, BACKUP_COMPRESS_THREADS, BACKUP_VOLUME_WORKERS, BACKUP_VOLUME_MODE, BACKUP_CODEC,
+    BACKUP_PROGRESS_MODE
+)
 
 
 def _detect_lang_from_argv():
@@ -53,6 +65,9 @@ def main():
     group.add_argument('-r', '--recovery', nargs='*', metavar='ARG', help=_('recovery_description'))
     group.add_argument('-ri', '--recover-install', nargs='+', metavar='ARG', help=_('recover_install_description'))
     group.add_argument('-v', '--version', action='store_true', help=_('version_description'))
+    group.add_argument('--list', metavar='BACKUP_FILE', help=_('list_description'))
+    group.add_argument('--verify', metavar='BACKUP_FILE', help=_('verify_description'))
+    group.add_argument('--list-backups', metavar='BACKUP_DIR', help=_('list_backups_description'))
     
     # 独立的配置管理参数
     parser.add_argument('-sd', '--set-data', nargs='?', const='', metavar='PATH', help=_('set_data_description'))
@@ -61,6 +76,24 @@ def main():
     parser.add_argument('--with-napcat', action='store_true', help=_('with_napcat_description'))
     parser.add_argument('--dry-run', action='store_true', help=_('dry_run_description'))
     
+    # 备份选项
+    parser.add_argument('--compress-level', type=int, metavar='N',
+                        help=_('compress_level_description', BACKUP_COMPRESS_LEVEL))
+    parser.add_argument('--compress-threads', type=int, metavar='N',
+                        help=_('compress_threads_description', BACKUP_COMPRESS_THREADS))
+    parser.add_argument('--volume-workers', type=int, metavar='N',
+                        help=_('volume_workers_description', BACKUP_VOLUME_WORKERS))
+    parser.add_argument('--volume-mode', choices=['stream', 'file'],
+                        help=_('volume_mode_description', BACKUP_VOLUME_MODE))
+    parser.add_argument('--incremental', action='store_true', help=_('incremental_description'))
+    parser.add_argument('--codec', choices=CODEC_CHOICES, help=_('codec_description', BACKUP_CODEC))
+    add_retention_arguments(parser)
+    parser.add_argument('--report-json', metavar='PATH', help=_('report_json_description'))
+    parser.add_argument('--progress', choices=PROGRESS_MODES, help=_('progress_description', BACKUP_PROGRESS_MODE))
+
+    # 恢复选项
+    parser.add_argument('--only', action='append', metavar='SELECTOR', help=_('only_description'))
+
     #通用选项
     parser.add_argument('-y', '--yes', action='store_true', help=_('yes_description'))
 
@@ -69,6 +102,22 @@ def main():
 
     args = parser.parse_args()
 
+    if args.compress_level is not None and not 1 <= args.compress_level <= 22:
+        parser.error(_('error_invalid_compress_level', args.compress_level))
+    if args.compress_threads is not None and args.compress_threads < 0:
+        parser.error(_('error_invalid_compress_threads', args.compress_threads))
+    if args.volume_workers is not None and args.volume_workers < 1:
+        parser.error(_('error_invalid_volume_workers', args.volume_workers))
+    if args.only:
+        try:
+            RestoreFilter(args.only)
+        except ValueError as e:
+            parser.error(str(e))
+    try:
+        retention = get_retention_policy(args)
+    except ValueError as e:
+        parser.error(str(e))
+
     if getattr(args, 'logo', False):
         print(LOGO)
         return
@@ -77,6 +126,21 @@ def main():
         print(get_version_info())
         return
 
+    if args.list:
+        if not list_backup(args.list):
+            sys.exit(1)
+        return
+
+    if args.verify:
+        if not verify_backup(args.verify):
+            sys.exit(1)
+        return
+
+    if args.list_backups:
+        if not list_backups(args.list_backups):
+            sys.exit(1)
+        return
+
     if args.set_data is not None:
         if args.set_data == '':
             # 如果没有提供路径，显示当前设置
@@ -177,7 +241,19 @@ def main():
             print(_("error_prefix") + " " + _("backup_description"))
             sys.exit(1)
             
-        backup_agent(data_dir, backup_dir)
+        backup_agent(
+            data_dir,
+            backup_dir,
+            compress_level=args.compress_level,
+            compress_threads=args.compress_threads,
+            volume_workers=args.volume_workers,
+            volume_mode=args.volume_mode,
+            incremental=args.incremental,
+            codec=args.codec,
+            retention=retention,
+            report_path=args.report_json,
+            progress_mode=args.progress
+        )
     elif args.recovery is not None:
         # 处理恢复命令
         if len(args.recovery) == 2:
@@ -195,7 +271,9 @@ def main():
             print(_("error_prefix") + " " + _("recovery_description"))
             sys.exit(1)
             
-        recover_agent(backup_file, data_dir, non_interactive=args.yes)
+        recover_agent(backup_file, data_dir, non_interactive=args.yes,
+                      volume_workers=args.volume_workers, only=args.only, report_path=args.report_json,
+                      progress_mode=args.progress)
     elif args.recover_install:
         # 处理恢复并安装命令
         if len(args.recover_install) == 2:
@@ -212,8 +290,12 @@ def main():
         else:
             print(_("error_prefix") + " " + _("recover_install_description"))
             sys.exit(1)
+        # 安装过程会切换工作目录，待导入文件按归档的绝对路径查找
+        archive_path = os.path.abspath(backup_file)
         # 先恢复
-        recover_agent(backup_file, install_dir, non_interactive=args.yes)
+        recovered = recover_agent(backup_file, install_dir, non_interactive=args.yes,
+                                  volume_workers=args.volume_workers, only=args.only,
+                                  report_path=args.report_json, progress_mode=args.progress)
         # 再安装
         install_agent(
             nekro_data_dir=install_dir,
@@ -221,6 +303,13 @@ def main():
             dry_run=args.dry_run,
             non_interactive=args.yes
         )
+        # 恢复时服务尚未运行的 Postgres 逻辑备份和 Qdrant 快照，在服务启动后导入；
+        # 恢复失败时不导入，待导入文件可能不完整
+        if recovered and not args.dry_run:
+            postgres_ok = restore_pending_postgres_dumps(archive_path)
+            qdrant_ok = restore_pending_qdrant_snapshots(install_dir, archive_path)
+            if not (postgres_ok and qdrant_ok):
+                sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -13,4 +13,88 @@ DOCKER_VOLUMES_TO_BACKUP: List[str] = ["nekro_postgres_data", "nekro_qdrant_data
 # 备份/恢复过程中使用的临时容器镜像和 tag
 # 默认使用 Ubuntu 基础镜像及指定的 tag（可根据需要改为 alpine、debian 等更小的镜像）
 BACKUP_HELPER_IMAGE: str = "alpine"
-BACKUP_HELPER_TAG: str = "3.22"
\ No newline at end of file
+BACKUP_HELPER_TAG: str = "3.22"
+
+# helper 镜像就绪标记的有效期（秒）：标记记录镜像 ID，有效期内的后续运行（如定时备份）不再检查或拉取镜像；0 表示不使用标记
+BACKUP_HELPER_MARKER_TTL: int = 7 * 24 * 3600
+
+# 备份归档的压缩编解码器："auto" 按 zstd、xz、gzip 的顺序选择第一个可用的，也可指定 "zstd"、"xz"、"gzip" 或 "none"
+BACKUP_CODEC: str = "auto"
+
+# 备份归档的压缩级别（zstd 为 1-22，20 以上会自动启用 --ultra；xz/gzip 超过 9 时按 9 处理）
+BACKUP_COMPRESS_LEVEL: int = 3
+
+# 压缩线程数，0 表示使用全部 CPU 核心
+BACKUP_COMPRESS_THREADS: int = 0
+
+# 同时通过容器备份或恢复的 Docker 卷数量上限（避免磁盘 I/O 被占满）
+BACKUP_VOLUME_WORKERS: int = 4
+
+# 容器卷备份方式：
+#   "stream" - helper 容器执行 `tar cf - /data`，输出直接作为成员写入主归档（无临时文件、无 gzip 双重压缩）
+#   "file"   - helper 容器先在临时目录生成 <卷名>.tar.gz，再整体加入主归档
+BACKUP_VOLUME_MODE: str = "stream"
+
+# 增量备份的分块仓库目录名（位于备份目录下）
+BACKUP_CHUNK_STORE_DIR: str = "na_store"
+
+# 增量备份的分块大小（字节）：最小值 / 平均值 / 最大值
+BACKUP_CHUNK_MIN_SIZE: int = 256 * 1024
+BACKUP_CHUNK_AVG_SIZE: int = 1024 * 1024
+BACKUP_CHUNK_MAX_SIZE: int = 4 * 1024 * 1024
+
+# 不支持文件锁的平台（Windows）上清理分块仓库时，跳过最近多少秒内写入的分块，
+# 避免删除并发进行的增量备份已写入、但快照清单尚未保存的分块
+BACKUP_CHUNK_GC_GRACE: int = 24 * 3600
+
+# xz/gzip 并行压缩时每个独立压缩块的大小（字节）
+BACKUP_CODEC_BLOCK_SIZE: int = 8 * 1024 * 1024
+
+# 存在使用该卷的运行中 Postgres 容器时，改为在容器内执行 pg_dump 做逻辑备份（一致且体积更小），而不是复制正在写入的卷文件
+BACKUP_POSTGRES_DUMP: bool = True
+
+# 视为 Postgres 数据卷的卷名后缀
+BACKUP_POSTGRES_VOLUME_SUFFIXES: List[str] = ["nekro_postgres_data"]
+
+# pg_dump 输出写入归档时每个分段成员的大小（字节），分段在内存中缓冲
+BACKUP_PG_DUMP_PART_SIZE: int = 32 * 1024 * 1024
+
+# pg_restore 的并行任务数，0 表示使用 CPU 核心数
+BACKUP_PG_RESTORE_JOBS: int = 0
+
+# 恢复并安装后等待 Postgres / Qdrant 服务就绪的最长时间（秒）
+BACKUP_SERVICE_READY_TIMEOUT: int = 180
+
+# 存在使用该卷的运行中 Qdrant 服务时，改为通过 HTTP API 为每个集合创建快照备份，而不是复制正在修改的段文件
+BACKUP_QDRANT_SNAPSHOT: bool = True
+
+# 视为 Qdrant 数据卷的卷名后缀
+BACKUP_QDRANT_VOLUME_SUFFIXES: List[str] = ["nekro_qdrant_data"]
+
+# Qdrant HTTP API 地址，为空时使用挂载该卷的运行中容器的 IP（Linux 上可从宿主机直接访问）
+BACKUP_QDRANT_URL: str = ""
+
+# 自动探测容器地址时使用的 Qdrant HTTP 端口
+BACKUP_QDRANT_PORT: int = 6333
+
+# 备份目录下记录已有备份（大小、耗时、编解码器、校验和）的目录文件名，列出和清理备份时无需打开归档
+BACKUP_CATALOG_NAME: str = "na_catalog.json"
+
+# 每次备份成功后的默认保留策略，0 表示不启用该规则（全部为 0 时不删除任何备份）
+# 保留最近的备份数量
+BACKUP_RETENTION_KEEP_LAST: int = 0
+# 保留最近多少天 / 周 / 月中每个时间段的最新备份
+BACKUP_RETENTION_KEEP_DAILY: int = 0
+BACKUP_RETENTION_KEEP_WEEKLY: int = 0
+BACKUP_RETENTION_KEEP_MONTHLY: int = 0
+# 保留的备份总大小上限（字节），超出时从最旧的备份开始删除
+BACKUP_RETENTION_MAX_TOTAL_SIZE: int = 0
+
+# 备份和恢复时的进度显示方式："auto"（终端中显示进度条，否则不显示）、"bar"、"json"、"off"
+BACKUP_PROGRESS_MODE: str = "auto"
+
+# 进度条的刷新间隔（秒）
+BACKUP_PROGRESS_BAR_INTERVAL: float = 0.2
+
+# 输出 JSON 进度行的间隔（秒）
+BACKUP_PROGRESS_JSON_INTERVAL: float = 10
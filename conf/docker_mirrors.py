@@ -8,4 +8,35 @@ DOCKER_MIRRORS: List[str] = [
     "docker.xuanyuan.me", # 轩辕镜像
     "docker.1ms.run", # 1毫秒
     "smwyfknvowek.ap-northeast-1.clawcloudrun.com", # 自建镜像
-]
\ No newline at end of file
+]
+
+# Docker Hub 官方 registry 地址
+DOCKER_OFFICIAL_REGISTRY = "registry-1.docker.io"
+
+# 镜像地址中表示 Docker Hub 的 registry 前缀，带这些前缀的镜像同样可以从镜像源拉取
+DOCKER_HUB_PREFIXES = ("docker.io/", "index.docker.io/", "registry-1.docker.io/")
+
+# 测速时单个请求的超时时间（秒）
+DOCKER_MIRROR_PROBE_TIMEOUT = 3
+
+# 测速的整体等待时间（秒），届时仍未响应的镜像源视为不可达
+DOCKER_MIRROR_PROBE_DEADLINE = 8
+
+# 镜像源健康状态缓存文件名（位于工具配置目录下）
+DOCKER_MIRROR_CACHE_NAME = "registry_health.json"
+
+# 从镜像源拉取并重新标记的镜像的 manifest 摘要记录文件名（位于工具配置目录下）。
+# 删除镜像源名称后 docker 不再保留其 RepoDigests，检查更新时以此记录作为本地摘要
+DOCKER_MIRROR_DIGESTS_NAME = "mirror_digests.json"
+
+# 可用镜像源的测速结果有效期（秒），期间不再重新测速
+DOCKER_MIRROR_CACHE_TTL = 3600
+
+# 镜像源失败后跳过探测的初始时长（秒），连续失败时逐次翻倍
+DOCKER_MIRROR_BACKOFF_BASE = 300
+
+# 失败退避时长的上限（秒）
+DOCKER_MIRROR_BACKOFF_MAX = 24 * 3600
+
+# 计算延迟中位数时保留的最近测速次数
+DOCKER_MIRROR_LATENCY_SAMPLES = 5
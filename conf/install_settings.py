@@ -15,3 +15,9 @@ BASE_URLS = [
 
 # 应用数据目录权限的项目约定
 DATA_DIR_MODE = 0o777  # 可根据实际需要修改，推荐 0o777
+
+# Nekro Agent 沙盒镜像
+SANDBOX_IMAGE = "kromiose/nekro-agent-sandbox"
+
+# 安装和更新时并发拉取镜像的最大数量
+DOCKER_PULL_WORKERS = 4
@@ -7,6 +7,7 @@ MESSAGES = {
     "adding_docker_volume_backup": "إضافة نسخة احتياطية لحجم Docker: {} (تم أرشفته كـ: {})",
     "adding_to_archive": "إضافة: {} (تم أرشفته كـ: {})",
     "admin_account": "حساب المسؤول: admin | كلمة المرور: {}",
+    "all_cpu_cores": "جميع الأنوية",
     "all_description": "تحديث جميع الخدمات، وليس فقط Nekro Agent",
     "all_mirrors_failed_try_official": "فشلت جميع المرايا، محاولة استخدام السجل الرسمي: {}",
     "allow_port": "السماح بالمنفذ {}",
@@ -14,11 +15,15 @@ MESSAGES = {
     "app_data_directory": "دليل بيانات التطبيق (NEKRO_DATA_DIR): {}",
     "app_description": "أداة إدارة موحدة لتثبيت وتحديث ونسخ احتياطي لـ Nekro Agent.",
     "app_examples": "أمثلة الاستخدام:\n  {} -i ./na_data\n    # تثبيت Nekro Agent في الدليل ./na_data\n\n  {} -u ./na_data\n    # تنفيذ تحديث جزئي في الدليل المحدد\n\n  {} -ua ./na_data\n    # تنفيذ تحديث كامل (ترقية) في الدليل المحدد\n\n  {} -b ./na_data ./backups\n    # نسخ احتياطي لدليل na_data إلى مجلد backups\n\n  {} -r ./backups/na_backup_123.tar.zstd ./na_data_new\n    # استعادة من ملف النسخة الاحتياطية إلى الدليل na_data_new\n\n  {} -ri ./backup.tar.zst ./restored_install\n    # استعادة البيانات من النسخة الاحتياطية وتشغيل التثبيت فوقها",
+    "applying_pending_postgres_restore": "جارٍ استيراد نسخة Postgres المنطقية المحفوظة لوحدة التخزين '{}'...",
+    "applying_pending_qdrant_restore": "جارٍ استيراد لقطات مجموعات Qdrant المحفوظة لوحدة التخزين '{}'...",
+    "applying_retention_policy": "جارٍ تطبيق سياسة الاحتفاظ بالنسخ الاحتياطية...",
     "archiving_current_directory": "أرشفة الدليل الحالي '.' كـ '{}'",
     "backup_description": "نسخ احتياطي لدليل البيانات إلى المجلد المحدد.",
     "backup_docker_volume_complete": "اكتمل النسخ الاحتياطي لحجم Docker '{}' : {}",
     "backup_docker_volume_exception": "حدث استثناء أثناء النسخ الاحتياطي لحجم Docker '{}' : {}",
     "backup_docker_volume_failed": "فشل النسخ الاحتياطي لحجم Docker '{}' : {}",
+    "backup_failed": "فشل النسخ الاحتياطي.",
     "backup_file_created": "تم إنشاء ملف النسخة الاحتياطية: {}",
     "backup_file_not_created": "ملف النسخة الاحتياطية {} لم يتم إنشاؤه بنجاح أو فارغ",
     "backup_module_description": "أداة النسخ الاحتياطي والاستعادة لـ Nekro Agent.",
@@ -31,12 +36,19 @@ MESSAGES = {
     "channel_already_set": "قناة الصورة مضبوطة بالفعل على '{}'، لا حاجة لتغيير.",
     "channel_switched": "تم تبديل قناة الصورة من '{}' إلى '{}'.",
     "checking_generating_credentials": "جارٍ التحقق وإنشاء بيانات الاعتماد اللازمة...",
+    "checking_image_updates": "جارٍ التحقق من تحديثات الصور...",
     "checking_install_file": "تم التحقق من {} (لا توجد معلومات إصدار تحتاج إلى تحديث حاليًا)",
+    "chunk_gc_stats": "تمت إزالة {} من الأجزاء غير المرجعية من المخزن، وتحرير {} بايت",
     "clear_cancelled": "تم إلغاء عملية المسح.",
     "clear_default_data_dir_prompt": "أدخل 'clear' لمسح إعداد دليل البيانات الافتراضي: ",
     "cloud_server_note": "1. إذا كنت تستخدم خادمًا سحابيًا، يرجى السماح بالمنافذ المقابلة في وحدة التحكم الخاصة بمجموعة الأمان لمزود الخدمة السحابية الخاص بك.",
+    "codec_description": "يُستخدم مع --backup لاختيار برنامج الضغط (auto يختار أول متاح من zstd و xz و gzip؛ الافتراضي {}).",
     "command_failed_retry_sudo_exit": "فشل الأمر. إعادة المحاولة(r/R)، رفع الامتيازات(y/Y)، أو الخروج(n/N):",
     "compose_file_found": "تم العثور على ملف docker-compose.yml في الدليل الحالي: {}",
+    "compress_level_description": "يُستخدم مع --backup لتعيين مستوى الضغط (1-22، ويُقيَّد بالحد الأقصى لبرنامج الضغط، الافتراضي {}).",
+    "compress_threads_description": "يُستخدم مع --backup لتعيين عدد خيوط الضغط (0 يستخدم كل أنوية المعالج، الافتراضي {}).",
+    "compressing_with_codec": "جارٍ الضغط باستخدام {} ({}) إلى: {}...",
+    "compression_settings": "إعدادات الضغط: المستوى {}، الخيوط {}",
     "configuring_firewall": "جارٍ تكوين قواعد جدار الحماية...",
     "configuring_firewall_ufw": "جارٍ تكوين جدار الحماية (ufw)...",
     "confirm_continue": "هل تريد المتابعة؟ (y/N): ",
@@ -46,7 +58,13 @@ MESSAGES = {
     "confirm_version_update": "تأكيد تحديث الإصدار؟ (y/N): ",
     "copy_success": "تم النسخ بنجاح.",
     "created_dev_compose_file": "تم إنشاء ملف Compose للتطوير: {}",
+    "creating_incremental_snapshot": "جارٍ إنشاء لقطة تزايدية في مخزن الأجزاء: {}...",
     "dev_compose_image_replaced": "تم استبدال علامة الصورة من latest إلى preview",
+    "docker_volume_not_found": "وحدة التخزين غير موجودة",
+    "error_archive_integrity": "فشل التحقق من سلامة الأرشيف ({} أخطاء)؛ تم إلغاء الاستعادة ولم يتم تعديل الدليل الهدف",
+    "error_backup_dir_not_exist": "دليل النسخ الاحتياطي المحدد '{}' غير موجود أو ليس دليلاً.",
+    "error_codec_required_for_recovery": "خطأ: تتطلب استعادة هذه النسخة وحدة فك الترميز '{}' (أمر zstd أو وحدة Python zstandard).",
+    "error_codec_unavailable": "خطأ: برنامج الضغط '{}' غير متاح في هذه البيئة.",
     "error_create_dev_compose": "فشل في إنشاء ملف Compose للتطوير: {}",
     "creating_archive": "جارٍ بدء إنشاء ملف الأرشيف...",
     "creating_docker_volume": "جارٍ إنشاء حجم Docker '{}'...",
@@ -59,7 +77,6 @@ MESSAGES = {
     "dependencies_check_passed": "تم التحقق من التبعيات بنجاح.",
     "deployment_complete": "=== اكتمل النشر! ===",
     "detected_docker_host_correcting": "تم اكتشاف DOCKER_HOST='{}'، سيتم تصحيحه تلقائيًا إلى 'unix://{}'",
-    "detected_zstd_compressing": "تم اكتشاف zstd، جارٍ الضغط إلى: {}...",
     "discovered_docker_volumes": "تم اكتشاف {} من مجلدات Docker المطابقة ديناميكيًا",
     "docker_volume_created": "تم إنشاء مجلد Docker '{}' بنجاح",
     "docker_volume_exists": "مجلد Docker '{}' موجود بالفعل",
@@ -95,16 +112,24 @@ MESSAGES = {
     "error_docker_volume_discovery_exception": "خطأ: حدث استثناء أثناء اكتشاف مجلدات Docker: {}",
     "error_env_file_not_exist": "ملف .env غير موجود، يرجى التحقق مما إذا تم تثبيت Nekro Agent بشكل صحيح.",
     "error_invalid_channel": "قناة غير صالحة: {}. يرجى استخدام 'latest' أو 'preview'.",
+    "error_invalid_compress_level": "خطأ: يجب أن يكون مستوى الضغط بين 1 و 22، القيمة الحالية {}.",
+    "error_invalid_compress_threads": "خطأ: لا يمكن أن يكون عدد خيوط الضغط سالبًا، القيمة الحالية {}.",
+    "error_invalid_restore_selector": "خطأ: محدد استعادة غير صالح '{}'، المتوقع data أو data:<نمط> أو volume:<الاسم>.",
+    "error_invalid_retention_count": "خطأ: لا يمكن أن تكون قيم --keep-last / --keep-daily / --keep-weekly / --keep-monthly سالبة.",
+    "error_invalid_size": "خطأ: حجم غير صالح '{}'، يجب أن يكون رقماً مع وحدة اختيارية K/M/G/T (مثل 500M).",
+    "error_invalid_volume_workers": "خطأ: يجب أن يكون عدد عمال وحدات التخزين أكبر من 0، القيمة الحالية {}.",
     "error_nekro_agent_image_not_found": "لم يتم العثور على صورة Nekro Agent في docker-compose.yml.",
+    "error_pull_image": "فشل سحب الصورة {}: {}",
     "error_read_compose_file": "فشل في قراءة docker-compose.yml: {}",
+    "error_snapshot_chunk_corrupted": "الجزء {} المشار إليه في اللقطة مفقود أو تالف",
     "error_switch_channel": "فشل في تبديل قناة الصورة: {}",
-    "error_invalid_backup_format": "تنسيق ملف النسخة الاحتياطية غير صالح. يدعم فقط '.tar' و '.tar.zstd'.",
+    "error_invalid_backup_format": "تنسيق ملف النسخ الاحتياطي غير صالح. يُدعم فقط '.tar' و '.tar.zstd' و '.tar.xz' و '.tar.gz' واللقطات التزايدية '.snapshot.json'.",
     "error_prefix": "خطأ:",
     "error_pull_helper_image": "خطأ: فشل سحب صورة helper للنسخة '{}' : {}",
     "error_sudo_failed": "خطأ: فشل sudo لتنفيذ الأمر: {}",
     "error_sudo_not_found": "الأمر 'sudo' غير موجود. يرجى التأكد من أن لديك امتيازات المسؤول.",
     "error_unsupported_file_format": "خطأ: تنسيق ملف غير معتمد: {}",
-    "error_zstd_required_for_recovery": "خطأ: الاستعادة تتطلب الأمر 'zstd'.",
+    "error_volume_backup_incomplete": "فشل النسخ الاحتياطي للمجلدات التالية بعد كتابة جزء من بياناتها في الأرشيف؛ الأرشيف غير مكتمل وتم تجاهل هذه النسخة الاحتياطية: {}",
     "excluding_env_template": "استبعاد قالب التهيئة: {}",
     "excluding_from_archive": "استبعاد: {}",
     "excluding_logs_directory": "استبعاد دليل السجلات: {}",
@@ -128,6 +153,8 @@ MESSAGES = {
     "helper_image_not_found_try_pull": "صورة المساعد للنسخة '{}' غير موجودة، محاولة السحب...",
     "important_config_info": "=== معلومات التهيئة الهامة ===",
     "important_notes": "=== ملاحظات هامة ===",
+    "incremental_description": "استخدم مع --backup لإنشاء نسخة احتياطية تزايدية: تُقسَّم البيانات إلى أجزاء معنونة بالمحتوى في مخزن داخل دليل النسخ الاحتياطي، ولا تُكتب إلا الأجزاء الجديدة.",
+    "incremental_snapshot_stats": "تشير اللقطة إلى {} جزءًا ({} جديدة)، {} بايت من البيانات، {} بايت مخزنة حديثًا",
     "install_description": "تثبيت Nekro Agent في المسار المحدد.",
     "install_module_data_dir_help": "دليل بيانات تطبيق Nekro Agent.\nافتراضيًا مجلد \"na_data/\" في مجلد السكربت.",
     "install_module_description": "سكربت التثبيت وإدارة Nekro Agent",
@@ -139,6 +166,24 @@ MESSAGES = {
     "installation_complete": "اكتمل التثبيت! استمتع بالاستخدام!",
     "insufficient_permissions_try_sudo": "قد لا يملك المستخدم الحالي أذونات كافية، حاول استخدام sudo لرفع الصلاحيات...",
     "invalid_input_retry": "إدخال غير صالح، يرجى الاختيار مرة أخرى.",
+    "keep_daily_description": "استخدم مع --backup: احتفظ بأحدث نسخة لكل يوم من آخر N أيام",
+    "keep_last_description": "استخدم مع --backup: بعد نجاح النسخ احتفظ بأحدث N نسخ احتياطية",
+    "keep_monthly_description": "استخدم مع --backup: احتفظ بأحدث نسخة لكل شهر من آخر N أشهر",
+    "keep_weekly_description": "استخدم مع --backup: احتفظ بأحدث نسخة لكل أسبوع من آخر N أسابيع",
+    "list_backup_header": "ملف النسخ الاحتياطي: {}",
+    "list_backups_description": "عرض جميع النسخ الاحتياطية في دليل النسخ (يقرأ الفهرس دون فتح الأرشيفات)",
+    "list_backups_empty": "لا توجد نسخ احتياطية في {}.",
+    "list_backups_header": "النسخ الاحتياطية في {} (الأحدث أولاً):",
+    "list_backups_total": "{} نسخ احتياطية، الإجمالي {}",
+    "list_compression": "الضغط: {}",
+    "list_created_at": "تاريخ الإنشاء: {}",
+    "list_data_root": "دليل البيانات: {}",
+    "list_description": "عرض محتويات ملف النسخ الاحتياطي (يقرأ البيان في بداية الأرشيف)",
+    "list_docker_volumes": "وحدات تخزين Docker:",
+    "list_file_summary": "الملفات: {}، الحجم الإجمالي: {}",
+    "list_no_manifest_scanning": "ملف النسخ الاحتياطي {} لا يحتوي على بيان (نسخة قديمة)، جارٍ فحص الأرشيف بالكامل...",
+    "list_toolkit_version": "إصدار الأداة: {}",
+    "max_total_size_description": "استخدم مع --backup: الحد الأقصى للحجم الإجمالي للنسخ المحتفظ بها (مثل 500M أو 20G)؛ تُحذف الأقدم أولاً",
     "mirror_pull_failed": "فشل السحب من المرآة: {} ({})",
     "mirror_pull_success": "تم السحب بنجاح من المرآة: {} ({}), الصورة: {}",
     "multiple_root_directories_warning": "تحذير: النسخة الاحتياطية تحتوي على عدة مجلدات جذر محتملة: {}. لا يمكن تحديد مجلد البيانات الرئيسي تلقائيًا.",
@@ -158,16 +203,39 @@ MESSAGES = {
     "official_pull_success": "تم السحب بنجاح من السجل الرسمي: {} ({})",
     "onebot_access_token": "رمز وصول OneBot: {}",
     "onebot_websocket_address": "رابط اتصال OneBot WebSocket: ws://127.0.0.1:{}/onebot/v11/ws",
+    "only_description": "استخدم مع --recovery / --recover-install لاستعادة المحتوى المحدد فقط، ويمكن تكراره: data (دليل البيانات بالكامل)، data:<نمط> (مسارات داخل دليل البيانات، مثل data:configs/*)، volume:<الاسم> (يُسمح بأحرف البدل).",
     "operation_cancelled": "تم إلغاء العملية.",
+    "pending_restores_discarded": "تجاهل البيانات غير المستوردة المتبقية من استعادة سابقة: {}",
+    "postgres_container_not_ready": "لم تصبح حاوية Postgres التي تستخدم وحدة التخزين '{}' جاهزة خلال {} ثانية؛ النسخة المنطقية محفوظة في {}",
+    "postgres_dump_complete": "اكتمل pg_dump لوحدة التخزين '{}': {}، {} أجزاء",
+    "postgres_dump_container_found": "وحدة التخزين '{}' مستخدمة بواسطة حاوية Postgres العاملة {}، سيتم نسخها احتياطيًا باستخدام pg_dump",
+    "postgres_dump_failed": "فشل pg_dump لوحدة التخزين '{}': {}",
+    "postgres_dump_incomplete": "النسخة الاحتياطية المنطقية للمجلد '{}' غير مكتملة (لم يكتمل pg_dump أثناء النسخ الاحتياطي أو لا تتطابق البيانات مع سجل الاكتمال)؛ تم تخطي pg_restore ولم يتم تعديل قاعدة البيانات",
+    "postgres_restore_complete": "اكتمل pg_restore لوحدة التخزين '{}'",
+    "postgres_restore_failed": "فشلت استعادة النسخة المنطقية لوحدة التخزين '{}': {}",
+    "postgres_restore_pending": "لا توجد حاوية Postgres عاملة تستخدم وحدة التخزين '{0}'؛ تم حفظ النسخة المنطقية في {1}. سيتم استيرادها تلقائيًا بعد أن يقوم -ri بتثبيت الخدمة وتشغيلها، أو شغّل الخدمة وأعد الاستعادة باستخدام --only volume:{0}",
     "preparing_recovery_from_backup": "التحضير للاستعادة من ملف النسخة الاحتياطية: {}",
+    "probing_registries": "جارٍ قياس السجل الرسمي والمرايا: {} ({})",
+    "progress_backup": "النسخ",
+    "progress_description": "استخدم مع --backup / --recovery: طريقة عرض التقدم (auto يعرض شريط تقدم في الطرفية ولا يعرض شيئًا في غير ذلك؛ استخدم json لطباعة أسطر JSON دورية؛ الافتراضي {})",
+    "progress_restore": "الاستعادة",
     "pulling_all_services": "جارٍ سحب أحدث الصور لجميع الخدمات",
     "pulling_helper_image": "جارٍ سحب صورة helper للنسخة الاحتياطية...",
     "pulling_image_mirrors": "جارٍ سحب الصورة من المرايا: {} ({})",
     "pulling_image_official": "جارٍ سحب الصورة من السجل الرسمي: {} ({})",
+    "pulling_images_concurrently": "جارٍ سحب {} صورة (حتى {} في وقت واحد): {}",
     "pulling_latest_nekro_agent": "جارٍ سحب أحدث صورة nekro_agent",
     "pulling_latest_sandbox": "جارٍ سحب أحدث صورة kromiose/nekro-agent-sandbox",
     "pulling_sandbox_image": "جارٍ سحب صورة الصندوق الرمل (sandbox)",
     "pulling_service_images": "جارٍ سحب صور الخدمات",
+    "qdrant_restore_complete": "تمت استعادة جميع لقطات مجموعات وحدة التخزين '{}'",
+    "qdrant_restore_failed": "فشلت استعادة لقطة Qdrant '{}': {}",
+    "qdrant_restore_pending": "لا توجد خدمة Qdrant يمكن الوصول إليها تستخدم وحدة التخزين '{0}'؛ تم حفظ لقطات المجموعات في {1}. سيتم استيرادها تلقائيًا بعد أن يقوم -ri بتثبيت الخدمة وتشغيلها، أو شغّل الخدمة وأعد الاستعادة باستخدام --only volume:{0}",
+    "qdrant_service_found": "وحدة التخزين '{}' مستخدمة بواسطة خدمة Qdrant العاملة {}، سيتم نسخها احتياطيًا عبر لقطات المجموعات",
+    "qdrant_service_not_ready": "لم تكن خدمة Qdrant التي تستخدم وحدة التخزين '{}' متاحة خلال {} ثانية؛ لقطات المجموعات محفوظة في {}",
+    "qdrant_snapshot_collection_done": "تمت كتابة لقطة المجموعة '{}' في الأرشيف: {}",
+    "qdrant_snapshot_complete": "اكتمل النسخ الاحتياطي باللقطات لوحدة التخزين '{}': {} مجموعات، {}",
+    "qdrant_snapshot_failed": "فشل النسخ الاحتياطي للقطة Qdrant لـ '{}': {}",
     "rebuilding_nekro_agent": "إعادة بناء وتشغيل حاوية nekro_agent",
     "recover_install_description": "استعادة وتثبيت. سيقوم هذا بفك ضغط ملف النسخة الاحتياطية إلى الدليل الهدف، ثم تشغيل عملية التثبيت فوقه.",
     "recovery_description": "استعادة من ملف النسخة الاحتياطية إلى دليل البيانات المحدد.",
@@ -179,14 +247,30 @@ MESSAGES = {
     "recovery_module_help": "استعادة البيانات ومجلدات Docker من ملف النسخة الاحتياطية المحدد إلى الدليل الهدف.",
     "recovery_step_failed": "فشل خطوة الاستعادة، جارٍ إيقاف العملية.",
     "recovery_success": "تمت الاستعادة بنجاح! تم استعادة البيانات إلى: {}",
+    "registry_status_available": "الصورة متاحة",
+    "registry_status_backoff": "تم التخطي، الفحص التالي بعد {} دقيقة (آخر فشل: {})",
+    "registry_status_cached": "متاح (مخزن مؤقتًا)",
+    "registry_status_missing": "الصورة غير موجودة",
+    "registry_status_unknown": "قابل للوصول، لم يتم تأكيد الصورة ({})",
+    "registry_status_unreachable": "غير قابل للوصول ({})",
+    "report_json_description": "استخدم مع --backup / --recovery: اكتب زمن كل مرحلة وحجم البيانات ونسبة الضغط والإنتاجية في تقرير JSON (حتى عند الفشل)",
+    "report_written": "تمت كتابة التقرير في: {}",
     "restarting_all_services": "جارٍ إعادة تشغيل جميع حاويات الخدمات",
     "restore_docker_volume_failed": "خطأ: فشل استعادة مجلد Docker '{}': {}",
     "restoring_backup_to": "جارٍ استعادة النسخة الاحتياطية إلى: {}",
     "restoring_data_to": "جارٍ استعادة البيانات إلى: {}",
     "restoring_docker_volume": "جارٍ استعادة مجلد Docker '{}' إلى: {}",
     "restoring_docker_volume_via_container": "جارٍ استعادة مجلد Docker '{}' (عبر الحاوية)",
+    "restoring_postgres_dump": "جارٍ استعادة وحدة التخزين '{0}' في الحاوية {1} باستخدام pg_restore ({2} مهام متوازية)...",
+    "restoring_qdrant_collection": "جارٍ رفع لقطة المجموعة '{}' ({})...",
     "restoring_via_container_complete": "اكتملت استعادة مجلد Docker '{}'",
     "restoring_via_container_starting": "جارٍ استعادة مجلد Docker '{}' عبر الحاوية...",
+    "retagging_mirror_image": "إعادة وسم الصورة باسم {}",
+    "retention_applying": "سياسة الاحتفاظ: {}؛ عدد النسخ {}، سيُحذف منها {}",
+    "retention_removed_backup": "تم حذف النسخة الاحتياطية {} (أُنشئت في {})",
+    "selective_restore_no_volume_matched": "تحذير: لا توجد وحدة تخزين Docker تطابق {}، لن تتم استعادة أي وحدة تخزين.",
+    "selective_restore_selectors": "استعادة انتقائية، سيتم استعادة: {} فقط",
+    "selective_restore_stopped_early": "تمت قراءة جميع الملفات المحددة، وتم تخطي بقية الأرشيف (لم يتم التحقق من المجاميع الاختبارية المسجلة في النهاية؛ استخدم --verify للتحقق الكامل)",
     "service_access_info": "=== معلومات الوصول إلى الخدمة ===",
     "set_data_description": "تعيين أو مسح دليل البيانات الافتراضي.",
     "setting_directory_permissions": "تعيين أذونات الدليل",
@@ -194,6 +278,10 @@ MESSAGES = {
     "starting_extraction": "بدء الاستخراج والاستعادة...",
     "starting_main_service": "بدء الخدمة الرئيسية",
     "starting_version_update": "بدء تحديث الإصدار...",
+    "streaming_postgres_dump": "جارٍ بث pg_dump لوحدة التخزين '{0}' من الحاوية {1} إلى الأرشيف: {2}",
+    "streaming_qdrant_snapshots": "جارٍ إنشاء لقطات لمجموعات وحدة التخزين '{0}' عبر {1} في الأرشيف: {2}",
+    "streaming_volume_complete": "تمت كتابة وحدة تخزين Docker '{}' في الأرشيف، {} إدخالات",
+    "streaming_volume_into_archive": "جارٍ بث وحدة تخزين Docker '{}' من الحاوية المساعدة إلى الأرشيف (مؤرشفة باسم: {}/)...",
     "sudo_elevation_success": "تمت عملية sudo بنجاح.",
     "sudo_failed_retry_exit": "فشل sudo. إعادة المحاولة(r/R/y/Y) أو الخروج(n/N):",
     "switched_to_directory": "تم التبديل إلى الدليل: {}",
@@ -202,6 +290,7 @@ MESSAGES = {
     "target_version": "الإصدار المستهدف: {}",
     "trying_mirror_pull": "محاولة السحب من المرآة: {} ({})",
     "unknown_system_permission": "نظام غير معروف، لم يتم تعيين الإذن: {0}",
+    "update_already_up_to_date": "جميع الصور محدثة بالفعل، تم تخطي السحب",
     "update_cancelled": "تم إلغاء التحديث.",
     "update_complete": "اكتمل التحديث!",
     "update_description": "تنفيذ تحديث جزئي على التثبيت في المسار المحدد.",
@@ -213,6 +302,13 @@ MESSAGES = {
     "update_module_examples": "أمثلة الاستخدام:\n  python update.py\n    # تحديث Nekro Agent في الدليل الحالي (مستحسن)\n\n  python update.py /srv/nekro\n    # تحديث Nekro Agent الموجود في /srv/nekro\n\n  python update.py --all\n    # تحديث جميع الخدمات في الدليل الافتراضي (بما في ذلك قواعد البيانات)\n\n  python update.py /srv/nekro --all\n    # استخدام مشترك: تحديث جميع الخدمات في الدليل المحدد",
     "update_module_yes_help": "تأكيد تلقائي لجميع المطالبات لتشغيل في وضع غير تفاعلي.",
     "update_module_channel_help": "تبديل قناة الصورة: 'latest' (مستقر) أو 'preview' (تجريبي)",
+    "update_services_changed": "سيتم تحديث: {}",
+    "update_status_changed": "{}: يتوفر إصدار جديد",
+    "update_status_container_outdated": "{} ({}): الحاوية لا تزال تستخدم صورة أقدم، سيتم إعادة إنشائها",
+    "update_status_current": "{} ({}): محدث",
+    "update_status_image_current": "{}: محدث",
+    "update_status_missing": "{}: غير موجودة محليًا، سيتم سحبها",
+    "update_status_unknown": "{}: تعذر الاستعلام عن الملخص البعيد، سيتم سحبها",
     "updated_version": "الإصدار بعد التحديث: {}",
     "error_channel_switch_failed": "فشل تبديل القناة",
     "channel_switch_complete": "تم تبديل القناة بنجاح",
@@ -221,27 +317,64 @@ MESSAGES = {
     "upgrade_description": "تنفيذ تحديث كامل (upgrade) على التثبيت في المسار المحدد.",
     "use_napcat_service": "هل تستخدم خدمة napcat أيضًا؟ [Y/n] ",
     "using_docker_compose_cmd": "يتم استخدام '{}' كأمر docker-compose.",
+    "verify_description": "التحقق من سلامة ملف النسخ الاحتياطي (قراءة متدفقة واحدة دون استخراج إلى القرص)",
+    "verify_error_checksum_mismatch": "عدم تطابق المجموع الاختباري: {}",
+    "verify_error_decompression": "فشل فك الضغط (إطار تالف أو مقطوع): {}",
+    "verify_error_member_missing": "عنصر مفقود: {}",
+    "verify_error_nested_volume": "نسخة وحدة التخزين {} تالفة: {}",
+    "verify_error_read": "فشل قراءة الأرشيف: {}",
+    "verify_error_trailing_data": "توجد بيانات غير صفرية بعد علامة نهاية tar: ترويسة tar تالفة",
+    "verify_failed": "ملف النسخ الاحتياطي تالف: {} ({} أخطاء)",
+    "verify_nested_volume": "جارٍ التحقق من نسخة وحدة التخزين {}",
+    "verify_no_checksums": "لا تحتوي النسخة الاحتياطية على مجاميع اختبارية مسجلة (نسخة قديمة)؛ تم فحص إطارات الضغط وبنية tar فقط.",
+    "verify_stats": "تم فحص {} عنصرًا، {} غير مضغوطة، حجم الأرشيف {}، استغرق {:.1f} ث",
+    "verify_success": "ملف النسخ الاحتياطي سليم: {}",
+    "verify_throughput": "الإنتاجية: {}/ث غير مضغوطة، {}/ث للأرشيف",
+    "verifying_backup": "جارٍ التحقق من ملف النسخ الاحتياطي: {}",
     "version_description": "عرض معلومات الإصدار.",
     "version_update_cancelled": "تم إلغاء العملية",
     "version_update_complete": "اكتملت عملية تحديث الإصدار!",
     "view_logs_instruction": "يمكنك عرض سجلات الخدمة باستخدام الأوامر التالية:",
+    "volume_backup_done": "[{}/{}] تم النسخ الاحتياطي لوحدة تخزين Docker '{}' خلال {:.1f} ث",
+    "volume_backup_failed_progress": "[{}/{}] فشل النسخ الاحتياطي لوحدة تخزين Docker '{}' بعد {:.1f} ث",
     "volume_backup_skipped": "تحتوي النسخة على مجلد '{}'، ولكن لم يتم توفير مسار الاستعادة، سيتم تخطيه.",
+    "volume_backup_workers": "جارٍ النسخ الاحتياطي لـ {} من وحدات تخزين Docker بالتوازي (حتى {} في آن واحد)...",
+    "volume_mode_description": "استخدم مع --backup لاختيار طريقة النسخ الاحتياطي لوحدات التخزين: 'stream' يمرر مخرجات الحاوية المساعدة مباشرة إلى الأرشيف، و'file' يكتب ملف .tar.gz مؤقتًا أولاً (الافتراضي {}).",
+    "volume_restore_col_size": "البيانات",
+    "volume_restore_col_status": "الحالة",
+    "volume_restore_col_time": "الوقت",
+    "volume_restore_col_volume": "وحدة التخزين",
+    "volume_restore_status_failed": "فشل",
+    "volume_restore_status_ok": "نجاح",
+    "volume_restore_summary": "نتائج استعادة وحدات تخزين Docker:",
+    "volume_restore_workers": "جارٍ استعادة وحدات تخزين Docker بالتوازي (حتى {} في نفس الوقت)...",
+    "volume_workers_description": "استخدم مع --backup / --recovery / --recover-install لتحديد الحد الأقصى لعدد وحدات تخزين Docker التي يتم نسخها احتياطيًا أو استعادتها بالتوازي (الافتراضي {}).",
+    "waiting_for_postgres_container": "في انتظار جاهزية حاوية Postgres التي تستخدم وحدة التخزين '{}'...",
+    "waiting_for_qdrant_service": "في انتظار إمكانية الوصول إلى خدمة Qdrant التي تستخدم وحدة التخزين '{}'...",
     "warning_cannot_determine_data_dir": "لا يمكن تحديد الدليل الرئيسي للبيانات من ملف النسخة الاحتياطية، أو تحتوي النسخة فقط على مجلدات Docker.",
     "warning_cannot_get_volume_info": "تحذير: لا يمكن الحصول على معلومات عن مجلد Docker '{}'، سيتم تخطيه. الخطأ: {}",
     "warning_cannot_get_volume_list": "تحذير: لا يمكن الحصول على قائمة مجلدات Docker: {}",
     "warning_cannot_get_volume_mountpoint": "تحذير: لا يمكن الحصول على نقطة تركيب مجلد Docker '{}'، سيتم تخطيه. الخطأ: {}",
+    "warning_catalog_update_failed": "تحذير: تعذّر تحديث فهرس النسخ الاحتياطية {}: {}",
     "warning_chmod_777": "تحذير: تعيين أذونات دليل التطبيق إلى 777، قد يكون هذا غير آمن.",
+    "warning_chunk_gc_busy": "مخزن الأجزاء {} قيد الاستخدام من قبل نسخة احتياطية تزايدية أخرى؛ تم تخطي تنظيف الأجزاء هذه المرة.",
+    "warning_chunk_gc_skipped": "تحذير: تعذّرت قراءة بيان اللقطة {} ({})، تم تخطي تنظيف الأجزاء.",
     "warning_compose_file_not_found": "لم يتم العثور على ملف docker-compose.yml في الدليل '{}'.",
+    "warning_compose_images_unresolved": "تحذير: تعذر تحديد الصور في ملف compose، سيتم استخدام compose pull",
     "warning_data_dir_not_empty": "دليل البيانات الهدف '{}' ليس فارغًا. قد تقوم عملية الاستعادة بكتابة فوق الملفات الموجودة.",
     "warning_docker_not_found_skip_backup": "تحذير: لم يتم العثور على الأمر 'docker'، سيتم تخطي نسخ Docker الاحتياطية.",
     "warning_docker_not_found_skip_recovery": "تحذير: لم يتم العثور على الأمر 'docker'، سيتم تخطي استعادة مجلدات Docker.",
     "warning_docker_volume_invalid_path": "تحذير: مسار '{}' للحجم Docker '{}' غير صالح أو ليس مجلدًا، سيتم تخطيه.",
     "warning_docker_volumes_will_overwrite": "سيتم استعادة مجلدات Docker التالية، وسيتم الكتابة فوق المحتوى الحالي في المجلدات:",
+    "warning_file_unreadable": "تحذير: تعذر قراءة {}، لم تتم كتابته في الأرشيف ({})",
+    "warning_file_vanished": "تحذير: تم حذف {} أثناء النسخ الاحتياطي وهو غير موجود في الأرشيف",
     "warning_prefix": "تحذير:",
+    "warning_report_write_failed": "تحذير: تعذّرت كتابة التقرير {}: {}",
+    "warning_retag_failed": "تحذير: تعذر إعادة وسم الصورة {} باسم {}: {}",
+    "warning_retention_remove_failed": "تحذير: تعذّر حذف النسخة الاحتياطية {}: {}",
     "warning_skip_data_restore": "سيتم استعادة دليل البيانات فقط، وسيتم تخطي استعادة مجلدات Docker.",
     "will_restore_docker_volume_to_path": "سيتم استعادة مجلد Docker '{}' إلى المسار: {}",
     "will_restore_docker_volume_via_container": "سيتم استعادة مجلد Docker '{}' بواسطة طريقة الحاوية",
     "with_napcat_description": "استخدم مع --install أو --recover-install لنشر خدمة NapCat.",
     "yes_description": "تأكيد تلقائي لجميع المطالبات لتشغيل في وضع غير تفاعلي.",
-    "zstd_not_detected_tar_only": "لم يتم اكتشاف zstd، سيتم إنشاء أرشيف .tar فقط"
 }
\ No newline at end of file
@@ -7,6 +7,7 @@ MESSAGES = {
     "adding_docker_volume_backup": "Adding Docker volume backup: {} (archived as: {})",
     "adding_to_archive": "Adding: {} (archived as: {})",
     "admin_account": "Admin Account: admin | Password: {}",
+    "all_cpu_cores": "all cores",
     "all_description": "Update all services, not just Nekro Agent",
     "all_mirrors_failed_try_official": "All mirrors failed, trying official registry: {}",
     "allow_port": "Allow port {}",
@@ -14,11 +15,15 @@ MESSAGES = {
     "app_data_directory": "Application data directory (NEKRO_DATA_DIR): {}",
     "app_description": "Nekro Agent installation, update and backup unified management tool.",
     "app_examples": "Usage examples:\n  {} -i ./na_data\n    # Install Nekro Agent in ./na_data directory\n\n  {} -u ./na_data\n    # Perform partial update on installation in specified directory\n\n  {} -ua ./na_data\n    # Perform complete update (upgrade) on installation in specified directory\n\n  {} -b ./na_data ./backups\n    # Backup na_data directory to backups folder\n\n  {} -r ./backups/na_backup_123.tar.zstd ./na_data_new\n    # Restore from backup file to na_data_new directory\n\n  {} -ri ./backup.tar.zst ./restored_install\n    # Restore data from backup and run installation on top of it",
+    "applying_pending_postgres_restore": "Importing the saved Postgres logical backup of volume '{}'...",
+    "applying_pending_qdrant_restore": "Importing the saved Qdrant collection snapshots of volume '{}'...",
+    "applying_retention_policy": "Applying backup retention policy...",
     "archiving_current_directory": "Archiving current directory '.' as '{}'",
     "backup_description": "Backup data directory to the specified folder.",
     "backup_docker_volume_complete": "Docker volume '{}' backup complete: {}",
     "backup_docker_volume_exception": "Exception occurred while backing up Docker volume '{}': {}",
     "backup_docker_volume_failed": "Failed to backup Docker volume '{}': {}",
+    "backup_failed": "Backup failed.",
     "backup_file_created": "Backup file created: {}",
     "backup_file_not_created": "Backup file {} was not successfully created or is empty",
     "backup_module_description": "Nekro Agent backup and recovery tool.",
@@ -31,12 +36,19 @@ MESSAGES = {
     "channel_already_set": "Image channel is already set to '{}', no changes needed.",
     "channel_switched": "Switched image channel from '{}' to '{}'.",
     "checking_generating_credentials": "Checking and generating necessary access credentials...",
+    "checking_image_updates": "Checking for image updates...",
     "checking_install_file": "Checked {} (no version information needs updating currently)",
+    "chunk_gc_stats": "Removed {} unreferenced chunks from the chunk store, freed {} bytes",
     "clear_cancelled": "Clear operation cancelled.",
     "clear_default_data_dir_prompt": "Enter 'clear' to clear default data directory setting: ",
     "cloud_server_note": "1. If you are using a cloud server, please allow the corresponding ports in your cloud provider's security group console.",
+    "codec_description": "Use with --backup to choose the compression codec (auto picks the first available of zstd, xz, gzip; default {}).",
     "command_failed_retry_sudo_exit": "Command failed. Retry(r/R), elevate(y/Y), or exit(n/N):",
     "compose_file_found": "Found docker-compose.yml file in current directory: {}",
+    "compress_level_description": "Use with --backup to set the compression level (1-22, capped at the codec's maximum, default {}).",
+    "compress_threads_description": "Use with --backup to set the number of compression threads (0 uses all CPU cores, default {}).",
+    "compressing_with_codec": "Compressing with {} ({}) to: {}...",
+    "compression_settings": "Compression settings: level {}, threads {}",
     "configuring_firewall": "Configuring firewall rules...",
     "configuring_firewall_ufw": "Configuring firewall (ufw)...",
     "confirm_continue": "Continue? (y/N): ",
@@ -46,7 +58,13 @@ MESSAGES = {
     "confirm_version_update": "Confirm version update? (y/N): ",
     "copy_success": "Copy successful.",
     "created_dev_compose_file": "Created dev Compose file: {}",
+    "creating_incremental_snapshot": "Creating incremental snapshot in chunk store: {}...",
     "dev_compose_image_replaced": "Replaced image tag from latest to preview",
+    "docker_volume_not_found": "volume does not exist",
+    "error_archive_integrity": "Archive integrity check failed ({} errors); restore aborted and the target directory was left unchanged",
+    "error_backup_dir_not_exist": "The specified backup directory '{}' does not exist or is not a directory.",
+    "error_codec_required_for_recovery": "Error: Restoring this backup requires the '{}' decoder (the zstd command or the Python zstandard module).",
+    "error_codec_unavailable": "Error: Compression codec '{}' is not available in this environment.",
     "error_create_dev_compose": "Failed to create dev Compose file: {}",
     "creating_archive": "Starting to create archive file...",
     "creating_docker_volume": "Creating Docker volume '{}'...",
@@ -59,7 +77,6 @@ MESSAGES = {
     "dependencies_check_passed": "Dependencies check passed.",
     "deployment_complete": "=== Deployment Complete! ===",
     "detected_docker_host_correcting": "Detected DOCKER_HOST='{}', will automatically correct to 'unix://{}'",
-    "detected_zstd_compressing": "Detected zstd, compressing to: {}...",
     "discovered_docker_volumes": "Dynamically discovered {} matching Docker volumes",
     "docker_volume_created": "Docker volume '{}' created successfully",
     "docker_volume_exists": "Docker volume '{}' already exists",
@@ -95,16 +112,24 @@ MESSAGES = {
     "error_docker_volume_discovery_exception": "Error: Exception occurred during Docker volume discovery: {}",
     "error_env_file_not_exist": ".env file does not exist, please check if Nekro Agent is properly installed.",
     "error_invalid_channel": "Invalid channel: {}. Please use 'latest' or 'preview'.",
+    "error_invalid_compress_level": "Error: Compression level must be between 1 and 22, got {}.",
+    "error_invalid_compress_threads": "Error: Compression thread count cannot be negative, got {}.",
+    "error_invalid_restore_selector": "Error: Invalid restore selector '{}', expected data, data:<glob> or volume:<name>.",
+    "error_invalid_retention_count": "Error: --keep-last / --keep-daily / --keep-weekly / --keep-monthly must not be negative.",
+    "error_invalid_size": "Error: Invalid size '{}', expected a number with an optional K/M/G/T unit (e.g. 500M).",
+    "error_invalid_volume_workers": "Error: Volume worker count must be greater than 0, got {}.",
     "error_nekro_agent_image_not_found": "Nekro Agent image not found in docker-compose.yml.",
+    "error_pull_image": "Failed to pull image {}: {}",
     "error_read_compose_file": "Failed to read docker-compose.yml: {}",
+    "error_snapshot_chunk_corrupted": "Chunk {} referenced by the snapshot is missing or corrupted",
     "error_switch_channel": "Failed to switch image channel: {}",
-    "error_invalid_backup_format": "Invalid backup file format. Only '.tar' and '.tar.zstd' are supported.",
+    "error_invalid_backup_format": "Invalid backup file format. Only '.tar', '.tar.zstd', '.tar.xz', '.tar.gz' and incremental snapshots '.snapshot.json' are supported.",
     "error_prefix": "Error:",
     "error_pull_helper_image": "Error: Failed to pull backup helper image '{}' : {}",
     "error_sudo_failed": "Sudo failed for command: {}",
     "error_sudo_not_found": "'sudo' command not found. Please ensure you have administrator privileges.",
     "error_unsupported_file_format": "Error: Unsupported file format: {}",
-    "error_zstd_required_for_recovery": "Error: Recovery requires 'zstd' command.",
+    "error_volume_backup_incomplete": "Backup of the following volumes failed after part of their data was written to the archive; the archive is incomplete and this backup was discarded: {}",
     "excluding_env_template": "Excluding config template: {}",
     "excluding_from_archive": "Excluding: {}",
     "excluding_logs_directory": "Excluding logs directory: {}",
@@ -128,6 +153,8 @@ MESSAGES = {
     "helper_image_not_found_try_pull": "Helper image for backup '{}' not found, attempting to pull from remote...",
     "important_config_info": "=== Important Configuration Information ===",
     "important_notes": "=== Important Notes ===",
+    "incremental_description": "Use with --backup to create an incremental backup: data is split into content-addressed chunks in a chunk store under the backup directory, and only new chunks are written.",
+    "incremental_snapshot_stats": "Snapshot references {} chunks ({} new), {} bytes of data, {} bytes newly stored",
     "install_description": "Install Nekro Agent to the specified path.",
     "install_module_data_dir_help": "Nekro Agent application data directory.\nDefaults to \"na_data/\" folder in the script directory.",
     "install_module_description": "Nekro Agent installation and management script",
@@ -139,6 +166,24 @@ MESSAGES = {
     "installation_complete": "Installation complete! Enjoy using it!",
     "insufficient_permissions_try_sudo": "The current user may not have sufficient permissions, try using sudo to elevate privileges...",
     "invalid_input_retry": "Invalid input, please choose again.",
+    "keep_daily_description": "Use with --backup: keep the newest backup of each of the last N days",
+    "keep_last_description": "Use with --backup: after a successful backup keep the N most recent backups",
+    "keep_monthly_description": "Use with --backup: keep the newest backup of each of the last N months",
+    "keep_weekly_description": "Use with --backup: keep the newest backup of each of the last N weeks",
+    "list_backup_header": "Backup file: {}",
+    "list_backups_description": "List all backups in a backup directory (reads the catalog, does not open archives)",
+    "list_backups_empty": "No backups found in {}.",
+    "list_backups_header": "Backups in {} (newest first):",
+    "list_backups_total": "{} backups, {} in total",
+    "list_compression": "Compression: {}",
+    "list_created_at": "Created: {}",
+    "list_data_root": "Data directory: {}",
+    "list_description": "List the contents of a backup file (reads the manifest at the start of the archive)",
+    "list_docker_volumes": "Docker volumes:",
+    "list_file_summary": "Files: {}, total size: {}",
+    "list_no_manifest_scanning": "Backup file {} has no manifest (older backup), scanning the whole archive...",
+    "list_toolkit_version": "Toolkit version: {}",
+    "max_total_size_description": "Use with --backup: upper limit for the total size of kept backups (e.g. 500M, 20G); the oldest backups are removed first",
     "mirror_pull_failed": "Failed to pull from mirror: {} ({})",
     "mirror_pull_success": "Successfully pulled from mirror: {} ({}), image: {}",
     "multiple_root_directories_warning": "Warning: Backup contains multiple possible root directories: {}. Cannot automatically determine main data directory.",
@@ -158,16 +203,39 @@ MESSAGES = {
     "official_pull_success": "Successfully pulled from official registry: {} ({})",
     "onebot_access_token": "OneBot Access Token: {}",
     "onebot_websocket_address": "OneBot WebSocket Connection URL: ws://127.0.0.1:{}/onebot/v11/ws",
+    "only_description": "Use with --recovery / --recover-install to restore only the selected content; repeatable: data (whole data directory), data:<glob> (paths inside the data directory, e.g. data:configs/*), volume:<name> (globs allowed).",
     "operation_cancelled": "Operation cancelled.",
+    "pending_restores_discarded": "Discarding data left unimported by an earlier restore: {}",
+    "postgres_container_not_ready": "The Postgres container using volume '{}' did not become ready within {}s; the logical backup is kept at {}",
+    "postgres_dump_complete": "pg_dump of volume '{}' complete: {}, {} parts",
+    "postgres_dump_container_found": "Volume '{}' is used by running Postgres container {}, backing it up with pg_dump",
+    "postgres_dump_failed": "pg_dump of volume '{}' failed: {}",
+    "postgres_dump_incomplete": "The logical backup of volume '{}' is incomplete (pg_dump did not finish during backup or the data does not match its completion record); pg_restore was skipped and the database was left unchanged",
+    "postgres_restore_complete": "pg_restore of volume '{}' complete",
+    "postgres_restore_failed": "Restoring the logical backup of volume '{}' failed: {}",
+    "postgres_restore_pending": "No running Postgres container uses volume '{0}'; the logical backup was saved to {1}. It is imported automatically after -ri installs and starts the service, or start the service and re-run the recovery with --only volume:{0}",
     "preparing_recovery_from_backup": "Preparing recovery from backup file: {}",
+    "probing_registries": "Measuring official registry and mirrors: {} ({})",
+    "progress_backup": "Backup",
+    "progress_description": "Use with --backup / --recovery: how to show progress (auto draws a progress bar on a terminal and shows nothing otherwise; use json for periodic JSON lines; default {})",
+    "progress_restore": "Restore",
     "pulling_all_services": "Pulling latest images for all services",
     "pulling_helper_image": "Pulling backup helper image...",
     "pulling_image_mirrors": "Pulling image from mirrors: {} ({})",
     "pulling_image_official": "Pulling image from official registry: {} ({})",
+    "pulling_images_concurrently": "Pulling {} image(s), up to {} at a time: {}",
     "pulling_latest_nekro_agent": "Pulling latest nekro_agent image",
     "pulling_latest_sandbox": "Pulling latest kromiose/nekro-agent-sandbox image",
     "pulling_sandbox_image": "Pulling sandbox image",
     "pulling_service_images": "Pulling service images",
+    "qdrant_restore_complete": "All collection snapshots of volume '{}' restored",
+    "qdrant_restore_failed": "Restoring Qdrant snapshot '{}' failed: {}",
+    "qdrant_restore_pending": "No reachable Qdrant service uses volume '{0}'; the collection snapshots were saved to {1}. They are imported automatically after -ri installs and starts the service, or start the service and re-run the recovery with --only volume:{0}",
+    "qdrant_service_found": "Volume '{}' is used by running Qdrant service {}, backing it up with collection snapshots",
+    "qdrant_service_not_ready": "The Qdrant service using volume '{}' was not reachable within {}s; the collection snapshots are kept at {}",
+    "qdrant_snapshot_collection_done": "Snapshot of collection '{}' written into archive: {}",
+    "qdrant_snapshot_complete": "Snapshot backup of volume '{}' complete: {} collections, {}",
+    "qdrant_snapshot_failed": "Qdrant snapshot backup of '{}' failed: {}",
     "rebuilding_nekro_agent": "Rebuilding and starting nekro_agent container",
     "recover_install_description": "Recover and install. This will extract the backup file to the target directory, then run the installation process on top of it.",
     "recovery_description": "Restore from backup file to the specified data directory.",
@@ -179,14 +247,30 @@ MESSAGES = {
     "recovery_module_help": "Restore data and Docker volumes from specified backup file to target directory.",
     "recovery_step_failed": "Recovery step failed, aborting operation.",
     "recovery_success": "Recovery successful! Data restored to: {}",
+    "registry_status_available": "image available",
+    "registry_status_backoff": "skipped, next check in {} min (last failure: {})",
+    "registry_status_cached": "available (cached)",
+    "registry_status_missing": "image not found",
+    "registry_status_unknown": "reachable, image not confirmed ({})",
+    "registry_status_unreachable": "unreachable ({})",
+    "report_json_description": "Use with --backup / --recovery: write per-phase wall time, bytes, compression ratio and throughput to a JSON report (also written on failure)",
+    "report_written": "Report written to: {}",
     "restarting_all_services": "Restarting all service containers",
     "restore_docker_volume_failed": "Error: Failed to restore Docker volume '{}': {}",
     "restoring_backup_to": "Restoring backup to: {}",
     "restoring_data_to": "Restoring data to: {}",
     "restoring_docker_volume": "Restoring Docker volume '{}' to: {}",
     "restoring_docker_volume_via_container": "Restoring Docker volume '{}' (via container method)",
+    "restoring_postgres_dump": "Restoring volume '{0}' in container {1} with pg_restore ({2} parallel jobs)...",
+    "restoring_qdrant_collection": "Uploading snapshot of collection '{}' ({})...",
     "restoring_via_container_complete": "Docker volume '{}' restoration complete",
     "restoring_via_container_starting": "Restoring Docker volume '{}' via container...",
+    "retagging_mirror_image": "Retagging image as {}",
+    "retention_applying": "Retention policy: {}; {} backups found, {} to remove",
+    "retention_removed_backup": "Removed backup {} (created {})",
+    "selective_restore_no_volume_matched": "Warning: No Docker volume matches {}, no volumes will be restored.",
+    "selective_restore_selectors": "Selective restore, only restoring: {}",
+    "selective_restore_stopped_early": "All selected files have been read, skipping the rest of the archive (the checksums recorded at the end were not checked; use --verify for a full check)",
     "service_access_info": "=== Service Access Information ===",
     "set_data_description": "Set or clear the default data directory.",
     "setting_directory_permissions": "Setting directory permissions",
@@ -194,6 +278,10 @@ MESSAGES = {
     "starting_extraction": "Starting extraction and recovery...",
     "starting_main_service": "Starting main service",
     "starting_version_update": "Starting version update...",
+    "streaming_postgres_dump": "Streaming pg_dump of volume '{0}' from container {1} into archive: {2}",
+    "streaming_qdrant_snapshots": "Snapshotting collections of volume '{0}' via {1} into archive: {2}",
+    "streaming_volume_complete": "Docker volume '{}' written into archive, {} entries",
+    "streaming_volume_into_archive": "Streaming Docker volume '{}' from helper container into archive (archived as: {}/)...",
     "sudo_elevation_success": "Sudo elevation successful.",
     "sudo_failed_retry_exit": "Sudo failed. Retry(r/R/y/Y) or exit(n/N):",
     "switched_to_directory": "Switched to directory: {}",
@@ -202,6 +290,7 @@ MESSAGES = {
     "target_version": "Target version: {}",
     "trying_mirror_pull": "Trying to pull from mirror: {} ({})",
     "unknown_system_permission": "Unknown system, permission not set: {0}",
+    "update_already_up_to_date": "All images are already up to date, skipping pull",
     "update_cancelled": "Update cancelled.",
     "update_complete": "Update complete!",
     "update_description": "Perform partial update on the installation at the specified path.",
@@ -213,6 +302,13 @@ MESSAGES = {
     "update_module_examples": "Usage examples:\n  python update.py\n    # Update Nekro Agent in current directory (recommended)\n\n  python update.py /srv/nekro\n    # Update Nekro Agent located at /srv/nekro\n\n  python update.py --all\n    # Update all services in default directory (including databases)\n\n  python update.py /srv/nekro --all\n    # Combined usage: update all services in specified directory",
     "update_module_yes_help": "Automatically confirm all prompts to run in non-interactive mode.",
     "update_module_channel_help": "Switch image channel: 'latest' (stable) or 'preview' (beta)",
+    "update_services_changed": "To update: {}",
+    "update_status_changed": "{}: new version available",
+    "update_status_container_outdated": "{} ({}): container still uses an older image, will recreate",
+    "update_status_current": "{} ({}): up to date",
+    "update_status_image_current": "{}: up to date",
+    "update_status_missing": "{}: not found locally, will pull",
+    "update_status_unknown": "{}: could not query the remote digest, will pull",
     "updated_version": "Updated version: {}",
     "error_channel_switch_failed": "Channel switch failed",
     "channel_switch_complete": "Channel switch successful",
@@ -221,27 +317,64 @@ MESSAGES = {
     "upgrade_description": "Perform complete update (upgrade) on the installation at the specified path.",
     "use_napcat_service": "Use napcat service as well? [Y/n] ",
     "using_docker_compose_cmd": "Using '{}' as docker-compose command.",
+    "verify_description": "Verify the integrity of a backup file (single streaming pass, nothing is extracted to disk)",
+    "verify_error_checksum_mismatch": "Checksum mismatch: {}",
+    "verify_error_decompression": "Decompression failed (corrupted or truncated frame): {}",
+    "verify_error_member_missing": "Missing entry: {}",
+    "verify_error_nested_volume": "Volume backup {} is corrupted: {}",
+    "verify_error_read": "Failed to read archive: {}",
+    "verify_error_trailing_data": "Non-zero data after the tar end marker: a tar header is corrupted",
+    "verify_failed": "Backup file is corrupted: {} ({} errors)",
+    "verify_nested_volume": "Verifying volume backup {}",
+    "verify_no_checksums": "The backup has no recorded checksums (older backup); only compression frames and tar structure were checked.",
+    "verify_stats": "Checked {} entries, {} uncompressed, archive size {}, took {:.1f}s",
+    "verify_success": "Backup file is intact: {}",
+    "verify_throughput": "Throughput: {}/s uncompressed, {}/s archive",
+    "verifying_backup": "Verifying backup file: {}",
     "version_description": "Display version information.",
     "version_update_cancelled": "Operation cancelled",
     "version_update_complete": "Version update complete!",
     "view_logs_instruction": "You can view service logs with the following commands:",
+    "volume_backup_done": "[{}/{}] Docker volume '{}' backed up in {:.1f}s",
+    "volume_backup_failed_progress": "[{}/{}] Docker volume '{}' backup failed after {:.1f}s",
     "volume_backup_skipped": "Backup contains volume '{}', but no recovery path provided, will skip.",
+    "volume_backup_workers": "Backing up {} Docker volumes concurrently (up to {} at a time)...",
+    "volume_mode_description": "Use with --backup to choose how container volumes are backed up: 'stream' pipes the helper container's stdout straight into the archive, 'file' writes a temporary .tar.gz first (default {}).",
+    "volume_restore_col_size": "Data",
+    "volume_restore_col_status": "Status",
+    "volume_restore_col_time": "Time",
+    "volume_restore_col_volume": "Volume",
+    "volume_restore_status_failed": "FAILED",
+    "volume_restore_status_ok": "OK",
+    "volume_restore_summary": "Docker volume restore results:",
+    "volume_restore_workers": "Restoring Docker volumes concurrently (up to {} at a time)...",
+    "volume_workers_description": "Use with --backup / --recovery / --recover-install to cap how many Docker volumes are backed up or restored concurrently (default {}).",
+    "waiting_for_postgres_container": "Waiting for the Postgres container using volume '{}' to accept connections...",
+    "waiting_for_qdrant_service": "Waiting for the Qdrant service using volume '{}' to become reachable...",
     "warning_cannot_determine_data_dir": "Cannot determine main data directory from backup file, or backup only contains Docker volumes.",
     "warning_cannot_get_volume_info": "Warning: Cannot get information for Docker volume '{}', will skip. Error: {}",
     "warning_cannot_get_volume_list": "Warning: Cannot get Docker volume list: {}",
     "warning_cannot_get_volume_mountpoint": "Warning: Cannot get mountpoint for Docker volume '{}', will skip. Error: {}",
+    "warning_catalog_update_failed": "Warning: Could not update backup catalog {}: {}",
     "warning_chmod_777": "Warning: Setting application directory permissions to 777, this may not be secure.",
+    "warning_chunk_gc_busy": "The chunk store {} is in use by another incremental backup; skipping chunk cleanup this time.",
+    "warning_chunk_gc_skipped": "Warning: Could not read snapshot manifest {} ({}), skipping chunk cleanup.",
     "warning_compose_file_not_found": "docker-compose.yml file not found in directory '{}'.",
+    "warning_compose_images_unresolved": "Warning: could not resolve the images in the compose file, falling back to compose pull",
     "warning_data_dir_not_empty": "Target data directory '{}' is not empty. Recovery operation may overwrite existing files.",
     "warning_docker_not_found_skip_backup": "Warning: 'docker' command not found, will skip Docker volume backup.",
     "warning_docker_not_found_skip_recovery": "Warning: 'docker' command not found, will skip Docker volume recovery.",
     "warning_docker_volume_invalid_path": "Warning: Docker volume '{}' path '{}' is invalid or not a directory, will skip.",
     "warning_docker_volumes_will_overwrite": "The following Docker volumes will be restored, which will overwrite existing content in the volumes:",
+    "warning_file_unreadable": "Warning: cannot read {}, not written to the archive ({})",
+    "warning_file_vanished": "Warning: {} was removed during the backup and is not in the archive",
     "warning_prefix": "Warning:",
+    "warning_report_write_failed": "Warning: Could not write report {}: {}",
+    "warning_retag_failed": "Warning: could not retag image {} as {}: {}",
+    "warning_retention_remove_failed": "Warning: Could not remove backup {}: {}",
     "warning_skip_data_restore": "Will only restore data directory, skip Docker volume recovery.",
     "will_restore_docker_volume_to_path": "Will restore Docker volume '{}' to path: {}",
     "will_restore_docker_volume_via_container": "Will restore Docker volume '{}' via container method",
     "with_napcat_description": "Use with --install or --recover-install to deploy NapCat service.",
     "yes_description": "Automatically confirm all prompts to run in non-interactive mode.",
-    "zstd_not_detected_tar_only": "zstd not detected, creating .tar archive only."
 }
\ No newline at end of file
@@ -7,6 +7,7 @@ MESSAGES = {
     "adding_docker_volume_backup": "Agregando copia de seguridad del volumen Docker: {} (archivado como: {})",
     "adding_to_archive": "Agregando: {} (archivado como: {})",
     "admin_account": "Cuenta de administrador: admin | Contraseña: {}",
+    "all_cpu_cores": "todos los núcleos",
     "all_description": "Actualizar todos los servicios, no solo Nekro Agent",
     "all_mirrors_failed_try_official": "Todos los espejos fallaron, intentando con el registro oficial: {}",
     "allow_port": "Permitir puerto {}",
@@ -14,11 +15,15 @@ MESSAGES = {
     "app_data_directory": "Directorio de datos de la aplicación (NEKRO_DATA_DIR): {}",
     "app_description": "Herramienta de gestión unificada para la instalación, actualización y copia de seguridad de Nekro Agent.",
     "app_examples": "Ejemplos de uso:\n  {} -i ./na_data\n    # Instalar Nekro Agent en el directorio ./na_data\n\n  {} -u ./na_data\n    # Realizar una actualización parcial en el directorio especificado\n\n  {} -ua ./na_data\n    # Realizar una actualización completa (upgrade) en el directorio especificado\n\n  {} -b ./na_data ./backups\n    # Copia de seguridad del directorio na_data en la carpeta backups\n\n  {} -r ./backups/na_backup_123.tar.zstd ./na_data_new\n    # Restaurar desde el archivo de copia de seguridad en el directorio na_data_new\n\n  {} -ri ./backup.tar.zst ./restored_install\n    # Restaurar datos desde la copia de seguridad y ejecutar la instalación encima",
+    "applying_pending_postgres_restore": "Importando la copia lógica de Postgres guardada del volumen '{}'...",
+    "applying_pending_qdrant_restore": "Importando las instantáneas de Qdrant guardadas del volumen '{}'...",
+    "applying_retention_policy": "Aplicando la política de retención de copias...",
     "archiving_current_directory": "Archivando el directorio actual '.' como '{}'",
     "backup_description": "Hacer una copia de seguridad del directorio de datos en la carpeta especificada.",
     "backup_docker_volume_complete": "Copia de seguridad del volumen Docker '{}' completada: {}",
     "backup_docker_volume_exception": "Se produjo una excepción al hacer la copia de seguridad del volumen Docker '{}' : {}",
     "backup_docker_volume_failed": "Error al hacer la copia de seguridad del volumen Docker '{}' : {}",
+    "backup_failed": "La copia de seguridad ha fallado.",
     "backup_file_created": "Archivo de copia de seguridad creado: {}",
     "backup_file_not_created": "El archivo de copia de seguridad {} no se creó con éxito o está vacío",
     "backup_module_description": "Herramienta de copia de seguridad y restauración de Nekro Agent.",
@@ -31,12 +36,19 @@ MESSAGES = {
     "channel_already_set": "El canal de imagen ya está configurado como '{}', no se requieren cambios.",
     "channel_switched": "Se cambió el canal de imagen de '{}' a '{}'.",
     "checking_generating_credentials": "Verificando y generando las credenciales de acceso necesarias...",
+    "checking_image_updates": "Comprobando actualizaciones de imágenes...",
     "checking_install_file": "Verificado {} (no se necesita actualizar la información de la versión actualmente)",
+    "chunk_gc_stats": "Se eliminaron {} fragmentos sin referencias del almacén, liberados {} bytes",
     "clear_cancelled": "Operación de limpieza cancelada.",
     "clear_default_data_dir_prompt": "Ingrese 'clear' para borrar la configuración del directorio de datos predeterminado: ",
     "cloud_server_note": "1. Si está utilizando un servidor en la nube, permita los puertos correspondientes en la consola del grupo de seguridad de su proveedor de nube.",
+    "codec_description": "Usar con --backup para elegir el códec de compresión (auto elige el primero disponible entre zstd, xz, gzip; predeterminado {}).",
     "command_failed_retry_sudo_exit": "Comando fallido. Reintentar(r/R), elevar(y/Y), o salir(n/N):",
     "compose_file_found": "Archivo docker-compose.yml encontrado en el directorio actual: {}",
+    "compress_level_description": "Usar con --backup para establecer el nivel de compresión (1-22, limitado al máximo del códec, predeterminado {}).",
+    "compress_threads_description": "Usar con --backup para establecer el número de hilos de compresión (0 usa todos los núcleos, predeterminado {}).",
+    "compressing_with_codec": "Comprimiendo con {} ({}) en: {}...",
+    "compression_settings": "Parámetros de compresión: nivel {}, hilos {}",
     "configuring_firewall": "Configurando reglas de firewall...",
     "configuring_firewall_ufw": "Configurando el firewall (ufw)...",
     "confirm_continue": "¿Continuar? (y/N): ",
@@ -46,7 +58,13 @@ MESSAGES = {
     "confirm_version_update": "¿Confirmar la actualización de la versión? (y/N): ",
     "copy_success": "Copia exitosa.",
     "created_dev_compose_file": "Archivo Compose de desarrollo creado: {}",
+    "creating_incremental_snapshot": "Creando instantánea incremental en el almacén de fragmentos: {}...",
     "dev_compose_image_replaced": "Etiqueta de imagen reemplazada de latest a preview",
+    "docker_volume_not_found": "el volumen no existe",
+    "error_archive_integrity": "La verificación de integridad del archivo falló ({} errores); restauración cancelada y el directorio de destino no se modificó",
+    "error_backup_dir_not_exist": "El directorio de copias '{}' no existe o no es un directorio.",
+    "error_codec_required_for_recovery": "Error: Restaurar esta copia requiere el decodificador '{}' (el comando zstd o el módulo Python zstandard).",
+    "error_codec_unavailable": "Error: El códec de compresión '{}' no está disponible en este entorno.",
     "error_create_dev_compose": "Error al crear el archivo Compose de desarrollo: {}",
     "creating_archive": "Iniciando la creación del archivo de copia de seguridad...",
     "creating_docker_volume": "Creando volumen Docker '{}'...",
@@ -59,7 +77,6 @@ MESSAGES = {
     "dependencies_check_passed": "Verificación de dependencias completada.",
     "deployment_complete": "=== ¡Despliegue completado! ===",
     "detected_docker_host_correcting": "Detectado DOCKER_HOST='{}', se corregirá automáticamente a 'unix://{}'",
-    "detected_zstd_compressing": "Detectado zstd, comprimiendo a: {}...",
     "discovered_docker_volumes": "Se descubrieron dinámicamente {} volúmenes Docker coincidentes",
     "docker_volume_created": "Volumen Docker '{}' creado correctamente",
     "docker_volume_exists": "El volumen Docker '{}' ya existe",
@@ -95,16 +112,24 @@ MESSAGES = {
     "error_docker_volume_discovery_exception": "Error: excepción durante el descubrimiento de volúmenes Docker: {}",
     "error_env_file_not_exist": "El archivo .env no existe, por favor verifique si Nekro Agent está correctamente instalado.",
     "error_invalid_channel": "Canal inválido: {}. Por favor use 'latest' o 'preview'.",
+    "error_invalid_compress_level": "Error: El nivel de compresión debe estar entre 1 y 22, se recibió {}.",
+    "error_invalid_compress_threads": "Error: El número de hilos de compresión no puede ser negativo, se recibió {}.",
+    "error_invalid_restore_selector": "Error: Selector de restauración no válido '{}', se esperaba data, data:<patrón> o volume:<nombre>.",
+    "error_invalid_retention_count": "Error: --keep-last / --keep-daily / --keep-weekly / --keep-monthly no pueden ser negativos.",
+    "error_invalid_size": "Error: tamaño no válido '{}', se espera un número con unidad opcional K/M/G/T (p. ej. 500M).",
+    "error_invalid_volume_workers": "Error: El número de trabajadores de volúmenes debe ser mayor que 0, se recibió {}.",
     "error_nekro_agent_image_not_found": "Imagen de Nekro Agent no encontrada en docker-compose.yml.",
+    "error_pull_image": "Error al descargar la imagen {}: {}",
     "error_read_compose_file": "Error al leer docker-compose.yml: {}",
+    "error_snapshot_chunk_corrupted": "El fragmento {} referenciado por la instantánea falta o está dañado",
     "error_switch_channel": "Error al cambiar el canal de imagen: {}",
-    "error_invalid_backup_format": "Formato de archivo de copia inválido. Solo se admiten '.tar' y '.tar.zstd'.",
+    "error_invalid_backup_format": "Formato de archivo de copia no válido. Solo se admiten '.tar', '.tar.zstd', '.tar.xz', '.tar.gz' e instantáneas incrementales '.snapshot.json'.",
     "error_prefix": "Error:",
     "error_pull_helper_image": "Error: fallo al tirar la imagen helper de backup '{}' : {}",
     "error_sudo_failed": "Error: sudo falló para el comando: {}",
     "error_sudo_not_found": "Comando 'sudo' no encontrado. Asegúrese de tener privilegios de administrador.",
     "error_unsupported_file_format": "Error: formato de archivo no soportado: {}",
-    "error_zstd_required_for_recovery": "Error: La recuperación requiere el comando 'zstd'.",
+    "error_volume_backup_incomplete": "La copia de los siguientes volúmenes falló después de escribir parte de sus datos en el archivo; el archivo está incompleto y esta copia se descartó: {}",
     "excluding_env_template": "Excluyendo plantilla de configuración: {}",
     "excluding_from_archive": "Excluyendo: {}",
     "excluding_logs_directory": "Excluyendo directorio de logs: {}",
@@ -128,6 +153,8 @@ MESSAGES = {
     "helper_image_not_found_try_pull": "Imagen helper para backup '{}' no encontrada, intentando descargar...",
     "important_config_info": "=== Información de configuración importante ===",
     "important_notes": "=== Notas importantes ===",
+    "incremental_description": "Usar con --backup para crear una copia incremental: los datos se dividen en fragmentos direccionados por contenido en un almacén dentro del directorio de copias y solo se escriben los fragmentos nuevos.",
+    "incremental_snapshot_stats": "La instantánea referencia {} fragmentos ({} nuevos), {} bytes de datos, {} bytes almacenados nuevos",
     "install_description": "Instalar Nekro Agent en la ruta especificada.",
     "install_module_data_dir_help": "Directorio de datos de la aplicación Nekro Agent.\nPor defecto la carpeta \"na_data/\" en el directorio del script.",
     "install_module_description": "Script de instalación y gestión de Nekro Agent",
@@ -139,6 +166,24 @@ MESSAGES = {
     "installation_complete": "¡Instalación completa! ¡Disfrute su uso!",
     "insufficient_permissions_try_sudo": "El usuario actual puede no tener permisos suficientes, intente usar sudo para elevar privilegios...",
     "invalid_input_retry": "Entrada inválida, por favor elija de nuevo.",
+    "keep_daily_description": "Usar con --backup: conservar la copia más reciente de cada uno de los últimos N días",
+    "keep_last_description": "Usar con --backup: tras una copia correcta conservar las N copias más recientes",
+    "keep_monthly_description": "Usar con --backup: conservar la copia más reciente de cada uno de los últimos N meses",
+    "keep_weekly_description": "Usar con --backup: conservar la copia más reciente de cada una de las últimas N semanas",
+    "list_backup_header": "Archivo de copia de seguridad: {}",
+    "list_backups_description": "Listar todas las copias de un directorio de copias (lee el catálogo, no abre los archivos)",
+    "list_backups_empty": "No se encontraron copias en {}.",
+    "list_backups_header": "Copias en {} (más recientes primero):",
+    "list_backups_total": "{} copias, {} en total",
+    "list_compression": "Compresión: {}",
+    "list_created_at": "Creado: {}",
+    "list_data_root": "Directorio de datos: {}",
+    "list_description": "Listar el contenido de un archivo de copia de seguridad (lee el manifiesto al inicio del archivo)",
+    "list_docker_volumes": "Volúmenes Docker:",
+    "list_file_summary": "Archivos: {}, tamaño total: {}",
+    "list_no_manifest_scanning": "El archivo {} no tiene manifiesto (copia antigua), analizando todo el archivo...",
+    "list_toolkit_version": "Versión de la herramienta: {}",
+    "max_total_size_description": "Usar con --backup: límite del tamaño total de las copias conservadas (p. ej. 500M, 20G); se eliminan primero las más antiguas",
     "mirror_pull_failed": "Fallo al tirar del espejo: {} ({})",
     "mirror_pull_success": "Éxito al tirar del espejo: {} ({}), imagen: {}",
     "multiple_root_directories_warning": "Advertencia: la copia contiene múltiples posibles directorios raíz: {}. No se puede determinar automáticamente el directorio de datos principal.",
@@ -158,16 +203,39 @@ MESSAGES = {
     "official_pull_success": "Éxito al tirar del registro oficial: {} ({})",
     "onebot_access_token": "Token de acceso OneBot: {}",
     "onebot_websocket_address": "URL de conexión OneBot WebSocket: ws://127.0.0.1:{}/onebot/v11/ws",
+    "only_description": "Usar con --recovery / --recover-install para restaurar solo el contenido seleccionado; repetible: data (todo el directorio de datos), data:<patrón> (rutas dentro del directorio de datos, p. ej. data:configs/*), volume:<nombre> (se permiten comodines).",
     "operation_cancelled": "Operación cancelada.",
+    "pending_restores_discarded": "Descartando datos no importados de una restauración anterior: {}",
+    "postgres_container_not_ready": "El contenedor Postgres que usa el volumen '{}' no estuvo listo en {}s; la copia lógica se conserva en {}",
+    "postgres_dump_complete": "pg_dump del volumen '{}' completado: {}, {} partes",
+    "postgres_dump_container_found": "El volumen '{}' lo usa el contenedor Postgres en ejecución {}, se respaldará con pg_dump",
+    "postgres_dump_failed": "Falló pg_dump del volumen '{}': {}",
+    "postgres_dump_incomplete": "La copia lógica del volumen '{}' está incompleta (pg_dump no terminó durante la copia o los datos no coinciden con su registro de finalización); se omitió pg_restore y la base de datos no se modificó",
+    "postgres_restore_complete": "pg_restore del volumen '{}' completado",
+    "postgres_restore_failed": "Falló la restauración de la copia lógica del volumen '{}': {}",
+    "postgres_restore_pending": "Ningún contenedor Postgres en ejecución usa el volumen '{0}'; la copia lógica se guardó en {1}. Se importa automáticamente tras instalar e iniciar el servicio con -ri, o inicie el servicio y repita la recuperación con --only volume:{0}",
     "preparing_recovery_from_backup": "Preparando recuperación desde archivo de copia: {}",
+    "probing_registries": "Midiendo el registro oficial y los espejos: {} ({})",
+    "progress_backup": "Copia",
+    "progress_description": "Usar con --backup / --recovery: cómo mostrar el progreso (auto dibuja una barra en un terminal y, si no, no muestra nada; use json para líneas JSON periódicas; predeterminado {})",
+    "progress_restore": "Restauración",
     "pulling_all_services": "Tirando de las últimas imágenes para todos los servicios",
     "pulling_helper_image": "Tirando de la imagen helper de backup...",
     "pulling_image_mirrors": "Tirando imagen desde espejos: {} ({})",
     "pulling_image_official": "Tirando imagen desde registro oficial: {} ({})",
+    "pulling_images_concurrently": "Descargando {} imagen(es), hasta {} a la vez: {}",
     "pulling_latest_nekro_agent": "Tirando la última imagen nekro_agent",
     "pulling_latest_sandbox": "Tirando la última imagen kromiose/nekro-agent-sandbox",
     "pulling_sandbox_image": "Tirando la imagen sandbox",
     "pulling_service_images": "Tirando imágenes de servicios",
+    "qdrant_restore_complete": "Todas las instantáneas de colecciones del volumen '{}' restauradas",
+    "qdrant_restore_failed": "Falló la restauración de la instantánea de Qdrant '{}': {}",
+    "qdrant_restore_pending": "Ningún servicio Qdrant accesible usa el volumen '{0}'; las instantáneas se guardaron en {1}. Se importan automáticamente tras instalar e iniciar el servicio con -ri, o inicie el servicio y repita la recuperación con --only volume:{0}",
+    "qdrant_service_found": "El volumen '{}' lo usa el servicio Qdrant en ejecución {}, se respaldará con instantáneas de colecciones",
+    "qdrant_service_not_ready": "El servicio Qdrant que usa el volumen '{}' no estuvo accesible en {}s; las instantáneas se conservan en {}",
+    "qdrant_snapshot_collection_done": "Instantánea de la colección '{}' escrita en el archivo: {}",
+    "qdrant_snapshot_complete": "Copia por instantáneas del volumen '{}' completada: {} colecciones, {}",
+    "qdrant_snapshot_failed": "Falló la copia por instantánea de Qdrant de '{}': {}",
     "rebuilding_nekro_agent": "Reconstruyendo e iniciando el contenedor nekro_agent",
     "recover_install_description": "Recuperar e instalar. Esto extraerá el archivo de copia en el directorio de destino y luego ejecutará la instalación encima.",
     "recovery_description": "Restaurar desde archivo de copia al directorio de datos especificado.",
@@ -179,14 +247,30 @@ MESSAGES = {
     "recovery_module_help": "Restaurar datos y volúmenes Docker desde el archivo de copia especificado al directorio objetivo.",
     "recovery_step_failed": "Paso de recuperación falló, abortando operación.",
     "recovery_success": "Recuperación exitosa! Datos restaurados a: {}",
+    "registry_status_available": "imagen disponible",
+    "registry_status_backoff": "omitido, próxima comprobación en {} min (último fallo: {})",
+    "registry_status_cached": "disponible (en caché)",
+    "registry_status_missing": "imagen no encontrada",
+    "registry_status_unknown": "accesible, imagen no confirmada ({})",
+    "registry_status_unreachable": "inaccesible ({})",
+    "report_json_description": "Usar con --backup / --recovery: escribir en un informe JSON el tiempo, los bytes, la relación de compresión y el rendimiento de cada fase (también en caso de fallo)",
+    "report_written": "Informe escrito en: {}",
     "restarting_all_services": "Reiniciando todos los contenedores de servicios",
     "restore_docker_volume_failed": "Error: fallo al restaurar el volumen Docker '{}': {}",
     "restoring_backup_to": "Restaurando copia a: {}",
     "restoring_data_to": "Restaurando datos a: {}",
     "restoring_docker_volume": "Restaurando volumen Docker '{}' a: {}",
     "restoring_docker_volume_via_container": "Restaurando volumen Docker '{}' (vía contenedor)",
+    "restoring_postgres_dump": "Restaurando el volumen '{0}' en el contenedor {1} con pg_restore ({2} tareas en paralelo)...",
+    "restoring_qdrant_collection": "Subiendo la instantánea de la colección '{}' ({})...",
     "restoring_via_container_complete": "Restauración del volumen Docker '{}' completada",
     "restoring_via_container_starting": "Restaurando volumen Docker '{}' vía contenedor...",
+    "retagging_mirror_image": "Reetiquetando la imagen como {}",
+    "retention_applying": "Política de retención: {}; {} copias encontradas, {} a eliminar",
+    "retention_removed_backup": "Copia eliminada {} (creada {})",
+    "selective_restore_no_volume_matched": "Advertencia: Ningún volumen Docker coincide con {}, no se restaurará ningún volumen.",
+    "selective_restore_selectors": "Restauración selectiva, solo se restaura: {}",
+    "selective_restore_stopped_early": "Se leyeron todos los archivos seleccionados, se omite el resto del archivo (no se comprobaron las sumas de verificación registradas al final; use --verify para una comprobación completa)",
     "service_access_info": "=== Información de acceso al servicio ===",
     "set_data_description": "Establecer o borrar el directorio de datos predeterminado.",
     "setting_directory_permissions": "Configurando permisos de directorio",
@@ -194,6 +278,10 @@ MESSAGES = {
     "starting_extraction": "Iniciando extracción y recuperación...",
     "starting_main_service": "Iniciando servicio principal",
     "starting_version_update": "Iniciando actualización de versión...",
+    "streaming_postgres_dump": "Transmitiendo pg_dump del volumen '{0}' desde el contenedor {1} al archivo: {2}",
+    "streaming_qdrant_snapshots": "Creando instantáneas de las colecciones del volumen '{0}' mediante {1} en el archivo: {2}",
+    "streaming_volume_complete": "Volumen Docker '{}' escrito en el archivo, {} entradas",
+    "streaming_volume_into_archive": "Transmitiendo el volumen Docker '{}' desde el contenedor auxiliar al archivo (archivado como: {}/)...",
     "sudo_elevation_success": "Elevación con sudo exitosa.",
     "sudo_failed_retry_exit": "Sudo falló. Reintentar(r/R/y/Y) o salir(n/N):",
     "switched_to_directory": "Cambiado al directorio: {}",
@@ -202,6 +290,7 @@ MESSAGES = {
     "target_version": "Versión objetivo: {}",
     "trying_mirror_pull": "Intentando tirar desde espejo: {} ({})",
     "unknown_system_permission": "Sistema desconocido, permiso no establecido: {0}",
+    "update_already_up_to_date": "Todas las imágenes ya están actualizadas, se omite la descarga",
     "update_cancelled": "Actualización cancelada.",
     "update_complete": "¡Actualización completa!",
     "update_description": "Realizar una actualización parcial en la instalación en la ruta especificada.",
@@ -213,6 +302,13 @@ MESSAGES = {
     "update_module_examples": "Ejemplos de uso:\n  python update.py\n    # Actualizar Nekro Agent en el directorio actual (recomendado)\n\n  python update.py /srv/nekro\n    # Actualizar Nekro Agent ubicado en /srv/nekro\n\n  python update.py --all\n    # Actualizar todos los servicios en el directorio por defecto (incluyendo bases de datos)\n\n  python update.py /srv/nekro --all\n    # Uso combinado: actualizar todos los servicios en el directorio especificado",
     "update_module_yes_help": "Confirmar automáticamente todas las indicaciones para ejecutar en modo no interactivo.",
     "update_module_channel_help": "Cambiar canal de imagen: 'latest' (estable) o 'preview' (beta)",
+    "update_services_changed": "Para actualizar: {}",
+    "update_status_changed": "{}: nueva versión disponible",
+    "update_status_container_outdated": "{} ({}): el contenedor aún usa una imagen anterior, se recreará",
+    "update_status_current": "{} ({}): actualizado",
+    "update_status_image_current": "{}: actualizado",
+    "update_status_missing": "{}: no existe localmente, se descargará",
+    "update_status_unknown": "{}: no se pudo consultar el digest remoto, se descargará",
     "updated_version": "Versión actualizada: {}",
     "error_channel_switch_failed": "Error al cambiar el canal",
     "channel_switch_complete": "Cambio de canal exitoso",
@@ -221,27 +317,64 @@ MESSAGES = {
     "upgrade_description": "Realizar una actualización completa (upgrade) en la instalación de la ruta especificada.",
     "use_napcat_service": "¿Usar también el servicio napcat? [Y/n] ",
     "using_docker_compose_cmd": "Usando '{}' como comando docker-compose.",
+    "verify_description": "Verificar la integridad de un archivo de copia de seguridad (una sola lectura en streaming, sin extraer al disco)",
+    "verify_error_checksum_mismatch": "Suma de verificación no coincide: {}",
+    "verify_error_decompression": "Falló la descompresión (marco dañado o truncado): {}",
+    "verify_error_member_missing": "Falta la entrada: {}",
+    "verify_error_nested_volume": "La copia del volumen {} está dañada: {}",
+    "verify_error_read": "Error al leer el archivo: {}",
+    "verify_error_trailing_data": "Datos no nulos después del marcador de fin de tar: un encabezado tar está dañado",
+    "verify_failed": "El archivo de copia de seguridad está dañado: {} ({} errores)",
+    "verify_nested_volume": "Verificando copia del volumen {}",
+    "verify_no_checksums": "La copia no tiene sumas de verificación registradas (copia antigua); solo se comprobaron los marcos de compresión y la estructura tar.",
+    "verify_stats": "Se comprobaron {} entradas, {} sin comprimir, tamaño del archivo {}, tardó {:.1f}s",
+    "verify_success": "El archivo de copia de seguridad está íntegro: {}",
+    "verify_throughput": "Rendimiento: {}/s sin comprimir, {}/s del archivo",
+    "verifying_backup": "Verificando archivo de copia de seguridad: {}",
     "version_description": "Mostrar información de versión.",
     "version_update_cancelled": "Operación cancelada",
     "version_update_complete": "¡Actualización de versión completada!",
     "view_logs_instruction": "Puede ver los registros del servicio con los siguientes comandos:",
+    "volume_backup_done": "[{}/{}] Volumen Docker '{}' respaldado en {:.1f}s",
+    "volume_backup_failed_progress": "[{}/{}] Falló el respaldo del volumen Docker '{}' tras {:.1f}s",
     "volume_backup_skipped": "La copia contiene el volumen '{}', pero no se proporcionó ruta de recuperación, se omitirá.",
+    "volume_backup_workers": "Respaldando {} volúmenes Docker en paralelo (hasta {} a la vez)...",
+    "volume_mode_description": "Usar con --backup para elegir cómo se respaldan los volúmenes: 'stream' envía la salida del contenedor auxiliar directamente al archivo, 'file' escribe primero un .tar.gz temporal (predeterminado {}).",
+    "volume_restore_col_size": "Datos",
+    "volume_restore_col_status": "Estado",
+    "volume_restore_col_time": "Tiempo",
+    "volume_restore_col_volume": "Volumen",
+    "volume_restore_status_failed": "FALLÓ",
+    "volume_restore_status_ok": "OK",
+    "volume_restore_summary": "Resultados de la restauración de volúmenes Docker:",
+    "volume_restore_workers": "Restaurando volúmenes Docker simultáneamente (hasta {} a la vez)...",
+    "volume_workers_description": "Usar con --backup / --recovery / --recover-install para limitar cuántos volúmenes Docker se respaldan o restauran simultáneamente (predeterminado {}).",
+    "waiting_for_postgres_container": "Esperando a que el contenedor Postgres que usa el volumen '{}' acepte conexiones...",
+    "waiting_for_qdrant_service": "Esperando a que el servicio Qdrant que usa el volumen '{}' esté accesible...",
     "warning_cannot_determine_data_dir": "No se puede determinar el directorio de datos principal desde el archivo de copia, o la copia solo contiene volúmenes Docker.",
     "warning_cannot_get_volume_info": "Advertencia: No se puede obtener información del volumen Docker '{}', se omitirá. Error: {}",
     "warning_cannot_get_volume_list": "Advertencia: No se puede obtener la lista de volúmenes Docker: {}",
     "warning_cannot_get_volume_mountpoint": "Advertencia: No se puede obtener el punto de montaje del volumen Docker '{}', se omitirá. Error: {}",
+    "warning_catalog_update_failed": "Advertencia: no se pudo actualizar el catálogo de copias {}: {}",
     "warning_chmod_777": "Advertencia: Estableciendo permisos de directorio de la aplicación a 777, esto puede no ser seguro.",
+    "warning_chunk_gc_busy": "El almacén de fragmentos {} está en uso por otra copia incremental; se omite la limpieza de fragmentos esta vez.",
+    "warning_chunk_gc_skipped": "Advertencia: no se pudo leer el manifiesto de instantánea {} ({}), se omite la limpieza de fragmentos.",
     "warning_compose_file_not_found": "Archivo docker-compose.yml no encontrado en el directorio '{}'.",
+    "warning_compose_images_unresolved": "Advertencia: no se pudieron resolver las imágenes del archivo compose, se usará compose pull",
     "warning_data_dir_not_empty": "El directorio de datos objetivo '{}' no está vacío. La operación de recuperación puede sobrescribir archivos existentes.",
     "warning_docker_not_found_skip_backup": "Advertencia: Comando 'docker' no encontrado, se omitirá la copia de volúmenes Docker.",
     "warning_docker_not_found_skip_recovery": "Advertencia: Comando 'docker' no encontrado, se omitirá la restauración de volúmenes Docker.",
     "warning_docker_volume_invalid_path": "Advertencia: La ruta '{}' del volumen Docker '{}' es inválida o no es un directorio, se omitirá.",
     "warning_docker_volumes_will_overwrite": "Se restaurarán los siguientes volúmenes Docker, lo que sobrescribirá el contenido existente en los volúmenes:",
+    "warning_file_unreadable": "Advertencia: no se puede leer {}, no se escribió en el archivo ({})",
+    "warning_file_vanished": "Advertencia: {} se eliminó durante la copia de seguridad y no está en el archivo",
     "warning_prefix": "Advertencia:",
+    "warning_report_write_failed": "Advertencia: no se pudo escribir el informe {}: {}",
+    "warning_retag_failed": "Advertencia: no se pudo reetiquetar la imagen {} como {}: {}",
+    "warning_retention_remove_failed": "Advertencia: no se pudo eliminar la copia {}: {}",
     "warning_skip_data_restore": "Solo se restaurará el directorio de datos, se omitirá la recuperación de volúmenes Docker.",
     "will_restore_docker_volume_to_path": "Se restaurará el volumen Docker '{}' a la ruta: {}",
     "will_restore_docker_volume_via_container": "Se restaurará el volumen Docker '{}' vía método de contenedor",
     "with_napcat_description": "Usar con --install o --recover-install para desplegar el servicio NapCat.",
     "yes_description": "Confirmar automáticamente todas las indicaciones para ejecutar en modo no interactivo.",
-    "zstd_not_detected_tar_only": "zstd no detectado, creando solo archivo .tar"
 }
\ No newline at end of file
@@ -7,6 +7,7 @@ MESSAGES = {
     "adding_docker_volume_backup": "Ajout de la sauvegarde du volume Docker : {} (archivé sous : {})",
     "adding_to_archive": "Ajout : {} (archivé sous : {})",
     "admin_account": "Compte administrateur : admin | Mot de passe : {}",
+    "all_cpu_cores": "tous les cœurs",
     "all_description": "Mettre à jour tous les services, pas seulement Nekro Agent",
     "all_mirrors_failed_try_official": "Tous les miroirs ont échoué, tentative avec le registre officiel : {}",
     "allow_port": "Autoriser le port {}",
@@ -14,11 +15,15 @@ MESSAGES = {
     "app_data_directory": "Répertoire des données de l'application (NEKRO_DATA_DIR) : {}",
     "app_description": "Outil de gestion unifiée pour l'installation, la mise à jour et la sauvegarde de Nekro Agent.",
     "app_examples": "Exemples d'utilisation :\n  {} -i ./na_data\n    # Installer Nekro Agent dans le répertoire ./na_data\n\n  {} -u ./na_data\n    # Effectuer une mise à jour partielle dans le répertoire spécifié\n\n  {} -ua ./na_data\n    # Effectuer une mise à jour complète (upgrade) dans le répertoire spécifié\n\n  {} -b ./na_data ./backups\n    # Sauvegarder le répertoire na_data dans le dossier backups\n\n  {} -r ./backups/na_backup_123.tar.zstd ./na_data_new\n    # Restaurer à partir du fichier de sauvegarde dans le répertoire na_data_new\n\n  {} -ri ./backup.tar.zst ./restored_install\n    # Restaurer les données à partir de la sauvegarde et exécuter l'installation par-dessus",
+    "applying_pending_postgres_restore": "Importation de la sauvegarde logique Postgres enregistrée du volume '{}'...",
+    "applying_pending_qdrant_restore": "Importation des instantanés Qdrant enregistrés du volume '{}'...",
+    "applying_retention_policy": "Application de la politique de rétention des sauvegardes...",
     "archiving_current_directory": "Archivage du répertoire actuel '.' sous '{}'",
     "backup_description": "Sauvegarder le répertoire de données dans le dossier spécifié.",
     "backup_docker_volume_complete": "Sauvegarde du volume Docker '{}' terminée : {}",
     "backup_docker_volume_exception": "Une exception s'est produite lors de la sauvegarde du volume Docker '{}' : {}",
     "backup_docker_volume_failed": "Échec de la sauvegarde du volume Docker '{}' : {}",
+    "backup_failed": "La sauvegarde a échoué.",
     "backup_file_created": "Fichier de sauvegarde créé : {}",
     "backup_file_not_created": "Le fichier de sauvegarde {} n'a pas été créé avec succès ou est vide",
     "backup_module_description": "Outil de sauvegarde et de restauration Nekro Agent.",
@@ -31,12 +36,19 @@ MESSAGES = {
     "channel_already_set": "Le canal d'image est déjà défini sur '{}', aucun changement nécessaire.",
     "channel_switched": "Canal d'image changé de '{}' à '{}'.",
     "checking_generating_credentials": "Vérification et génération des informations d'identification nécessaires...",
+    "checking_image_updates": "Recherche de mises à jour des images...",
     "checking_install_file": "Vérifié {} (aucune mise à jour des informations de version nécessaire actuellement)",
+    "chunk_gc_stats": "{} blocs non référencés supprimés du dépôt, {} octets libérés",
     "clear_cancelled": "Opération d'effacement annulée.",
     "clear_default_data_dir_prompt": "Entrez 'clear' pour effacer le paramètre du répertoire de données par défaut : ",
     "cloud_server_note": "1. Si vous utilisez un serveur cloud, veuillez autoriser les ports correspondants dans la console du groupe de sécurité de votre fournisseur cloud.",
+    "codec_description": "À utiliser avec --backup pour choisir le codec de compression (auto choisit le premier disponible parmi zstd, xz, gzip ; par défaut {}).",
     "command_failed_retry_sudo_exit": "Commande échouée. Réessayer(r/R), élever(y/Y), ou quitter(n/N) :",
     "compose_file_found": "Fichier docker-compose.yml trouvé dans le répertoire actuel : {}",
+    "compress_level_description": "À utiliser avec --backup pour définir le niveau de compression (1-22, plafonné au maximum du codec, par défaut {}).",
+    "compress_threads_description": "À utiliser avec --backup pour définir le nombre de threads de compression (0 utilise tous les cœurs, par défaut {}).",
+    "compressing_with_codec": "Compression avec {} ({}) vers : {}...",
+    "compression_settings": "Paramètres de compression : niveau {}, threads {}",
     "configuring_firewall": "Configuration des règles du pare-feu...",
     "configuring_firewall_ufw": "Configuration du pare-feu (ufw)...",
     "confirm_continue": "Continuer ? (y/N) : ",
@@ -46,7 +58,13 @@ MESSAGES = {
     "confirm_version_update": "Confirmer la mise à jour de la version ? (y/N) : ",
     "copy_success": "Copie réussie.",
     "created_dev_compose_file": "Fichier Compose de développement créé : {}",
+    "creating_incremental_snapshot": "Création d'un instantané incrémental dans le dépôt de blocs : {}...",
     "dev_compose_image_replaced": "Balise d'image remplacée de latest en preview",
+    "docker_volume_not_found": "le volume n'existe pas",
+    "error_archive_integrity": "Échec de la vérification d'intégrité de l'archive ({} erreurs) ; restauration annulée, le répertoire cible n'a pas été modifié",
+    "error_backup_dir_not_exist": "Le répertoire de sauvegarde '{}' n'existe pas ou n'est pas un répertoire.",
+    "error_codec_required_for_recovery": "Erreur : la restauration de cette sauvegarde nécessite le décodeur '{}' (la commande zstd ou le module Python zstandard).",
+    "error_codec_unavailable": "Erreur : le codec de compression '{}' n'est pas disponible dans cet environnement.",
     "error_create_dev_compose": "Échec de la création du fichier Compose de développement : {}",
     "creating_archive": "Début de la création du fichier d'archive...",
     "creating_docker_volume": "Création du volume Docker '{}'...",
@@ -59,7 +77,6 @@ MESSAGES = {
     "dependencies_check_passed": "Vérification des dépendances réussie.",
     "deployment_complete": "=== Déploiement terminé ! ===",
     "detected_docker_host_correcting": "DOCKER_HOST='{}' détecté, correction automatique vers 'unix://{}'",
-    "detected_zstd_compressing": "zstd détecté, compression vers : {}...",
     "discovered_docker_volumes": "{} volumes Docker correspondants découverts dynamiquement",
     "docker_volume_created": "Volume Docker '{}' créé avec succès",
     "docker_volume_exists": "Le volume Docker '{}' existe déjà",
@@ -95,16 +112,24 @@ MESSAGES = {
     "error_docker_volume_discovery_exception": "Erreur : exception lors de la découverte des volumes Docker : {}",
     "error_env_file_not_exist": "Le fichier .env n'existe pas, veuillez vérifier si Nekro Agent est correctement installé.",
     "error_invalid_channel": "Canal invalide: {}. Veuillez utiliser 'latest' ou 'preview'.",
+    "error_invalid_compress_level": "Erreur : le niveau de compression doit être compris entre 1 et 22, reçu {}.",
+    "error_invalid_compress_threads": "Erreur : le nombre de threads de compression ne peut pas être négatif, reçu {}.",
+    "error_invalid_restore_selector": "Erreur : sélecteur de restauration invalide '{}', attendu data, data:<motif> ou volume:<nom>.",
+    "error_invalid_retention_count": "Erreur : --keep-last / --keep-daily / --keep-weekly / --keep-monthly ne peuvent pas être négatifs.",
+    "error_invalid_size": "Erreur : taille invalide '{}', un nombre avec une unité facultative K/M/G/T est attendu (ex. 500M).",
+    "error_invalid_volume_workers": "Erreur : le nombre de workers de volumes doit être supérieur à 0, reçu {}.",
     "error_nekro_agent_image_not_found": "Image Nekro Agent non trouvée dans docker-compose.yml.",
+    "error_pull_image": "Échec du téléchargement de l'image {} : {}",
     "error_read_compose_file": "Échec de la lecture de docker-compose.yml: {}",
+    "error_snapshot_chunk_corrupted": "Le bloc {} référencé par l'instantané est manquant ou corrompu",
     "error_switch_channel": "Échec du changement de canal d'image: {}",
-    "error_invalid_backup_format": "Format de sauvegarde invalide. Seuls '.tar' et '.tar.zstd' sont pris en charge.",
+    "error_invalid_backup_format": "Format de fichier de sauvegarde invalide. Seuls '.tar', '.tar.zstd', '.tar.xz', '.tar.gz' et les instantanés incrémentaux '.snapshot.json' sont pris en charge.",
     "error_prefix": "Erreur :",
     "error_pull_helper_image": "Erreur : échec du pull de l'image helper de sauvegarde '{}' : {}",
     "error_sudo_failed": "Erreur : sudo a échoué pour la commande : {}",
     "error_sudo_not_found": "Commande 'sudo' introuvable. Veuillez vous assurer d'avoir les privilèges administrateur.",
     "error_unsupported_file_format": "Erreur : format de fichier non pris en charge : {}",
-    "error_zstd_required_for_recovery": "Erreur : la récupération nécessite la commande 'zstd'.",
+    "error_volume_backup_incomplete": "La sauvegarde des volumes suivants a échoué après l'écriture d'une partie de leurs données dans l'archive ; l'archive est incomplète et cette sauvegarde a été abandonnée : {}",
     "excluding_env_template": "Exclusion du modèle de configuration : {}",
     "excluding_from_archive": "Exclusion : {}",
     "excluding_logs_directory": "Exclusion du répertoire des logs : {}",
@@ -128,6 +153,8 @@ MESSAGES = {
     "helper_image_not_found_try_pull": "Image helper pour la sauvegarde '{}' introuvable, tentative de pull...",
     "important_config_info": "=== Informations de configuration importantes ===",
     "important_notes": "=== Notes importantes ===",
+    "incremental_description": "À utiliser avec --backup pour créer une sauvegarde incrémentale : les données sont découpées en blocs adressés par contenu dans un dépôt situé dans le répertoire de sauvegarde, et seuls les nouveaux blocs sont écrits.",
+    "incremental_snapshot_stats": "L'instantané référence {} blocs ({} nouveaux), {} octets de données, {} octets nouvellement stockés",
     "install_description": "Installer Nekro Agent dans le chemin spécifié.",
     "install_module_data_dir_help": "Répertoire de données de l'application Nekro Agent.\nPar défaut le dossier \"na_data/\" dans le répertoire du script.",
     "install_module_description": "Script d'installation et de gestion de Nekro Agent",
@@ -139,6 +166,24 @@ MESSAGES = {
     "installation_complete": "Installation terminée ! Profitez-en !",
     "insufficient_permissions_try_sudo": "L'utilisateur actuel n'a peut-être pas les permissions suffisantes, essayez sudo pour élever les privilèges...",
     "invalid_input_retry": "Entrée invalide, veuillez choisir à nouveau.",
+    "keep_daily_description": "À utiliser avec --backup : conserver la sauvegarde la plus récente de chacun des N derniers jours",
+    "keep_last_description": "À utiliser avec --backup : après une sauvegarde réussie, conserver les N sauvegardes les plus récentes",
+    "keep_monthly_description": "À utiliser avec --backup : conserver la sauvegarde la plus récente de chacun des N derniers mois",
+    "keep_weekly_description": "À utiliser avec --backup : conserver la sauvegarde la plus récente de chacune des N dernières semaines",
+    "list_backup_header": "Fichier de sauvegarde : {}",
+    "list_backups_description": "Lister toutes les sauvegardes d'un répertoire de sauvegarde (lit le catalogue, n'ouvre pas les archives)",
+    "list_backups_empty": "Aucune sauvegarde trouvée dans {}.",
+    "list_backups_header": "Sauvegardes dans {} (les plus récentes d'abord) :",
+    "list_backups_total": "{} sauvegardes, {} au total",
+    "list_compression": "Compression : {}",
+    "list_created_at": "Créé : {}",
+    "list_data_root": "Répertoire de données : {}",
+    "list_description": "Lister le contenu d'un fichier de sauvegarde (lit le manifeste au début de l'archive)",
+    "list_docker_volumes": "Volumes Docker :",
+    "list_file_summary": "Fichiers : {}, taille totale : {}",
+    "list_no_manifest_scanning": "Le fichier {} n'a pas de manifeste (ancienne sauvegarde), analyse de toute l'archive...",
+    "list_toolkit_version": "Version de l'outil : {}",
+    "max_total_size_description": "À utiliser avec --backup : taille totale maximale des sauvegardes conservées (ex. 500M, 20G) ; les plus anciennes sont supprimées en premier",
     "mirror_pull_failed": "Échec du pull depuis le miroir : {} ({})",
     "mirror_pull_success": "Pull réussi depuis le miroir : {} ({}), image : {}",
     "multiple_root_directories_warning": "Attention : la sauvegarde contient plusieurs répertoires racine possibles : {}. Impossible de déterminer automatiquement le répertoire de données principal.",
@@ -158,16 +203,39 @@ MESSAGES = {
     "official_pull_success": "Pull réussi depuis le registre officiel : {} ({})",
     "onebot_access_token": "Jeton d'accès OneBot : {}",
     "onebot_websocket_address": "URL de connexion OneBot WebSocket : ws://127.0.0.1:{}/onebot/v11/ws",
+    "only_description": "À utiliser avec --recovery / --recover-install pour ne restaurer que le contenu sélectionné ; répétable : data (tout le répertoire de données), data:<motif> (chemins dans le répertoire de données, ex. data:configs/*), volume:<nom> (jokers autorisés).",
     "operation_cancelled": "Opération annulée.",
+    "pending_restores_discarded": "Suppression des données non importées laissées par une restauration précédente : {}",
+    "postgres_container_not_ready": "Le conteneur Postgres utilisant le volume '{}' n'est pas prêt après {}s ; la sauvegarde logique est conservée dans {}",
+    "postgres_dump_complete": "pg_dump du volume '{}' terminé : {}, {} parties",
+    "postgres_dump_container_found": "Le volume '{}' est utilisé par le conteneur Postgres en cours d'exécution {}, sauvegarde avec pg_dump",
+    "postgres_dump_failed": "Échec du pg_dump du volume '{}' : {}",
+    "postgres_dump_incomplete": "La sauvegarde logique du volume '{}' est incomplète (pg_dump ne s'est pas terminé lors de la sauvegarde ou les données ne correspondent pas à l'enregistrement de fin) ; pg_restore a été ignoré et la base de données n'a pas été modifiée",
+    "postgres_restore_complete": "pg_restore du volume '{}' terminé",
+    "postgres_restore_failed": "Échec de la restauration de la sauvegarde logique du volume '{}' : {}",
+    "postgres_restore_pending": "Aucun conteneur Postgres en cours d'exécution n'utilise le volume '{0}' ; la sauvegarde logique a été enregistrée dans {1}. Elle est importée automatiquement après l'installation et le démarrage du service par -ri, ou démarrez le service et relancez la restauration avec --only volume:{0}",
     "preparing_recovery_from_backup": "Préparation de la récupération depuis le fichier de sauvegarde : {}",
+    "probing_registries": "Mesure du registre officiel et des miroirs : {} ({})",
+    "progress_backup": "Sauvegarde",
+    "progress_description": "À utiliser avec --backup / --recovery : mode d'affichage de la progression (auto affiche une barre dans un terminal et rien sinon ; utilisez json pour des lignes JSON périodiques ; par défaut {})",
+    "progress_restore": "Restauration",
     "pulling_all_services": "Pull des dernières images pour tous les services",
     "pulling_helper_image": "Pull de l'image helper de sauvegarde...",
     "pulling_image_mirrors": "Pull de l'image depuis les miroirs : {} ({})",
     "pulling_image_official": "Pull de l'image depuis le registre officiel : {} ({})",
+    "pulling_images_concurrently": "Téléchargement de {} image(s), jusqu'à {} à la fois : {}",
     "pulling_latest_nekro_agent": "Pull de la dernière image nekro_agent",
     "pulling_latest_sandbox": "Pull de la dernière image kromiose/nekro-agent-sandbox",
     "pulling_sandbox_image": "Pull de l'image sandbox",
     "pulling_service_images": "Pull des images de services",
+    "qdrant_restore_complete": "Tous les instantanés de collections du volume '{}' ont été restaurés",
+    "qdrant_restore_failed": "Échec de la restauration de l'instantané Qdrant '{}' : {}",
+    "qdrant_restore_pending": "Aucun service Qdrant accessible n'utilise le volume '{0}' ; les instantanés ont été enregistrés dans {1}. Ils sont importés automatiquement après l'installation et le démarrage du service par -ri, ou démarrez le service et relancez la restauration avec --only volume:{0}",
+    "qdrant_service_found": "Le volume '{}' est utilisé par le service Qdrant en cours d'exécution {}, sauvegarde par instantanés de collections",
+    "qdrant_service_not_ready": "Le service Qdrant utilisant le volume '{}' n'était pas accessible après {}s ; les instantanés sont conservés dans {}",
+    "qdrant_snapshot_collection_done": "Instantané de la collection '{}' écrit dans l'archive : {}",
+    "qdrant_snapshot_complete": "Sauvegarde par instantanés du volume '{}' terminée : {} collections, {}",
+    "qdrant_snapshot_failed": "Échec de la sauvegarde par instantané Qdrant de '{}' : {}",
     "rebuilding_nekro_agent": "Reconstruction et démarrage du conteneur nekro_agent",
     "recover_install_description": "Récupérer et installer. Cela extraira le fichier de sauvegarde dans le répertoire cible, puis exécutera l'installation par-dessus.",
     "recovery_description": "Restaurer depuis le fichier de sauvegarde vers le répertoire de données spécifié.",
@@ -179,14 +247,30 @@ MESSAGES = {
     "recovery_module_help": "Restaurer les données et les volumes Docker depuis le fichier de sauvegarde spécifié vers le répertoire cible.",
     "recovery_step_failed": "Étape de récupération échouée, interruption de l'opération.",
     "recovery_success": "Récupération réussie ! Données restaurées vers : {}",
+    "registry_status_available": "image disponible",
+    "registry_status_backoff": "ignoré, prochaine vérification dans {} min (dernier échec : {})",
+    "registry_status_cached": "disponible (en cache)",
+    "registry_status_missing": "image introuvable",
+    "registry_status_unknown": "accessible, image non confirmée ({})",
+    "registry_status_unreachable": "inaccessible ({})",
+    "report_json_description": "À utiliser avec --backup / --recovery : écrire dans un rapport JSON la durée, les octets, le taux de compression et le débit de chaque phase (également en cas d'échec)",
+    "report_written": "Rapport écrit dans : {}",
     "restarting_all_services": "Redémarrage de tous les conteneurs de services",
     "restore_docker_volume_failed": "Erreur : échec de la restauration du volume Docker '{}' : {}",
     "restoring_backup_to": "Restauration de la sauvegarde vers : {}",
     "restoring_data_to": "Restauration des données vers : {}",
     "restoring_docker_volume": "Restauration du volume Docker '{}' vers : {}",
     "restoring_docker_volume_via_container": "Restauration du volume Docker '{}' (via conteneur)",
+    "restoring_postgres_dump": "Restauration du volume '{0}' dans le conteneur {1} avec pg_restore ({2} tâches parallèles)...",
+    "restoring_qdrant_collection": "Téléversement de l'instantané de la collection '{}' ({})...",
     "restoring_via_container_complete": "Restauration du volume Docker '{}' terminée",
     "restoring_via_container_starting": "Restauration du volume Docker '{}' via conteneur...",
+    "retagging_mirror_image": "Réétiquetage de l'image en {}",
+    "retention_applying": "Politique de rétention : {} ; {} sauvegardes trouvées, {} à supprimer",
+    "retention_removed_backup": "Sauvegarde supprimée {} (créée le {})",
+    "selective_restore_no_volume_matched": "Avertissement : aucun volume Docker ne correspond à {}, aucun volume ne sera restauré.",
+    "selective_restore_selectors": "Restauration sélective, uniquement : {}",
+    "selective_restore_stopped_early": "Tous les fichiers sélectionnés ont été lus, le reste de l'archive est ignoré (les sommes de contrôle enregistrées à la fin n'ont pas été vérifiées ; utilisez --verify pour une vérification complète)",
     "service_access_info": "=== Informations d'accès au service ===",
     "set_data_description": "Définir ou effacer le répertoire de données par défaut.",
     "setting_directory_permissions": "Configuration des permissions du répertoire",
@@ -194,6 +278,10 @@ MESSAGES = {
     "starting_extraction": "Démarrage de l'extraction et de la récupération...",
     "starting_main_service": "Démarrage du service principal",
     "starting_version_update": "Démarrage de la mise à jour de version...",
+    "streaming_postgres_dump": "Écriture du pg_dump du volume '{0}' depuis le conteneur {1} dans l'archive : {2}",
+    "streaming_qdrant_snapshots": "Instantanés des collections du volume '{0}' via {1} dans l'archive : {2}",
+    "streaming_volume_complete": "Volume Docker '{}' écrit dans l'archive, {} entrées",
+    "streaming_volume_into_archive": "Diffusion du volume Docker '{}' depuis le conteneur auxiliaire vers l'archive (archivé sous : {}/)...",
     "sudo_elevation_success": "Élévation sudo réussie.",
     "sudo_failed_retry_exit": "Sudo échoué. Réessayer(r/R/y/Y) ou quitter(n/N) :",
     "switched_to_directory": "Changement de répertoire : {}",
@@ -202,6 +290,7 @@ MESSAGES = {
     "target_version": "Version cible : {}",
     "trying_mirror_pull": "Tentative de pull depuis miroir : {} ({})",
     "unknown_system_permission": "Système inconnu, permission non définie : {0}",
+    "update_already_up_to_date": "Toutes les images sont déjà à jour, téléchargement ignoré",
     "update_cancelled": "Mise à jour annulée.",
     "update_complete": "Mise à jour terminée !",
     "update_description": "Effectuer une mise à jour partielle sur l'installation au chemin spécifié.",
@@ -213,6 +302,13 @@ MESSAGES = {
     "update_module_examples": "Exemples d'utilisation :\n  python update.py\n    # Mettre à jour Nekro Agent dans le répertoire courant (recommandé)\n\n  python update.py /srv/nekro\n    # Mettre à jour Nekro Agent situé dans /srv/nekro\n\n  python update.py --all\n    # Mettre à jour tous les services dans le répertoire par défaut (y compris les bases de données)\n\n  python update.py /srv/nekro --all\n    # Utilisation combinée : mettre à jour tous les services dans le répertoire spécifié",
     "update_module_yes_help": "Confirmer automatiquement toutes les invites pour exécuter en mode non interactif.",
     "update_module_channel_help": "Changer de canal d'image : 'latest' (stable) ou 'preview' (beta)",
+    "update_services_changed": "À mettre à jour : {}",
+    "update_status_changed": "{} : nouvelle version disponible",
+    "update_status_container_outdated": "{} ({}) : le conteneur utilise encore une ancienne image, il sera recréé",
+    "update_status_current": "{} ({}) : à jour",
+    "update_status_image_current": "{} : à jour",
+    "update_status_missing": "{} : absente localement, sera téléchargée",
+    "update_status_unknown": "{} : impossible d'obtenir le digest distant, sera téléchargée",
     "updated_version": "Version mise à jour : {}",
     "error_channel_switch_failed": "Échec du changement de canal",
     "channel_switch_complete": "Changement de canal réussi",
@@ -221,27 +317,64 @@ MESSAGES = {
     "upgrade_description": "Effectuer une mise à jour complète (upgrade) sur l'installation au chemin spécifié.",
     "use_napcat_service": "Utiliser également le service napcat ? [Y/n] ",
     "using_docker_compose_cmd": "Utilisation de '{}' comme commande docker-compose.",
+    "verify_description": "Vérifier l'intégrité d'un fichier de sauvegarde (une seule lecture en flux, rien n'est extrait sur le disque)",
+    "verify_error_checksum_mismatch": "Somme de contrôle incorrecte : {}",
+    "verify_error_decompression": "Échec de la décompression (trame corrompue ou tronquée) : {}",
+    "verify_error_member_missing": "Entrée manquante : {}",
+    "verify_error_nested_volume": "La sauvegarde de volume {} est corrompue : {}",
+    "verify_error_read": "Échec de la lecture de l'archive : {}",
+    "verify_error_trailing_data": "Données non nulles après le marqueur de fin tar : un en-tête tar est corrompu",
+    "verify_failed": "Le fichier de sauvegarde est corrompu : {} ({} erreurs)",
+    "verify_nested_volume": "Vérification de la sauvegarde de volume {}",
+    "verify_no_checksums": "La sauvegarde ne contient pas de sommes de contrôle (ancienne sauvegarde) ; seules les trames de compression et la structure tar ont été vérifiées.",
+    "verify_stats": "{} entrées vérifiées, {} non compressés, taille de l'archive {}, durée {:.1f}s",
+    "verify_success": "Le fichier de sauvegarde est intact : {}",
+    "verify_throughput": "Débit : {}/s non compressé, {}/s archive",
+    "verifying_backup": "Vérification du fichier de sauvegarde : {}",
     "version_description": "Afficher les informations de version.",
     "version_update_cancelled": "Opération annulée",
     "version_update_complete": "Mise à jour de version terminée !",
     "view_logs_instruction": "Vous pouvez consulter les logs des services avec les commandes suivantes :",
+    "volume_backup_done": "[{}/{}] Volume Docker '{}' sauvegardé en {:.1f}s",
+    "volume_backup_failed_progress": "[{}/{}] Échec de la sauvegarde du volume Docker '{}' après {:.1f}s",
     "volume_backup_skipped": "La sauvegarde contiene el volumen '{}' (este mensaje en ES — traducir si corresponde)",
+    "volume_backup_workers": "Sauvegarde simultanée de {} volumes Docker (jusqu'à {} à la fois)...",
+    "volume_mode_description": "À utiliser avec --backup pour choisir le mode de sauvegarde des volumes : 'stream' envoie la sortie du conteneur auxiliaire directement dans l'archive, 'file' écrit d'abord un .tar.gz temporaire (par défaut {}).",
+    "volume_restore_col_size": "Données",
+    "volume_restore_col_status": "Statut",
+    "volume_restore_col_time": "Durée",
+    "volume_restore_col_volume": "Volume",
+    "volume_restore_status_failed": "ÉCHEC",
+    "volume_restore_status_ok": "OK",
+    "volume_restore_summary": "Résultats de la restauration des volumes Docker :",
+    "volume_restore_workers": "Restauration simultanée des volumes Docker (jusqu'à {} à la fois)...",
+    "volume_workers_description": "À utiliser avec --backup / --recovery / --recover-install pour limiter le nombre de volumes Docker sauvegardés ou restaurés simultanément (par défaut {}).",
+    "waiting_for_postgres_container": "Attente que le conteneur Postgres utilisant le volume '{}' accepte les connexions...",
+    "waiting_for_qdrant_service": "Attente que le service Qdrant utilisant le volume '{}' soit accessible...",
     "warning_cannot_determine_data_dir": "Impossible de déterminer le répertoire de données principal à partir du fichier de sauvegarde, ou la sauvegarde contient uniquement des volumes Docker.",
     "warning_cannot_get_volume_info": "Attention : impossible d'obtenir les informations du volume Docker '{}' , sera ignoré. Erreur : {}",
     "warning_cannot_get_volume_list": "Attention : impossible d'obtenir la liste des volumes Docker : {}",
     "warning_cannot_get_volume_mountpoint": "Attention : impossible d'obtenir le point de montage du volume Docker '{}' , sera ignoré. Erreur : {}",
+    "warning_catalog_update_failed": "Avertissement : impossible de mettre à jour le catalogue des sauvegardes {} : {}",
     "warning_chmod_777": "Attention : paramètres des permissions du répertoire de l'application à 777, cela peut ne pas être sûr.",
+    "warning_chunk_gc_busy": "Le dépôt de blocs {} est utilisé par une autre sauvegarde incrémentale ; nettoyage des blocs ignoré cette fois.",
+    "warning_chunk_gc_skipped": "Avertissement : impossible de lire le manifeste d'instantané {} ({}), nettoyage des blocs ignoré.",
     "warning_compose_file_not_found": "Fichier docker-compose.yml introuvable dans le répertoire '{}'.",
+    "warning_compose_images_unresolved": "Avertissement : impossible de résoudre les images du fichier compose, utilisation de compose pull",
     "warning_data_dir_not_empty": "Le répertoire de données cible '{}' n'est pas vide. L'opération de récupération peut écraser des fichiers existants.",
     "warning_docker_not_found_skip_backup": "Attention : commande 'docker' introuvable, la sauvegarde des volumes Docker sera ignorée.",
     "warning_docker_not_found_skip_recovery": "Attention : commande 'docker' introuvable, la restauration des volumes Docker sera ignorée.",
     "warning_docker_volume_invalid_path": "Attention : le chemin '{}' du volume Docker '{}' est invalide ou n'est pas un répertoire, sera ignoré.",
     "warning_docker_volumes_will_overwrite": "Les volumes Docker suivants seront restaurés, ce qui écrasera le contenu existant :",
+    "warning_file_unreadable": "Avertissement : impossible de lire {}, non écrit dans l'archive ({})",
+    "warning_file_vanished": "Avertissement : {} a été supprimé pendant la sauvegarde et n'est pas dans l'archive",
     "warning_prefix": "Attention :",
+    "warning_report_write_failed": "Avertissement : impossible d'écrire le rapport {} : {}",
+    "warning_retag_failed": "Avertissement : impossible de réétiqueter l'image {} en {} : {}",
+    "warning_retention_remove_failed": "Avertissement : impossible de supprimer la sauvegarde {} : {}",
     "warning_skip_data_restore": "Seul le répertoire de données sera restauré, la restauration des volumes Docker sera ignorée.",
     "will_restore_docker_volume_to_path": "Restaurer le volume Docker '{}' vers le chemin : {}",
     "will_restore_docker_volume_via_container": "Restaurer le volume Docker '{}' via la méthode conteneur",
     "with_napcat_description": "À utiliser avec --install ou --recover-install pour déployer le service NapCat.",
     "yes_description": "Confirmer automatiquement toutes les invites pour exécuter en mode non interactif.",
-    "zstd_not_detected_tar_only": "zstd non détecté, création uniquement de l'archive .tar"
 }
\ No newline at end of file
@@ -7,6 +7,7 @@ MESSAGES = {
     "adding_docker_volume_backup": "Docker ボリュームのバックアップを追加中: {} (アーカイブ名: {})",
     "adding_to_archive": "追加中: {} (アーカイブ名: {})",
     "admin_account": "管理者アカウント: admin | パスワード: {}",
+    "all_cpu_cores": "全コア",
     "all_description": "Nekro Agent だけでなく、すべてのサービスを更新",
     "all_mirrors_failed_try_official": "すべてのミラーが失敗しました。公式レジストリを試行中: {}",
     "allow_port": "ポート {} を許可",
@@ -14,11 +15,15 @@ MESSAGES = {
     "app_data_directory": "アプリケーションデータディレクトリ (NEKRO_DATA_DIR): {}",
     "app_description": "Nekro Agent のインストール、更新、バックアップを統合管理するツール。",
     "app_examples": "使用例:\n  {} -i ./na_data\n    # ./na_data ディレクトリに Nekro Agent をインストール\n\n  {} -u ./na_data\n    # 指定されたディレクトリで部分更新を実行\n\n  {} -ua ./na_data\n    # 指定されたディレクトリで完全更新（アップグレード）を実行\n\n  {} -b ./na_data ./backups\n    # na_data ディレクトリを backups フォルダにバックアップ\n\n  {} -r ./backups/na_backup_123.tar.zstd ./na_data_new\n    # バックアップファイルから na_data_new ディレクトリに復元\n\n  {} -ri ./backup.tar.zst ./restored_install\n    # バックアップからデータを復元し、その上にインストールを実行",
+    "applying_pending_postgres_restore": "ボリューム '{}' の保存済み Postgres 論理バックアップを取り込み中...",
+    "applying_pending_qdrant_restore": "ボリューム '{}' の保存済み Qdrant コレクションスナップショットを取り込み中...",
+    "applying_retention_policy": "バックアップ保持ポリシーを適用しています...",
     "archiving_current_directory": "現在のディレクトリ '.' を '{}' としてアーカイブ中",
     "backup_description": "データディレクトリを指定されたフォルダにバックアップします。",
     "backup_docker_volume_complete": "Docker ボリューム '{}' のバックアップが完了しました: {}",
     "backup_docker_volume_exception": "Docker ボリューム '{}' のバックアップ中に例外が発生しました: {}",
     "backup_docker_volume_failed": "Docker ボリューム '{}' のバックアップに失敗しました: {}",
+    "backup_failed": "バックアップに失敗しました。",
     "backup_file_created": "バックアップファイルが作成されました: {}",
     "backup_file_not_created": "バックアップファイル {} が正常に作成されなかったか、空です",
     "backup_module_description": "Nekro Agent のバックアップおよび復元ツール。",
@@ -31,12 +36,19 @@ MESSAGES = {
     "channel_already_set": "画像 channel はすでに '{}' に設定されています。",
     "channel_switched": "画像 channel を '{}' から '{}' に切り替えました。",
     "checking_generating_credentials": "必要なアクセス認証情報を確認および生成中...",
+    "checking_image_updates": "イメージの更新を確認中...",
     "checking_install_file": "{} を確認しました（現在、バージョン情報の更新は不要です）",
+    "chunk_gc_stats": "チャンクストアから参照されていないチャンク {} 個を削除し、{} バイトを解放しました",
     "clear_cancelled": "クリア操作がキャンセルされました。",
     "clear_default_data_dir_prompt": "デフォルトのデータディレクトリ設定をクリアするには 'clear' を入力してください: ",
     "cloud_server_note": "1. クラウドサーバーを使用している場合は、クラウドプロバイダーのセキュリティグループコンソールで対応するポートを許可してください。",
+    "codec_description": "--backup と併用して圧縮コーデックを選択します（auto は zstd、xz、gzip の順に利用可能なものを選択、デフォルト {}）。",
     "command_failed_retry_sudo_exit": "コマンドが失敗しました。再試行(r/R)、昇格(y/Y)、または終了(n/N):",
     "compose_file_found": "現在のディレクトリに docker-compose.yml ファイルが見つかりました: {}",
+    "compress_level_description": "--backup と併用して圧縮レベルを設定します（1-22、コーデックの上限を超える場合は上限に丸め、デフォルト {}）。",
+    "compress_threads_description": "--backup と併用して圧縮スレッド数を設定します（0 はすべての CPU コアを使用、デフォルト {}）。",
+    "compressing_with_codec": "{}（{}）で圧縮中: {}...",
+    "compression_settings": "圧縮設定: レベル {}、スレッド数 {}",
     "configuring_firewall": "ファイアウォールルールを構成中...",
     "configuring_firewall_ufw": "ファイアウォール (ufw) を構成中...",
     "confirm_continue": "続行しますか？ (y/N): ",
@@ -46,7 +58,13 @@ MESSAGES = {
     "confirm_version_update": "バージョン更新を確認しますか？ (y/N): ",
     "copy_success": "コピーが成功しました。",
     "created_dev_compose_file": "開発用 Compose ファイルを作成しました: {}",
+    "creating_incremental_snapshot": "チャンクストアに増分スナップショットを作成しています: {}...",
     "dev_compose_image_replaced": "イメージタグを latest から preview に変更しました",
+    "docker_volume_not_found": "ボリュームが存在しません",
+    "error_archive_integrity": "アーカイブの整合性チェックに失敗しました（{} 件のエラー）。復元を中止し、復元先ディレクトリは変更されていません",
+    "error_backup_dir_not_exist": "指定されたバックアップディレクトリ '{}' が存在しないか、ディレクトリではありません。",
+    "error_codec_required_for_recovery": "エラー: このバックアップの復元には '{}' デコーダー（zstd コマンドまたは Python の zstandard モジュール）が必要です。",
+    "error_codec_unavailable": "エラー: 圧縮コーデック '{}' はこの環境では利用できません。",
     "error_create_dev_compose": "開発用 Compose ファイルの作成に失敗しました: {}",
     "creating_archive": "アーカイブファイルの作成を開始中...",
     "creating_docker_volume": "Docker ボリューム '{}' を作成中...",
@@ -59,7 +77,6 @@ MESSAGES = {
     "dependencies_check_passed": "依存関係のチェックに合格しました。",
     "deployment_complete": "=== デプロイ完了！ ===",
     "detected_docker_host_correcting": "DOCKER_HOST='{}' が検出されました。'unix://{}' に自動修正します",
-    "detected_zstd_compressing": "zstd が検出されました。{} に圧縮しています...",
     "discovered_docker_volumes": "動的に {} 個の一致する Docker ボリュームを発見しました",
     "docker_volume_created": "Docker ボリューム '{}' が正常に作成されました",
     "docker_volume_exists": "Docker ボリューム '{}' は既に存在します",
@@ -95,16 +112,24 @@ MESSAGES = {
     "error_docker_volume_discovery_exception": "エラー: Docker ボリュームの検出中に例外が発生しました: {}",
     "error_env_file_not_exist": ".env ファイルが存在しません。Nekro Agent が正しくインストールされているか確認してください。",
     "error_invalid_channel": "無効な channel: {}。'latest' または 'preview' を使用してください。",
+    "error_invalid_compress_level": "エラー: 圧縮レベルは 1 から 22 の範囲で指定してください（指定値: {}）。",
+    "error_invalid_compress_threads": "エラー: 圧縮スレッド数に負の値は指定できません（指定値: {}）。",
+    "error_invalid_restore_selector": "エラー: 無効な復元セレクター '{}' です。data、data:<パターン>、volume:<名前> のいずれかを指定してください。",
+    "error_invalid_retention_count": "エラー：--keep-last / --keep-daily / --keep-weekly / --keep-monthly に負の値は指定できません。",
+    "error_invalid_size": "エラー：無効なサイズ '{}'。数値と省略可能な単位 K/M/G/T を指定してください（例：500M）。",
+    "error_invalid_volume_workers": "エラー: ボリュームワーカー数は 0 より大きい値を指定してください（指定値: {}）。",
     "error_nekro_agent_image_not_found": "docker-compose.yml に Nekro Agent 画像が見つかりません。",
+    "error_pull_image": "イメージ {} の pull に失敗しました：{}",
     "error_read_compose_file": "docker-compose.yml の読み込みに失敗しました: {}",
+    "error_snapshot_chunk_corrupted": "スナップショットが参照するチャンク {} が存在しないか破損しています",
     "error_switch_channel": "画像 channel の切り替えに失敗しました: {}",
-    "error_invalid_backup_format": "無効なバックアップファイル形式。'.tar' と '.tar.zstd' のみサポートされています。",
+    "error_invalid_backup_format": "無効なバックアップファイル形式です。'.tar'、'.tar.zstd'、'.tar.xz'、'.tar.gz' および増分スナップショット '.snapshot.json' のみサポートされています。",
     "error_prefix": "エラー:",
     "error_pull_helper_image": "エラー: バックアップヘルパーイメージ '{}' の pull に失敗しました: {}",
     "error_sudo_failed": "エラー: sudo による昇格後もコマンドが失敗しました: {}",
     "error_sudo_not_found": "'sudo' コマンドが見つかりません。管理者権限を持っていることを確認してください。",
     "error_unsupported_file_format": "エラー: サポートされていないファイル形式: {}",
-    "error_zstd_required_for_recovery": "エラー: 復元には 'zstd' コマンドが必要です。",
+    "error_volume_backup_incomplete": "次のボリュームはデータの一部をアーカイブに書き込んだ後にバックアップに失敗しました。アーカイブは不完全なため、このバックアップは破棄されました：{}",
     "excluding_env_template": "構成テンプレートを除外: {}",
     "excluding_from_archive": "除外: {}",
     "excluding_logs_directory": "ログディレクトリを除外: {}",
@@ -128,6 +153,8 @@ MESSAGES = {
     "helper_image_not_found_try_pull": "バックアップ用ヘルパーイメージ '{}' が見つかりません。pull を試みます...",
     "important_config_info": "=== 重要な構成情報 ===",
     "important_notes": "=== 注意事項 ===",
+    "incremental_description": "--backup と併用して増分バックアップを作成します。データはバックアップディレクトリ内のチャンクストアにコンテンツアドレス方式で分割保存され、新しいチャンクのみが書き込まれます。",
+    "incremental_snapshot_stats": "スナップショットは {} 個のチャンク（新規 {} 個）を参照、データ {} バイト、新規保存 {} バイト",
     "install_description": "指定したパスに Nekro Agent をインストールします。",
     "install_module_data_dir_help": "Nekro Agent のアプリデータディレクトリ。\nデフォルトはスクリプトのディレクトリ内の \"na_data/\" フォルダです。",
     "install_module_description": "Nekro Agent のインストールおよび管理スクリプト",
@@ -139,6 +166,24 @@ MESSAGES = {
     "installation_complete": "インストール完了！ご利用をお楽しみください！",
     "insufficient_permissions_try_sudo": "現在のユーザーは十分な権限がない可能性があります。sudo を試してください...",
     "invalid_input_retry": "無効な入力です。再度選択してください。",
+    "keep_daily_description": "--backup と併用：直近 N 日間の各日の最新バックアップを保持します",
+    "keep_last_description": "--backup と併用：バックアップ成功後、最新の N 個のバックアップを保持します",
+    "keep_monthly_description": "--backup と併用：直近 N か月の各月の最新バックアップを保持します",
+    "keep_weekly_description": "--backup と併用：直近 N 週間の各週の最新バックアップを保持します",
+    "list_backup_header": "バックアップファイル: {}",
+    "list_backups_description": "バックアップディレクトリ内の全バックアップを一覧表示（カタログを読み取り、アーカイブは開きません）",
+    "list_backups_empty": "{} にバックアップはありません。",
+    "list_backups_header": "{} 内のバックアップ（新しい順）：",
+    "list_backups_total": "バックアップ {} 個、合計 {}",
+    "list_compression": "圧縮設定: {}",
+    "list_created_at": "作成日時: {}",
+    "list_data_root": "データディレクトリ: {}",
+    "list_description": "バックアップファイルの内容を一覧表示（アーカイブ先頭のマニフェストを読み取り）",
+    "list_docker_volumes": "Docker ボリューム:",
+    "list_file_summary": "ファイル数: {}、合計サイズ: {}",
+    "list_no_manifest_scanning": "バックアップファイル {} にはマニフェストがありません（旧形式）。アーカイブ全体をスキャンしています...",
+    "list_toolkit_version": "ツールバージョン: {}",
+    "max_total_size_description": "--backup と併用：保持するバックアップの合計サイズ上限（例：500M、20G）。超過時は古いものから削除します",
     "mirror_pull_failed": "ミラーからの pull に失敗: {} ({})",
     "mirror_pull_success": "ミラーからの pull に成功: {} ({}), イメージ: {}",
     "multiple_root_directories_warning": "警告: バックアップには複数の可能性のあるルートディレクトリが含まれています: {}。主要なデータディレクトリを自動判別できません。",
@@ -158,16 +203,39 @@ MESSAGES = {
     "official_pull_success": "公式レジストリからの pull に成功: {} ({})",
     "onebot_access_token": "OneBot アクセストークン: {}",
     "onebot_websocket_address": "OneBot WebSocket 接続 URL: ws://127.0.0.1:{}/onebot/v11/ws",
+    "only_description": "--recovery / --recover-install と併用して選択した内容のみ復元します（複数指定可）: data（データディレクトリ全体）、data:<パターン>（データディレクトリ内のパス、例 data:configs/*）、volume:<名前>（ワイルドカード可）。",
     "operation_cancelled": "操作がキャンセルされました。",
+    "pending_restores_discarded": "以前の復元で残された未インポートのデータを破棄します：{}",
+    "postgres_container_not_ready": "ボリューム '{}' を使用する Postgres コンテナが {} 秒以内に準備できませんでした。論理バックアップは {} に保持されています",
+    "postgres_dump_complete": "ボリューム '{}' の pg_dump が完了しました: {}、{} パート",
+    "postgres_dump_container_found": "ボリューム '{}' は実行中の Postgres コンテナ {} が使用しているため、pg_dump で論理バックアップします",
+    "postgres_dump_failed": "ボリューム '{}' の pg_dump に失敗しました: {}",
+    "postgres_dump_incomplete": "ボリューム '{}' の論理バックアップが不完全です（バックアップ時に pg_dump が完了しなかったか、データが完了記録と一致しません）。pg_restore をスキップし、データベースは変更されていません",
+    "postgres_restore_complete": "ボリューム '{}' の pg_restore が完了しました",
+    "postgres_restore_failed": "ボリューム '{}' の論理バックアップの復元に失敗しました: {}",
+    "postgres_restore_pending": "ボリューム '{0}' を使用する実行中の Postgres コンテナがないため、論理バックアップを {1} に保存しました。-ri でサービスをインストール・起動した後に自動で取り込まれます。またはサービスを起動してから --only volume:{0} で復元を再実行してください",
     "preparing_recovery_from_backup": "バックアップファイルからの復元を準備中: {}",
+    "probing_registries": "公式レジストリとミラーを計測中：{}（{}）",
+    "progress_backup": "バックアップ",
+    "progress_description": "--backup / --recovery と併用：進捗の表示方法（auto は端末では進捗バーを表示し、それ以外では何も表示しない。定期的な JSON 行には json を指定。デフォルト {}）",
+    "progress_restore": "復元",
     "pulling_all_services": "すべてのサービスの最新イメージを pull 中",
     "pulling_helper_image": "バックアップヘルパーイメージを pull 中...",
     "pulling_image_mirrors": "ミラーからイメージを pull 中: {} ({})",
     "pulling_image_official": "公式レジストリからイメージを pull 中: {} ({})",
+    "pulling_images_concurrently": "{} 個のイメージを pull 中（同時に最大 {} 個）：{}",
     "pulling_latest_nekro_agent": "最新の nekro_agent イメージを pull 中",
     "pulling_latest_sandbox": "最新の kromiose/nekro-agent-sandbox イメージを pull 中",
     "pulling_sandbox_image": "サンドボックスイメージを pull 中",
     "pulling_service_images": "サービスイメージを pull 中",
+    "qdrant_restore_complete": "ボリューム '{}' のコレクションスナップショットをすべて復元しました",
+    "qdrant_restore_failed": "Qdrant スナップショット '{}' の復元に失敗しました: {}",
+    "qdrant_restore_pending": "ボリューム '{0}' を使用するアクセス可能な Qdrant サービスがないため、コレクションスナップショットを {1} に保存しました。-ri でサービスをインストール・起動した後に自動で取り込まれます。またはサービスを起動してから --only volume:{0} で復元を再実行してください",
+    "qdrant_service_found": "ボリューム '{}' は実行中の Qdrant サービス {} が使用しているため、コレクションのスナップショットでバックアップします",
+    "qdrant_service_not_ready": "ボリューム '{}' を使用する Qdrant サービスに {} 秒以内にアクセスできませんでした。コレクションスナップショットは {} に保持されています",
+    "qdrant_snapshot_collection_done": "コレクション '{}' のスナップショットをアーカイブへ書き込みました: {}",
+    "qdrant_snapshot_complete": "ボリューム '{}' のスナップショットバックアップが完了しました: {} コレクション、{}",
+    "qdrant_snapshot_failed": "'{}' の Qdrant スナップショットバックアップに失敗しました: {}",
     "rebuilding_nekro_agent": "nekro_agent コンテナを再構築して起動しています",
     "recover_install_description": "復元してインストールします。これはバックアップファイルをターゲットディレクトリに展開し、その上でインストールプロセスを実行します。",
     "recovery_description": "バックアップファイルから指定されたデータディレクトリへ復元します。",
@@ -179,14 +247,30 @@ MESSAGES = {
     "recovery_module_help": "指定されたバックアップファイルからデータと Docker ボリュームをターゲットディレクトリに復元します。",
     "recovery_step_failed": "復元ステップが失敗しました。操作を中止します。",
     "recovery_success": "復元成功！データは次の場所に復元されました: {}",
+    "registry_status_available": "イメージあり",
+    "registry_status_backoff": "スキップ、{} 分後に再確認（前回の失敗：{}）",
+    "registry_status_cached": "利用可能（キャッシュ）",
+    "registry_status_missing": "イメージなし",
+    "registry_status_unknown": "到達可能、イメージ未確認（{}）",
+    "registry_status_unreachable": "到達不可（{}）",
+    "report_json_description": "--backup / --recovery と併用：各フェーズの所要時間、データ量、圧縮率、スループットを JSON レポートに書き出します（失敗時も書き出します）",
+    "report_written": "レポートを書き出しました：{}",
     "restarting_all_services": "すべてのサービスコンテナを再起動しています",
     "restore_docker_volume_failed": "エラー: Docker ボリューム '{}' の復元に失敗しました: {}",
     "restoring_backup_to": "バックアップを次へ復元中: {}",
     "restoring_data_to": "データを次へ復元中: {}",
     "restoring_docker_volume": "Docker ボリューム '{}' を次へ復元中: {}",
     "restoring_docker_volume_via_container": "Docker ボリューム '{}' を（コンテナ経由で）復元中",
+    "restoring_postgres_dump": "コンテナ {1} で pg_restore によりボリューム '{0}' を復元中（並列ジョブ {2}）...",
+    "restoring_qdrant_collection": "コレクション '{}' のスナップショットをアップロード中 ({})...",
     "restoring_via_container_complete": "Docker ボリューム '{}' の復元が完了しました",
     "restoring_via_container_starting": "Docker ボリューム '{}' をコンテナ経由で復元中...",
+    "retagging_mirror_image": "イメージを {} として再タグ付け中",
+    "retention_applying": "保持ポリシー：{}。既存のバックアップ {} 個、削除対象 {} 個",
+    "retention_removed_backup": "バックアップ {} を削除しました（作成日時 {}）",
+    "selective_restore_no_volume_matched": "警告: {} に一致する Docker ボリュームがありません。ボリュームは復元されません。",
+    "selective_restore_selectors": "選択的復元: {} のみ復元します",
+    "selective_restore_stopped_early": "選択したファイルをすべて読み取ったため、アーカイブの残りをスキップします（末尾に記録されたチェックサムは検証していません。完全な検証には --verify を使用してください）",
     "service_access_info": "=== サービスアクセス情報 ===",
     "set_data_description": "デフォルトデータディレクトリを設定またはクリアします。",
     "setting_directory_permissions": "ディレクトリの権限を設定中",
@@ -194,6 +278,10 @@ MESSAGES = {
     "starting_extraction": "抽出と復元を開始しています...",
     "starting_main_service": "メインサービスを起動中",
     "starting_version_update": "バージョン更新を開始しています...",
+    "streaming_postgres_dump": "コンテナ {1} からボリューム '{0}' の pg_dump をアーカイブへ書き込み中: {2}",
+    "streaming_qdrant_snapshots": "{1} 経由でボリューム '{0}' のコレクションのスナップショットをアーカイブへ書き込み中: {2}",
+    "streaming_volume_complete": "Docker ボリューム '{}' をアーカイブへ書き込みました（{} エントリ）",
+    "streaming_volume_into_archive": "ヘルパーコンテナから Docker ボリューム '{}' をアーカイブへストリーミングしています（アーカイブ名: {}/）...",
     "sudo_elevation_success": "sudo による昇格が成功しました。",
     "sudo_failed_retry_exit": "sudo が失敗しました。再試行(r/R/y/Y) または終了(n/N):",
     "switched_to_directory": "ディレクトリを切り替えました: {}",
@@ -202,6 +290,7 @@ MESSAGES = {
     "target_version": "ターゲットバージョン: {}",
     "trying_mirror_pull": "ミラーから pull を試みています: {} ({})",
     "unknown_system_permission": "不明なシステム、権限が設定されていません: {0}",
+    "update_already_up_to_date": "すべてのイメージは最新です。pull をスキップします",
     "update_cancelled": "更新がキャンセルされました。",
     "update_complete": "更新完了！",
     "update_description": "指定パスのインストールに対して部分更新を実行します。",
@@ -213,6 +302,13 @@ MESSAGES = {
     "update_module_examples": "使用例:\n  python update.py\n    # カレントディレクトリの Nekro Agent を更新（推奨）\n\n  python update.py /srv/nekro\n    # /srv/nekro にある Nekro Agent を更新\n\n  python update.py --all\n    # デフォルトディレクトリ内のすべてのサービスを更新（DB 等含む）\n\n  python update.py /srv/nekro --all\n    # 指定ディレクトリで全サービスを更新",
     "update_module_yes_help": "すべてのプロンプトを自動確認して非対話モードで実行します。",
     "update_module_channel_help": "画像 channel を切り替え: 'latest' (安定版) または 'preview' (ベータ)",
+    "update_services_changed": "更新対象：{}",
+    "update_status_changed": "{}：新しいバージョンがあります",
+    "update_status_container_outdated": "{}（{}）：コンテナが古いイメージを使用しているため再作成します",
+    "update_status_current": "{}（{}）：最新です",
+    "update_status_image_current": "{}：最新です",
+    "update_status_missing": "{}：ローカルに存在しないため pull します",
+    "update_status_unknown": "{}：リモートのダイジェストを取得できないため pull します",
     "updated_version": "更新後のバージョン: {}",
     "error_channel_switch_failed": "channel の切り替えに失敗しました",
     "channel_switch_complete": "channel の切り替えに成功しました",
@@ -221,27 +317,64 @@ MESSAGES = {
     "upgrade_description": "指定パスのインストールを完全更新（アップグレード）します。",
     "use_napcat_service": "napcat サービスも使用しますか？[Y/n] ",
     "using_docker_compose_cmd": "'{}' を docker-compose コマンドとして使用します。",
+    "verify_description": "バックアップファイルの整合性を検証（ストリームで一度だけ読み取り、ディスクには展開しません）",
+    "verify_error_checksum_mismatch": "チェックサムが一致しません: {}",
+    "verify_error_decompression": "解凍に失敗しました（フレームの破損または切り詰め）: {}",
+    "verify_error_member_missing": "エントリがありません: {}",
+    "verify_error_nested_volume": "ボリュームバックアップ {} が破損しています: {}",
+    "verify_error_read": "アーカイブの読み取りに失敗しました: {}",
+    "verify_error_trailing_data": "tar の終端マーカーの後に非ゼロのデータがあります。tar ヘッダーが破損しています",
+    "verify_failed": "バックアップファイルが破損しています: {}（エラー {} 件）",
+    "verify_nested_volume": "ボリュームバックアップ {} を検証しています",
+    "verify_no_checksums": "バックアップにチェックサムが記録されていません（旧形式）。圧縮フレームと tar 構造のみ検証しました。",
+    "verify_stats": "{} 件のエントリを検証、非圧縮データ {}、アーカイブサイズ {}、所要時間 {:.1f} 秒",
+    "verify_success": "バックアップファイルは正常です: {}",
+    "verify_throughput": "スループット: {}/s（非圧縮）、{}/s（アーカイブ）",
+    "verifying_backup": "バックアップファイルを検証しています: {}",
     "version_description": "バージョン情報を表示します。",
     "version_update_cancelled": "操作がキャンセルされました",
     "version_update_complete": "バージョン更新完了！",
     "view_logs_instruction": "以下のコマンドでサービスログを確認できます:",
+    "volume_backup_done": "[{}/{}] Docker ボリューム '{}' のバックアップが完了しました（{:.1f} 秒）",
+    "volume_backup_failed_progress": "[{}/{}] Docker ボリューム '{}' のバックアップに失敗しました（{:.1f} 秒）",
     "volume_backup_skipped": "バックアップにボリューム '{}' が含まれていますが、復元パスが提供されていないためスキップされます。",
+    "volume_backup_workers": "{} 個の Docker ボリュームを並行してバックアップしています（同時に最大 {} 個）...",
+    "volume_mode_description": "--backup と併用してボリュームのバックアップ方式を選択します。'stream' はヘルパーコンテナの標準出力を直接アーカイブへ書き込み、'file' は一時的な .tar.gz を作成します（既定値 {}）。",
+    "volume_restore_col_size": "データ量",
+    "volume_restore_col_status": "状態",
+    "volume_restore_col_time": "所要時間",
+    "volume_restore_col_volume": "ボリューム",
+    "volume_restore_status_failed": "失敗",
+    "volume_restore_status_ok": "成功",
+    "volume_restore_summary": "Docker ボリュームの復元結果:",
+    "volume_restore_workers": "Docker ボリュームを並行して復元しています（同時に最大 {} 個）...",
+    "volume_workers_description": "--backup / --recovery / --recover-install と併用して同時にバックアップ・復元する Docker ボリューム数の上限を設定します（既定値 {}）。",
+    "waiting_for_postgres_container": "ボリューム '{}' を使用する Postgres コンテナの準備を待っています...",
+    "waiting_for_qdrant_service": "ボリューム '{}' を使用する Qdrant サービスの準備を待っています...",
     "warning_cannot_determine_data_dir": "バックアップファイルから主要なデータディレクトリを特定できないか、バックアップが Docker ボリュームのみを含んでいます。",
     "warning_cannot_get_volume_info": "警告: Docker ボリューム '{}' の情報を取得できません。スキップします。エラー: {}",
     "warning_cannot_get_volume_list": "警告: Docker ボリューム一覧を取得できません: {}",
     "warning_cannot_get_volume_mountpoint": "警告: Docker ボリューム '{}' のマウントポイントを取得できません。スキップします。エラー: {}",
+    "warning_catalog_update_failed": "警告：バックアップカタログ {} を更新できません：{}",
     "warning_chmod_777": "警告: アプリケーションディレクトリの権限を 777 に設定します。これは安全でない可能性があります。",
+    "warning_chunk_gc_busy": "チャンクストア {} は別の増分バックアップで使用中のため、今回はチャンクのクリーンアップをスキップします。",
+    "warning_chunk_gc_skipped": "警告：スナップショットマニフェスト {} を読み取れません（{}）。チャンクの整理をスキップします。",
     "warning_compose_file_not_found": "ディレクトリ '{}' に docker-compose.yml ファイルが見つかりません。",
+    "warning_compose_images_unresolved": "警告：compose ファイルのイメージを解決できません。compose pull を使用します",
     "warning_data_dir_not_empty": "ターゲットデータディレクトリ '{}' は空ではありません。復元操作により既存ファイルが上書きされる可能性があります。",
     "warning_docker_not_found_skip_backup": "警告: 'docker' コマンドが見つかりません。Docker ボリュームのバックアップをスキップします。",
     "warning_docker_not_found_skip_recovery": "警告: 'docker' コマンドが見つかりません。Docker ボリュームの復元をスキップします。",
     "warning_docker_volume_invalid_path": "警告: Docker ボリューム '{}' のパス '{}' は無効かディレクトリではありません。スキップします。",
     "warning_docker_volumes_will_overwrite": "以下の Docker ボリュームが復元され、ボリューム内の既存内容が上書きされます:",
+    "warning_file_unreadable": "警告：{} を読み取れないため、アーカイブに書き込みませんでした（{}）",
+    "warning_file_vanished": "警告：{} はバックアップ中に削除されたため、アーカイブに含まれていません",
     "warning_prefix": "警告:",
+    "warning_report_write_failed": "警告：レポート {} を書き出せません：{}",
+    "warning_retag_failed": "警告：イメージ {} を {} として再タグ付けできませんでした：{}",
+    "warning_retention_remove_failed": "警告：バックアップ {} を削除できません：{}",
     "warning_skip_data_restore": "データディレクトリのみ復元し、Docker ボリュームの復元をスキップします。",
     "will_restore_docker_volume_to_path": "Docker ボリューム '{}' を次のパスに復元します: {}",
     "will_restore_docker_volume_via_container": "Docker ボリューム '{}' をコンテナ方式で復元します",
     "with_napcat_description": "--install または --recover-install と一緒に使用して NapCat サービスを展開します。",
     "yes_description": "すべてのプロンプトを自動確認して非対話モードで実行します。",
-    "zstd_not_detected_tar_only": "zstd が検出されません。.tar のみ作成します。"
 }
\ No newline at end of file
@@ -7,6 +7,7 @@ MESSAGES = {
     "adding_docker_volume_backup": "Добавление резервной копии тома Docker: {} (архивировано как: {})",
     "adding_to_archive": "Добавление: {} (архивировано как: {})",
     "admin_account": "Администраторский аккаунт: admin | Пароль: {}",
+    "all_cpu_cores": "все ядра",
     "all_description": "Обновить все сервисы, а не только Nekro Agent",
     "all_mirrors_failed_try_official": "Все зеркала не работают, попытка использовать официальный реестр: {}",
     "allow_port": "Разрешить порт {}",
@@ -14,11 +15,15 @@ MESSAGES = {
     "app_data_directory": "Каталог данных приложения (NEKRO_DATA_DIR): {}",
     "app_description": "Унифицированный инструмент управления установкой, обновлением и резервным копированием Nekro Agent.",
     "app_examples": "Примеры использования:\n  {} -i ./na_data\n    # Установить Nekro Agent в каталог ./na_data\n\n  {} -u ./na_data\n    # Выполнить частичное обновление в указанном каталоге\n\n  {} -ua ./na_data\n    # Выполнить полное обновление (апгрейд) в указанном каталоге\n\n  {} -b ./na_data ./backups\n    # Резервное копирование каталога na_data в папку backups\n\n  {} -r ./backups/na_backup_123.tar.zstd ./na_data_new\n    # Восстановить из резервного файла в каталог na_data_new\n\n  {} -ri ./backup.tar.zst ./restored_install\n    # Восстановить данные из резервной копии и выполнить установку поверх",
+    "applying_pending_postgres_restore": "Импорт сохранённой логической копии Postgres тома '{}'...",
+    "applying_pending_qdrant_restore": "Импорт сохранённых снимков коллекций Qdrant тома '{}'...",
+    "applying_retention_policy": "Применение политики хранения резервных копий...",
     "archiving_current_directory": "Архивирование текущего каталога '.' как '{}'",
     "backup_description": "Резервное копирование каталога данных в указанный каталог.",
     "backup_docker_volume_complete": "Резервное копирование тома Docker '{}' завершено: {}",
     "backup_docker_volume_exception": "Произошла ошибка при резервном копировании тома Docker '{}' : {}",
     "backup_docker_volume_failed": "Не удалось выполнить резервное копирование тома Docker '{}' : {}",
+    "backup_failed": "Резервное копирование не удалось.",
     "backup_file_created": "Файл резервной копии создан: {}",
     "backup_file_not_created": "Файл резервной копии {} не был успешно создан или пуст",
     "backup_module_description": "Инструмент резервного копирования и восстановления Nekro Agent.",
@@ -31,12 +36,19 @@ MESSAGES = {
     "channel_already_set": "Канал образа уже установлен на '{}', изменения не требуются.",
     "channel_switched": "Канал образа переключен с '{}' на '{}'.",
     "checking_generating_credentials": "Проверка и генерация необходимых учетных данных...",
+    "checking_image_updates": "Проверка обновлений образов...",
     "checking_install_file": "Проверено {} (обновление информации о версии не требуется)",
+    "chunk_gc_stats": "Удалено неиспользуемых фрагментов из хранилища: {}, освобождено {} байт",
     "clear_cancelled": "Операция очистки отменена.",
     "clear_default_data_dir_prompt": "Введите 'clear', чтобы очистить настройку каталога данных по умолчанию: ",
     "cloud_server_note": "1. Если вы используете облачный сервер, разрешите соответствующие порты в консоли группы безопасности вашего облачного провайдера.",
+    "codec_description": "Используется с --backup для выбора кодека сжатия (auto выбирает первый доступный из zstd, xz, gzip; по умолчанию {}).",
     "command_failed_retry_sudo_exit": "Команда не выполнена. Повторить(r/R), повысить права(y/Y), или выйти(n/N):",
     "compose_file_found": "Файл docker-compose.yml найден в текущем каталоге: {}",
+    "compress_level_description": "Используется с --backup для установки уровня сжатия (1-22, ограничивается максимумом кодека, по умолчанию {}).",
+    "compress_threads_description": "Используется с --backup для установки числа потоков сжатия (0 — все ядра CPU, по умолчанию {}).",
+    "compressing_with_codec": "Сжатие с помощью {} ({}) в: {}...",
+    "compression_settings": "Параметры сжатия: уровень {}, потоков {}",
     "configuring_firewall": "Настройка правил брандмауэра...",
     "configuring_firewall_ufw": "Настройка брандмауэра (ufw)...",
     "confirm_continue": "Продолжить? (y/N): ",
@@ -46,7 +58,13 @@ MESSAGES = {
     "confirm_version_update": "Подтвердить обновление версии? (y/N): ",
     "copy_success": "Копирование успешно.",
     "created_dev_compose_file": "Создан файл Compose для разработки: {}",
+    "creating_incremental_snapshot": "Создание инкрементального снимка в хранилище фрагментов: {}...",
     "dev_compose_image_replaced": "Тег образа заменен с latest на preview",
+    "docker_volume_not_found": "том не существует",
+    "error_archive_integrity": "Проверка целостности архива не пройдена (ошибок: {}); восстановление прервано, целевой каталог не изменён",
+    "error_backup_dir_not_exist": "Указанный каталог резервных копий '{}' не существует или не является каталогом.",
+    "error_codec_required_for_recovery": "Ошибка: для восстановления этой резервной копии требуется декодер '{}' (команда zstd или модуль Python zstandard).",
+    "error_codec_unavailable": "Ошибка: кодек сжатия '{}' недоступен в этой среде.",
     "error_create_dev_compose": "Не удалось создать файл Compose для разработки: {}",
     "creating_archive": "Начало создания архивного файла...",
     "creating_docker_volume": "Создание тома Docker '{}'...",
@@ -59,7 +77,6 @@ MESSAGES = {
     "dependencies_check_passed": "Проверка зависимостей пройдена.",
     "deployment_complete": "=== Развертывание завершено! ===",
     "detected_docker_host_correcting": "Обнаружен DOCKER_HOST='{}', автоматически исправлю на 'unix://{}'",
-    "detected_zstd_compressing": "Обнаружен zstd, сжатие в: {}...",
     "discovered_docker_volumes": "Динамически обнаружено {} подходящих Docker томов",
     "docker_volume_created": "Docker том '{}' успешно создан",
     "docker_volume_exists": "Docker том '{}' уже существует",
@@ -95,16 +112,24 @@ MESSAGES = {
     "error_docker_volume_discovery_exception": "Ошибка: исключение при обнаружении Docker томов: {}",
     "error_env_file_not_exist": "Файл .env не существует, проверьте, правильно ли установлен Nekro Agent.",
     "error_invalid_channel": "Неверный канал: {}. Пожалуйста, используйте 'latest' или 'preview'.",
+    "error_invalid_compress_level": "Ошибка: уровень сжатия должен быть от 1 до 22, получено {}.",
+    "error_invalid_compress_threads": "Ошибка: число потоков сжатия не может быть отрицательным, получено {}.",
+    "error_invalid_restore_selector": "Ошибка: недопустимый селектор восстановления '{}', ожидается data, data:<шаблон> или volume:<имя>.",
+    "error_invalid_retention_count": "Ошибка: --keep-last / --keep-daily / --keep-weekly / --keep-monthly не могут быть отрицательными.",
+    "error_invalid_size": "Ошибка: недопустимый размер '{}', ожидается число с необязательной единицей K/M/G/T (например, 500M).",
+    "error_invalid_volume_workers": "Ошибка: число обработчиков томов должно быть больше 0, получено {}.",
     "error_nekro_agent_image_not_found": "Образ Nekro Agent не найден в docker-compose.yml.",
+    "error_pull_image": "Не удалось загрузить образ {}: {}",
     "error_read_compose_file": "Не удалось прочитать docker-compose.yml: {}",
+    "error_snapshot_chunk_corrupted": "Фрагмент {}, на который ссылается снимок, отсутствует или повреждён",
     "error_switch_channel": "Не удалось переключить канал образа: {}",
-    "error_invalid_backup_format": "Неверный формат файла резервной копии. Поддерживаются только '.tar' и '.tar.zstd'.",
+    "error_invalid_backup_format": "Неверный формат файла резервной копии. Поддерживаются только '.tar', '.tar.zstd', '.tar.xz', '.tar.gz' и инкрементальные снимки '.snapshot.json'.",
     "error_prefix": "Ошибка:",
     "error_pull_helper_image": "Ошибка: не удалось скачать backup helper образ '{}' : {}",
     "error_sudo_failed": "Ошибка: sudo не смог выполнить команду: {}",
     "error_sudo_not_found": "Команда 'sudo' не найдена. Убедитесь, что у вас есть права администратора.",
     "error_unsupported_file_format": "Ошибка: неподдерживаемый формат файла: {}",
-    "error_zstd_required_for_recovery": "Ошибка: для восстановления требуется команда 'zstd'.",
+    "error_volume_backup_incomplete": "Резервное копирование следующих томов завершилось ошибкой после записи части их данных в архив; архив неполный, эта резервная копия отброшена: {}",
     "excluding_env_template": "Исключение шаблона конфигурации: {}",
     "excluding_from_archive": "Исключается: {}",
     "excluding_logs_directory": "Исключение каталога логов: {}",
@@ -128,6 +153,8 @@ MESSAGES = {
     "helper_image_not_found_try_pull": "Helper образ для бэкапа '{}' не найден, пробуем скачать...",
     "important_config_info": "=== Важная информация конфигурации ===",
     "important_notes": "=== Важные заметки ===",
+    "incremental_description": "Используйте с --backup для инкрементального резервного копирования: данные делятся на адресуемые по содержимому фрагменты в хранилище внутри каталога резервных копий, записываются только новые фрагменты.",
+    "incremental_snapshot_stats": "Снимок ссылается на {} фрагментов ({} новых), данных {} байт, новых записано {} байт",
     "install_description": "Установить Nekro Agent в указанный путь.",
     "install_module_data_dir_help": "Каталог данных приложения Nekro Agent.\nПо умолчанию папка \"na_data/\" в каталоге скрипта.",
     "install_module_description": "Скрипт установки и управления Nekro Agent",
@@ -139,6 +166,24 @@ MESSAGES = {
     "installation_complete": "Установка завершена! Приятного использования!",
     "insufficient_permissions_try_sudo": "Текущий пользователь, возможно, не имеет достаточных прав, попробуйте sudo для повышения привилегий...",
     "invalid_input_retry": "Неверный ввод, пожалуйста, выберите снова.",
+    "keep_daily_description": "Используйте с --backup: хранить последнюю копию за каждый из N последних дней",
+    "keep_last_description": "Используйте с --backup: после успешного копирования хранить N последних резервных копий",
+    "keep_monthly_description": "Используйте с --backup: хранить последнюю копию за каждый из N последних месяцев",
+    "keep_weekly_description": "Используйте с --backup: хранить последнюю копию за каждую из N последних недель",
+    "list_backup_header": "Файл резервной копии: {}",
+    "list_backups_description": "Показать все резервные копии в каталоге (читает каталог, архивы не открываются)",
+    "list_backups_empty": "В {} нет резервных копий.",
+    "list_backups_header": "Резервные копии в {} (сначала новые):",
+    "list_backups_total": "Резервных копий: {}, всего {}",
+    "list_compression": "Сжатие: {}",
+    "list_created_at": "Создан: {}",
+    "list_data_root": "Каталог данных: {}",
+    "list_description": "Показать содержимое файла резервной копии (читает манифест в начале архива)",
+    "list_docker_volumes": "Тома Docker:",
+    "list_file_summary": "Файлов: {}, общий размер: {}",
+    "list_no_manifest_scanning": "Файл {} не содержит манифеста (старая копия), сканирование всего архива...",
+    "list_toolkit_version": "Версия инструмента: {}",
+    "max_total_size_description": "Используйте с --backup: предельный общий размер хранимых копий (например, 500M, 20G); сначала удаляются самые старые",
     "mirror_pull_failed": "Не удалось скачать с зеркала: {} ({})",
     "mirror_pull_success": "Успешно скачано с зеркала: {} ({}), образ: {}",
     "multiple_root_directories_warning": "Внимание: резервная копия содержит несколько возможных корневых каталогов: {}. Невозможно автоматически определить основной каталог данных.",
@@ -158,16 +203,39 @@ MESSAGES = {
     "official_pull_success": "Успешно скачано из официального реестра: {} ({})",
     "onebot_access_token": "Токен доступа OneBot: {}",
     "onebot_websocket_address": "URL подключения OneBot WebSocket: ws://127.0.0.1:{}/onebot/v11/ws",
+    "only_description": "Используйте с --recovery / --recover-install, чтобы восстановить только выбранное (можно повторять): data (весь каталог данных), data:<шаблон> (пути внутри каталога данных, например data:configs/*), volume:<имя> (допускаются шаблоны).",
     "operation_cancelled": "Операция отменена.",
+    "pending_restores_discarded": "Удаление неимпортированных данных, оставшихся от предыдущего восстановления: {}",
+    "postgres_container_not_ready": "Контейнер Postgres, использующий том '{}', не стал доступен за {} с; логическая копия сохранена в {}",
+    "postgres_dump_complete": "pg_dump тома '{}' завершён: {}, частей: {}",
+    "postgres_dump_container_found": "Том '{}' используется работающим контейнером Postgres {}, резервное копирование через pg_dump",
+    "postgres_dump_failed": "Ошибка pg_dump тома '{}': {}",
+    "postgres_dump_incomplete": "Логическая резервная копия тома '{}' неполная (pg_dump не завершился при резервном копировании или данные не совпадают с записью о завершении); pg_restore пропущен, база данных не изменена",
+    "postgres_restore_complete": "pg_restore тома '{}' завершён",
+    "postgres_restore_failed": "Не удалось восстановить логическую копию тома '{}': {}",
+    "postgres_restore_pending": "Нет работающего контейнера Postgres, использующего том '{0}'; логическая копия сохранена в {1}. Она будет импортирована автоматически после установки и запуска сервиса через -ri, либо запустите сервис и повторите восстановление с --only volume:{0}",
     "preparing_recovery_from_backup": "Подготовка к восстановлению из файла резервной копии: {}",
+    "probing_registries": "Замер официального реестра и зеркал: {} ({})",
+    "progress_backup": "Копирование",
+    "progress_description": "Используйте с --backup / --recovery: способ отображения прогресса (auto рисует индикатор в терминале и ничего не выводит в остальных случаях; для периодических строк JSON укажите json; по умолчанию {})",
+    "progress_restore": "Восстановление",
     "pulling_all_services": "Загрузка последних образов для всех сервисов",
     "pulling_helper_image": "Загрузка helper образа для бэкапа...",
     "pulling_image_mirrors": "Загрузка образа с зеркал: {} ({})",
     "pulling_image_official": "Загрузка образа из официального реестра: {} ({})",
+    "pulling_images_concurrently": "Загрузка образов: {} (до {} одновременно): {}",
     "pulling_latest_nekro_agent": "Загрузка последнего образа nekro_agent",
     "pulling_latest_sandbox": "Загрузка последнего образа kromiose/nekro-agent-sandbox",
     "pulling_sandbox_image": "Загрузка sandbox образа",
     "pulling_service_images": "Загрузка образов сервисов",
+    "qdrant_restore_complete": "Все снимки коллекций тома '{}' восстановлены",
+    "qdrant_restore_failed": "Не удалось восстановить снимок Qdrant '{}': {}",
+    "qdrant_restore_pending": "Нет доступного сервиса Qdrant, использующего том '{0}'; снимки коллекций сохранены в {1}. Они будут импортированы автоматически после установки и запуска сервиса через -ri, либо запустите сервис и повторите восстановление с --only volume:{0}",
+    "qdrant_service_found": "Том '{}' используется работающим сервисом Qdrant {}, резервное копирование через снимки коллекций",
+    "qdrant_service_not_ready": "Сервис Qdrant, использующий том '{}', не стал доступен за {} с; снимки коллекций сохранены в {}",
+    "qdrant_snapshot_collection_done": "Снимок коллекции '{}' записан в архив: {}",
+    "qdrant_snapshot_complete": "Резервное копирование снимков тома '{}' завершено: коллекций {}, {}",
+    "qdrant_snapshot_failed": "Ошибка резервного копирования снимка Qdrant '{}': {}",
     "rebuilding_nekro_agent": "Пересборка и запуск контейнера nekro_agent",
     "recover_install_description": "Восстановить и установить. Это распакует файл резервной копии в целевой каталог, затем выполнит установку поверх.",
     "recovery_description": "Восстановить из файла резервной копии в указанный каталог данных.",
@@ -179,14 +247,30 @@ MESSAGES = {
     "recovery_module_help": "Восстановить данные и Docker тома из указанного файла резервной копии в целевой каталог.",
     "recovery_step_failed": "Шаг восстановления не выполнен, прерывание операции.",
     "recovery_success": "Восстановление успешно! Данные восстановлены в: {}",
+    "registry_status_available": "образ доступен",
+    "registry_status_backoff": "пропущен, повторная проверка через {} мин (последняя ошибка: {})",
+    "registry_status_cached": "доступен (из кэша)",
+    "registry_status_missing": "образ не найден",
+    "registry_status_unknown": "доступен, образ не подтверждён ({})",
+    "registry_status_unreachable": "недоступен ({})",
+    "report_json_description": "Используйте с --backup / --recovery: записать в JSON-отчёт время, объём данных, степень сжатия и пропускную способность каждой фазы (в том числе при ошибке)",
+    "report_written": "Отчёт записан в: {}",
     "restarting_all_services": "Перезапуск всех контейнеров сервисов",
     "restore_docker_volume_failed": "Ошибка: не удалось восстановить Docker том '{}': {}",
     "restoring_backup_to": "Восстановление резервной копии в: {}",
     "restoring_data_to": "Восстановление данных в: {}",
     "restoring_docker_volume": "Восстановление Docker тома '{}' в: {}",
     "restoring_docker_volume_via_container": "Восстановление Docker тома '{}' (через контейнер)",
+    "restoring_postgres_dump": "Восстановление тома '{0}' в контейнере {1} через pg_restore ({2} параллельных заданий)...",
+    "restoring_qdrant_collection": "Загрузка снимка коллекции '{}' ({})...",
     "restoring_via_container_complete": "Восстановление Docker тома '{}' завершено",
     "restoring_via_container_starting": "Восстановление Docker тома '{}' через контейнер...",
+    "retagging_mirror_image": "Переименование образа в {}",
+    "retention_applying": "Политика хранения: {}; найдено копий: {}, к удалению: {}",
+    "retention_removed_backup": "Удалена резервная копия {} (создана {})",
+    "selective_restore_no_volume_matched": "Предупреждение: ни один том Docker не соответствует {}, тома не будут восстановлены.",
+    "selective_restore_selectors": "Выборочное восстановление, только: {}",
+    "selective_restore_stopped_early": "Все выбранные файлы прочитаны, остаток архива пропущен (контрольные суммы в конце архива не проверялись; для полной проверки используйте --verify)",
     "service_access_info": "=== Информация для доступа к сервису ===",
     "set_data_description": "Установить или очистить каталог данных по умолчанию.",
     "setting_directory_permissions": "Установка прав доступа к директории",
@@ -194,6 +278,10 @@ MESSAGES = {
     "starting_extraction": "Начало извлечения и восстановления...",
     "starting_main_service": "Запуск основного сервиса",
     "starting_version_update": "Начало обновления версии...",
+    "streaming_postgres_dump": "Потоковая запись pg_dump тома '{0}' из контейнера {1} в архив: {2}",
+    "streaming_qdrant_snapshots": "Создание снимков коллекций тома '{0}' через {1} в архив: {2}",
+    "streaming_volume_complete": "Том Docker '{}' записан в архив, записей: {}",
+    "streaming_volume_into_archive": "Потоковая запись тома Docker '{}' из вспомогательного контейнера в архив (в архиве: {}/)...",
     "sudo_elevation_success": "Повышение через sudo выполнено успешно.",
     "sudo_failed_retry_exit": "sudo не удался. Повторить(r/R/y/Y) или выйти(n/N):",
     "switched_to_directory": "Переключено в каталог: {}",
@@ -202,6 +290,7 @@ MESSAGES = {
     "target_version": "Целевая версия: {}",
     "trying_mirror_pull": "Попытка pull с зеркала: {} ({})",
     "unknown_system_permission": "Неизвестная система, разрешение не установлено: {0}",
+    "update_already_up_to_date": "Все образы уже актуальны, загрузка пропущена",
     "update_cancelled": "Обновление отменено.",
     "update_complete": "Обновление завершено!",
     "update_description": "Выполнить частичное обновление установки в указанном пути.",
@@ -213,6 +302,13 @@ MESSAGES = {
     "update_module_examples": "Примеры использования:\n  python update.py\n    # Обновить Nekro Agent в текущем каталоге (рекомендуется)\n\n  python update.py /srv/nekro\n    # Обновить Nekro Agent, расположенный в /srv/nekro\n\n  python update.py --all\n    # Обновить все сервисы в каталоге по умолчанию (включая БД)\n\n  python update.py /srv/nekro --all\n    # Комбинированное использование: обновить все сервисы в указанном каталоге",
     "update_module_yes_help": "Автоматически подтверждать все подсказки для запуска в неинтерактивном режиме.",
     "update_module_channel_help": "Переключить канал образа: 'latest' (стабильный) или 'preview' (бета)",
+    "update_services_changed": "Требуют обновления: {}",
+    "update_status_changed": "{}: доступна новая версия",
+    "update_status_container_outdated": "{} ({}): контейнер использует старый образ, будет пересоздан",
+    "update_status_current": "{} ({}): актуален",
+    "update_status_image_current": "{}: актуален",
+    "update_status_missing": "{}: отсутствует локально, будет загружен",
+    "update_status_unknown": "{}: не удалось получить удалённый дайджест, будет загружен",
     "updated_version": "Обновленная версия: {}",
     "error_channel_switch_failed": "Ошибка переключения канала",
     "channel_switch_complete": "Переключение канала успешно",
@@ -221,27 +317,64 @@ MESSAGES = {
     "upgrade_description": "Выполнить полное обновление (upgrade) установки в указанном пути.",
     "use_napcat_service": "Использовать также сервис napcat? [Y/n] ",
     "using_docker_compose_cmd": "Используется '{}' как команда docker-compose.",
+    "verify_description": "Проверить целостность файла резервной копии (один потоковый проход, без распаковки на диск)",
+    "verify_error_checksum_mismatch": "Несовпадение контрольной суммы: {}",
+    "verify_error_decompression": "Ошибка распаковки (кадр повреждён или обрезан): {}",
+    "verify_error_member_missing": "Отсутствует запись: {}",
+    "verify_error_nested_volume": "Резервная копия тома {} повреждена: {}",
+    "verify_error_read": "Не удалось прочитать архив: {}",
+    "verify_error_trailing_data": "Ненулевые данные после маркера конца tar: заголовок tar повреждён",
+    "verify_failed": "Файл резервной копии повреждён: {} (ошибок: {})",
+    "verify_nested_volume": "Проверка резервной копии тома {}",
+    "verify_no_checksums": "В резервной копии нет контрольных сумм (старая копия); проверены только кадры сжатия и структура tar.",
+    "verify_stats": "Проверено записей: {}, несжатых данных {}, размер архива {}, заняло {:.1f} с",
+    "verify_success": "Файл резервной копии цел: {}",
+    "verify_throughput": "Пропускная способность: {}/с несжатых, {}/с архива",
+    "verifying_backup": "Проверка файла резервной копии: {}",
     "version_description": "Показать информацию о версии.",
     "version_update_cancelled": "Операция отменена",
     "version_update_complete": "Обновление версии завершено!",
     "view_logs_instruction": "Вы можете просмотреть логи сервисов следующими командами:",
+    "volume_backup_done": "[{}/{}] Том Docker '{}' сохранён за {:.1f} с",
+    "volume_backup_failed_progress": "[{}/{}] Не удалось сохранить том Docker '{}' (прошло {:.1f} с)",
     "volume_backup_skipped": "Резервная копия содержит том '{}', но путь восстановления не указан, будет пропущен.",
+    "volume_backup_workers": "Параллельное резервное копирование {} томов Docker (до {} одновременно)...",
+    "volume_mode_description": "Используйте с --backup, чтобы выбрать способ резервирования томов: 'stream' передаёт stdout вспомогательного контейнера прямо в архив, 'file' сначала пишет временный .tar.gz (по умолчанию {}).",
+    "volume_restore_col_size": "Данные",
+    "volume_restore_col_status": "Статус",
+    "volume_restore_col_time": "Время",
+    "volume_restore_col_volume": "Том",
+    "volume_restore_status_failed": "ОШИБКА",
+    "volume_restore_status_ok": "ОК",
+    "volume_restore_summary": "Результаты восстановления томов Docker:",
+    "volume_restore_workers": "Параллельное восстановление томов Docker (до {} одновременно)...",
+    "volume_workers_description": "Используйте с --backup / --recovery / --recover-install, чтобы ограничить число одновременно резервируемых или восстанавливаемых томов Docker (по умолчанию {}).",
+    "waiting_for_postgres_container": "Ожидание готовности контейнера Postgres, использующего том '{}'...",
+    "waiting_for_qdrant_service": "Ожидание доступности сервиса Qdrant, использующего том '{}'...",
     "warning_cannot_determine_data_dir": "Невозможно определить основной каталог данных из файла резервной копии, или резервная копия содержит только Docker тома.",
     "warning_cannot_get_volume_info": "Предупреждение: невозможно получить информацию о Docker томе '{}', будет пропущено. Ошибка: {}",
     "warning_cannot_get_volume_list": "Предупреждение: невозможно получить список Docker томов: {}",
     "warning_cannot_get_volume_mountpoint": "Предупреждение: невозможно получить точку монтирования Docker тома '{}', будет пропущено. Ошибка: {}",
+    "warning_catalog_update_failed": "Предупреждение: не удалось обновить каталог резервных копий {}: {}",
     "warning_chmod_777": "Предупреждение: установка прав каталога приложения в 777 может быть небезопасной.",
+    "warning_chunk_gc_busy": "Хранилище блоков {} используется другим инкрементным резервным копированием; очистка блоков на этот раз пропущена.",
+    "warning_chunk_gc_skipped": "Предупреждение: не удалось прочитать манифест снимка {} ({}), очистка фрагментов пропущена.",
     "warning_compose_file_not_found": "Файл docker-compose.yml не найден в каталоге '{}'.",
+    "warning_compose_images_unresolved": "Предупреждение: не удалось определить образы из файла compose, используется compose pull",
     "warning_data_dir_not_empty": "Целевой каталог данных '{}' не пуст. Операция восстановления может перезаписать существующие файлы.",
     "warning_docker_not_found_skip_backup": "Предупреждение: команда 'docker' не найдена, пропускается резервное копирование Docker томов.",
     "warning_docker_not_found_skip_recovery": "Предупреждение: команда 'docker' не найдена, пропускается восстановление Docker томов.",
     "warning_docker_volume_invalid_path": "Предупреждение: путь '{}' для Docker тома '{}' недействителен или не является каталогом, будет пропущено.",
     "warning_docker_volumes_will_overwrite": "Будут восстановлены следующие Docker тома, что перезапишет существующее содержимое:",
+    "warning_file_unreadable": "Предупреждение: не удалось прочитать {}, файл не записан в архив ({})",
+    "warning_file_vanished": "Предупреждение: {} был удалён во время резервного копирования и не попал в архив",
     "warning_prefix": "Предупреждение:",
+    "warning_report_write_failed": "Предупреждение: не удалось записать отчёт {}: {}",
+    "warning_retag_failed": "Предупреждение: не удалось переименовать образ {} в {}: {}",
+    "warning_retention_remove_failed": "Предупреждение: не удалось удалить резервную копию {}: {}",
     "warning_skip_data_restore": "Будет восстановлен только каталог данных, восстановление Docker томов пропущено.",
     "will_restore_docker_volume_to_path": "Восстановить Docker том '{}' в путь: {}",
     "will_restore_docker_volume_via_container": "Восстановить Docker том '{}' через контейнер",
     "with_napcat_description": "Используйте с --install или --recover-install для развертывания сервиса NapCat.",
     "yes_description": "Автоматически подтверждать все подсказки для запуска в неинтерактивном режиме.",
-    "zstd_not_detected_tar_only": "zstd не обнаружен, создаётся только .tar архив"
 }
\ No newline at end of file
@@ -7,6 +7,7 @@ MESSAGES = {
     "adding_docker_volume_backup": "正在添加 Docker 卷备份: {} (归档为: {})",
     "adding_to_archive": "正在添加: {} (归档为: {})",
     "admin_account": "管理员账号: admin | 密码: {}",
+    "all_cpu_cores": "全部核心",
     "all_description": "更新所有服务，而不仅仅是 Nekro Agent",
     "all_mirrors_failed_try_official": "所有镜像源均失败，尝试从官方源拉取镜像 '{}'",
     "allow_port": "放行端口 {}",
@@ -14,11 +15,15 @@ MESSAGES = {
     "app_data_directory": "应用数据目录 (NEKRO_DATA_DIR): {}",
     "app_description": "Nekro Agent 安装、更新与备份的统一管理工具。",
     "app_examples": "用法示例:\n  {} -i ./na_data\n    # 在 ./na_data 目录中安装 Nekro Agent\n\n  {} -u ./na_data\n    # 对指定目录的安装执行部分更新\n\n  {} -ua ./na_data\n    # 对指定目录的安装执行完全更新（升级）\n\n  {} -b ./na_data ./backups\n    # 备份 na_data 目录到 backups 文件夹\n\n  {} -r ./backups/na_backup_123.tar.zstd ./na_data_new\n    # 从备份文件恢复到 na_data_new 目录\n\n  {} -ri ./backup.tar.zst ./restored_install\n    # 从备份恢复数据，并在此基础上执行安装",
+    "applying_pending_postgres_restore": "正在导入卷 '{}' 已保存的 Postgres 逻辑备份...",
+    "applying_pending_qdrant_restore": "正在导入卷 '{}' 已保存的 Qdrant 集合快照...",
+    "applying_retention_policy": "正在应用备份保留策略...",
     "archiving_current_directory": "将当前目录 '.' 归档为 '{}'",
     "backup_description": "备份数据目录到指定文件夹。",
     "backup_docker_volume_complete": "Docker 卷 '{}' 备份完成: {}",
     "backup_docker_volume_exception": "备份 Docker 卷 '{}' 时发生异常: {}",
     "backup_docker_volume_failed": "备份 Docker 卷 '{}' 失败: {}",
+    "backup_failed": "备份失败。",
     "backup_file_created": "已创建备份文件: {}",
     "backup_file_not_created": "备份文件 {} 未成功创建或为空",
     "backup_module_description": "Nekro Agent 备份与恢复工具。",
@@ -31,12 +36,19 @@ MESSAGES = {
     "channel_already_set": "镜像 channel 已设置为 '{}'，无需更改。",
     "channel_switched": "已将镜像 channel 从 '{}' 切换到 '{}'。",
     "checking_generating_credentials": "正在检查并生成必要的访问凭证...",
+    "checking_image_updates": "正在检查镜像更新...",
     "checking_install_file": "已检查 {}（当前无版本信息需要更新）",
+    "chunk_gc_stats": "已清理分块仓库中 {} 个不再被引用的分块，释放 {} 字节",
     "clear_cancelled": "清除操作已取消。",
     "clear_default_data_dir_prompt": "输入 'clear' 以清除默认数据目录设置: ",
     "cloud_server_note": "1. 如果您使用的是云服务器，请在云服务商控制台的安全组中放行相应端口。",
+    "codec_description": "与 --backup 配合使用，选择压缩编解码器（auto 按 zstd、xz、gzip 顺序选择可用的，默认 {}）。",
     "command_failed_retry_sudo_exit": "命令执行失败。重试(r/R)，提权(y/Y)，退出(n/N)：",
     "compose_file_found": "在当前目录找到 docker-compose.yml 文件: {}",
+    "compress_level_description": "与 --backup 配合使用，设置压缩级别（1-22，超出编解码器上限时取上限，默认 {}）。",
+    "compress_threads_description": "与 --backup 配合使用，设置压缩线程数（0 表示使用全部 CPU 核心，默认 {}）。",
+    "compressing_with_codec": "正在使用 {}（{}）压缩为: {}...",
+    "compression_settings": "压缩参数：级别 {}，线程数 {}",
     "configuring_firewall": "正在配置防火墙规则...",
     "configuring_firewall_ufw": "正在配置防火墙 (ufw)...",
     "confirm_continue": "是否继续？ (y/N): ",
@@ -46,7 +58,13 @@ MESSAGES = {
     "confirm_version_update": "确认更新版本吗? (y/N): ",
     "copy_success": "复制成功。",
     "created_dev_compose_file": "已创建开发版 Compose 文件: {}",
+    "creating_incremental_snapshot": "正在创建增量快照，分块仓库: {}...",
     "dev_compose_image_replaced": "已将镜像 tag 从 latest 替换为 preview",
+    "docker_volume_not_found": "卷不存在",
+    "error_archive_integrity": "归档完整性校验失败（{} 个错误），已放弃恢复，目标目录未被修改",
+    "error_backup_dir_not_exist": "指定的备份目录 '{}' 不存在或不是一个目录。",
+    "error_codec_required_for_recovery": "错误: 恢复此备份需要 '{}' 解码器（zstd 命令或 Python zstandard 模块）。",
+    "error_codec_unavailable": "错误: 压缩编解码器 '{}' 在当前环境不可用。",
     "error_create_dev_compose": "创建开发版 Compose 文件失败: {}",
     "creating_archive": "开始创建归档文件...",
     "creating_docker_volume": "正在创建 Docker 卷 '{}'...",
@@ -59,7 +77,6 @@ MESSAGES = {
     "dependencies_check_passed": "依赖检查通过。",
     "deployment_complete": "=== 部署完成！ ===",
     "detected_docker_host_correcting": "检测到 DOCKER_HOST='{}'，将自动修正为 'unix://{}'",
-    "detected_zstd_compressing": "检测到 zstd，正在压缩为: {}...",
     "discovered_docker_volumes": "动态发现了 {} 个符合条件的 Docker 卷",
     "docker_volume_created": "Docker 卷 '{}' 创建成功",
     "docker_volume_exists": "Docker 卷 '{}' 已存在",
@@ -95,16 +112,24 @@ MESSAGES = {
     "error_docker_volume_discovery_exception": "错误: 发现 Docker 卷时发生异常: {}",
     "error_env_file_not_exist": ".env 文件不存在，请检查 Nekro Agent 是否已正确安装。",
     "error_invalid_channel": "无效的 channel: {}。请使用 'latest' 或 'preview'。",
+    "error_invalid_compress_level": "错误：压缩级别必须在 1 到 22 之间，当前为 {}。",
+    "error_invalid_compress_threads": "错误：压缩线程数不能为负数，当前为 {}。",
+    "error_invalid_restore_selector": "错误：无效的恢复选择器 '{}'，应为 data、data:<通配符> 或 volume:<卷名>。",
+    "error_invalid_retention_count": "错误：--keep-last / --keep-daily / --keep-weekly / --keep-monthly 不能为负数。",
+    "error_invalid_size": "错误：无效的大小 '{}'，应为数字加可选单位 K/M/G/T（如 500M）。",
+    "error_invalid_volume_workers": "错误：并发卷备份数必须大于 0，当前为 {}。",
     "error_nekro_agent_image_not_found": "未在 docker-compose.yml 中找到 Nekro Agent 镜像。",
+    "error_pull_image": "拉取镜像 {} 失败：{}",
     "error_read_compose_file": "读取 docker-compose.yml 文件失败: {}",
+    "error_snapshot_chunk_corrupted": "快照引用的分块 {} 缺失或已损坏",
     "error_switch_channel": "切换镜像 channel 失败: {}",
-    "error_invalid_backup_format": "无效的备份文件格式。只支持 '.tar' 和 '.tar.zstd'。",
+    "error_invalid_backup_format": "无效的备份文件格式。只支持 '.tar'、'.tar.zstd'、'.tar.xz'、'.tar.gz' 和增量快照 '.snapshot.json'。",
     "error_prefix": "错误:",
     "error_pull_helper_image": "错误: 拉取备份 helper 镜像 '{}' 失败: {}",
     "error_sudo_failed": "错误: 使用 sudo 提权后，{} 仍然失败.\n{}",
     "error_sudo_not_found": "'sudo' 命令未找到。请确保您有管理员权限。",
     "error_unsupported_file_format": "错误: 不支持的文件格式: {}",
-    "error_zstd_required_for_recovery": "错误: 恢复需要 'zstd' 命令。",
+    "error_volume_backup_incomplete": "以下卷的数据已部分写入归档后备份失败，归档不完整，已放弃本次备份：{}",
     "excluding_env_template": "排除配置模板: {}",
     "excluding_from_archive": "正在排除: {}",
     "excluding_logs_directory": "排除日志目录: {}",
@@ -128,6 +153,8 @@ MESSAGES = {
     "helper_image_not_found_try_pull": "未找到用于备份的 helper 镜像 '{}'，尝试从远程拉取...",
     "important_config_info": "=== 重要配置信息 ===",
     "important_notes": "=== 注意事项 ===",
+    "incremental_description": "与 --backup 配合使用，以增量方式备份：数据按内容分块存入备份目录下的分块仓库，仅写入新增分块。",
+    "incremental_snapshot_stats": "快照包含 {} 个分块（新增 {} 个），原始数据 {} 字节，本次新写入 {} 字节",
     "install_description": "安装 Nekro Agent 到指定路径。",
     "install_module_data_dir_help": "Nekro Agent 的应用数据目录。\n默认为脚本所在目录下的 \"na_data/\" 文件夹。",
     "install_module_description": "Nekro Agent 安装与管理脚本",
@@ -139,6 +166,24 @@ MESSAGES = {
     "installation_complete": "安装完成！祝您使用愉快！",
     "insufficient_permissions_try_sudo": "当前用户可能权限不足，尝试使用 sudo 提权...",
     "invalid_input_retry": "无效输入，请重新选择。",
+    "keep_daily_description": "与 --backup 一起使用：保留最近 N 天中每天的最新备份",
+    "keep_last_description": "与 --backup 一起使用：备份成功后只保留最近的 N 个备份",
+    "keep_monthly_description": "与 --backup 一起使用：保留最近 N 个月中每月的最新备份",
+    "keep_weekly_description": "与 --backup 一起使用：保留最近 N 周中每周的最新备份",
+    "list_backup_header": "备份文件: {}",
+    "list_backups_description": "列出备份目录中的所有备份（读取目录文件，不打开归档）",
+    "list_backups_empty": "备份目录 {} 中没有备份。",
+    "list_backups_header": "备份目录 {} 中的备份（从新到旧）：",
+    "list_backups_total": "共 {} 个备份，占用 {}",
+    "list_compression": "压缩参数: {}",
+    "list_created_at": "创建时间: {}",
+    "list_data_root": "数据目录: {}",
+    "list_description": "列出备份文件的内容（读取归档开头的清单）",
+    "list_docker_volumes": "Docker 卷:",
+    "list_file_summary": "文件数: {}，总大小: {}",
+    "list_no_manifest_scanning": "备份文件 {} 不包含清单（旧版本备份），正在扫描全部内容...",
+    "list_toolkit_version": "工具版本: {}",
+    "max_total_size_description": "与 --backup 一起使用：保留的备份总大小上限（如 500M、20G），超出时从最旧的备份开始删除",
     "mirror_pull_failed": "从镜像源 '{}' 拉取失败: {}",
     "mirror_pull_success": "成功从镜像源 '{}' 拉取镜像 '{}' ({})",
     "multiple_root_directories_warning": "警告: 备份中包含多个可能的根目录: {}。无法自动确定主数据目录。",
@@ -158,16 +203,39 @@ MESSAGES = {
     "official_pull_success": "成功从官方源拉取镜像 '{}' ({})",
     "onebot_access_token": "OneBot 访问令牌: {}",
     "onebot_websocket_address": "OneBot WebSocket 连接地址: ws://127.0.0.1:{}/onebot/v11/ws",
+    "only_description": "与 --recovery / --recover-install 配合使用，只恢复选中的内容，可重复指定：data（整个数据目录）、data:<通配符>（数据目录中的路径，如 data:configs/*）、volume:<卷名>（支持通配符）。",
     "operation_cancelled": "操作已取消。",
+    "pending_restores_discarded": "丢弃之前的恢复留下、尚未导入的数据：{}",
+    "postgres_container_not_ready": "使用卷 '{}' 的 Postgres 容器在 {} 秒内未就绪，逻辑备份保留在 {}",
+    "postgres_dump_complete": "卷 '{}' 的 pg_dump 已完成: {}，{} 个分段",
+    "postgres_dump_container_found": "卷 '{}' 由运行中的 Postgres 容器 {} 使用，将以 pg_dump 逻辑备份",
+    "postgres_dump_failed": "卷 '{}' 的 pg_dump 失败: {}",
+    "postgres_dump_incomplete": "卷 '{}' 的逻辑备份不完整（备份时 pg_dump 未成功完成或数据与完成标记不一致），已跳过 pg_restore，数据库未被修改",
+    "postgres_restore_complete": "卷 '{}' 的 pg_restore 已完成",
+    "postgres_restore_failed": "卷 '{}' 的逻辑备份导入失败: {}",
+    "postgres_restore_pending": "没有使用卷 '{0}' 的运行中 Postgres 容器，逻辑备份已保存到 {1}；-ri 安装并启动服务后会自动导入，也可以启动服务后以 --only volume:{0} 重新恢复",
     "preparing_recovery_from_backup": "准备从备份文件恢复: {}",
+    "probing_registries": "正在测速官方源和镜像源：{}（{}）",
+    "progress_backup": "备份",
+    "progress_description": "与 --backup / --recovery 一起使用：进度显示方式（auto 在终端中显示进度条，否则不显示；需要定期输出 JSON 行时使用 json；默认 {}）",
+    "progress_restore": "恢复",
     "pulling_all_services": "拉取所有服务的最新镜像",
     "pulling_helper_image": "正在拉取备份 helper 镜像...",
     "pulling_image_mirrors": "正在从镜像源拉取镜像: {} ({})",
     "pulling_image_official": "正在从官方源拉取镜像: {} ({})",
+    "pulling_images_concurrently": "并发拉取 {} 个镜像（最多同时 {} 个）：{}",
     "pulling_latest_nekro_agent": "拉取最新的 nekro_agent 镜像",
     "pulling_latest_sandbox": "拉取最新的 kromiose/nekro-agent-sandbox 镜像",
     "pulling_sandbox_image": "拉取沙盒镜像",
     "pulling_service_images": "拉取服务镜像",
+    "qdrant_restore_complete": "卷 '{}' 的集合快照已全部导入",
+    "qdrant_restore_failed": "Qdrant 快照 '{}' 导入失败: {}",
+    "qdrant_restore_pending": "没有使用卷 '{0}' 的可访问 Qdrant 服务，集合快照已保存到 {1}；-ri 安装并启动服务后会自动导入，也可以启动服务后以 --only volume:{0} 重新恢复",
+    "qdrant_service_found": "卷 '{}' 由运行中的 Qdrant 服务 {} 使用，将以集合快照备份",
+    "qdrant_service_not_ready": "使用卷 '{}' 的 Qdrant 服务在 {} 秒内不可访问，集合快照保留在 {}",
+    "qdrant_snapshot_collection_done": "集合 '{}' 的快照已写入归档: {}",
+    "qdrant_snapshot_complete": "卷 '{}' 的快照备份已完成: {} 个集合，{}",
+    "qdrant_snapshot_failed": "Qdrant 快照备份 '{}' 失败: {}",
     "rebuilding_nekro_agent": "重新构建并启动 nekro_agent 容器",
     "recover_install_description": "恢复并安装。这会解压备份文件到目标目录，然后在此之上运行安装流程。",
     "recovery_description": "从备份文件恢复到指定数据目录。",
@@ -179,14 +247,30 @@ MESSAGES = {
     "recovery_module_help": "从指定的备份文件恢复数据和 Docker 卷到目标目录。",
     "recovery_step_failed": "恢复步骤失败，中止操作。",
     "recovery_success": "恢复成功！数据已恢复至: {}",
+    "registry_status_available": "镜像可用",
+    "registry_status_backoff": "已跳过，{} 分钟后重新检测（上次失败：{}）",
+    "registry_status_cached": "可用（缓存）",
+    "registry_status_missing": "镜像不存在",
+    "registry_status_unknown": "可达，无法确认镜像（{}）",
+    "registry_status_unreachable": "不可达（{}）",
+    "report_json_description": "与 --backup / --recovery 一起使用：将各阶段耗时、数据量、压缩比和吞吐量写入 JSON 报告（失败时也会写入）",
+    "report_written": "统计报告已写入：{}",
     "restarting_all_services": "重启所有服务容器",
     "restore_docker_volume_failed": "错误: 恢复 Docker 卷 '{}' 失败: {}",
     "restoring_backup_to": "正在将备份恢复到: {}",
     "restoring_data_to": "正在恢复数据到: {}",
     "restoring_docker_volume": "正在恢复 Docker 卷 '{}' 到: {}",
     "restoring_docker_volume_via_container": "正在恢复 Docker 卷 '{}' (通过容器方式)",
+    "restoring_postgres_dump": "正在容器 {1} 中以 pg_restore 恢复卷 '{0}'（{2} 个并行任务）...",
+    "restoring_qdrant_collection": "正在上传集合 '{}' 的快照 ({})...",
     "restoring_via_container_complete": "Docker 卷 '{}' 恢复完成",
     "restoring_via_container_starting": "正在通过容器恢复 Docker 卷 '{}'...",
+    "retagging_mirror_image": "将镜像重新标记为 {}",
+    "retention_applying": "保留策略：{}；现有 {} 个备份，将删除 {} 个",
+    "retention_removed_backup": "已删除备份 {}（创建于 {}）",
+    "selective_restore_no_volume_matched": "警告：没有 Docker 卷匹配选择器 {}，将不恢复任何卷。",
+    "selective_restore_selectors": "选择性恢复，仅恢复: {}",
+    "selective_restore_stopped_early": "所选文件已全部读取，跳过归档的剩余部分（未校验归档末尾记录的校验和，可使用 --verify 完整校验）",
     "service_access_info": "=== 服务访问信息 ===",
     "set_data_description": "设置或清除默认数据目录。",
     "setting_directory_permissions": "设置目录权限",
@@ -194,6 +278,10 @@ MESSAGES = {
     "starting_extraction": "开始解压和恢复文件...",
     "starting_main_service": "启动主服务",
     "starting_version_update": "开始更新版本...",
+    "streaming_postgres_dump": "正在从容器 {1} 以 pg_dump 备份卷 '{0}'，写入归档: {2}",
+    "streaming_qdrant_snapshots": "正在通过 {1} 为卷 '{0}' 的集合创建快照，写入归档: {2}",
+    "streaming_volume_complete": "Docker 卷 '{}' 已写入归档，共 {} 个条目",
+    "streaming_volume_into_archive": "正在从 helper 容器流式写入 Docker 卷 '{}'（归档为: {}/）...",
     "sudo_elevation_success": "使用 sudo 提权成功。",
     "sudo_failed_retry_exit": "sudo 提权后仍失败。重试(r/R/y/Y)，退出(n/N)：",
     "switched_to_directory": "已切换到目录: {}",
@@ -202,6 +290,7 @@ MESSAGES = {
     "target_version": "目标版本: {}",
     "trying_mirror_pull": "尝试从镜像源 '{}' 拉取镜像 '{}'",
     "unknown_system_permission": "未知系统，未设置权限: {0}",
+    "update_already_up_to_date": "所有镜像均已是最新，跳过拉取",
     "update_cancelled": "取消更新。",
     "update_complete": "更新完成!",
     "update_description": "对指定路径的安装执行部分更新。",
@@ -213,6 +302,13 @@ MESSAGES = {
     "update_module_examples": "用法示例:\n  python update.py\n    # 在当前目录更新 Nekro Agent (推荐方式)\n\n  python update.py /srv/nekro\n    # 更新位于 /srv/nekro 的 Nekro Agent\n\n  python update.py --all\n    # 在默认目录更新所有服务 (包括数据库等)\n\n  python update.py /srv/nekro --all\n    # 组合使用：在指定目录更新所有服务",
     "update_module_yes_help": "自动确认所有提示，以非交互模式运行。",
     "update_module_channel_help": "切换镜像 channel：'latest'（稳定版）或 'preview'（预览版）",
+    "update_services_changed": "需要更新：{}",
+    "update_status_changed": "{}：有新版本",
+    "update_status_container_outdated": "{}（{}）：容器仍在使用旧镜像，将重新创建",
+    "update_status_current": "{}（{}）：已是最新",
+    "update_status_image_current": "{}：已是最新",
+    "update_status_missing": "{}：本地不存在，将拉取",
+    "update_status_unknown": "{}：无法查询远程摘要，将拉取",
     "updated_version": "更新后版本: {}",
     "error_channel_switch_failed": "Channel 切换失败",
     "channel_switch_complete": "Channel 切换成功",
@@ -221,27 +317,64 @@ MESSAGES = {
     "upgrade_description": "对指定路径的安装执行完全更新（升级）。",
     "use_napcat_service": "是否同时使用 napcat 服务？[Y/n] ",
     "using_docker_compose_cmd": "使用 '{}' 作为 docker-compose 命令。",
+    "verify_description": "校验备份文件的完整性（单次流式读取，不解压到磁盘）",
+    "verify_error_checksum_mismatch": "校验和不匹配: {}",
+    "verify_error_decompression": "解压失败（压缩帧损坏或被截断）: {}",
+    "verify_error_member_missing": "缺少条目: {}",
+    "verify_error_nested_volume": "卷备份 {} 已损坏: {}",
+    "verify_error_read": "读取归档失败: {}",
+    "verify_error_trailing_data": "tar 结束标记之后存在非零数据，某个 tar 头部已损坏",
+    "verify_failed": "备份文件已损坏: {}（{} 个错误）",
+    "verify_nested_volume": "正在校验卷备份 {}",
+    "verify_no_checksums": "备份中没有记录校验和（旧版本备份），仅校验了压缩帧和 tar 结构。",
+    "verify_stats": "已校验 {} 个条目，未压缩数据 {}，归档大小 {}，耗时 {:.1f} 秒",
+    "verify_success": "备份文件完好: {}",
+    "verify_throughput": "吞吐量: {}/s（未压缩），{}/s（归档）",
+    "verifying_backup": "正在校验备份文件: {}",
     "version_description": "显示版本信息。",
     "version_update_cancelled": "取消操作",
     "version_update_complete": "版本更新完成!",
     "view_logs_instruction": "你可以通过以下命令查看服务日志：",
+    "volume_backup_done": "[{}/{}] Docker 卷 '{}' 备份完成，耗时 {:.1f} 秒",
+    "volume_backup_failed_progress": "[{}/{}] Docker 卷 '{}' 备份失败，耗时 {:.1f} 秒",
     "volume_backup_skipped": "备份中包含卷 '{}'，但未提供其恢复路径，将跳过。",
+    "volume_backup_workers": "正在并发备份 {} 个 Docker 卷（最多 {} 个同时进行）...",
+    "volume_mode_description": "与 --backup 配合使用，选择容器卷备份方式：stream 直接从 helper 容器的标准输出写入归档，file 先写入临时 .tar.gz（默认 {}）。",
+    "volume_restore_col_size": "数据量",
+    "volume_restore_col_status": "状态",
+    "volume_restore_col_time": "耗时",
+    "volume_restore_col_volume": "卷",
+    "volume_restore_status_failed": "失败",
+    "volume_restore_status_ok": "成功",
+    "volume_restore_summary": "Docker 卷恢复结果:",
+    "volume_restore_workers": "正在并发恢复 Docker 卷（最多 {} 个同时进行）...",
+    "volume_workers_description": "与 --backup / --recovery / --recover-install 配合使用，设置同时备份或恢复的 Docker 卷数量上限（默认 {}）。",
+    "waiting_for_postgres_container": "等待使用卷 '{}' 的 Postgres 容器就绪...",
+    "waiting_for_qdrant_service": "等待使用卷 '{}' 的 Qdrant 服务就绪...",
     "warning_cannot_determine_data_dir": "无法在备份文件中确定主数据目录，或备份中只包含 Docker 卷。",
     "warning_cannot_get_volume_info": "警告: 无法获取 Docker 卷 '{}' 的信息，将跳过。错误: {}",
     "warning_cannot_get_volume_list": "警告: 无法获取 Docker 卷列表: {}",
     "warning_cannot_get_volume_mountpoint": "警告: 无法获取 Docker 卷 '{}' 的挂载点，将跳过。错误: {}",
+    "warning_catalog_update_failed": "警告：无法更新备份目录文件 {}：{}",
     "warning_chmod_777": "警告: 正在设置应用目录权限为 777，这可能不安全。",
+    "warning_chunk_gc_busy": "分块仓库 {} 正被其他增量备份使用，本次跳过分块清理。",
+    "warning_chunk_gc_skipped": "警告：无法读取快照清单 {}（{}），跳过分块清理。",
     "warning_compose_file_not_found": "目录 '{}' 中未找到 docker-compose.yml 文件。",
+    "warning_compose_images_unresolved": "警告：无法解析 compose 文件中的镜像，改为使用 compose pull 拉取",
     "warning_data_dir_not_empty": "目标数据目录 '{}' 非空。恢复操作可能会覆盖现有文件。",
     "warning_docker_not_found_skip_backup": "警告: 未找到 'docker' 命令，将跳过 Docker 卷的备份。",
     "warning_docker_not_found_skip_recovery": "警告: 未找到 'docker' 命令，将跳过 Docker 卷的恢复。",
     "warning_docker_volume_invalid_path": "警告: Docker 卷 '{}' 的路径 '{}' 无效或不是一个目录，将跳过。",
     "warning_docker_volumes_will_overwrite": "将恢复以下 Docker 卷，这会覆盖卷中的现有内容:",
+    "warning_file_unreadable": "警告：无法读取 {}，未写入归档（{}）",
+    "warning_file_vanished": "警告：{} 在备份过程中被删除，未写入归档",
     "warning_prefix": "警告:",
+    "warning_report_write_failed": "警告：无法写入统计报告 {}：{}",
+    "warning_retag_failed": "警告：无法将镜像 {} 重新标记为 {}：{}",
+    "warning_retention_remove_failed": "警告：无法删除备份 {}：{}",
     "warning_skip_data_restore": "将仅恢复数据目录，跳过 Docker 卷的恢复。",
     "will_restore_docker_volume_to_path": "将恢复 Docker 卷 '{}' 到路径: {}",
     "will_restore_docker_volume_via_container": "将通过容器方式恢复 Docker 卷 '{}'",
     "with_napcat_description": "与 --install 或 --recover-install 配合使用，部署 NapCat 服务。",
     "yes_description": "自动确认所有提示，以非交互模式运行。",
-    "zstd_not_detected_tar_only": "未检测到 zstd，仅创建 .tar 归档。"
 }
\ No newline at end of file
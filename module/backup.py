@@ -2,7 +2,9 @@
 import argparse
 import os
 import sys
+import tarfile
 import time
+from typing import List, Optional
 
 # 将项目根目录添加到 sys.path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -12,15 +14,65 @@ if project_root not in sys.path:
 from utils.backup_utils import (
     create_archive, extract_archive, get_archive_root_dir, 
     get_docker_volumes, get_docker_volumes_for_recovery, 
-    get_volumes_to_backup, get_user_confirmation
+    get_volumes_to_backup, get_user_confirmation, read_archive_manifest, open_archive_stream,
+    RestoreFilter, verify_archive
 )
+from utils.chunk_store import SNAPSHOT_SUFFIX
+from utils.postgres_dump import find_postgres_containers
+from utils.qdrant_snapshot import find_qdrant_clients
+from utils.backup_codecs import ARCHIVE_SUFFIXES, CODEC_CHOICES
+from utils.backup_manifest import METADATA_MEMBERS
+from utils.backup_catalog import RetentionPolicy, load_catalog, record_backup, apply_retention
+from utils.backup_report import OperationReport
+from utils.progress import PROGRESS_MODES
+from utils.helpers import format_size, parse_size
 from module.install import install_agent
 from utils.i18n import get_message as _
-from conf.backup_settings import DOCKER_VOLUMES_TO_BACKUP, DOCKER_VOLUME_SUFFIXES
+from conf.backup_settings import (
+    DOCKER_VOLUMES_TO_BACKUP, DOCKER_VOLUME_SUFFIXES, BACKUP_COMPRESS_LEVEL, BACKUP_COMPRESS_THREADS,
+    BACKUP_VOLUME_WORKERS, BACKUP_VOLUME_MODE, BACKUP_CODEC, BACKUP_PROGRESS_MODE
+)
+
+def _finish_report(report: OperationReport, report_path: Optional[str], ok: bool) -> None:
+    """结束统计报告，指定了路径时写入 JSON 文件。"""
+    report.finish(ok)
+    if not report_path:
+        return
+    try:
+        report.write_json(report_path)
+        print(_('report_written', report_path))
+    except OSError as e:
+        print(_('warning_report_write_failed', report_path, e), file=sys.stderr)
+
+
+def backup_agent(data_dir: str, backup_dir: str, compress_level: Optional[int] = None,
+                 compress_threads: Optional[int] = None, volume_workers: Optional[int] = None,
+                 volume_mode: Optional[str] = None, incremental: bool = False,
+                 codec: Optional[str] = None, retention: Optional[RetentionPolicy] = None,
+                 report_path: Optional[str] = None, progress_mode: Optional[str] = None) -> bool:
+    """备份 Nekro Agent 数据及相关的 Docker 卷。
+
+    备份成功后记录到备份目录的目录文件，并按保留策略清理旧备份。
+
+    Args:
+        data_dir (str): 要备份的数据目录。
+        backup_dir (str): 备份文件的保存目录。
+        compress_level (int, optional): 压缩级别，None 表示使用配置默认值。
+        compress_threads (int, optional): 压缩线程数，0 表示全部核心，None 表示使用配置默认值。
+        volume_workers (int, optional): 并发备份的 Docker 卷数量上限，None 表示使用配置默认值。
+        volume_mode (str, optional): 容器卷备份方式 "stream" 或 "file"，None 表示使用配置默认值。
+        incremental (bool): 是否以增量快照方式写入备份目录下的分块仓库。
+        codec (str, optional): 压缩编解码器（auto/zstd/xz/gzip/none），None 表示使用配置默认值。
+        retention (RetentionPolicy, optional): 备份成功后应用的保留策略，None 表示使用配置默认值。
+        report_path (str, optional): 写入各阶段耗时和数据量 JSON 报告的路径，失败时也会写入。
+        progress_mode (str, optional): 进度显示方式 auto/bar/json/off，None 表示使用配置默认值。
 
-def backup_agent(data_dir: str, backup_dir: str):
-    """备份 Nekro Agent 数据及相关的 Docker 卷。"""
+    Returns:
+        bool: 备份成功返回 True，失败返回 False。
+    """
     print(_("starting_backup", data_dir))
+    report = OperationReport("backup")
+    report.info["source"] = os.path.abspath(data_dir)
     
     source_paths = {}
 
@@ -35,15 +87,24 @@ def backup_agent(data_dir: str, backup_dir: str):
     else:
         if not os.path.isdir(data_dir):
             print(_("error_data_dir_not_exist", data_dir), file=sys.stderr)
-            return
+            report.fail(_("error_data_dir_not_exist", data_dir))
+            _finish_report(report, report_path, False)
+            return False
         arcname = os.path.basename(os.path.normpath(data_dir))
         source_paths[data_dir] = arcname
 
     # 2. 获取并添加 Docker 卷路径
     print(f"\n{_('finding_docker_volumes_backup')}")
-    volumes_to_backup = get_volumes_to_backup(DOCKER_VOLUMES_TO_BACKUP, DOCKER_VOLUME_SUFFIXES)
-    volume_paths = get_docker_volumes(volumes_to_backup)
+    with report.phase("volume_discovery"):
+        volumes_to_backup = get_volumes_to_backup(DOCKER_VOLUMES_TO_BACKUP, DOCKER_VOLUME_SUFFIXES)
+        volume_paths = get_docker_volumes(volumes_to_backup)
+        # 服务运行时 Postgres 卷改用 pg_dump 逻辑备份，不再复制正在写入的卷文件
+        postgres_dumps = find_postgres_containers(list(volume_paths))
+        # Qdrant 卷改用集合快照，API 密钥读取自数据目录的 .env
+        qdrant_snapshots = find_qdrant_clients(list(volume_paths), os.path.join(data_dir, ".env"))
     for name, path_or_method in volume_paths.items():
+        if name in postgres_dumps or name in qdrant_snapshots:
+            continue
         if path_or_method == "container_backup":
             # 使用容器方式备份的卷
             source_paths[f"volumes/{name}"] = "container_backup"
@@ -52,9 +113,10 @@ def backup_agent(data_dir: str, backup_dir: str):
             source_paths[path_or_method] = os.path.join('volumes', name)
         # 如果卷不可用，get_docker_volumes 已经打印了警告
 
-    if len(source_paths) == 1 and list(source_paths.keys())[0] == data_dir and not os.path.isdir(data_dir):
+    if len(source_paths) == 1 and not postgres_dumps and not qdrant_snapshots and list(source_paths.keys())[0] == data_dir and not os.path.isdir(data_dir):
         # 如果只有数据目录一个源，且该目录无效，则终止
-        return
+        _finish_report(report, report_path, False)
+        return False
 
     # 3. 创建备份目录和文件名
     os.makedirs(backup_dir, exist_ok=True)
@@ -64,37 +126,104 @@ def backup_agent(data_dir: str, backup_dir: str):
 
     # 4. 执行备份
     print(f"\n{_('creating_archive')}")
-    final_archive_path = create_archive(source_paths, dest_path_base)
+    start_time = time.monotonic()
+    final_archive_path = create_archive(source_paths, dest_path_base,
+                                        compress_level=compress_level,
+                                        compress_threads=compress_threads,
+                                        volume_workers=volume_workers,
+                                        volume_mode=volume_mode,
+                                        incremental=incremental,
+                                        codec=codec,
+                                        postgres_dumps=postgres_dumps,
+                                        qdrant_snapshots=qdrant_snapshots,
+                                        report=report,
+                                        progress_mode=progress_mode)
 
     if final_archive_path:
         print(f"\n{_('backup_success')}")
         print(final_archive_path)
-    else:
-        print(f"\n{_('recovery_failed')}")
+        # 5. 记录到目录文件并按保留策略清理旧备份
+        with report.phase("catalog"):
+            entry = record_backup(backup_dir, final_archive_path, time.monotonic() - start_time,
+                                  sha256=report.info.get("sha256"))
+        report.info["sha256"] = entry["sha256"]
+        policy = retention or RetentionPolicy()
+        if policy.enabled:
+            print(f"\n{_('applying_retention_policy')}")
+            with report.phase("retention"):
+                removed = apply_retention(backup_dir, policy)
+            report.info["pruned"] = [e["name"] for e in removed]
+        _finish_report(report, report_path, True)
+        return True
+    print(f"\n{_('backup_failed')}")
+    _finish_report(report, report_path, False)
+    return False
+
+def recover_agent(backup_file: str, data_dir: str, non_interactive: bool = False,
+                  volume_workers: Optional[int] = None, only: Optional[List[str]] = None,
+                  report_path: Optional[str] = None, progress_mode: Optional[str] = None):
+    """从备份文件恢复 Nekro Agent 数据和 Docker 卷。
 
-def recover_agent(backup_file: str, data_dir: str, non_interactive: bool = False):
-    """从备份文件恢复 Nekro Agent 数据和 Docker 卷。"""
+    Args:
+        backup_file (str): 备份文件路径。
+        data_dir (str): 恢复的目标数据目录。
+        non_interactive (bool): 是否跳过所有确认。
+        volume_workers (int, optional): 同时恢复的 Docker 卷数量上限，None 表示使用配置默认值。
+        only (list[str], optional): 选择性恢复的选择器（"data"、"data:<glob>"、"volume:<name>"），
+            None 表示恢复全部内容。
+        report_path (str, optional): 写入各阶段耗时和数据量 JSON 报告的路径，失败时也会写入。
+        progress_mode (str, optional): 进度显示方式 auto/bar/json/off，None 表示使用配置默认值。
+    """
     print(_('preparing_recovery_from_backup', backup_file))
+    report = OperationReport("restore")
+    report.info["archive"] = os.path.abspath(backup_file)
+    report.info["destination"] = os.path.abspath(data_dir)
     if not os.path.isfile(backup_file):
         print(_("error_backup_file_not_exist", backup_file), file=sys.stderr)
+        report.fail(_("error_backup_file_not_exist", backup_file))
+        _finish_report(report, report_path, False)
         return False
     
-    if not backup_file.endswith(('.tar', '.tar.zstd')):
+    if not backup_file.endswith(ARCHIVE_SUFFIXES + (SNAPSHOT_SUFFIX,)):
         print(_("error_invalid_backup_format"), file=sys.stderr)
+        report.fail(_("error_invalid_backup_format"))
+        _finish_report(report, report_path, False)
         return False
 
+    restore_filter = None
+    if only:
+        try:
+            restore_filter = RestoreFilter(only)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            report.fail(e)
+            _finish_report(report, report_path, False)
+            return False
+        print(_('selective_restore_selectors', ", ".join(only)))
+
     os.makedirs(data_dir, exist_ok=True)
 
     # 检查目标数据目录是否为空
-    if os.listdir(data_dir) and not non_interactive:
+    if (restore_filter is None or restore_filter.wants_data) and os.listdir(data_dir) and not non_interactive:
         print(_("warning_data_dir_not_empty", data_dir))
         if not get_user_confirmation():
+            report.fail(_("operation_cancelled"))
+            _finish_report(report, report_path, False)
             return False
 
     # 1. 查找需要恢复的 Docker 卷
-    print(f"\n{_('finding_docker_volumes_recovery')}")
-    volumes_to_backup = get_volumes_to_backup(DOCKER_VOLUMES_TO_BACKUP, DOCKER_VOLUME_SUFFIXES)
-    available_volumes = get_docker_volumes_for_recovery(volumes_to_backup)
+    available_volumes = {}
+    if restore_filter is None or restore_filter.wants_volumes:
+        print(f"\n{_('finding_docker_volumes_recovery')}")
+        with report.phase("volume_discovery"):
+            volumes_to_backup = get_volumes_to_backup(DOCKER_VOLUMES_TO_BACKUP, DOCKER_VOLUME_SUFFIXES)
+            if restore_filter:
+                # 只准备选中的卷，未选中的卷不会被创建或覆盖
+                volumes_to_backup = [name for name in volumes_to_backup if restore_filter.includes_volume(name)]
+                if not volumes_to_backup:
+                    print(_('selective_restore_no_volume_matched', ", ".join(restore_filter.volume_globs)), file=sys.stderr)
+            if volumes_to_backup:
+                available_volumes = get_docker_volumes_for_recovery(volumes_to_backup)
     
     if available_volumes and not non_interactive:
         print(_("warning_docker_volumes_will_overwrite"))
@@ -109,15 +238,168 @@ def recover_agent(backup_file: str, data_dir: str, non_interactive: bool = False
     print(f"\n{_('starting_extraction')}")
     # 传递卷名映射，extract_archive 会根据系统类型选择恢复方式
     volume_mountpoints = {name: info for name, info in available_volumes.items()}
-    if extract_archive(backup_file, data_dir, volume_mountpoints=volume_mountpoints):
+    if extract_archive(backup_file, data_dir, volume_mountpoints=volume_mountpoints,
+                       volume_workers=volume_workers, restore_filter=restore_filter, report=report,
+                       progress_mode=progress_mode):
         print(_("recovery_success", data_dir))
         if volume_mountpoints:
             print(_("docker_volumes_restored"))
+        _finish_report(report, report_path, True)
         return True
     else:
         print(f"\n{_('recovery_failed')}")
+        _finish_report(report, report_path, False)
+        return False
+
+
+def list_backup(backup_file: str) -> bool:
+    """列出备份文件的内容。
+
+    优先读取归档开头的清单，只需解压归档的开头部分；
+    旧版本归档没有清单时，顺序扫描全部成员。
+
+    Args:
+        backup_file (str): 备份文件（.tar / .tar.zstd / .tar.xz / .tar.gz / .snapshot.json）路径。
+
+    Returns:
+        bool: 成功返回 True，失败返回 False。
+    """
+    if not os.path.isfile(backup_file):
+        print(_("error_backup_file_not_exist", backup_file), file=sys.stderr)
+        return False
+
+    if not backup_file.endswith(ARCHIVE_SUFFIXES + (SNAPSHOT_SUFFIX,)):
+        print(_("error_invalid_backup_format"), file=sys.stderr)
+        return False
+
+    manifest = read_archive_manifest(backup_file)
+    if manifest is None:
+        # 旧版本归档：没有清单，只能读取整个归档
+        print(_('list_no_manifest_scanning', backup_file))
+        try:
+            with open_archive_stream(backup_file) as stream:
+                with tarfile.open(fileobj=stream, mode="r|") as tar:
+                    for member in tar:
+                        if member.isreg() and member.name not in METADATA_MEMBERS:
+                            print(f"  {format_size(member.size):>10}  "
+                                  f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(member.mtime))}  "
+                                  f"{member.name}")
+        except (OSError, ValueError, tarfile.TarError) as e:
+            print(_('error_archive_extraction_failed', e), file=sys.stderr)
+            return False
+        return True
+
+    files = manifest.get("files", [])
+    compression = manifest.get("compression", {})
+    print(_('list_backup_header', backup_file))
+    print(f"  - {_('list_toolkit_version', manifest.get('toolkit', '-'))}")
+    print(f"  - {_('list_created_at', time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(manifest.get('created', 0))))}")
+    print(f"  - {_('list_compression', ', '.join(f'{k}={v}' for k, v in compression.items()))}")
+    print(f"  - {_('list_data_root', manifest.get('root_dir') or '-')}")
+    print(f"  - {_('list_file_summary', len(files), format_size(sum(f.get('size', 0) for f in files)))}")
+    volumes = manifest.get("volumes", [])
+    if volumes:
+        print(f"  - {_('list_docker_volumes')}")
+        for volume in volumes:
+            print(f"      {volume['name']} ({volume.get('method', '-')}) -> {volume.get('arcname', '-')}")
+    print()
+    for entry in files:
+        print(f"  {format_size(entry.get('size', 0)):>10}  "
+              f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry.get('mtime', 0)))}  "
+              f"{entry['path']}")
+    return True
+
+
+def list_backups(backup_dir: str) -> bool:
+    """列出备份目录中的所有备份，只读取目录文件，不打开归档。
+
+    Args:
+        backup_dir (str): 备份目录。
+
+    Returns:
+        bool: 成功返回 True，目录不存在返回 False。
+    """
+    if not os.path.isdir(backup_dir):
+        print(_("error_backup_dir_not_exist", backup_dir), file=sys.stderr)
+        return False
+
+    entries = load_catalog(backup_dir)
+    if not entries:
+        print(_('list_backups_empty', backup_dir))
+        return True
+    print(_('list_backups_header', backup_dir))
+    for entry in reversed(entries):
+        duration = entry.get("duration")
+        print(f"  {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['created']))}  "
+              f"{format_size(entry.get('size', 0)):>10}  "
+              f"{(f'{duration:.1f}s' if duration is not None else '-'):>8}  "
+              f"{entry.get('codec') or '-':<11}  "
+              f"{(entry.get('sha256') or '-')[:12]:<12}  "
+              f"{entry['name']}")
+    print(_('list_backups_total', len(entries), format_size(sum(e.get('size', 0) for e in entries))))
+    return True
+
+
+def add_retention_arguments(parser: argparse.ArgumentParser) -> None:
+    """向命令行解析器添加保留策略参数。"""
+    parser.add_argument('--keep-last', type=int, metavar='N', help=_('keep_last_description'))
+    parser.add_argument('--keep-daily', type=int, metavar='N', help=_('keep_daily_description'))
+    parser.add_argument('--keep-weekly', type=int, metavar='N', help=_('keep_weekly_description'))
+    parser.add_argument('--keep-monthly', type=int, metavar='N', help=_('keep_monthly_description'))
+    parser.add_argument('--max-total-size', metavar='SIZE', help=_('max_total_size_description'))
+
+
+def get_retention_policy(args: argparse.Namespace) -> RetentionPolicy:
+    """根据命令行参数构造保留策略，未指定的规则使用配置默认值。
+
+    Raises:
+        ValueError: 参数无效，异常信息可直接展示给用户。
+    """
+    max_total_size = None
+    if args.max_total_size is not None:
+        try:
+            max_total_size = parse_size(args.max_total_size)
+        except ValueError:
+            raise ValueError(_('error_invalid_size', args.max_total_size))
+    counts = (args.keep_last, args.keep_daily, args.keep_weekly, args.keep_monthly)
+    if any(n is not None and n < 0 for n in counts):
+        raise ValueError(_('error_invalid_retention_count'))
+    return RetentionPolicy(*counts, max_total_size=max_total_size)
+
+
+def verify_backup(backup_file: str) -> bool:
+    """校验备份文件的完整性，无需解压到磁盘。
+
+    Args:
+        backup_file (str): 备份文件（.tar / .tar.zstd / .tar.xz / .tar.gz / .snapshot.json）路径。
+
+    Returns:
+        bool: 备份完好返回 True，否则返回 False。
+    """
+    if not os.path.isfile(backup_file):
+        print(_("error_backup_file_not_exist", backup_file), file=sys.stderr)
+        return False
+
+    if not backup_file.endswith(ARCHIVE_SUFFIXES + (SNAPSHOT_SUFFIX,)):
+        print(_("error_invalid_backup_format"), file=sys.stderr)
         return False
 
+    print(_('verifying_backup', backup_file))
+    result = verify_archive(backup_file)
+    elapsed = max(result["elapsed"], 1e-6)
+    print(f"  - {_('verify_stats', result['members'], format_size(result['bytes']), format_size(result['archive_size']), result['elapsed'])}")
+    print(f"  - {_('verify_throughput', format_size(result['bytes'] / elapsed), format_size(result['archive_size'] / elapsed))}")
+    if not result["has_manifest"]:
+        print(f"  - {_('verify_no_checksums')}")
+
+    if result["ok"]:
+        print(_('verify_success', backup_file))
+        return True
+    for error in result["errors"]:
+        print(f"  - {error}", file=sys.stderr)
+    print(_('verify_failed', backup_file, len(result["errors"])), file=sys.stderr)
+    return False
+
 
 def main():
     """备份与恢复工具的独立命令行入口。"""
@@ -127,15 +409,55 @@ def main():
                        help=_('backup_module_help'))
     group.add_argument('-r', '--recovery', nargs=2, metavar=('BACKUP_FILE', 'DATA_DIR'), 
                        help=_('recovery_module_help'))
+    group.add_argument('--list', metavar='BACKUP_FILE', help=_('list_description'))
+    group.add_argument('--verify', metavar='BACKUP_FILE', help=_('verify_description'))
+    group.add_argument('--list-backups', metavar='BACKUP_DIR', help=_('list_backups_description'))
+    parser.add_argument('--only', action='append', metavar='SELECTOR', help=_('only_description'))
+    parser.add_argument('--compress-level', type=int, metavar='N',
+                        help=_('compress_level_description', BACKUP_COMPRESS_LEVEL))
+    parser.add_argument('--compress-threads', type=int, metavar='N',
+                        help=_('compress_threads_description', BACKUP_COMPRESS_THREADS))
+    parser.add_argument('--volume-workers', type=int, metavar='N',
+                        help=_('volume_workers_description', BACKUP_VOLUME_WORKERS))
+    parser.add_argument('--volume-mode', choices=['stream', 'file'],
+                        help=_('volume_mode_description', BACKUP_VOLUME_MODE))
+    parser.add_argument('--incremental', action='store_true',
+                        help=_('incremental_description'))
+    parser.add_argument('--codec', choices=CODEC_CHOICES,
+                        help=_('codec_description', BACKUP_CODEC))
+    add_retention_arguments(parser)
+    parser.add_argument('--report-json', metavar='PATH', help=_('report_json_description'))
+    parser.add_argument('--progress', choices=PROGRESS_MODES,
+                        help=_('progress_description', BACKUP_PROGRESS_MODE))
 
     args = parser.parse_args()
+    try:
+        retention = get_retention_policy(args)
+    except ValueError as e:
+        parser.error(str(e))
 
     if args.backup:
         data_dir, backup_dir = args.backup
-        backup_agent(data_dir, backup_dir)
+        backup_agent(data_dir, backup_dir,
+                     compress_level=args.compress_level,
+                     compress_threads=args.compress_threads,
+                     volume_workers=args.volume_workers,
+                     volume_mode=args.volume_mode,
+                     incremental=args.incremental,
+                     codec=args.codec,
+                     retention=retention,
+                     report_path=args.report_json,
+                     progress_mode=args.progress)
     elif args.recovery:
         backup_file, data_dir = args.recovery
-        recover_agent(backup_file, data_dir)
+        recover_agent(backup_file, data_dir, volume_workers=args.volume_workers, only=args.only,
+                      report_path=args.report_json, progress_mode=args.progress)
+    elif args.list:
+        list_backup(args.list)
+    elif args.verify:
+        sys.exit(0 if verify_backup(args.verify) else 1)
+    elif args.list_backups:
+        sys.exit(0 if list_backups(args.list_backups) else 1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from utils import backup_utils
+from utils.backup_utils import create_archive, extract_archive, verify_archive
+
+
+class SourceChangedDuringBackupTest(unittest.TestCase):
+    """扫描清单之后、写入数据之前源文件发生变化时，归档仍然可以校验和恢复。"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.work_dir, "na_data")
+        os.makedirs(os.path.join(self.source, "configs"))
+        for name in ("f1.txt", "f2.txt"):
+            with open(os.path.join(self.source, "configs", name), "w") as f:
+                f.write(name)
+        self.dest = os.path.join(self.work_dir, "restore")
+        os.makedirs(self.dest)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+    def test_file_deleted_after_manifest_scan(self):
+        scan_source_files = backup_utils.scan_source_files
+
+        def scan_then_delete(*args, **kwargs):
+            files = scan_source_files(*args, **kwargs)
+            os.remove(os.path.join(self.source, "configs", "f1.txt"))
+            return files
+
+        with mock.patch.object(backup_utils, "scan_source_files", scan_then_delete):
+            archive = create_archive({self.source: "na_data"}, os.path.join(self.work_dir, "backup"),
+                                     codec="gzip", progress_mode="off")
+        self.assertIsNotNone(archive)
+
+        result = verify_archive(archive)
+        self.assertTrue(result["ok"], result["errors"])
+
+        self.assertTrue(extract_archive(archive, self.dest, progress_mode="off"))
+        self.assertEqual(os.listdir(os.path.join(self.dest, "configs")), ["f2.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,8 +10,14 @@
 
 用法：
   python3 tools/backup_docker_images.py [--output FILE]
+  python3 tools/backup_docker_images.py --bundle DIR [--codec zstd] [--level 3]
 
 这个脚本尽量保持简单：自动 pull 每个镜像，然后一次性 docker save 并写入 gzip 文件（流式写入，节省内存）。
+能直接访问 Docker 守护进程的套接字时通过 Engine API 拉取和导出，否则使用 docker 命令。
+
+使用 --bundle 时改为生成按层去重的镜像包目录（见 utils/image_bundle.py）：各镜像共用的层只保存一次，
+新内容以多线程 zstd 压缩；对已有的镜像包再次运行时，镜像未变化的直接跳过，只写入新增的层。
+用 tools/import_docker_images.py --bundle DIR 导入。
 """
 
 import argparse
@@ -22,6 +28,16 @@ import subprocess
 import sys
 from typing import List
 
+# 将项目根目录添加到 sys.path，确保可以正确导入本地模块
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.docker_api import STREAM_CHUNK_SIZE, DockerAPIError, get_docker_client
+from utils.backup_codecs import select_codec
+from utils.helpers import format_size
+from utils.image_bundle import BundleError, ImageBundle, get_image_id, open_image_save
+
 IMAGES: List[str] = [
     "mlikiowa/napcat-docker:latest",
     # "kromiose/nekro-agent-sandbox:latest",
@@ -32,30 +48,61 @@ IMAGES: List[str] = [
 
 DEFAULT_OUTPUT = "docker-images-backup.tar.gz"
 
+# 镜像包默认的压缩级别（层只压缩一次，之后的刷新会复用，可以比备份用更高的级别）
+DEFAULT_BUNDLE_LEVEL = 10
+
 
 def parse_args():
     p = argparse.ArgumentParser(description="简化的 Docker 镜像导出脚本")
     p.add_argument("--output", "-o", default=DEFAULT_OUTPUT, help="输出 .tar.gz 文件路径")
+    p.add_argument("--bundle", "-b", metavar="DIR", help="生成或刷新按层去重的镜像包目录（代替 .tar.gz）")
+    p.add_argument("--codec", default="auto", choices=["auto", "zstd", "xz", "gzip"],
+                   help="镜像包新内容的压缩方式，auto 优先 zstd")
+    p.add_argument("--level", type=int, default=DEFAULT_BUNDLE_LEVEL, help="镜像包的压缩级别")
+    p.add_argument("--threads", type=int, default=0, help="压缩线程数，0 表示使用全部 CPU 核心")
     return p.parse_args()
 
 
 def ensure_docker_available() -> None:
-    if shutil.which("docker") is None:
+    if get_docker_client() is None and shutil.which("docker") is None:
         print("❌ Docker 未安装或不可用，请先安装 Docker 并确保在 PATH 中。")
         sys.exit(1)
 
 
 def pull_images(images: List[str]) -> None:
+    client = get_docker_client()
     for img in images:
         print(f"📥 拉取镜像：{img}（如果已存在会跳过或更新）")
         try:
-            subprocess.run(["docker", "pull", img], check=True)
-        except subprocess.CalledProcessError as e:
+            if client:
+                client.pull_image(img)
+            else:
+                subprocess.run(["docker", "pull", img], check=True)
+        except (subprocess.CalledProcessError, DockerAPIError) as e:
             print(f"⚠️ 拉取镜像 {img} 失败：{e}")
             print("继续尝试导出已存在的镜像（如果没有则会在 docker save 时失败）")
 
 
+def api_save_and_gzip(images: List[str], output_file: str) -> int:
+    client = get_docker_client()
+    print("📦 正在通过 Docker API 导出：", " ".join(images))
+    try:
+        response = client.save_images(images)
+        with gzip.open(output_file, "wb") as gz:
+            shutil.copyfileobj(response, gz, STREAM_CHUNK_SIZE)
+    except DockerAPIError as e:
+        print("❌ docker save 失败，错误信息：")
+        print(e)
+        return 1
+    except Exception as e:
+        print("❌ 导出/压缩过程中出错：", e)
+        return 3
+    return 0
+
+
 def stream_save_and_gzip(images: List[str], output_file: str) -> int:
+    if get_docker_client():
+        return api_save_and_gzip(images, output_file)
     cmd = ["docker", "save"] + images
     print("📦 正在执行：", " ".join(cmd))
     try:
@@ -88,6 +135,49 @@ def stream_save_and_gzip(images: List[str], output_file: str) -> int:
     return proc.returncode
 
 
+def build_bundle(images: List[str], bundle_dir: str, codec_name: str, level: int, threads: int) -> int:
+    """生成或刷新按层去重的镜像包，返回 0 表示成功。"""
+    try:
+        codec = select_codec(codec_name)
+        bundle = ImageBundle(bundle_dir)
+    except (ValueError, BundleError) as e:
+        print("❌", e)
+        return 1
+    print(f"📦 镜像包：{bundle_dir}（压缩方式：{codec.name} {codec.backend()}，级别 {level}）")
+    failed = []
+    for img in images:
+        image_id = get_image_id(img)
+        if image_id is None:
+            print(f"❌ 本地不存在镜像：{img}")
+            failed.append(img)
+            continue
+        if bundle.is_current(img, image_id):
+            print(f"✅ {img} 未变化（{image_id[7:19]}），跳过")
+            continue
+        print(f"🔁 导出 {img}（{image_id[7:19]}）...")
+        try:
+            with open_image_save(img) as stream:
+                new_bytes = bundle.add_image(img, image_id, stream, codec, level, threads)
+        except (OSError, DockerAPIError, subprocess.CalledProcessError) as e:
+            print(f"❌ 导出 {img} 失败：{e}")
+            failed.append(img)
+            continue
+        # 每个镜像完成后立即写入清单，中断后再次运行可以接着处理
+        bundle.save()
+        print(f"   镜像大小 {format_size(bundle.image_size(img))}，新写入 {format_size(new_bytes)}")
+
+    for img in bundle.retain_images(images):
+        print(f"🗑️ 移除不再需要的镜像：{img}")
+    freed = bundle.prune_blobs()
+    bundle.save()
+    if freed:
+        print(f"🗑️ 清理不再被引用的层：{format_size(freed)}")
+    logical = sum(bundle.image_size(img) for img in bundle.images)
+    print(f"📊 共 {len(bundle.images)} 个镜像，未压缩合计 {format_size(logical)}，"
+          f"镜像包实际占用 {format_size(bundle.stored_size())}")
+    return 1 if failed else 0
+
+
 def main() -> None:
     args = parse_args()
     output_file = args.output
@@ -97,6 +187,13 @@ def main() -> None:
     # 尝试拉取镜像以确保存在
     pull_images(IMAGES)
 
+    if args.bundle:
+        rc = build_bundle(IMAGES, args.bundle, args.codec, args.level, args.threads)
+        if rc == 0:
+            print(f"✅ 镜像包已更新：{args.bundle}")
+            print(f"提示：使用 python3 tools/import_docker_images.py --bundle {args.bundle} 导入")
+        sys.exit(rc)
+
     # 删除已有文件以避免追加
     if os.path.exists(output_file):
         print(f"ℹ️ 输出文件已存在，正在覆盖：{output_file}")
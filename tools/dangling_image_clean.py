@@ -16,14 +16,26 @@ Python 版本的 Docker 悬空镜像清理脚本（等价于 tools/dangling-imag
   python3 tools/dangling_image_clean.py --yes
   python3 tools/dangling_image_clean.py --dry-run
 
+能直接访问 Docker 守护进程的套接字时，查询和删除都通过 Engine API 完成，否则使用 docker 命令。
 """
 
 import argparse
+import os
 import shutil
 import subprocess
 import sys
 import time
-from typing import List
+from typing import Dict, List
+
+# 将项目根目录添加到 sys.path，确保可以正确导入本地模块
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.docker_api import DockerAPIError, get_docker_client
+
+# 通过 Docker API 查询到的悬空镜像大小，避免逐个 inspect
+_image_sizes: Dict[str, int] = {}
 
 
 def human_readable_size(num: int) -> str:
@@ -36,7 +48,7 @@ def human_readable_size(num: int) -> str:
 
 
 def check_docker_available() -> None:
-    if shutil.which("docker") is None:
+    if get_docker_client() is None and shutil.which("docker") is None:
         print("❌ Docker 未安装或不在 PATH 中，请先安装 Docker。")
         sys.exit(1)
 
@@ -53,6 +65,16 @@ def run(cmd: List[str], capture: bool = False) -> subprocess.CompletedProcess:
 
 
 def list_dangling_images() -> List[str]:
+    client = get_docker_client()
+    if client:
+        try:
+            images = client.list_images({"dangling": ["true"]})
+        except DockerAPIError as e:
+            print("❌ 查询悬空镜像时出错：", e)
+            sys.exit(1)
+        _image_sizes.clear()
+        _image_sizes.update({image["Id"]: image.get("Size", 0) for image in images})
+        return list(_image_sizes)
     cp = run(["docker", "images", "-q", "-f", "dangling=true"], capture=True)
     if cp.returncode != 0:
         # If docker returns error, show stderr and exit
@@ -67,10 +89,16 @@ def list_dangling_images() -> List[str]:
 
 def show_dangling_images_verbose() -> None:
     print("\n找到以下悬空镜像（即将被删除）：")
+    if get_docker_client():
+        for id_, size in _image_sizes.items():
+            print(f"  {id_[7:19]}  {human_readable_size(size)}")
+        return
     _ = run(["docker", "images", "--filter", "dangling=true"], capture=False)
 
 
 def compute_total_size(ids: List[str]) -> int:
+    if get_docker_client():
+        return sum(_image_sizes.get(id_, 0) for id_ in ids)
     total = 0
     for id_ in ids:
         cp = run(["docker", "inspect", "--format={{.Size}}", id_], capture=True)
@@ -103,6 +131,17 @@ def remove_images(ids: List[str], dry_run: bool = False) -> bool:
         print("[dry-run] 将执行命令：", " ".join(cmd))
         return True
     print("开始删除悬空镜像...")
+    client = get_docker_client()
+    if client:
+        failed = False
+        for id_ in ids:
+            try:
+                client.remove_image(id_)
+            except DockerAPIError as e:
+                print(f"警告：删除 {id_[7:19]} 时出现错误：{e}")
+                failed = True
+        print("删除命令执行完成。")
+        return not failed
     cp = run(cmd, capture=True)
     if cp.returncode != 0:
         # Print stderr but continue
@@ -120,11 +159,36 @@ def prune_images(dry_run: bool = False) -> None:
         print("[dry-run] 将执行： docker image prune -f")
         return
     print("执行 docker image prune -f 以进行最终清理...")
+    client = get_docker_client()
+    if client:
+        try:
+            result = client.prune_images()
+            print("已释放空间：", human_readable_size(result.get("SpaceReclaimed") or 0))
+        except DockerAPIError as e:
+            print("警告：清理失败：", e)
+        return
     _ = run(["docker", "image", "prune", "-f"], capture=False)
 
 
 def show_docker_df() -> None:
     print("\n当前 Docker 磁盘使用情况:")
+    client = get_docker_client()
+    if client:
+        try:
+            usage = client.disk_usage()
+        except DockerAPIError as e:
+            print("⚠️ 无法获取磁盘使用情况：", e)
+            return
+        images = usage.get("Images") or []
+        containers = usage.get("Containers") or []
+        volumes = usage.get("Volumes") or []
+        print(f"{'TYPE':<16}{'TOTAL':>8}  SIZE")
+        print(f"{'Images':<16}{len(images):>8}  {human_readable_size(usage.get('LayersSize') or 0)}")
+        print(f"{'Containers':<16}{len(containers):>8}  "
+              f"{human_readable_size(sum(c.get('SizeRw') or 0 for c in containers))}")
+        print(f"{'Local Volumes':<16}{len(volumes):>8}  "
+              f"{human_readable_size(sum(max(0, (v.get('UsageData') or {}).get('Size', 0)) for v in volumes))}")
+        return
     _ = run(["docker", "system", "df"], capture=False)
 
 
@@ -8,12 +8,15 @@ import_docker_images.py
 用法示例：
   python3 tools/import_docker_images.py
   python3 tools/import_docker_images.py --input my-backup.tar.gz --remove-after
+  python3 tools/import_docker_images.py --bundle images-bundle/
 
 功能：
  - 检查 docker 是否可用
  - 检查输入文件存在
  - 以流方式打开 gzip 并把内容写入 `docker load` 的 stdin（不解压到磁盘）
  - 可选导入后列出镜像和删除源文件
+能直接访问 Docker 守护进程的套接字时，解压数据以分块编码直接上传到 Engine API，不再启动 docker load。
+使用 --bundle 时从按层去重的镜像包目录导入：逐个镜像重建 docker save 数据流并校验内容摘要。
 """
 
 import argparse
@@ -22,7 +25,15 @@ import os
 import shutil
 import subprocess
 import sys
-from typing import Optional
+from typing import Iterator, List, Optional
+
+# 将项目根目录添加到 sys.path，确保可以正确导入本地模块
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.docker_api import STREAM_CHUNK_SIZE, DockerAPIError, get_docker_client
+from utils.image_bundle import BundleError, ImageBundle
 
 DEFAULT_INPUT = "docker-images-backup.tar.gz"
 
@@ -32,21 +43,56 @@ def parse_args():
     p.add_argument("--input", "-i", default=DEFAULT_INPUT, help="输入的 .tar.gz 文件路径")
     p.add_argument("--remove-after", "-r", action="store_true", help="导入成功后删除输入文件")
     p.add_argument("--show-images", "-s", action="store_true", help="导入后列出本地镜像")
+    p.add_argument("--bundle", "-b", metavar="DIR", help="从按层去重的镜像包目录导入（代替 --input）")
+    p.add_argument("--image", action="append", dest="images", metavar="IMAGE",
+                   help="只导入镜像包中的指定镜像，可重复使用")
     return p.parse_args()
 
 
 def ensure_docker_available() -> None:
-    if shutil.which("docker") is None:
+    if get_docker_client() is None and shutil.which("docker") is None:
         print("❌ Docker 未安装或不可用，请先安装 Docker 并确保在 PATH 中。")
         sys.exit(1)
 
 
+def _read_gzip_chunks(input_path: str) -> Iterator[bytes]:
+    with gzip.open(input_path, "rb") as gz:
+        while True:
+            chunk = gz.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+def api_import_from_gzip(input_path: str) -> int:
+    """通过 Docker API 导入镜像，返回值与 import_from_gzip 一致。"""
+    print("📥 通过 Docker API 从 gzip 流中导入镜像...")
+    try:
+        for line in get_docker_client().load_images(_read_gzip_chunks(input_path)):
+            print(line)
+    except KeyboardInterrupt:
+        print("⛔ 用户中断，已停止上传。")
+        return 4
+    except DockerAPIError as e:
+        print("❌ docker load 失败，错误信息：")
+        print(e)
+        return 1
+    except Exception as e:
+        print("❌ 在读取 gzip 或上传到 Docker 时发生异常：", e)
+        return 5
+    print("✅ 镜像导入完成。")
+    return 0
+
+
 def import_from_gzip(input_path: str) -> int:
     """将 input_path 的解压数据写入 docker load 的 stdin。返回 docker load 的退出码。"""
     if not os.path.isfile(input_path):
         print(f"❌ 找不到输入文件：{input_path}")
         return 2
 
+    if get_docker_client():
+        return api_import_from_gzip(input_path)
+
     cmd = ["docker", "load"]
     print("📥 启动 docker load 并从 gzip 流中导入镜像...")
 
@@ -107,7 +153,66 @@ def import_from_gzip(input_path: str) -> int:
     return proc.returncode
 
 
+def import_from_bundle(bundle_dir: str, images: Optional[List[str]] = None) -> int:
+    """从镜像包逐个导入镜像，返回值与 import_from_gzip 一致。"""
+    try:
+        bundle = ImageBundle(bundle_dir)
+    except BundleError as e:
+        print("❌ 无法读取镜像包：", e)
+        return 2
+    if not bundle.images:
+        print(f"❌ 镜像包中没有镜像：{bundle_dir}")
+        return 2
+    missing = [img for img in images or [] if img not in bundle.images]
+    if missing:
+        print("❌ 镜像包中没有这些镜像：", " ".join(missing))
+        return 2
+    client = get_docker_client()
+    for img in images or list(bundle.images):
+        print(f"📥 导入 {img} ...")
+        try:
+            if client:
+                for line in client.load_images(bundle.iter_image_tar(img)):
+                    print(line)
+                continue
+            proc = subprocess.Popen(["docker", "load"], stdin=subprocess.PIPE)
+            try:
+                bundle.write_image_tar(img, proc.stdin)
+                proc.stdin.close()
+            except BaseException:
+                proc.kill()
+                proc.wait()
+                raise
+            if proc.wait() != 0:
+                print(f"❌ docker load 返回非零退出码：{proc.returncode}")
+                return 1
+        except KeyboardInterrupt:
+            print("⛔ 用户中断，已停止导入。")
+            return 4
+        except BundleError as e:
+            print("❌ 镜像包内容有误：", e)
+            return 5
+        except DockerAPIError as e:
+            print("❌ docker load 失败，错误信息：")
+            print(e)
+            return 1
+        except OSError as e:
+            print("❌ 在读取镜像包或上传到 Docker 时发生异常：", e)
+            return 5
+    print("✅ 镜像导入完成。")
+    return 0
+
+
 def list_images() -> None:
+    client = get_docker_client()
+    if client:
+        try:
+            for image in client.list_images():
+                for tag in image.get("RepoTags") or ["<none>:<none>"]:
+                    print(f"{tag:<60} {image['Id'][7:19]}  {image.get('Size', 0) / 1e6:.1f}MB")
+        except DockerAPIError as e:
+            print("⚠️ 无法列出 docker images：", e)
+        return
     try:
         subprocess.run(["docker", "images"], check=False)
     except Exception as e:
@@ -118,6 +223,14 @@ def main() -> None:
     args = parse_args()
     ensure_docker_available()
 
+    if args.bundle:
+        rc = import_from_bundle(args.bundle, args.images)
+        if rc == 0 and args.show_images:
+            list_images()
+        if rc != 0:
+            print("❌ 导入失败，退出码：", rc)
+        sys.exit(rc)
+
     input_path = args.input
     if not os.path.exists(input_path):
         print(f"❌ 指定的输入文件不存在：{input_path}")
@@ -0,0 +1,292 @@
+"""
+备份目录的目录文件（catalog）与保留策略。
+
+每次备份成功后，在备份目录下的目录文件中追加一条记录（大小、耗时、编解码器、SHA-256），
+列出备份和按保留策略清理时只读取这一个文件，不需要打开任何归档。
+目录文件缺失或过期时（例如手动删除或复制了备份文件），会按文件名和文件属性自动补齐，
+无法得到的字段（耗时、校验和）留空。
+
+保留策略与常见备份工具的语义相同：保留最近 N 个备份，以及最近 N 天 / 周 / 月中每个时间段的最新备份；
+最后在保留的备份中从最旧的开始删除，直到总大小不超过上限。最新的备份总是保留。
+删除增量快照后，会清理分块仓库中不再被任何快照引用的分块。
+"""
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from utils.i18n import get_message as _
+from utils.backup_codecs import ARCHIVE_SUFFIXES, get_codec_for_path
+from utils.chunk_store import SNAPSHOT_SUFFIX, collect_garbage
+from conf.backup_settings import (
+    BACKUP_CATALOG_NAME, BACKUP_CHUNK_STORE_DIR, BACKUP_RETENTION_KEEP_LAST, BACKUP_RETENTION_KEEP_DAILY,
+    BACKUP_RETENTION_KEEP_WEEKLY, BACKUP_RETENTION_KEEP_MONTHLY, BACKUP_RETENTION_MAX_TOTAL_SIZE
+)
+
+# 目录文件格式版本
+CATALOG_FORMAT_VERSION = 1
+
+# 备份文件名前缀，其后为创建时间戳
+BACKUP_NAME_PREFIX = "na_backup_"
+
+# 计算备份文件校验和时的读取块大小
+_HASH_BUFSIZE = 1024 * 1024
+
+_TIMESTAMP_RE = re.compile(rf"^{BACKUP_NAME_PREFIX}(\d+)")
+
+
+class RetentionPolicy:
+    """备份保留策略。
+
+    Attributes:
+        keep_last (int): 保留最近的备份数量。
+        keep_daily (int): 保留最近多少天中每天的最新备份。
+        keep_weekly (int): 保留最近多少周中每周的最新备份。
+        keep_monthly (int): 保留最近多少个月中每月的最新备份。
+        max_total_size (int): 保留的备份总大小上限（字节）。
+    """
+
+    def __init__(self, keep_last: Optional[int] = None, keep_daily: Optional[int] = None,
+                 keep_weekly: Optional[int] = None, keep_monthly: Optional[int] = None,
+                 max_total_size: Optional[int] = None):
+        """
+        参数为 None 时使用配置文件中的默认值，0 表示不启用该规则。
+        """
+        self.keep_last = BACKUP_RETENTION_KEEP_LAST if keep_last is None else keep_last
+        self.keep_daily = BACKUP_RETENTION_KEEP_DAILY if keep_daily is None else keep_daily
+        self.keep_weekly = BACKUP_RETENTION_KEEP_WEEKLY if keep_weekly is None else keep_weekly
+        self.keep_monthly = BACKUP_RETENTION_KEEP_MONTHLY if keep_monthly is None else keep_monthly
+        self.max_total_size = BACKUP_RETENTION_MAX_TOTAL_SIZE if max_total_size is None else max_total_size
+
+    @property
+    def has_count_rules(self) -> bool:
+        return any((self.keep_last, self.keep_daily, self.keep_weekly, self.keep_monthly))
+
+    @property
+    def enabled(self) -> bool:
+        return self.has_count_rules or bool(self.max_total_size)
+
+    def describe(self) -> str:
+        """返回策略的简短描述。"""
+        rules = [f"{name}={value}" for name, value in (
+            ("keep-last", self.keep_last), ("keep-daily", self.keep_daily),
+            ("keep-weekly", self.keep_weekly), ("keep-monthly", self.keep_monthly),
+            ("max-total-size", self.max_total_size),
+        ) if value]
+        return ", ".join(rules)
+
+    def select_prunable(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """返回按策略应删除的备份。
+
+        Args:
+            entries (list[dict]): 目录中的备份记录。
+
+        Returns:
+            list[dict]: 应删除的记录，按从新到旧排列。
+        """
+        if not self.enabled or not entries:
+            return []
+        entries = sorted(entries, key=lambda e: e["created"], reverse=True)
+        if self.has_count_rules:
+            keep = {e["name"] for e in entries[:self.keep_last]}
+            for count, bucket_format in ((self.keep_daily, "%Y-%m-%d"), (self.keep_weekly, "%G-W%V"),
+                                         (self.keep_monthly, "%Y-%m")):
+                buckets = set()
+                for entry in entries:
+                    if len(buckets) >= count:
+                        break
+                    bucket = time.strftime(bucket_format, time.localtime(entry["created"]))
+                    if bucket not in buckets:
+                        # 每个时间段只保留其中最新的备份
+                        buckets.add(bucket)
+                        keep.add(entry["name"])
+        else:
+            keep = {e["name"] for e in entries}
+        keep.add(entries[0]["name"])
+
+        if self.max_total_size:
+            kept = [e for e in entries if e["name"] in keep]
+            total = sum(e.get("size", 0) for e in kept)
+            for entry in reversed(kept[1:]):
+                if total <= self.max_total_size:
+                    break
+                keep.discard(entry["name"])
+                total -= entry.get("size", 0)
+        return [e for e in entries if e["name"] not in keep]
+
+
+def get_catalog_path(backup_dir: str) -> str:
+    """返回备份目录下目录文件的路径。"""
+    return os.path.join(backup_dir, BACKUP_CATALOG_NAME)
+
+
+def _read_catalog(backup_dir: str) -> List[Dict[str, Any]]:
+    try:
+        with open(get_catalog_path(backup_dir), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return list(data.get("backups", []))
+    except (OSError, ValueError, AttributeError):
+        return []
+
+
+def _write_catalog(backup_dir: str, entries: List[Dict[str, Any]]) -> None:
+    """以临时文件加重命名的方式原子地写入目录文件。"""
+    entries = sorted(entries, key=lambda e: e["created"])
+    fd, tmp_path = tempfile.mkstemp(dir=backup_dir, prefix=f".{BACKUP_CATALOG_NAME}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"format": CATALOG_FORMAT_VERSION, "backups": entries}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, get_catalog_path(backup_dir))
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _scan_backup_files(backup_dir: str) -> Dict[str, os.stat_result]:
+    """列出备份目录中的备份文件（归档和增量快照清单），返回相对路径到 stat 结果的映射。"""
+    found = {}
+    for relative_dir in ("", os.path.join(BACKUP_CHUNK_STORE_DIR, "snapshots")):
+        try:
+            with os.scandir(os.path.join(backup_dir, relative_dir)) as it:
+                for entry in it:
+                    if not entry.name.startswith(BACKUP_NAME_PREFIX) or not entry.is_file():
+                        continue
+                    if entry.name.endswith(ARCHIVE_SUFFIXES + (SNAPSHOT_SUFFIX,)):
+                        found[os.path.join(relative_dir, entry.name).replace(os.sep, "/")] = entry.stat()
+        except OSError:
+            continue
+    return found
+
+
+def _entry_from_file(name: str, st: os.stat_result) -> Dict[str, Any]:
+    """根据文件名和文件属性构造目录记录（不打开文件）。"""
+    match = _TIMESTAMP_RE.match(os.path.basename(name))
+    if name.endswith(SNAPSHOT_SUFFIX):
+        codec = "chunk-store"
+    else:
+        codec_obj = get_codec_for_path(name)
+        codec = codec_obj.name if codec_obj else None
+    return {
+        "name": name,
+        "created": int(match.group(1)) if match else int(st.st_mtime),
+        "size": st.st_size,
+        "duration": None,
+        "codec": codec,
+        "sha256": None,
+    }
+
+
+def load_catalog(backup_dir: str) -> List[Dict[str, Any]]:
+    """读取备份目录的目录文件，并与目录中实际存在的备份文件同步。
+
+    已被删除的备份从记录中移除，目录文件中没有记录的备份文件按文件名补充记录。
+    有变化时写回目录文件。
+
+    Args:
+        backup_dir (str): 备份目录。
+
+    Returns:
+        list[dict]: 备份记录（name、created、size、duration、codec、sha256），按创建时间从旧到新排列。
+    """
+    entries = _read_catalog(backup_dir)
+    files = _scan_backup_files(backup_dir)
+    synced = [e for e in entries if e.get("name") in files]
+    known = {e["name"] for e in synced}
+    synced.extend(_entry_from_file(name, st) for name, st in files.items() if name not in known)
+    synced.sort(key=lambda e: e["created"])
+    if synced != entries:
+        try:
+            _write_catalog(backup_dir, synced)
+        except OSError:
+            # 目录文件只是缓存，备份目录只读时直接使用扫描结果
+            pass
+    return synced
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(_HASH_BUFSIZE)
+            if not data:
+                return digest.hexdigest()
+            digest.update(data)
+
+
+def record_backup(backup_dir: str, backup_path: str, duration: float,
+                  sha256: Optional[str] = None) -> Dict[str, Any]:
+    """在目录文件中记录一个刚完成的备份。
+
+    增量快照的大小记为本次新写入分块仓库的字节数，与归档一样反映该备份实际占用的空间。
+
+    Args:
+        backup_dir (str): 备份目录。
+        backup_path (str): 备份文件（归档或增量快照清单）路径。
+        duration (float): 备份耗时（秒）。
+        sha256 (str, optional): 写入归档时已计算的 SHA-256。未提供时读取文件计算
+            （增量快照清单很小，无需在写入时计算）。
+
+    Returns:
+        dict: 新的目录记录。
+    """
+    name = os.path.relpath(backup_path, backup_dir).replace(os.sep, "/")
+    entry = _entry_from_file(name, os.stat(backup_path))
+    entry["duration"] = round(duration, 3)
+    entry["sha256"] = sha256 or _file_sha256(backup_path)
+    if name.endswith(SNAPSHOT_SUFFIX):
+        try:
+            with open(backup_path, "r", encoding="utf-8") as f:
+                entry["size"] += int(json.load(f).get("new_bytes", 0))
+        except (OSError, ValueError, TypeError):
+            pass
+    entries = [e for e in load_catalog(backup_dir) if e["name"] != name]
+    entries.append(entry)
+    try:
+        _write_catalog(backup_dir, entries)
+    except OSError as e:
+        print(_('warning_catalog_update_failed', get_catalog_path(backup_dir), e), file=sys.stderr)
+    return entry
+
+
+def apply_retention(backup_dir: str, policy: RetentionPolicy) -> List[Dict[str, Any]]:
+    """按保留策略删除多余的备份，并清理不再被引用的增量分块。
+
+    Args:
+        backup_dir (str): 备份目录。
+        policy (RetentionPolicy): 保留策略。
+
+    Returns:
+        list[dict]: 已删除的备份记录。
+    """
+    if not policy.enabled:
+        return []
+    entries = load_catalog(backup_dir)
+    prunable = policy.select_prunable(entries)
+    print(_('retention_applying', policy.describe(), len(entries), len(prunable)))
+    removed = []
+    for entry in prunable:
+        try:
+            os.remove(os.path.join(backup_dir, entry["name"]))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(_('warning_retention_remove_failed', entry["name"], e), file=sys.stderr)
+            continue
+        removed.append(entry)
+        print(f"  - {_('retention_removed_backup', entry['name'], time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['created'])))}")
+
+    if removed:
+        removed_names = {e["name"] for e in removed}
+        try:
+            _write_catalog(backup_dir, [e for e in entries if e["name"] not in removed_names])
+        except OSError as e:
+            print(_('warning_catalog_update_failed', get_catalog_path(backup_dir), e), file=sys.stderr)
+        store_dir = os.path.join(backup_dir, BACKUP_CHUNK_STORE_DIR)
+        if any(e["name"].endswith(SNAPSHOT_SUFFIX) for e in removed) and os.path.isdir(store_dir):
+            collect_garbage(store_dir)
+    return removed
@@ -0,0 +1,441 @@
+"""
+备份归档的压缩编解码器。
+
+备份与恢复都通过这里选择编解码器，归档的文件后缀决定恢复时使用的解码器：
+- zstd（.tar.zstd）：优先使用 Python 绑定 zstandard，否则使用 zstd 命令；
+- xz（.tar.xz）、gzip（.tar.gz）：仅依赖标准库，数据按块在线程池中并行压缩，
+  每块输出为一个独立的 xz/gzip 流，多个流首尾相接仍是合法文件，可被标准工具解压；
+- none（.tar）：不压缩。
+在没有 zstd 的最小化主机上，备份会自动退回到 xz，而不是生成未压缩的 .tar。
+"""
+import contextlib
+import gzip
+import hashlib
+import lzma
+import os
+import subprocess
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from utils.helpers import command_exists
+from utils.i18n import get_message as _
+from conf.backup_settings import BACKUP_CODEC_BLOCK_SIZE
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 读写归档数据流时使用的缓冲区大小
+STREAM_BUFSIZE = 1024 * 1024
+
+
+class CodecError(OSError):
+    """压缩数据损坏或被截断。"""
+
+
+class _HashingFile:
+    """写入时同步计算 SHA-256 的输出文件，写完后无需再次读取文件即可得到校验和。"""
+
+    def __init__(self, path: str):
+        self._file = open(path, "wb")
+        self._hash = hashlib.sha256()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._hash.update(data)
+        return self._file.write(data)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+class _FileWriter:
+    """不压缩时直接写入文件的类文件对象，提供与其他写入器一致的 abort()。"""
+
+    def __init__(self, path: str):
+        self._file = _HashingFile(path)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return self._file.write(data)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def abort(self):
+        self._file.close()
+
+    def hexdigest(self) -> str:
+        return self._file.hexdigest()
+
+
+class _ProcessWriter:
+    """将写入的数据转交给子进程标准输入的类文件对象，关闭时检查子进程退出码。
+
+    子进程的标准输出由后台线程写入输出文件，同时计算校验和。
+    """
+
+    def __init__(self, proc: subprocess.Popen, path: str):
+        self._proc = proc
+        self._file = _HashingFile(path)
+        self._error: Optional[BaseException] = None
+        self._pump = threading.Thread(target=self._copy_output, daemon=True)
+        self._pump.start()
+
+    def _copy_output(self):
+        try:
+            while True:
+                data = self._proc.stdout.read(STREAM_BUFSIZE)
+                if not data:
+                    break
+                self._file.write(data)
+        except OSError as e:
+            self._error = e
+            # 不再读取输出，子进程会因管道断开而退出
+            self._proc.stdout.close()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return self._proc.stdin.write(data)
+
+    def flush(self):
+        self._proc.stdin.flush()
+
+    def close(self):
+        if not self._proc.stdin.closed:
+            self._proc.stdin.close()
+        returncode = self._proc.wait()
+        self._pump.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, self._proc.args)
+
+    def abort(self):
+        if self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+        self._pump.join()
+        self._file.close()
+
+    def hexdigest(self) -> str:
+        return self._file.hexdigest()
+
+
+class _BlockCompressWriter:
+    """按固定大小分块、在线程池中并行压缩并按顺序写出的类文件对象。
+
+    zlib 和 lzma 在压缩时会释放 GIL，因此多个线程可以同时利用多个 CPU 核心；
+    正在压缩的块数量受限，内存占用与数据总量无关。
+    """
+
+    def __init__(self, path: str, compress_block: Callable[[bytes], bytes], threads: int):
+        self._file = _HashingFile(path)
+        self._compress_block = compress_block
+        threads = threads or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        self._pending = []
+        self._max_pending = threads * 2
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer.extend(data)
+        while len(self._buffer) >= BACKUP_CODEC_BLOCK_SIZE:
+            block = bytes(self._buffer[:BACKUP_CODEC_BLOCK_SIZE])
+            del self._buffer[:BACKUP_CODEC_BLOCK_SIZE]
+            self._submit(block)
+        return len(data)
+
+    def _submit(self, block: bytes):
+        self._pending.append(self._executor.submit(self._compress_block, block))
+        # 按提交顺序写出已完成的块，并限制在途块数量
+        while self._pending and (self._pending[0].done() or len(self._pending) >= self._max_pending):
+            self._file.write(self._pending.pop(0).result())
+
+    def flush(self):
+        pass
+
+    def close(self):
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer = bytearray()
+            while self._pending:
+                self._file.write(self._pending.pop(0).result())
+        finally:
+            self._executor.shutdown(wait=True)
+            self._file.close()
+
+    def abort(self):
+        for future in self._pending:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self._file.close()
+
+    def hexdigest(self) -> str:
+        return self._file.hexdigest()
+
+
+class _ErrorMappingReader:
+    """将解码库特有的异常统一转换为 OSError 的只读包装器。"""
+
+    def __init__(self, fileobj, errors: tuple):
+        self._fileobj = fileobj
+        self._errors = errors
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        try:
+            return self._fileobj.read(size)
+        except self._errors as e:
+            raise CodecError(e)
+
+    def close(self):
+        self._fileobj.close()
+
+
+class Codec:
+    """编解码器基类。
+
+    Attributes:
+        name (str): 编解码器名称，记录在归档清单中。
+        suffix (str): 归档文件后缀。
+        max_level (int): 支持的最大压缩级别，更大的级别会被截断。
+    """
+    name = "none"
+    suffix = ".tar"
+    max_level = 0
+
+    def available(self) -> bool:
+        """当前环境是否可以使用该编解码器。"""
+        return True
+
+    def backend(self) -> str:
+        """实际使用的实现（记录在清单中，便于排查）。"""
+        return "builtin"
+
+    def effective_level(self, level: int) -> int:
+        return max(1, min(level, self.max_level)) if self.max_level else 0
+
+    def open_writer(self, path: str, level: int, threads: int):
+        """打开一个写入压缩文件的类文件对象，close() 时完成写入，abort() 时放弃。
+
+        close() 之后可通过 hexdigest() 取得输出文件的 SHA-256（写入时计算）。
+        """
+        return _FileWriter(path)
+
+    @contextlib.contextmanager
+    def open_reader(self, fileobj, check: bool = False):
+        """以上下文管理器形式打开解压后的只读数据流。
+
+        解码器直接从 fileobj 读取压缩数据（zstd 命令以其作为标准输入），
+        调用方可以通过该文件的读取位置得知已处理的压缩数据量。
+
+        Args:
+            fileobj: 以二进制模式打开的归档文件，由调用方负责关闭。
+            check (bool): 调用方会读取到流末尾时传入 True，确保解码器完成全部完整性校验。
+
+        Raises:
+            CodecError: 压缩数据损坏或被截断。
+        """
+        yield fileobj
+
+
+class ZstdCodec(Codec):
+    """zstd 编解码器：优先使用 zstandard 绑定，否则使用 zstd 命令。"""
+    name = "zstd"
+    suffix = ".tar.zstd"
+    max_level = 22
+
+    def available(self) -> bool:
+        return zstandard is not None or command_exists("zstd")
+
+    def backend(self) -> str:
+        return "zstandard" if zstandard is not None else "zstd-cli"
+
+    def open_writer(self, path: str, level: int, threads: int):
+        level = self.effective_level(level)
+        if zstandard is not None:
+            compressor = zstandard.ZstdCompressor(level=level, threads=threads or -1, write_checksum=True)
+            output = _HashingFile(path)
+            return _ZstandardWriter(compressor.stream_writer(output, closefd=True), output)
+        cmd = ["zstd", "--quiet", f"-{level}", f"-T{threads}"]
+        if level > 19:
+            # zstd 要求 20 级以上显式启用 --ultra
+            cmd.append("--ultra")
+        cmd.append("-c")
+        return _ProcessWriter(
+            subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=STREAM_BUFSIZE), path
+        )
+
+    @contextlib.contextmanager
+    def open_reader(self, fileobj, check: bool = False):
+        if zstandard is not None:
+            reader = zstandard.ZstdDecompressor().stream_reader(fileobj, read_across_frames=True, closefd=False)
+            yield _ErrorMappingReader(reader, (zstandard.ZstdError,))
+            return
+
+        proc = subprocess.Popen(
+            ["zstd", "-d", "-c", "--quiet"],
+            stdin=fileobj, stdout=subprocess.PIPE, stderr=subprocess.PIPE if check else None,
+            bufsize=STREAM_BUFSIZE
+        )
+        try:
+            try:
+                yield proc.stdout
+            except Exception:
+                # 读取出错时，如果 zstd 已报告错误，以 zstd 的错误为准（如帧损坏、校验和不匹配）
+                if check:
+                    proc.stdout.close()
+                    if proc.wait() > 0:
+                        raise CodecError(proc.stderr.read().decode(errors="ignore").strip())
+                raise
+            if check:
+                proc.stdout.close()
+                stderr = proc.stderr.read()
+                if proc.wait() != 0:
+                    raise CodecError(stderr.decode(errors="ignore").strip())
+        finally:
+            # 提前退出（例如只读取清单）时直接终止解压进程
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+
+
+class _ZstandardWriter:
+    """zstandard 流式写入器的包装，统一 close()/abort() 接口。"""
+
+    def __init__(self, writer, output: _HashingFile):
+        self._writer = writer
+        self._output = output
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return self._writer.write(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self._writer.close()
+
+    def abort(self):
+        self._writer.close()
+
+    def hexdigest(self) -> str:
+        return self._output.hexdigest()
+
+
+class XzCodec(Codec):
+    """xz 编解码器（标准库 lzma），按块并行压缩。"""
+    name = "xz"
+    suffix = ".tar.xz"
+    max_level = 9
+
+    def backend(self) -> str:
+        return "lzma"
+
+    def open_writer(self, path: str, level: int, threads: int):
+        preset = self.effective_level(level)
+        return _BlockCompressWriter(
+            path, lambda block: lzma.compress(block, format=lzma.FORMAT_XZ, preset=preset), threads
+        )
+
+    @contextlib.contextmanager
+    def open_reader(self, fileobj, check: bool = False):
+        with lzma.open(fileobj, "rb") as f:
+            yield _ErrorMappingReader(f, (lzma.LZMAError, EOFError))
+
+
+class GzipCodec(Codec):
+    """gzip 编解码器（标准库 zlib），按块并行压缩。"""
+    name = "gzip"
+    suffix = ".tar.gz"
+    max_level = 9
+
+    def backend(self) -> str:
+        return "zlib"
+
+    def open_writer(self, path: str, level: int, threads: int):
+        level = self.effective_level(level)
+        return _BlockCompressWriter(path, lambda block: gzip.compress(block, compresslevel=level, mtime=0), threads)
+
+    @contextlib.contextmanager
+    def open_reader(self, fileobj, check: bool = False):
+        with gzip.open(fileobj, "rb") as f:
+            yield _ErrorMappingReader(f, (zlib.error, EOFError, gzip.BadGzipFile))
+
+
+# 按备份时的优先顺序排列
+CODECS: List[Codec] = [ZstdCodec(), XzCodec(), GzipCodec(), Codec()]
+
+# 所有编解码器对应的归档后缀
+ARCHIVE_SUFFIXES = tuple(codec.suffix for codec in CODECS)
+
+# 命令行可选的编解码器名称
+CODEC_CHOICES = ["auto"] + [codec.name for codec in CODECS]
+
+
+def get_codec(name: str) -> Optional[Codec]:
+    """按名称返回编解码器。"""
+    return next((codec for codec in CODECS if codec.name == name), None)
+
+
+def get_codec_for_path(path: str) -> Optional[Codec]:
+    """根据归档文件后缀返回对应的编解码器，无法识别时返回 None。"""
+    # .tar 是其他后缀的一部分，按后缀长度从长到短匹配
+    for codec in sorted(CODECS, key=lambda c: len(c.suffix), reverse=True):
+        if path.endswith(codec.suffix):
+            return codec
+    return None
+
+
+def select_codec(preferred: str = "auto") -> Codec:
+    """选择备份使用的编解码器。
+
+    Args:
+        preferred (str): 编解码器名称，"auto" 表示按 zstd、xz、gzip 的顺序选择第一个可用的。
+
+    Returns:
+        Codec: 选中的编解码器。
+
+    Raises:
+        ValueError: 指定的编解码器不存在或在当前环境不可用。
+    """
+    if preferred == "auto":
+        return next(codec for codec in CODECS if codec.available())
+    codec = get_codec(preferred)
+    if codec is None or not codec.available():
+        raise ValueError(_('error_codec_unavailable', preferred))
+    return codec
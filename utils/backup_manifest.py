@@ -0,0 +1,204 @@
+"""
+备份归档内嵌清单的生成与读取。
+
+每个归档的第一个成员是 JSON 清单（.na_manifest.json），记录数据根目录、Docker 卷、
+文件列表（大小、修改时间）、工具版本和压缩参数，只需读取归档流的开头即可列出内容；
+最后一个成员是校验和清单（.na_checksums.json），记录写入时计算的每个成员的 SHA-256。
+由于归档是单次顺序写出的，哈希只能在写完成员后得到，因此单独放在归档末尾。
+"""
+import hashlib
+import io
+import json
+import stat
+import tarfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from utils.tree_archive import walk_tree
+
+# 归档开头的清单成员名
+MANIFEST_NAME = ".na_manifest.json"
+
+# 归档末尾的校验和成员名
+CHECKSUMS_NAME = ".na_checksums.json"
+
+# 归档中由工具自身写入的元数据成员
+METADATA_MEMBERS = (MANIFEST_NAME, CHECKSUMS_NAME)
+
+# 清单格式版本
+MANIFEST_FORMAT_VERSION = 1
+
+# 读取成员内容时的缓冲区大小
+_DRAIN_BUFSIZE = 1024 * 1024
+
+
+class VolumeBackupError(OSError):
+    """卷的数据已部分写入归档后备份失败，归档不完整，不能作为有效备份。"""
+
+
+class HashingReader:
+    """读取时同步计算 SHA-256 的文件包装器。"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._hash = hashlib.sha256()
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self._hash.update(data)
+        self.bytes_read += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        count = self._fileobj.readinto(buffer)
+        self._hash.update(memoryview(buffer)[:count])
+        self.bytes_read += count
+        return count
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+class ChecksumTarFile(tarfile.TarFile):
+    """写入常规文件成员时顺带计算其 SHA-256 的 TarFile。
+
+    计算结果保存在 checksums 字典中（成员名 -> 十六进制哈希），
+    不需要为了校验和再次读取源文件。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checksums: Dict[str, str] = {}
+
+    def addfile(self, tarinfo, fileobj=None):
+        if fileobj is None or not tarinfo.isreg():
+            return super().addfile(tarinfo, fileobj)
+        reader = HashingReader(fileobj)
+        super().addfile(tarinfo, reader)
+        self.checksums[tarinfo.name] = reader.hexdigest()
+
+
+class VerifyingTarFile(tarfile.TarFile):
+    """流模式读取时计算每个常规文件成员 SHA-256 的 TarFile，与 ChecksumTarFile 对应。
+
+    extractfile() 和 extract() 读取的内容直接参与哈希；调用方没有读取（或只读取了一部分）的成员，
+    在读取下一个头部前读完剩余内容，因此遍历结束后 checksums 包含全部常规文件成员
+    （成员名为读取到头部时的原始名称，调用方之后修改 member.name 不影响结果）。
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.checksums: Dict[str, str] = {}
+        self._reader: Optional[HashingReader] = None
+        self._reader_member: Optional[tarfile.TarInfo] = None
+        self._reader_name = ""
+        super().__init__(*args, **kwargs)
+
+    def _finish_member(self) -> None:
+        if self._reader is None:
+            return
+        while self._reader.read(_DRAIN_BUFSIZE):
+            pass
+        self.checksums[self._reader_name] = self._reader.hexdigest()
+        self._reader = self._reader_member = None
+
+    def next(self):
+        if self.firstmember is not None:
+            # 打开时已读取的第一个成员，数据尚未被调用方读取
+            return super().next()
+        self._finish_member()
+        member = super().next()
+        if member is not None and member.isreg():
+            self._reader = HashingReader(super().extractfile(member))
+            self._reader_member = member
+            self._reader_name = member.name
+        return member
+
+    def extractfile(self, member):
+        if self._reader is not None and member is self._reader_member:
+            return self._reader
+        return super().extractfile(member)
+
+    def makefile(self, tarinfo, targetpath):
+        # 解压过滤器可能返回成员的副本，按数据偏移量判断是否为当前成员
+        if self._reader is None or tarinfo.offset_data != self._reader_member.offset_data:
+            return super().makefile(tarinfo, targetpath)
+        with open(targetpath, "wb") as target:
+            while True:
+                data = self._reader.read(_DRAIN_BUFSIZE)
+                if not data:
+                    break
+                target.write(data)
+
+
+def add_json_member(tar: tarfile.TarFile, name: str, data: Dict) -> None:
+    """将字典序列化为 JSON 并作为一个成员写入归档。"""
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    info = tarfile.TarInfo(name)
+    info.size = len(payload)
+    info.mtime = int(time.time())
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(payload))
+
+
+def scan_source_files(source: str, arcname: str,
+                      is_excluded: Optional[Callable[[str], bool]] = None) -> List[Dict]:
+    """遍历源目录，返回将写入归档的文件列表（仅读取 stat 信息，不读取文件内容）。
+
+    Args:
+        source (str): 源目录路径。
+        arcname (str): 源目录在归档中的名称。
+        is_excluded (Callable[[str], bool], optional): 判断归档路径是否被排除的函数。
+
+    Returns:
+        list[dict]: 每项包含 path（归档路径）、size、mtime。
+    """
+    entries = []
+    for _path, arc_path, st in walk_tree(source, arcname, is_excluded):
+        # 套接字不会写入归档
+        if not stat.S_ISDIR(st.st_mode) and not stat.S_ISSOCK(st.st_mode):
+            entries.append({"path": arc_path, "size": st.st_size, "mtime": int(st.st_mtime)})
+    return entries
+
+
+def build_manifest(root_dir: Optional[str], volumes: List[Dict], files: List[Dict],
+                   compression: Dict, toolkit_version: str) -> Dict:
+    """构建归档清单。
+
+    Args:
+        root_dir (str, optional): 数据目录在归档中的顶层目录名。
+        volumes (list[dict]): Docker 卷信息，每项包含 name、method、arcname。
+        files (list[dict]): scan_source_files 返回的文件列表。
+        compression (dict): 压缩参数（codec、level、threads 等）。
+        toolkit_version (str): 工具版本信息。
+
+    Returns:
+        dict: 可序列化为 JSON 的清单。
+    """
+    return {
+        "format": MANIFEST_FORMAT_VERSION,
+        "toolkit": toolkit_version,
+        "created": int(time.time()),
+        "root_dir": root_dir,
+        "compression": compression,
+        "volumes": volumes,
+        "files": files,
+        "checksums": {"algorithm": "sha256", "member": CHECKSUMS_NAME},
+    }
+
+
+def read_manifest_from_stream(fileobj) -> Optional[Dict]:
+    """从归档 tar 流中读取第一个成员作为清单，只消耗流的开头部分。
+
+    Args:
+        fileobj: 可读的未压缩 tar 数据流。
+
+    Returns:
+        Optional[dict]: 归档包含清单时返回清单，否则返回 None。
+    """
+    with tarfile.open(fileobj=fileobj, mode="r|") as tar:
+        first = tar.next()
+        if first is None or first.name != MANIFEST_NAME or not first.isreg():
+            return None
+        data = tar.extractfile(first).read()
+    return json.loads(data.decode("utf-8"))
@@ -0,0 +1,217 @@
+"""
+备份与恢复的耗时和数据量统计。
+
+备份和恢复的各个阶段（卷发现、数据目录打包、helper 容器、压缩、解压、写回目标目录等）
+以计时区间记录耗时和流经的字节数，每个 Docker 卷单独记录结果，
+结束后可通过 --report-json 导出为 JSON 报告，用于规划备份窗口和发现性能回退。
+流式管线中的阶段会相互重叠（例如压缩发生在打包期间），各阶段耗时之和不等于总耗时。
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.helpers import get_version_info
+
+# 报告格式版本
+REPORT_FORMAT_VERSION = 1
+
+
+def _rate(num: Optional[int], seconds: float) -> Optional[float]:
+    if num is None or seconds <= 0:
+        return None
+    return round(num / seconds, 1)
+
+
+def _ratio(bytes_in: Optional[int], bytes_out: Optional[int]) -> Optional[float]:
+    if not bytes_in or not bytes_out:
+        return None
+    return round(bytes_in / bytes_out, 3)
+
+
+class PhaseStats:
+    """一个阶段的统计数据，同名阶段多次进入时累加。
+
+    Attributes:
+        name (str): 阶段名称。
+        elapsed (float): 累计耗时（秒）。
+        bytes_in (int, optional): 进入该阶段的字节数。
+        bytes_out (int, optional): 该阶段输出的字节数。
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.elapsed = 0.0
+        self.bytes_in: Optional[int] = None
+        self.bytes_out: Optional[int] = None
+
+    def add_bytes(self, bytes_in: Optional[int] = None, bytes_out: Optional[int] = None) -> None:
+        if bytes_in is not None:
+            self.bytes_in = (self.bytes_in or 0) + bytes_in
+        if bytes_out is not None:
+            self.bytes_out = (self.bytes_out or 0) + bytes_out
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "wall_time": round(self.elapsed, 3),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "compression_ratio": _ratio(self.bytes_in, self.bytes_out),
+            "throughput_in": _rate(self.bytes_in, self.elapsed),
+            "throughput_out": _rate(self.bytes_out, self.elapsed),
+        }
+
+
+class OperationReport:
+    """一次备份或恢复操作的统计报告。
+
+    各方法都是线程安全的，可在并发备份或恢复卷的工作线程中调用。
+    """
+
+    def __init__(self, operation: str):
+        """
+        Args:
+            operation (str): 操作类型，"backup" 或 "restore"。
+        """
+        self.operation = operation
+        self.ok: Optional[bool] = None
+        self.error: Optional[str] = None
+        self.info: Dict[str, Any] = {}
+        self.bytes_in: Optional[int] = None
+        self.bytes_out: Optional[int] = None
+        self._phases: Dict[str, PhaseStats] = {}
+        self._volumes: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+        self._started = time.monotonic()
+        self._elapsed: Optional[float] = None
+
+    def get_phase(self, name: str) -> PhaseStats:
+        """返回阶段的统计对象，不存在时创建。阶段按首次出现的顺序输出。"""
+        with self._lock:
+            if name not in self._phases:
+                self._phases[name] = PhaseStats(name)
+            return self._phases[name]
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[PhaseStats]:
+        """计时区间，退出时（包括异常退出）把耗时累加到该阶段。
+
+        Yields:
+            PhaseStats: 阶段的统计对象，可在区间内记录字节数。
+        """
+        stats = self.get_phase(name)
+        started = time.monotonic()
+        try:
+            yield stats
+        finally:
+            elapsed = time.monotonic() - started
+            with self._lock:
+                stats.elapsed += elapsed
+
+    def add_volume(self, name: str, method: str, ok: bool, elapsed: float,
+                   num_bytes: Optional[int] = None) -> None:
+        """记录单个 Docker 卷的备份或恢复结果。"""
+        with self._lock:
+            self._volumes.append({
+                "name": name,
+                "method": method,
+                "ok": bool(ok),
+                "wall_time": round(elapsed, 3),
+                "bytes": num_bytes,
+                "throughput": _rate(num_bytes, elapsed),
+            })
+
+    def set_volume_bytes(self, name: str, num_bytes: int) -> None:
+        """补充已记录卷的数据量（备份时卷的数据量在全部写入归档后才能统计）。"""
+        with self._lock:
+            for volume in self._volumes:
+                if volume["name"] == name:
+                    volume["bytes"] = num_bytes
+                    volume["throughput"] = _rate(num_bytes, volume["wall_time"])
+
+    def fail(self, error: Any) -> None:
+        """记录导致操作失败的错误（只保留第一个）。"""
+        with self._lock:
+            self.ok = False
+            if self.error is None:
+                self.error = str(error)
+
+    def finish(self, ok: bool) -> None:
+        """结束计时并记录操作结果。"""
+        self._elapsed = time.monotonic() - self._started
+        self.ok = bool(ok) and self.ok is not False
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = self._elapsed if self._elapsed is not None else time.monotonic() - self._started
+        with self._lock:
+            phases = [p.to_dict() for p in self._phases.values()]
+            volumes = sorted(self._volumes, key=lambda v: v["name"])
+        return {
+            "format": REPORT_FORMAT_VERSION,
+            "operation": self.operation,
+            "toolkit": get_version_info(),
+            "ok": self.ok,
+            "error": self.error,
+            "started": int(self._started_at),
+            "wall_time": round(elapsed, 3),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "compression_ratio": _ratio(self.bytes_in, self.bytes_out) if self.operation == "backup"
+            else _ratio(self.bytes_out, self.bytes_in),
+            "throughput": _rate(self.bytes_in, elapsed),
+            **self.info,
+            "phases": phases,
+            "volumes": volumes,
+        }
+
+    def write_json(self, path: str) -> None:
+        """将报告原子地写入 JSON 文件。
+
+        Raises:
+            OSError: 写入失败。
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+class TimedStream:
+    """包装数据流，统计经过的字节数和在底层 read/write 中阻塞的时间。
+
+    用于衡量流式管线中压缩或解压环节的耗时：tar 写入编解码器时的阻塞时间即为压缩耗时。
+    """
+
+    def __init__(self, fileobj, stats: PhaseStats):
+        """
+        Args:
+            fileobj: 被包装的类文件对象。
+            stats (PhaseStats): 累加耗时的阶段。
+        """
+        self._fileobj = fileobj
+        self._stats = stats
+        self.bytes = 0
+
+    def write(self, data) -> int:
+        started = time.monotonic()
+        try:
+            return self._fileobj.write(data)
+        finally:
+            self._stats.elapsed += time.monotonic() - started
+            self.bytes += len(data)
+
+    def read(self, size: int = -1) -> bytes:
+        started = time.monotonic()
+        data = self._fileobj.read(size)
+        self._stats.elapsed += time.monotonic() - started
+        self.bytes += len(data)
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._fileobj, name)
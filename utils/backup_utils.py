@@ -2,6 +2,10 @@
 备份与恢复功能的底层辅助函数。
 """
 import os
+import contextlib
+import fnmatch
+import gzip
+import hashlib
 import subprocess
 import tarfile
 import sys
@@ -9,12 +13,49 @@ import tempfile
 import json
 import platform
 import shutil
-from typing import Union, Optional, Dict, List
+import stat
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Union, Optional, Dict, List, Callable, Any
 
-from utils.helpers import command_exists, update_env_file, run_sudo_command
+from utils.helpers import (
+    command_exists, update_env_file, run_sudo_command, get_version_info, format_size, get_toolkit_config_dir,
+    get_pending_restore_dir, clear_pending_restores
+)
 from utils.i18n import get_message as _
 from utils.docker_helpers import docker_pull_image
-from conf.backup_settings import BACKUP_HELPER_IMAGE, BACKUP_HELPER_TAG
+from utils.docker_api import DockerAPIError, get_docker_client
+from utils.chunk_store import ChunkStoreWriter, ChunkStoreReader, SNAPSHOT_SUFFIX
+from utils.backup_codecs import CodecError, get_codec_for_path, select_codec
+from utils.tree_archive import add_tree_to_archive, walk_tree
+from utils.backup_report import OperationReport, TimedStream
+from utils.progress import ProgressReporter
+from utils.postgres_dump import (
+    PG_DUMP_SUFFIX, PG_DUMP_COMPLETE_NAME, PostgresRestoreStream, find_postgres_container,
+    stream_postgres_dump_into_archive
+)
+from utils.qdrant_snapshot import (
+    QDRANT_SNAPSHOT_SUFFIX, QdrantRestoreStream, find_qdrant_client, stream_qdrant_snapshots_into_archive
+)
+from utils.backup_manifest import (
+    MANIFEST_NAME, CHECKSUMS_NAME, METADATA_MEMBERS, ChecksumTarFile, HashingReader, VerifyingTarFile, VolumeBackupError,
+    add_json_member, scan_source_files, build_manifest, read_manifest_from_stream
+)
+from conf.backup_settings import (
+    BACKUP_HELPER_IMAGE, BACKUP_HELPER_TAG, BACKUP_HELPER_MARKER_TTL, BACKUP_COMPRESS_LEVEL, BACKUP_COMPRESS_THREADS,
+    BACKUP_VOLUME_WORKERS, BACKUP_VOLUME_MODE, BACKUP_CHUNK_STORE_DIR, BACKUP_CODEC
+)
+
+# 流式写入归档时 tarfile 使用的缓冲区大小
+ARCHIVE_STREAM_BUFSIZE = 1024 * 1024
+
+# 恢复卷时在卷内暂存数据的目录，归档校验通过后才替换卷中原有的内容
+VOLUME_STAGING_DIR = ".na_restore_staging"
+
+
+class ArchiveIntegrityError(ValueError):
+    """恢复时读取到的归档内容与其记录的校验和或清单不一致。"""
 
 
 def get_volumes_to_backup(static_volumes: List[str], volume_suffixes: List[str]) -> List[str]:
@@ -51,6 +92,78 @@ def get_user_confirmation() -> bool:
         print(f"\n{_('operation_cancelled')}")
         return False
 
+# 本次命令内缓存的全部 Docker 卷信息（卷名 -> docker volume inspect 的结果），None 表示尚未查询
+_volume_cache: Optional[Dict[str, Dict]] = None
+_volume_cache_lock = threading.Lock()
+
+# 查询 Docker 卷信息时可能出现的错误
+_VOLUME_QUERY_ERRORS = (subprocess.CalledProcessError, DockerAPIError, OSError, json.JSONDecodeError, KeyError)
+
+# 回退到 docker 命令时，单次 docker volume inspect 传入的卷名数量上限（避免命令行过长）
+_VOLUME_INSPECT_BATCH = 200
+
+
+def _inspect_volumes_via_cli(names: List[str]) -> Dict[str, Dict]:
+    """通过 docker volume inspect 批量查询卷信息，某个卷在查询前被删除时逐个重试。"""
+    def _inspect(batch: List[str]) -> Dict[str, Dict]:
+        result = subprocess.run(
+            ["docker", "volume", "inspect"] + batch,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True
+        )
+        return {v["Name"]: v for v in json.loads(result.stdout)}
+
+    volumes = {}
+    for start in range(0, len(names), _VOLUME_INSPECT_BATCH):
+        batch = names[start:start + _VOLUME_INSPECT_BATCH]
+        try:
+            volumes.update(_inspect(batch))
+        except subprocess.CalledProcessError:
+            for name in batch:
+                try:
+                    volumes.update(_inspect([name]))
+                except subprocess.CalledProcessError:
+                    continue
+    return volumes
+
+def load_docker_volumes(refresh: bool = False) -> Dict[str, Dict]:
+    """一次性获取全部 Docker 卷的元数据，并在本次命令内缓存。
+
+    通过 Docker API 时只需一次 /volumes 请求；回退到 docker 命令时为一次 docker volume ls
+    加上按批次的 docker volume inspect。卷发现、挂载点查询和存在性检查都从这份缓存中读取，
+    不再为每个卷单独查询。
+
+    Args:
+        refresh (bool): 是否忽略缓存重新查询。
+
+    Returns:
+        dict[str, dict]: 键是卷名，值是卷信息（Name、Mountpoint、Driver 等）。
+
+    Raises:
+        subprocess.CalledProcessError: docker 命令执行失败。
+        DockerAPIError: Docker API 返回错误。
+    """
+    global _volume_cache
+    with _volume_cache_lock:
+        if _volume_cache is None or refresh:
+            client = get_docker_client()
+            if client:
+                volumes = {v["Name"]: v for v in client.list_volumes()}
+            else:
+                result = subprocess.run(
+                    ["docker", "volume", "ls", "--format", "{{.Name}}"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    universal_newlines=True,
+                    check=True
+                )
+                names = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+                volumes = _inspect_volumes_via_cli(names)
+            _volume_cache = volumes
+        return _volume_cache
+
 def discover_docker_volumes_by_pattern(suffixes: Optional[List[str]] = None) -> List[str]:
     """根据后缀模式动态发现 Docker 卷。
 
@@ -72,24 +185,10 @@ def discover_docker_volumes_by_pattern(suffixes: Optional[List[str]] = None) ->
         return []
 
     try:
-        # 获取所有 Docker 卷
-        result = subprocess.run(
-            ["docker", "volume", "ls", "--format", "{{.Name}}"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-            check=True
-        )
-        
-        all_volumes = result.stdout.strip().split('\n')
-        if all_volumes == ['']:  # 如果没有卷，返回空列表
-            all_volumes = []
+        # 获取所有 Docker 卷（结果会被缓存，后续查询挂载点时不再调用 docker）
+        all_volumes = sorted(load_docker_volumes())
 
         for volume_name in all_volumes:
-            volume_name = volume_name.strip()
-            if not volume_name:
-                continue
-                
             # 检查后缀匹配（必须以指定后缀结尾）
             for suffix in suffixes:
                 if volume_name.endswith(suffix):
@@ -97,7 +196,7 @@ def discover_docker_volumes_by_pattern(suffixes: Optional[List[str]] = None) ->
                     print(f"  - {_('found_matching_docker_volume', volume_name, suffix)}")
                     break  # 找到一个匹配的后缀就跳出
 
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, DockerAPIError) as e:
         print(_('warning_cannot_get_volume_list', e), file=sys.stderr)
         return []
     except Exception as e:
@@ -106,6 +205,24 @@ def discover_docker_volumes_by_pattern(suffixes: Optional[List[str]] = None) ->
 
     return discovered_volumes
 
+def inspect_docker_volumes(volume_names: List[str]) -> Dict[str, Dict]:
+    """从缓存中批量查询 Docker 卷信息。
+
+    Args:
+        volume_names (list[str]): 要查询的 Docker 卷名称列表。
+
+    Returns:
+        dict[str, dict]: 键是卷名，值是卷信息；不存在的卷不在结果中。
+
+    Raises:
+        subprocess.CalledProcessError: docker 命令执行失败。
+        DockerAPIError: Docker API 返回错误。
+    """
+    if not volume_names:
+        return {}
+    volumes = load_docker_volumes()
+    return {name: volumes[name] for name in volume_names if name in volumes}
+
 def create_docker_volume_if_not_exists(volume_name: str) -> bool:
     """如果 Docker 卷不存在，则创建它。
     
@@ -116,21 +233,17 @@ def create_docker_volume_if_not_exists(volume_name: str) -> bool:
         bool: 卷存在或创建成功返回 True，失败返回 False。
     """
     try:
-        # 首先检查卷是否已经存在
-        result = subprocess.run(
-            ["docker", "volume", "inspect", volume_name],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-            check=True
-        )
-        print(f"  - {_('docker_volume_exists', volume_name)}")
-        return True
-        
-    except subprocess.CalledProcessError:
+        # 首先检查卷是否已经存在（从本次命令的卷缓存中读取）
+        if volume_name in load_docker_volumes():
+            print(f"  - {_('docker_volume_exists', volume_name)}")
+            return True
+
         # 卷不存在，尝试创建它
-        try:
-            print(f"  - {_('creating_docker_volume', volume_name)}")
+        print(f"  - {_('creating_docker_volume', volume_name)}")
+        client = get_docker_client()
+        if client:
+            volume = client.create_volume(volume_name)
+        else:
             subprocess.run(
                 ["docker", "volume", "create", volume_name],
                 stdout=subprocess.PIPE,
@@ -138,12 +251,16 @@ def create_docker_volume_if_not_exists(volume_name: str) -> bool:
                 universal_newlines=True,
                 check=True
             )
-            print(f"  - {_('docker_volume_created', volume_name)}")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            print(_("error_create_docker_volume", volume_name, e), file=sys.stderr)
-            return False
+            volume = {"Name": volume_name}
+        with _volume_cache_lock:
+            if _volume_cache is not None:
+                _volume_cache[volume_name] = volume
+        print(f"  - {_('docker_volume_created', volume_name)}")
+        return True
+
+    except _VOLUME_QUERY_ERRORS as e:
+        print(_("error_create_docker_volume", volume_name, e), file=sys.stderr)
+        return False
 
 def get_docker_volumes_for_recovery(volume_names: List[str]) -> Dict[str, str]:
     """为恢复操作获取或创建指定的 Docker 卷。
@@ -190,37 +307,78 @@ def get_docker_volumes(volume_names: List[str]) -> Dict[str, str]:
 
     volume_info = {}
     system = platform.system()
+
+    # 从本次命令的卷缓存中读取，而不是每个卷调用一次 docker volume inspect
+    try:
+        volumes = inspect_docker_volumes(volume_names)
+    except _VOLUME_QUERY_ERRORS as e:
+        for name in volume_names:
+            print(_("warning_cannot_get_volume_info", name, e), file=sys.stderr)
+        return {}
     
     for name in volume_names:
-        try:
-            # 使用 docker volume inspect 检查卷是否存在
-            result = subprocess.run(
-                ["docker", "volume", "inspect", name],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                check=True
-            )
-            volume_data = json.loads(result.stdout)
-            mountpoint = volume_data[0]['Mountpoint']
-            
-            if system == "Linux":
-                # 在 Linux 系统上，可以直接访问 Docker 卷路径
-                if os.path.isdir(mountpoint):
-                    volume_info[name] = mountpoint
-                    print(f"  - {_('found_docker_volume_path', name, mountpoint)}")
-                else:
-                    print(_("warning_docker_volume_invalid_path", name, mountpoint), file=sys.stderr)
+        volume = volumes.get(name)
+        if volume is None:
+            print(_("warning_cannot_get_volume_info", name, _('docker_volume_not_found')), file=sys.stderr)
+            continue
+        mountpoint = volume.get('Mountpoint', '')
+
+        if system == "Linux":
+            # 在 Linux 系统上，可以直接访问 Docker 卷路径
+            if os.path.isdir(mountpoint):
+                volume_info[name] = mountpoint
+                print(f"  - {_('found_docker_volume_path', name, mountpoint)}")
             else:
-                # 在 macOS/Windows 系统上，Docker 运行在虚拟机中，需要通过容器方式备份
-                volume_info[name] = "container_backup"
-                print(f"  - {_('found_docker_volume_container_backup', name)}")
-                
-        except (subprocess.CalledProcessError, json.JSONDecodeError, IndexError, KeyError) as e:
-            print(_("warning_cannot_get_volume_info", name, e), file=sys.stderr)
+                print(_("warning_docker_volume_invalid_path", name, mountpoint), file=sys.stderr)
+        else:
+            # 在 macOS/Windows 系统上，Docker 运行在虚拟机中，需要通过容器方式备份
+            volume_info[name] = "container_backup"
+            print(f"  - {_('found_docker_volume_container_backup', name)}")
     
     return volume_info
 
+def estimate_docker_volume_sizes(volume_names: List[str]) -> Optional[int]:
+    """估算多个 Docker 卷的数据总量，用于显示备份进度。
+
+    挂载点可直接访问时（Linux）只读取文件的 stat 大小；否则使用 Docker API 的磁盘占用数据
+    （docker system df），该请求可能较慢，应在后台线程中调用。
+
+    Args:
+        volume_names (list[str]): Docker 卷名称列表。
+
+    Returns:
+        Optional[int]: 估算的总字节数，有任何一个卷无法估算时返回 None。
+    """
+    total = 0
+    remaining = []
+    try:
+        volumes = inspect_docker_volumes(volume_names)
+    except _VOLUME_QUERY_ERRORS:
+        volumes = {}
+    for name in volume_names:
+        mountpoint = (volumes.get(name) or {}).get("Mountpoint", "")
+        if mountpoint and os.access(mountpoint, os.R_OK | os.X_OK):
+            total += sum(st.st_size for _path, _arc, st in walk_tree(mountpoint, name) if stat.S_ISREG(st.st_mode))
+        else:
+            remaining.append(name)
+    if not remaining:
+        return total
+
+    client = get_docker_client()
+    if client is None:
+        return None
+    try:
+        usage = client.disk_usage()
+    except (OSError, DockerAPIError):
+        return None
+    sizes = {v.get("Name"): (v.get("UsageData") or {}).get("Size", -1) for v in usage.get("Volumes") or []}
+    for name in remaining:
+        if sizes.get(name, -1) < 0:
+            return None
+        total += sizes[name]
+    return total
+
+
 def backup_docker_volume_via_container(volume_name: str, backup_path: str) -> bool:
     """通过 Docker 容器备份指定的 Docker 卷。
     
@@ -244,16 +402,8 @@ def backup_docker_volume_via_container(volume_name: str, backup_path: str) -> bo
         helper_image = f"{BACKUP_HELPER_IMAGE}:{BACKUP_HELPER_TAG}"
 
         # 确保 helper 镜像可用，否则尝试拉取
-        try:
-            subprocess.run(["docker", "image", "inspect", helper_image], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-        except subprocess.CalledProcessError:
-            # 如果镜像不存在，使用 docker_helpers.docker_pull_image 拉取
-            print(f"  - {_('helper_image_not_found_try_pull', helper_image)}")
-            try:
-                docker_pull_image(helper_image, _('pulling_helper_image'))
-            except Exception as e:
-                print(_('error_pull_helper_image', helper_image, e), file=sys.stderr)
-                return False
+        if not _ensure_helper_image(helper_image):
+            return False
 
         cmd = [
             "docker", "run", "--rm",
@@ -294,117 +444,322 @@ def backup_docker_volume_via_container(volume_name: str, backup_path: str) -> bo
         print(_('backup_docker_volume_exception', volume_name, e), file=sys.stderr)
         return False
 
-def restore_docker_volume_via_container(volume_name: str, backup_path: str) -> bool:
-    """通过 Docker 容器恢复指定的 Docker 卷。
-    
-    这种方法适用于所有操作系统，提供统一的恢复体验。
-    
-    Args:
-        volume_name (str): 要恢复的 Docker 卷名称。
-        backup_path (str): 备份文件的路径。
-        
-    Returns:
-        bool: 恢复成功返回 True，失败返回 False。
-    """
+# 本进程内已确认可用的 helper 镜像，以及保证并发的卷任务只检查/拉取一次的锁
+_ready_helper_images = set()
+_helper_image_lock = threading.Lock()
+
+# helper 镜像就绪标记文件名（位于工具配置目录下）
+_HELPER_MARKER_NAME = "helper_images.json"
+
+
+def _read_helper_markers() -> Dict[str, Dict]:
+    """读取 helper 镜像就绪标记（镜像引用 -> {id, checked}），文件不存在或损坏时返回空字典。"""
     try:
-        # 获取备份文件的目录和文件名
-        backup_dir = os.path.dirname(backup_path)
-        backup_filename = os.path.basename(backup_path)
-        
-        print(f"  - {_('restoring_via_container_starting', volume_name)}")
-        
-        # 使用配置的 helper 镜像来恢复卷的 tar 备份
-        # 先清理卷内容，然后解压备份
-        helper_image = f"{BACKUP_HELPER_IMAGE}:{BACKUP_HELPER_TAG}"
-        try:
-            subprocess.run(["docker", "image", "inspect", helper_image], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-        except subprocess.CalledProcessError:
+        with open(os.path.join(get_toolkit_config_dir(), _HELPER_MARKER_NAME), encoding="utf-8") as f:
+            markers = json.load(f)
+        return markers if isinstance(markers, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _write_helper_marker(helper_image: str, image_id: str) -> None:
+    """记录 helper 镜像的 ID 与检查时间，写入失败时忽略（标记只是优化）。"""
+    markers = _read_helper_markers()
+    markers[helper_image] = {"id": image_id, "checked": int(time.time())}
+    try:
+        path = os.path.join(get_toolkit_config_dir(), _HELPER_MARKER_NAME)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(markers, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def _inspect_helper_image_id(helper_image: str) -> Optional[str]:
+    """返回本地 helper 镜像的 ID（内容摘要），镜像不存在时返回 None。"""
+    client = get_docker_client()
+    try:
+        if client:
+            image = client.inspect_image(helper_image)
+            return image.get("Id") if image else None
+        result = subprocess.run(["docker", "image", "inspect", "--format", "{{.Id}}", helper_image],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True)
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() or None
+    except DockerAPIError:
+        return None
+
+def _ensure_helper_image(helper_image: str) -> bool:
+    """确保 helper 镜像在本地可用，否则尝试拉取。
+
+    每个进程只检查一次：并发的卷任务在锁上等待同一次检查或拉取的结果。
+    确认可用后在配置目录写入以镜像 ID 为内容的标记，BACKUP_HELPER_MARKER_TTL 内的后续运行
+    直接跳过检查（即使镜像随后被删除，docker run 也会自行拉取）。
+    """
+    if helper_image in _ready_helper_images:
+        return True
+    with _helper_image_lock:
+        if helper_image in _ready_helper_images:
+            return True
+        marker = _read_helper_markers().get(helper_image) if BACKUP_HELPER_MARKER_TTL else None
+        if marker and marker.get("id") and time.time() - marker.get("checked", 0) < BACKUP_HELPER_MARKER_TTL:
+            _ready_helper_images.add(helper_image)
+            return True
+
+        image_id = _inspect_helper_image_id(helper_image)
+        if image_id is None:
             print(f"  - {_('helper_image_not_found_try_pull', helper_image)}")
             try:
                 docker_pull_image(helper_image, _('pulling_helper_image'))
             except Exception as e:
                 print(_('error_pull_helper_image', helper_image, e), file=sys.stderr)
                 return False
-
-        cmd = [
-            "docker", "run", "--rm",
-            "-v", f"{volume_name}:/data",
-            "-v", f"{backup_dir}:/backup-dir",
-            helper_image,
-            "bash", "-c",
-            f"cd /data && rm -rf ./* ./.[!.]* ./..?* 2>/dev/null || true && tar xzf /backup-dir/{backup_filename} --strip-components=1"
-        ]
-        
-        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        print(f"  - {_('restoring_via_container_complete', volume_name)}")
+            image_id = _inspect_helper_image_id(helper_image)
+        if image_id and BACKUP_HELPER_MARKER_TTL:
+            _write_helper_marker(helper_image, image_id)
+        _ready_helper_images.add(helper_image)
         return True
-        
-    except subprocess.CalledProcessError as e:
-        print(_('restore_docker_volume_failed', volume_name, e), file=sys.stderr)
-        return False
 
+def stream_docker_volume_into_archive(volume_name: str, tar: tarfile.TarFile,
+                                      tar_lock: Optional[threading.Lock] = None) -> bool:
+    """通过 helper 容器的标准输出，将 Docker 卷内容直接写入主归档。
+
+    容器内执行 `tar cf - -C /data .`，宿主机以流模式读取该 tar 并把每个条目
+    重命名为 volumes/<卷名>/... 后逐个写入主归档，不产生临时文件，也不做 gzip 压缩
+    （压缩由外层归档统一完成）。恢复时按目录格式的卷备份处理。
 
-def restore_docker_volume_from_directory(volume_name: str, source_dir: str) -> bool:
-    """通过 Docker 容器从目录恢复指定的 Docker 卷。
-    
-    用于恢复直接以目录形式存储的卷备份。
-    
     Args:
-        volume_name (str): 要恢复的 Docker 卷名称。
-        source_dir (str): 包含卷数据的源目录路径。
-        
+        volume_name (str): 要备份的 Docker 卷名称。
+        tar (tarfile.TarFile): 以写模式打开的主归档。
+        tar_lock (threading.Lock, optional): 多个卷并发写入同一归档时使用的锁，
+            以条目为粒度串行化写入。
+
     Returns:
-        bool: 恢复成功返回 True，失败返回 False。
+        bool: 备份成功返回 True；尚未向主归档写入任何条目就失败时返回 False。
+
+    Raises:
+        VolumeBackupError: 已向主归档写入条目后失败。当前条目可能不完整，其后的归档内容无法对齐，
+            整个归档必须放弃。
     """
+    arc_root = f"volumes/{volume_name}"
+    tar_lock = tar_lock or threading.Lock()
+    helper_image = f"{BACKUP_HELPER_IMAGE}:{BACKUP_HELPER_TAG}"
+
+    print(f"  - {_('streaming_volume_into_archive', volume_name, arc_root)}")
+    if not _ensure_helper_image(helper_image):
+        return False
+
+    cmd = [
+        "docker", "run", "--rm",
+        "-v", f"{volume_name}:/data:ro",
+        helper_image,
+        "tar", "cf", "-", "-C", "/data", "."
+    ]
+    proc = None
+    stderr_chunks = []
+    written = False
     try:
-        print(f"  - {_('restoring_via_container_starting', volume_name)}")
-        
-        # 使用配置的 helper 镜像来恢复卷的目录数据
-        # 先清理卷内容，然后复制数据
-        helper_image = f"{BACKUP_HELPER_IMAGE}:{BACKUP_HELPER_TAG}"
-        try:
-            subprocess.run(["docker", "image", "inspect", helper_image], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-        except subprocess.CalledProcessError:
-            print(f"  - {_('helper_image_not_found_try_pull', helper_image)}")
-            try:
-                docker_pull_image(helper_image, _('pulling_helper_image'))
-            except Exception as e:
-                print(_('error_pull_helper_image', helper_image, e), file=sys.stderr)
-                return False
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # 单独读取 stderr，避免管道写满导致容器阻塞
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+        stderr_reader.start()
 
-        cmd = [
-            "docker", "run", "--rm",
-            "-v", f"{volume_name}:/data",
-            "-v", f"{source_dir}:/source-data",
-            helper_image,
-            "bash", "-c",
-            "cd /data && rm -rf ./* ./.[!.]* ./..?* 2>/dev/null || true && cp -a /source-data/. /data/"
-        ]
-        
-        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        print(f"  - {_('restoring_via_container_complete', volume_name)}")
+        entries = 0
+        with tarfile.open(fileobj=proc.stdout, mode="r|") as source:
+            for member in source:
+                relpath = member.name[2:] if member.name.startswith("./") else member.name
+                member.name = arc_root if relpath in ("", ".") else f"{arc_root}/{relpath}"
+                if member.islnk():
+                    linkpath = member.linkname[2:] if member.linkname.startswith("./") else member.linkname
+                    member.linkname = f"{arc_root}/{linkpath}"
+                # 源 tar 的 PAX path/linkpath 会覆盖新名称，稀疏格式头不再适用于展开后的内容，都需要移除
+                member.pax_headers = {k: v for k, v in member.pax_headers.items()
+                                      if k not in ("path", "linkpath") and not k.startswith("GNU.sparse.")}
+                fileobj = source.extractfile(member) if member.isreg() else None
+                with tar_lock:
+                    written = True
+                    tar.addfile(member, fileobj)
+                entries += 1
+
+        proc.wait()
+        stderr_reader.join()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, None, b"".join(stderr_chunks).decode(errors="ignore"))
+
+        print(f"  - {_('streaming_volume_complete', volume_name, entries)}")
         return True
-        
+
     except subprocess.CalledProcessError as e:
-        print(_('restore_docker_volume_failed', volume_name, e), file=sys.stderr)
+        print(_('backup_docker_volume_failed', volume_name, e), file=sys.stderr)
+        if e.stderr:
+            print(_('error_details', e.stderr), file=sys.stderr)
+        if written:
+            raise VolumeBackupError(_('error_volume_backup_incomplete', volume_name)) from e
+        return False
+    except (tarfile.TarError, OSError) as e:
+        print(_('backup_docker_volume_exception', volume_name, e), file=sys.stderr)
+        if written:
+            raise VolumeBackupError(_('error_volume_backup_incomplete', volume_name)) from e
         return False
+    finally:
+        if proc and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+def backup_docker_volumes_concurrently(volume_names: List[str], backup_func: Callable[[str], Any],
+                                       max_workers: int = BACKUP_VOLUME_WORKERS,
+                                       report: Optional[OperationReport] = None,
+                                       method: Union[str, Callable[[str], str]] = "container"):
+    """使用有界线程池并发地通过容器备份多个 Docker 卷。
+
+    各卷互不依赖，每个卷由独立的 helper 容器处理，整体耗时约等于最大卷的备份耗时。
+    每个卷完成时立即产出结果。
+
+    Args:
+        volume_names (list[str]): 要备份的 Docker 卷名称列表。
+        backup_func (Callable[[str], Any]): 备份单个卷的函数，返回假值表示失败。
+        max_workers (int): 同时运行的 helper 容器数量上限。
+        report (OperationReport, optional): 记录每个卷耗时和结果的统计报告。
+        method (str | Callable[[str], str]): 报告中记录的备份方式，或根据卷名返回备份方式的函数。
+
+    Yields:
+        tuple[str, Any]: (卷名, backup_func 的返回值)。
+
+    Raises:
+        VolumeBackupError: 某个卷写入归档中途失败，尚未开始的卷会被取消。
+    """
+    total = len(volume_names)
+    if not total:
+        return
+    max_workers = max(1, min(max_workers, total))
+    print(f"  - {_('volume_backup_workers', total, max_workers)}")
+
+    def _method(volume_name: str) -> str:
+        return method(volume_name) if callable(method) else method
+
+    def _backup_one(volume_name: str):
+        started = time.time()
+        try:
+            return volume_name, backup_func(volume_name), time.time() - started
+        except VolumeBackupError:
+            if report:
+                report.add_volume(volume_name, _method(volume_name), False, time.time() - started)
+            raise
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_backup_one, name) for name in volume_names]
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                volume_name, result, elapsed = future.result()
+            except VolumeBackupError:
+                # 归档已不可用，尚未开始的卷不再备份
+                for pending in futures:
+                    pending.cancel()
+                raise
+            if report:
+                report.add_volume(volume_name, _method(volume_name), bool(result), elapsed)
+            if result:
+                print(f"  - {_('volume_backup_done', done, total, volume_name, elapsed)}")
+            else:
+                print(f"  - {_('volume_backup_failed_progress', done, total, volume_name, elapsed)}", file=sys.stderr)
+            yield volume_name, result
+
+def get_exclusion_reason(arcname: str) -> Optional[str]:
+    """判断归档路径是否应被排除在备份之外。
+
+    会排除数据根目录下的 logs/、uploads/、napcat_data/ 目录、.env.example 文件
+    以及以 ._ 开头的临时文件。
+
+    Args:
+        arcname (str): 成员在归档中的路径。
+
+    Returns:
+        Optional[str]: 需要排除时返回说明原因的消息键，否则返回 None。
+    """
+    # 分离路径和文件名
+    path_parts = arcname.split('/')
+    filename = os.path.basename(arcname)
+
+    # 1. 过滤根目录下的 logs 文件夹
+    if len(path_parts) >= 2 and path_parts[1] == 'logs':
+        return 'excluding_logs_directory'
 
-def create_archive(source_paths: Dict[str, str], dest_path_base: str) -> Optional[str]:
+    # 2. 过滤根目录下的 uploads 文件夹
+    if len(path_parts) >= 2 and path_parts[1] == 'uploads':
+        return 'excluding_uploads_directory'
+
+    # 3.过滤根目录下的 napcat_data 文件夹
+    if len(path_parts) >= 2 and path_parts[1] == 'napcat_data':
+        return 'excluding_napcat_data_directory'
+
+    # 4. 过滤根目录下的 .env.example 文件
+    if len(path_parts) == 2 and path_parts[1] == '.env.example':
+        return 'excluding_env_template'
+
+    # 5. 过滤根目录下以 ._ 开头的文件
+    if len(path_parts) == 2 and filename.startswith('._'):
+        return 'excluding_temp_file'
+
+    return None
+
+def create_archive(source_paths: Dict[str, str], dest_path_base: str,
+                   compress_level: Optional[int] = None,
+                   compress_threads: Optional[int] = None,
+                   volume_workers: Optional[int] = None,
+                   volume_mode: Optional[str] = None,
+                   incremental: bool = False,
+                   codec: Optional[str] = None,
+                   postgres_dumps: Optional[Dict[str, str]] = None,
+                   qdrant_snapshots: Optional[Dict[str, Any]] = None,
+                   report: Optional[OperationReport] = None,
+                   progress_mode: Optional[str] = None) -> Optional[str]:
     """创建一个包含多个源目录的压缩归档文件。
 
-    如果系统支持 zstd，则创建 .tar.zstd 文件；否则，创建 .tar 文件。
+    tar 数据流直接写入所选编解码器，一次顺序写出压缩归档，不会在磁盘上生成完整的中间 .tar。
+    默认按 zstd、xz、gzip 的顺序选择可用的编解码器，归档后缀（.tar.zstd / .tar.xz / .tar.gz）
+    和清单中都会记录所用的编解码器，恢复时据此选择解码器。
     会排除 logs/, uploads/ 目录和 .env.example 文件。
     
-    对于 Docker 卷，如果值为 "container_backup"，则通过容器方式单独备份。
+    对于 Docker 卷，如果值为 "container_backup"，则通过容器方式并发备份：
+    stream 模式下容器输出的 tar 流直接写入归档（volumes/<卷名>/...），
+    file 模式下每个卷先生成 .tar.gz，完成后立即写入归档。
+    postgres_dumps 中的 Postgres 卷不复制卷文件，而是在运行中的容器内执行 pg_dump，
+    输出分段写入 volumes/<卷名>.pgdump/；qdrant_snapshots 中的 Qdrant 卷通过 HTTP API 为每个集合创建快照，
+    写入 volumes/<卷名>.qdrant/。
+
+    增量模式下，tar 数据流写入目标目录下的分块仓库，只保存新增分块，
+    并生成一个 .snapshot.json 快照清单作为本次备份。
+
+    各阶段（清单扫描、数据目录、服务备份、容器卷、压缩）的耗时和字节数记录到 report 中；
+    压缩阶段的耗时为 tar 数据流阻塞在编解码器写入上的时间加上最后刷新压缩器的时间。
+
+    写入期间按写入编解码器的 tar 字节数显示进度，总量由清单中的文件大小加上
+    在后台线程中估算的 Docker 卷大小得到。
 
     Args:
         source_paths (dict[str, str]): 一个字典，键是源路径，值是其在归档中的目标名称 (arcname) 或备份方法。
         dest_path_base (str): 不带扩展名的目标归档文件基础路径。
+        compress_level (int, optional): 压缩级别，默认使用 BACKUP_COMPRESS_LEVEL。
+        compress_threads (int, optional): 压缩线程数，默认使用 BACKUP_COMPRESS_THREADS。
+        volume_workers (int, optional): 并发备份的卷数量上限，默认使用 BACKUP_VOLUME_WORKERS。
+        volume_mode (str, optional): 容器卷备份方式 "stream" 或 "file"，默认使用 BACKUP_VOLUME_MODE。
+        incremental (bool): 是否写入分块仓库生成增量快照。
+        codec (str, optional): 编解码器名称（auto/zstd/xz/gzip/none），默认使用 BACKUP_CODEC。
+        postgres_dumps (dict[str, str], optional): 以 pg_dump 逻辑备份的卷名到其运行中容器的映射。
+        qdrant_snapshots (dict[str, QdrantClient], optional): 以集合快照备份的卷名到其服务客户端的映射。
+        report (OperationReport, optional): 记录各阶段耗时和数据量的统计报告。
+        progress_mode (str, optional): 进度显示方式 auto/bar/json/off，默认使用 BACKUP_PROGRESS_MODE。
 
     Returns:
-        Optional[str]: 成功则返回最终的归档文件路径，否则返回 None。
+        Optional[str]: 成功则返回最终的归档文件（或快照清单）路径，否则返回 None。
     """
-    tar_path = f"{dest_path_base}.tar"
+    compress_level = BACKUP_COMPRESS_LEVEL if compress_level is None else compress_level
+    compress_threads = BACKUP_COMPRESS_THREADS if compress_threads is None else compress_threads
+    volume_workers = BACKUP_VOLUME_WORKERS if volume_workers is None else volume_workers
+    volume_mode = volume_mode or BACKUP_VOLUME_MODE
+    postgres_dumps = postgres_dumps or {}
+    qdrant_snapshots = qdrant_snapshots or {}
+    report = report or OperationReport("backup")
     
     # 分离常规文件路径和 Docker 卷
     regular_sources = {}
@@ -418,201 +773,1101 @@ def create_archive(source_paths: Dict[str, str], dest_path_base: str) -> Optiona
         else:
             regular_sources[source] = arcname
 
-    # 定义要排除的路径和文件模式
-    def exclude_filter(tarinfo: tarfile.TarInfo) -> Optional[tarfile.TarInfo]:
-        """Tarfile filter to exclude specific files/directories."""
-        # 获取相对于归档根目录的路径
-        path = tarinfo.name
-        
-        # 分离路径和文件名
-        path_parts = path.split('/')
-        filename = os.path.basename(path)
-        
-        # 1. 过滤根目录下的 logs 文件夹
-        if len(path_parts) >= 2 and path_parts[1] == 'logs':
-            print(f"  - {_('excluding_logs_directory', tarinfo.name)}")
-            return None
-            
-        # 2. 过滤根目录下的 uploads 文件夹
-        if len(path_parts) >= 2 and path_parts[1] == 'uploads':
-            print(f"  - {_('excluding_uploads_directory', tarinfo.name)}")
-            return None
+    def print_excluded(arcname: str) -> None:
+        print(f"  - {_(get_exclusion_reason(arcname), arcname)}")
 
-        # 3.过滤根目录下的 napcat_data 文件夹
-        if len(path_parts) >= 2 and path_parts[1] == 'napcat_data':
-            print(f"  - {_('excluding_napcat_data_directory', tarinfo.name)}")
-            return None
-            
-        # 4. 过滤根目录下的 .env.example 文件
-        if len(path_parts) == 2 and path_parts[1] == '.env.example':
-            print(f"  - {_('excluding_env_template', tarinfo.name)}")
-            return None
-            
-        # 5. 过滤根目录下以 ._ 开头的文件
-        if len(path_parts) == 2 and filename.startswith('._'):
-            print(f"  - {_('excluding_temp_file', tarinfo.name)}")
+    # 已列入清单但没有写入归档的文件（无法读取，或在扫描清单后被删除），
+    # 记录在校验和成员中，校验时不视为缺失
+    skipped_files: List[str] = []
+
+    def print_unreadable(arcname: str, error: OSError) -> None:
+        skipped_files.append(arcname)
+        print(f"  - {_('warning_file_unreadable', arcname, error)}", file=sys.stderr)
+
+    archive_codec = None
+    archive_path = None
+    archive_writer = None
+    chunk_writer = None
+
+    if incremental:
+        compression = {"codec": "chunk-store", "chunk_codec": "zlib"}
+    else:
+        try:
+            archive_codec = select_codec(codec or BACKUP_CODEC)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            report.fail(e)
             return None
-            
-        return tarinfo
+        archive_path = f"{dest_path_base}{archive_codec.suffix}"
+        compression = {
+            "codec": archive_codec.name,
+            "backend": archive_codec.backend(),
+            "level": archive_codec.effective_level(compress_level),
+            "threads": compress_threads,
+        }
+    report.info["codec"] = compression["codec"]
+    manifest_files = []
+    with report.phase("manifest_scan"):
+        for source, arcname in regular_sources.items():
+            if os.path.isdir(source):
+                manifest_files.extend(scan_source_files(source, arcname, get_exclusion_reason))
+            elif os.path.exists(source):
+                st = os.stat(source)
+                manifest_files.append({"path": arcname, "size": st.st_size, "mtime": int(st.st_mtime)})
+    manifest_volumes = [
+        {
+            "name": name,
+            "method": volume_mode,
+            "arcname": f"volumes/{name}/" if volume_mode == "stream" else f"volumes/{name}.tar.gz",
+        }
+        for name in volume_sources
+    ] + [
+        {"name": os.path.basename(arcname), "method": "path", "arcname": f"{arcname}/"}
+        for arcname in regular_sources.values() if arcname.replace(os.sep, '/').startswith("volumes/")
+    ] + [
+        {"name": name, "method": "pg_dump", "arcname": f"volumes/{name}{PG_DUMP_SUFFIX}/"}
+        for name in postgres_dumps
+    ] + [
+        {"name": name, "method": "qdrant_snapshot", "arcname": f"volumes/{name}{QDRANT_SNAPSHOT_SUFFIX}/"}
+        for name in qdrant_snapshots
+    ]
+    manifest = build_manifest(
+        root_dir=next((arcname for arcname in regular_sources.values()
+                       if not arcname.replace(os.sep, '/').startswith("volumes/")), None),
+        volumes=manifest_volumes,
+        files=manifest_files,
+        compression=compression,
+        toolkit_version=get_version_info(),
+    )
 
+    compression_stats = report.get_phase("compression")
     try:
-        print(_('creating_tar_archive', tar_path))
-        
-        # 创建主 tar 文件
-        with tarfile.open(tar_path, "w") as tar:
-            # 添加常规文件和目录
+        if incremental:
+            # 归档流直接切分为内容寻址分块，未变化的数据不会重复写入
+            store_dir = os.path.join(os.path.dirname(dest_path_base), BACKUP_CHUNK_STORE_DIR)
+            print(_('creating_incremental_snapshot', store_dir))
+            chunk_writer = ChunkStoreWriter(store_dir, workers=compress_threads)
+            stream = TimedStream(chunk_writer, compression_stats)
+        else:
+            # tar 直接写入编解码器，单次顺序写出，不在磁盘上生成完整的中间 .tar
+            if archive_codec.max_level:
+                print(_('compressing_with_codec', archive_codec.name, archive_codec.backend(), archive_path))
+                print(f"  - {_('compression_settings', compression['level'], compress_threads or _('all_cpu_cores'))}")
+            else:
+                print(_('creating_tar_archive', archive_path))
+            archive_writer = archive_codec.open_writer(archive_path, compress_level, compress_threads)
+            stream = TimedStream(archive_writer, compression_stats)
+        tar = ChecksumTarFile.open(fileobj=stream, mode="w|", bufsize=ARCHIVE_STREAM_BUFSIZE)
+
+        # 文件部分的总量直接取自清单（每个条目另加一个 tar 头）
+        files_total = sum(entry["size"] for entry in manifest_files) + tarfile.BLOCKSIZE * len(manifest_files)
+        estimate_volumes = list(volume_sources) + list(postgres_dumps) + list(qdrant_snapshots)
+        progress_reporter = ProgressReporter("backup", lambda: stream.bytes,
+                                             None if estimate_volumes else files_total,
+                                             mode=progress_mode, label=_('progress_backup'))
+        if estimate_volumes and progress_reporter.mode != "off":
+            def _estimate_total():
+                volumes_total = estimate_docker_volume_sizes(estimate_volumes)
+                progress_reporter.set_total(None if volumes_total is None else files_total + volumes_total)
+
+            threading.Thread(target=_estimate_total, daemon=True).start()
+
+        with tar, progress_reporter:
+            # 清单作为第一个成员写入，列出内容时只需读取归档开头
+            add_json_member(tar, MANIFEST_NAME, manifest)
+
+            # 添加常规文件和目录（数据目录以及 Linux 上可直接访问的卷挂载点）
             for source, arcname in regular_sources.items():
                 print(_('adding_to_archive', source, arcname))
-                tar.add(source, arcname=arcname, filter=exclude_filter)
-        
-        # 处理 Docker 卷备份
-        if volume_sources:
-            temp_dir = tempfile.mkdtemp()
-            try:
-                # 为每个卷创建备份文件
-                volume_backups = {}
-                for volume_name, source in volume_sources.items():
-                    volume_backup_path = os.path.join(temp_dir, f"{volume_name}.tar.gz")
-                    if backup_docker_volume_via_container(volume_name, volume_backup_path):
-                        volume_backups[volume_name] = volume_backup_path
-                
-                # 将卷备份添加到主 tar 文件中
-                if volume_backups:
-                    with tarfile.open(tar_path, "a") as tar:
-                        for volume_name, backup_path in volume_backups.items():
-                            arcname = f"volumes/{volume_name}.tar.gz"
-                            print(_('adding_docker_volume_backup', volume_name, arcname))
-                            tar.add(backup_path, arcname=arcname)
-            finally:
-                import shutil
-                shutil.rmtree(temp_dir)
-
-        # 压缩最终归档
-        if command_exists("zstd"):
-            zstd_path = f"{dest_path_base}.tar.zstd"
-            print(_('detected_zstd_compressing', zstd_path))
-            subprocess.run(["zstd", "-f", "--quiet", tar_path, "-o", zstd_path], check=True)
-            os.remove(tar_path)
-            return zstd_path
-        else:
-            print(_('zstd_not_detected_tar_only'))
-            return tar_path
+                is_volume = arcname.replace(os.sep, '/').startswith("volumes/")
+                started = time.monotonic()
+                with report.phase("volume_paths" if is_volume else "data_files") as phase:
+                    offset = tar.offset
+                    if os.path.isdir(source) and not os.path.islink(source):
+                        add_tree_to_archive(tar, source, arcname, get_exclusion_reason, print_excluded,
+                                            print_unreadable)
+                    else:
+                        tar.add(source, arcname=arcname)
+                    phase.add_bytes(bytes_in=tar.offset - offset)
+                if is_volume:
+                    report.add_volume(os.path.basename(arcname), "path", True, time.monotonic() - started)
+
+            tar_lock = threading.Lock()
+
+            # 服务感知的卷备份：Postgres 的 pg_dump 输出和 Qdrant 的集合快照直接写入归档
+            def _backup_service(name: str) -> bool:
+                if name in postgres_dumps:
+                    return stream_postgres_dump_into_archive(name, postgres_dumps[name], tar, tar_lock)
+                return stream_qdrant_snapshots_into_archive(name, qdrant_snapshots[name], tar, tar_lock)
+
+            with report.phase("service_backups") as phase:
+                offset = tar.offset
+                service_backups = backup_docker_volumes_concurrently(
+                    list(postgres_dumps) + list(qdrant_snapshots), _backup_service, max_workers=volume_workers,
+                    report=report, method=lambda name: "pg_dump" if name in postgres_dumps else "qdrant_snapshot"
+                )
+                # pg_dump 失败时归档中已有不完整的分段，且卷文件没有另行备份，整个备份视为失败
+                failed_dumps = [volume_name for volume_name, ok in service_backups
+                                if not ok and volume_name in postgres_dumps]
+                phase.add_bytes(bytes_in=tar.offset - offset)
+            if failed_dumps:
+                raise VolumeBackupError(_('error_volume_backup_incomplete', ", ".join(failed_dumps)))
+
+            # 处理 Docker 卷备份
+            with report.phase("volume_containers") as phase:
+                offset = tar.offset
+                if volume_sources and volume_mode == "stream":
+                    streamed = backup_docker_volumes_concurrently(
+                        list(volume_sources),
+                        lambda name: stream_docker_volume_into_archive(name, tar, tar_lock),
+                        max_workers=volume_workers, report=report, method="stream"
+                    )
+                    for _volume_name, _ok in streamed:
+                        # 卷内容已由工作线程逐条写入归档，这里只需等待全部完成；
+                        # 写入中途失败的卷会抛出 VolumeBackupError，整个归档被放弃
+                        pass
+                elif volume_sources:
+                    temp_dir = tempfile.mkdtemp()
+
+                    def _backup_to_file(name: str) -> Optional[str]:
+                        path = os.path.join(temp_dir, f"{name}.tar.gz")
+                        return path if backup_docker_volume_via_container(name, path) else None
+
+                    try:
+                        volume_backups = backup_docker_volumes_concurrently(
+                            list(volume_sources), _backup_to_file, max_workers=volume_workers,
+                            report=report, method="file"
+                        )
+                        for volume_name, volume_backup_path in volume_backups:
+                            if volume_backup_path:
+                                # 卷备份作为成员直接写入同一条归档流
+                                arcname = f"volumes/{volume_name}.tar.gz"
+                                print(_('adding_docker_volume_backup', volume_name, arcname))
+                                tar.add(volume_backup_path, arcname=arcname)
+                                os.remove(volume_backup_path)
+                    finally:
+                        shutil.rmtree(temp_dir)
+                phase.add_bytes(bytes_in=tar.offset - offset)
+
+            # 扫描清单和写入数据是两次遍历，期间被删除的文件不会出现在归档中
+            written = {member.name for member in tar.members}
+            for entry in manifest_files:
+                if entry["path"] not in written and entry["path"] not in skipped_files:
+                    print(f"  - {_('warning_file_vanished', entry['path'])}", file=sys.stderr)
+                    skipped_files.append(entry["path"])
+
+            # 校验和在写入各成员时顺带计算，作为最后一个成员写入
+            add_json_member(tar, CHECKSUMS_NAME, {"algorithm": "sha256", "members": tar.checksums,
+                                                  "skipped": skipped_files})
 
-    except (subprocess.CalledProcessError, FileNotFoundError, OSError) as e:
+        # 按归档成员统计每个卷写入的数据量
+        volume_bytes: Dict[str, int] = {}
+        for member in tar.members:
+            parts = member.name.split("/", 2)
+            if parts[0] == "volumes" and len(parts) > 1:
+                volume_name = parts[1]
+                for suffix in (PG_DUMP_SUFFIX, QDRANT_SNAPSHOT_SUFFIX, ".tar.gz"):
+                    if volume_name.endswith(suffix):
+                        volume_name = volume_name[:-len(suffix)]
+                        break
+                volume_bytes[volume_name] = volume_bytes.get(volume_name, 0) + member.size
+        for volume_name, num_bytes in volume_bytes.items():
+            report.set_volume_bytes(volume_name, num_bytes)
+
+        # 刷新压缩器（或等待剩余分块落盘）的时间计入压缩阶段
+        with report.phase("compression") as phase:
+            if chunk_writer:
+                result_path = chunk_writer.commit(os.path.basename(dest_path_base))
+                bytes_out = chunk_writer.new_bytes
+            else:
+                archive_writer.close()
+                result_path = archive_path
+                bytes_out = os.path.getsize(archive_path)
+                # 归档文件的校验和在写出压缩数据时已同步计算
+                report.info["sha256"] = archive_writer.hexdigest()
+            phase.add_bytes(bytes_in=stream.bytes, bytes_out=bytes_out)
+        report.bytes_in = stream.bytes
+        report.bytes_out = bytes_out
+        report.info["archive"] = result_path
+        return result_path
+
+    except (subprocess.CalledProcessError, FileNotFoundError, OSError, tarfile.TarError) as e:
         print(_('error_archive_creation_failed', e), file=sys.stderr)
-        if os.path.exists(tar_path):
-            os.remove(tar_path)
+        report.fail(e)
+        if chunk_writer:
+            # 已写入的分块可被后续快照复用，只需丢弃未完成的快照
+            chunk_writer.close()
+            return None
+        if archive_writer:
+            archive_writer.abort()
+        if archive_path and os.path.exists(archive_path):
+            os.remove(archive_path)
         return None
 
-def extract_archive(archive_path: str, dest_dir: str, volume_mountpoints: Optional[Dict[str, str]] = None) -> bool:
-    """解压归档文件，区分数据目录和 Docker 卷。
+class RestoreFilter:
+    """选择性恢复的过滤条件。
+
+    由一组选择器构成，任一选择器命中即恢复该条目：
+    - "data"：整个数据目录；
+    - "data:<glob>"：数据目录中匹配的路径（相对数据目录，匹配目录时包含其全部内容），如 "data:configs/*"；
+    - "volume:<name>"：名称匹配的 Docker 卷（支持通配符）。
+    """
+
+    def __init__(self, selectors: List[str]):
+        """
+        Args:
+            selectors (list[str]): 选择器列表。
+
+        Raises:
+            ValueError: 选择器格式无效。
+        """
+        self.data_all = False
+        self.data_globs: List[str] = []
+        self.volume_globs: List[str] = []
+        for selector in selectors:
+            kind, _sep, pattern = selector.partition(":")
+            pattern = pattern.strip().strip("/")
+            if kind == "data" and not pattern:
+                self.data_all = True
+            elif kind == "data":
+                self.data_globs.append(pattern)
+            elif kind == "volume" and pattern:
+                self.volume_globs.append(pattern)
+            else:
+                raise ValueError(_('error_invalid_restore_selector', selector))
+
+    @property
+    def wants_data(self) -> bool:
+        return self.data_all or bool(self.data_globs)
+
+    @property
+    def wants_volumes(self) -> bool:
+        return bool(self.volume_globs)
+
+    def includes_data(self, relpath: str) -> bool:
+        """判断数据目录中的相对路径是否需要恢复。"""
+        if self.data_all:
+            return True
+        parts = relpath.split("/")
+        # 路径本身或其任一上级目录匹配即可
+        prefixes = ["/".join(parts[:i]) for i in range(1, len(parts) + 1)]
+        return any(fnmatch.fnmatchcase(prefix, pattern) for pattern in self.data_globs for prefix in prefixes)
+
+    def includes_volume(self, volume_name: str) -> bool:
+        """判断 Docker 卷是否需要恢复。"""
+        return any(fnmatch.fnmatchcase(volume_name, pattern) for pattern in self.volume_globs)
+
+
+class VolumeRestoreStream:
+    """通过 helper 容器的标准输入恢复单个 Docker 卷。
+
+    容器执行 `tar x` 从标准输入读取数据，宿主机边读取主归档边写入，数据解压到卷内的暂存目录
+    （VOLUME_STAGING_DIR），卷中原有的内容保持不变；整个归档校验通过后由 commit_staged_volume
+    替换卷的内容，校验失败时由 discard_staged_volume 删除暂存目录。支持两种输入：
+    - 目录格式的卷备份（volumes/<卷名>/...）：逐条重命名后以 tar 流写入；
+    - .tar.gz 格式的卷备份（volumes/<卷名>.tar.gz）：原样写入 `tar xz`。
+    """
+
+    def __init__(self, volume_name: str, compressed: bool = False, clean: bool = True):
+        """
+        Args:
+            volume_name (str): 要恢复的 Docker 卷名称。
+            compressed (bool): 输入是否为容器备份生成的 .tar.gz（顶层目录为 data/）。
+            clean (bool): 解压前是否清空暂存目录。同一个卷的后续容器应传入 False，在已恢复内容上继续写入。
+        """
+        self.volume_name = volume_name
+        self.compressed = compressed
+        self.clean = clean
+        self.entries = 0
+        self.bytes = 0
+        self.started = None
+        self.failed = False
+        self._arc_root = f"volumes/{volume_name}"
+        self._proc = None
+        self._tar = None
+        self._stderr_chunks = []
+        self._stderr_reader = None
+
+    def start(self) -> bool:
+        """启动 helper 容器。"""
+        helper_image = f"{BACKUP_HELPER_IMAGE}:{BACKUP_HELPER_TAG}"
+        print(f"  - {_('restoring_via_container_starting', self.volume_name)}")
+        if not _ensure_helper_image(helper_image):
+            return False
+
+        extract_cmd = "tar xzf - --strip-components=1" if self.compressed else "tar xf -"
+        # 第一个容器清除上次中断的恢复可能留下的暂存目录
+        prepare_cmd = f"rm -rf {VOLUME_STAGING_DIR} && " if self.clean else ""
+        cmd = [
+            "docker", "run", "--rm", "-i",
+            "-v", f"{self.volume_name}:/data",
+            helper_image,
+            "sh", "-c",
+            f"cd /data && {prepare_cmd}mkdir -p {VOLUME_STAGING_DIR} && cd {VOLUME_STAGING_DIR} && {extract_cmd}"
+        ]
+        self.started = time.time()
+        try:
+            self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                          stderr=subprocess.PIPE, bufsize=ARCHIVE_STREAM_BUFSIZE)
+        except OSError as e:
+            print(_('restore_docker_volume_failed', self.volume_name, e), file=sys.stderr)
+            return False
+        # 单独读取 stderr，避免管道写满导致容器阻塞
+        self._stderr_reader = threading.Thread(
+            target=lambda: self._stderr_chunks.append(self._proc.stderr.read()), daemon=True
+        )
+        self._stderr_reader.start()
+        if not self.compressed:
+            self._tar = tarfile.open(fileobj=self._proc.stdin, mode="w|", bufsize=ARCHIVE_STREAM_BUFSIZE)
+        return True
+
+    def add_member(self, member: tarfile.TarInfo, fileobj=None) -> None:
+        """写入一个目录格式卷备份中的条目（名称为 volumes/<卷名>/...）。"""
+        relpath = member.name[len(self._arc_root):].lstrip("/")
+        if not relpath:
+            # 卷根目录本身对应容器内的 /data，无需写入
+            return
+        member.name = relpath
+        if member.islnk() and member.linkname.startswith(f"{self._arc_root}/"):
+            member.linkname = member.linkname[len(self._arc_root) + 1:]
+        # 稀疏文件以展开后的完整内容写入，不保留原归档中的稀疏格式头
+        member.pax_headers = {k: v for k, v in member.pax_headers.items()
+                              if k not in ("path", "linkpath") and not k.startswith("GNU.sparse.")}
+        try:
+            self._tar.addfile(member, fileobj)
+        except BrokenPipeError:
+            # 容器提前退出导致管道断开，具体错误在 finish() 中报告
+            self.failed = True
+            return
+        self.entries += 1
+        if member.isreg():
+            self.bytes += member.size
+
+    def write_stream(self, fileobj) -> None:
+        """原样写入 .tar.gz 格式的卷备份数据。"""
+        try:
+            while True:
+                data = fileobj.read(ARCHIVE_STREAM_BUFSIZE)
+                if not data:
+                    break
+                self._proc.stdin.write(data)
+                self.bytes += len(data)
+        except BrokenPipeError:
+            self.failed = True
+            return
+        self.entries += 1
+
+    def finish(self) -> bool:
+        """结束输入并等待容器完成解压。
+
+        Returns:
+            bool: 恢复成功返回 True，失败返回 False。
+        """
+        try:
+            if self._tar:
+                self._tar.close()
+            self._proc.stdin.close()
+        except (OSError, tarfile.TarError):
+            # 容器提前退出时管道会断开，具体错误以容器的返回码为准
+            pass
+        returncode = self._proc.wait()
+        self._stderr_reader.join()
+        if returncode != 0 or self.failed:
+            details = b"".join(self._stderr_chunks).decode(errors="ignore").strip()
+            print(_('restore_docker_volume_failed', self.volume_name,
+                    subprocess.CalledProcessError(returncode, self._proc.args)), file=sys.stderr)
+            if details:
+                print(_('error_details', details), file=sys.stderr)
+            return False
+        print(f"  - {_('restoring_via_container_complete', self.volume_name)}")
+        return True
+
+    def abort(self) -> None:
+        """中止恢复并终止容器。"""
+        if self._proc and self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+
+
+def _run_volume_helper(volume_name: str, script: str) -> bool:
+    """在挂载了卷（/data）的 helper 容器中执行一段 shell 命令，成功返回 True。"""
+    helper_image = f"{BACKUP_HELPER_IMAGE}:{BACKUP_HELPER_TAG}"
+    if not _ensure_helper_image(helper_image):
+        return False
+    cmd = ["docker", "run", "--rm", "-v", f"{volume_name}:/data", helper_image, "sh", "-c", f"cd /data && {script}"]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    except OSError as e:
+        print(_('restore_docker_volume_failed', volume_name, e), file=sys.stderr)
+        return False
+    if result.returncode != 0:
+        print(_('restore_docker_volume_failed', volume_name,
+                subprocess.CalledProcessError(result.returncode, cmd)), file=sys.stderr)
+        if result.stderr.strip():
+            print(_('error_details', result.stderr.strip()), file=sys.stderr)
+        return False
+    return True
+
+
+def commit_staged_volume(volume_name: str) -> bool:
+    """用暂存目录中已解压的数据替换卷中原有的内容（同一文件系统内重命名，不复制数据）。"""
+    return _run_volume_helper(
+        volume_name,
+        f"find . -mindepth 1 -maxdepth 1 ! -name {VOLUME_STAGING_DIR} -exec rm -rf {{}} + && "
+        f"find {VOLUME_STAGING_DIR} -mindepth 1 -maxdepth 1 -exec mv {{}} . \\; && rmdir {VOLUME_STAGING_DIR}"
+    )
+
+
+def discard_staged_volume(volume_name: str) -> bool:
+    """删除卷内的暂存目录，卷中原有的内容保持不变。"""
+    return _run_volume_helper(volume_name, f"rm -rf {VOLUME_STAGING_DIR}")
+
+
+class VolumeRestorePool:
+    """并发恢复多个 Docker 卷的容器池。
+
+    主归档只能顺序读取，但各卷的 helper 容器互不依赖：容器的启动和收尾等待都在有界线程池中进行，
+    一个卷的条目读完后其容器在后台完成解压，不阻塞后续卷的读取，同时最多有 max_workers 个容器在运行。
+    当需要启动新容器而容器数已达上限时，先结束最早打开的容器；如果该卷的条目之后再次出现
+    （例如并发备份时交错写入的卷），会启动一个不清空暂存目录的新容器继续写入。
+    数据只写入各卷的暂存目录：归档校验通过后调用 finish_all 替换卷的内容，失败时调用 abort_all 丢弃。
+    """
+
+    def __init__(self, max_workers: int = BACKUP_VOLUME_WORKERS):
+        """
+        Args:
+            max_workers (int): 同时运行的 helper 容器数量上限。
+        """
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._open: Dict[str, Future] = {}
+        self._closing = []
+        self._started_volumes = set()
+        self._failed_volumes = set()
+        self.results: Dict[str, Dict[str, Any]] = {}
+        print(f"  - {_('volume_restore_workers', self.max_workers)}")
+
+    def _submit_start(self, volume_name: str, compressed: bool) -> None:
+        # 只有卷的第一个容器需要清空暂存目录，之后的容器在已恢复的内容上继续写入
+        stream = VolumeRestoreStream(volume_name, compressed=compressed,
+                                     clean=volume_name not in self._started_volumes)
+        self._started_volumes.add(volume_name)
+        self._open[volume_name] = self._executor.submit(lambda: stream if stream.start() else None)
+
+    def get(self, volume_name: str, compressed: bool) -> Optional[VolumeRestoreStream]:
+        """返回卷对应的恢复容器，必要时启动；容器启动失败时返回 None。"""
+        if volume_name in self._failed_volumes:
+            return None
+        if volume_name not in self._open:
+            if len(self._open) >= self.max_workers:
+                # 结束最早打开的容器，释放名额
+                oldest = next(iter(self._open))
+                self._close(oldest)
+            self._submit_start(volume_name, compressed)
+        stream = self._open[volume_name].result()
+        if stream is None:
+            self._open.pop(volume_name)
+            self._failed_volumes.add(volume_name)
+            self.results[volume_name] = {"ok": False, "bytes": 0, "elapsed": 0.0}
+        return stream
+
+    def _close(self, volume_name: str) -> None:
+        future = self._open.pop(volume_name)
+
+        def _finish():
+            stream = future.result()
+            if stream is None:
+                return volume_name, None
+            return volume_name, (stream.finish(), stream)
+
+        self._closing.append(self._executor.submit(_finish))
+
+    def finish_all(self) -> Dict[str, Dict[str, Any]]:
+        """结束所有容器并等待解压完成，然后用暂存的数据替换各卷的内容。
+
+        解压失败的卷不替换，丢弃其暂存目录，卷中原有的内容保持不变。
+
+        Returns:
+            dict[str, dict]: 卷名到结果（ok、bytes、elapsed）的映射。
+        """
+        for volume_name in list(self._open):
+            self._close(volume_name)
+        try:
+            for future in self._closing:
+                volume_name, outcome = future.result()
+                result = self.results.setdefault(volume_name, {"ok": True, "bytes": 0, "elapsed": 0.0})
+                if outcome is None:
+                    result["ok"] = False
+                    continue
+                ok, stream = outcome
+                result["ok"] = result["ok"] and ok
+                result["bytes"] += stream.bytes
+                result["elapsed"] = max(result["elapsed"], time.time() - stream.started)
+            outcomes = {
+                volume_name: self._executor.submit(
+                    commit_staged_volume if result["ok"] else discard_staged_volume, volume_name
+                )
+                for volume_name, result in self.results.items() if volume_name in self._started_volumes
+            }
+            for volume_name, future in outcomes.items():
+                if not future.result():
+                    self.results[volume_name]["ok"] = False
+        finally:
+            self._executor.shutdown(wait=True)
+        return self.results
+
+    def abort_all(self) -> None:
+        """终止所有仍在运行的容器，并丢弃各卷的暂存目录，卷中原有的内容保持不变。"""
+        for future in list(self._open.values()):
+            stream = future.result()
+            if stream:
+                stream.abort()
+        self._open.clear()
+        for future in self._closing:
+            future.result()
+        for volume_name in self._started_volumes:
+            discard_staged_volume(volume_name)
+        self._executor.shutdown(wait=True)
+
+
+def print_volume_restore_summary(results: Dict[str, Dict[str, Any]]) -> None:
+    """以表格形式打印每个 Docker 卷的恢复结果。"""
+    if not results:
+        return
+    width = max(len(_('volume_restore_col_volume')), *(len(name) for name in results))
+    print(f"\n{_('volume_restore_summary')}")
+    print(f"  {_('volume_restore_col_volume'):<{width}}  {_('volume_restore_col_status'):<8}  "
+          f"{_('volume_restore_col_size'):>10}  {_('volume_restore_col_time'):>8}")
+    for name in sorted(results):
+        result = results[name]
+        status = _('volume_restore_status_ok') if result["ok"] else _('volume_restore_status_failed')
+        print(f"  {name:<{width}}  {status:<8}  {format_size(result['bytes']):>10}  {result['elapsed']:>7.1f}s")
+
+
+def _swap_into_place(staging_dir: str, dest_dir: str, merge: bool = False) -> None:
+    """将暂存目录中的条目重命名到目标目录。
+
+    默认替换目标目录中同名的顶层条目；merge 为 True 时（选择性恢复）只逐个替换暂存目录中的文件，
+    目标目录中其他未恢复的文件保持不变。
+    """
+    if merge:
+        for root, dirs, files in os.walk(staging_dir):
+            target_root = os.path.join(dest_dir, os.path.relpath(root, staging_dir))
+            for name in dirs:
+                target = os.path.join(target_root, name)
+                if os.path.isdir(os.path.join(root, name)) and os.path.lexists(target) and not os.path.isdir(target):
+                    os.remove(target)
+                os.makedirs(target, exist_ok=True)
+            for name in files:
+                target = os.path.join(target_root, name)
+                if os.path.isdir(target) and not os.path.islink(target):
+                    shutil.rmtree(target)
+                os.replace(os.path.join(root, name), target)
+        return
+
+    for item in os.listdir(staging_dir):
+        s = os.path.join(staging_dir, item)
+        d = os.path.join(dest_dir, item)
+        if os.path.isdir(d) and not os.path.islink(d):
+            # 目录无法被原子替换：先把旧目录移开，新目录就位后再删除
+            old_dir = tempfile.mkdtemp(prefix=".na_old_", dir=dest_dir)
+            os.replace(d, os.path.join(old_dir, item))
+            os.replace(s, d)
+            shutil.rmtree(old_dir)
+        else:
+            os.replace(s, d)
+
+
+def extract_archive(archive_path: str, dest_dir: str, volume_mountpoints: Optional[Dict[str, str]] = None,
+                    volume_workers: Optional[int] = None,
+                    restore_filter: Optional[RestoreFilter] = None,
+                    report: Optional[OperationReport] = None,
+                    progress_mode: Optional[str] = None) -> bool:
+    """以流式方式恢复归档，区分数据目录和 Docker 卷。
+
+    归档以流模式顺序读取（.tar.zstd 边解压边读取，增量快照边读取分块），
+    数据目录的条目直接解压到目标目录下的暂存目录中，全部成功后再逐个重命名到最终位置；
+    volumes/* 条目通过标准输入直接写入对应卷的恢复容器，解压到卷内的暂存目录，多个卷的容器并发运行，
+    归档校验通过后才替换卷中原有的内容；
+    Postgres 逻辑备份（volumes/<卷名>.pgdump/）写入使用该卷的运行中容器后以 pg_restore 并行导入，
+    Qdrant 集合快照（volumes/<卷名>.qdrant/）先写入暂存目录，归档校验通过后上传到使用该卷的服务，
+    服务未运行时两者都保存为待导入文件。
+    整个过程不生成中间 .tar。单个卷恢复失败不影响其他卷和数据目录，
+    结束时打印每个卷的恢复结果。
+
+    提供 restore_filter 时只恢复选中的条目，其余条目在流中直接跳过，不写入磁盘。
+    其他情况下归档总是读取到末尾：读取时计算每个成员的 SHA-256，与归档末尾记录的校验和及清单比对，
+    解码器报错、校验和不符或缺少成员时恢复失败，暂存的数据不会写回目标目录或卷。
+    只恢复数据目录中的部分文件且归档带有清单时，清单中所选的文件全部读取后立即停止，
+    不再解压归档的剩余部分；此时读不到末尾的校验和成员，所选条目只经过 tar 头部校验、
+    长度检查和与清单的核对（所选文件必须全部出现），需要完整校验时使用 --verify。
+
+    解压、数据目录写入、卷恢复收尾和写回目标目录各阶段的耗时与字节数记录到 report 中。
+    读取归档期间按已读取的归档文件字节数显示进度。
 
     Args:
         archive_path (str): 要解压的归档文件路径。
         dest_dir (str): 数据文件的主要目标解压目录。
         volume_mountpoints (dict[str, str], optional): Docker 卷名到其挂载点的映射。如果提供，则恢复卷。
+        volume_workers (int, optional): 同时运行的卷恢复容器数量上限，默认使用 BACKUP_VOLUME_WORKERS。
+        restore_filter (RestoreFilter, optional): 选择性恢复的过滤条件，None 表示全部恢复。
+        report (OperationReport, optional): 记录各阶段耗时和数据量的统计报告。
+        progress_mode (str, optional): 进度显示方式 auto/bar/json/off，默认使用 BACKUP_PROGRESS_MODE。
 
     Returns:
         bool: 成功返回 True，失败返回 False。
     """
     volume_mountpoints = volume_mountpoints or {}
-    temp_extract_dir = tempfile.mkdtemp()
-    
+    report = report or OperationReport("restore")
+    # 增量快照的分块分散在仓库中，不统计其压缩后的大小
+    archive_size = None if archive_path.endswith(SNAPSHOT_SUFFIX) else os.path.getsize(archive_path)
+    dest_dir = os.path.abspath(dest_dir)
+    # 之前的恢复留下、尚未导入的逻辑备份和快照不再导入，避免在之后无关的 -ri 中被应用
+    stale_pending = clear_pending_restores()
+    if stale_pending:
+        print(_('pending_restores_discarded', ", ".join(stale_pending)))
+    # 暂存目录与目标目录位于同一文件系统，保证最终的重命名是原子操作
+    staging_dir = tempfile.mkdtemp(prefix=".na_restore_", dir=dest_dir)
+    data_root_name = None
+    data_dirs = []
+    skipped_volumes = set()
+    volume_pool = None
+    pg_restores: Dict[str, PostgresRestoreStream] = {}
+    qdrant_restores: Dict[str, QdrantRestoreStream] = {}
+    manifest = None
+    recorded = None
+    seen_paths = set()
+    skipped: List[str] = []
+    # 清单中选中的、还未读取的数据文件；None 表示需要读取整个归档
+    pending_data_files = None
+    if restore_filter and not restore_filter.wants_volumes:
+        head_manifest = read_archive_manifest(archive_path)
+        root_dir = head_manifest.get("root_dir") if head_manifest else None
+        if root_dir:
+            pending_data_files = {
+                entry["path"] for entry in head_manifest.get("files", [])
+                if entry["path"].startswith(f"{root_dir}/")
+                and restore_filter.includes_data(entry["path"][len(root_dir) + 1:])
+            }
+    stopped_early = False
+
+    progress_reporter = ProgressReporter("restore", mode=progress_mode, label=_('progress_restore'))
     try:
-        # 1. 解压整个归档到临时目录
-        if archive_path.endswith(".tar.zstd"):
-            if not command_exists("zstd"):
-                print(_('error_zstd_required_for_recovery'), file=sys.stderr)
-                return False
-            subprocess.run(["zstd", "-d", "--quiet", archive_path, "-o", f"{temp_extract_dir}/archive.tar"], check=True)
-            tar_path = f"{temp_extract_dir}/archive.tar"
-        elif archive_path.endswith(".tar"):
-            tar_path = archive_path
-        else:
-            print(_('error_unsupported_file_format', archive_path), file=sys.stderr)
-            return False
+        # 进度显示在归档文件关闭之前停止
+        with report.phase("extraction") as extraction, \
+                open_archive_stream(archive_path, check=pending_data_files is None,
+                                    progress=progress_reporter) as stream, \
+                progress_reporter:
+            stream = TimedStream(stream, report.get_phase("decompression"))
+            data_stats = report.get_phase("data_files")
+            with VerifyingTarFile.open(fileobj=stream, mode="r|") as tar:
+                for member in tar:
+                    if pending_data_files is not None and not pending_data_files:
+                        # 所选的数据文件已全部读取，无需解压归档的剩余部分
+                        stopped_early = True
+                        break
+                    seen_paths.add(member.name.rstrip("/"))
+                    if pending_data_files is not None:
+                        pending_data_files.discard(member.name)
+                    name = member.name[2:] if member.name.startswith("./") else member.name
+                    parts = name.split("/")
 
-        with tarfile.open(tar_path, "r") as tar:
-            tar.extractall(path=temp_extract_dir)
-        
-        # 清理临时 tar 文件（如果是从 zstd 解压的）
-        if tar_path != archive_path and os.path.exists(tar_path):
-            os.remove(tar_path)
+                    if name == MANIFEST_NAME:
+                        manifest = json.loads(tar.extractfile(member).read().decode("utf-8"))
+                        data_root_name = manifest.get("root_dir")
+                        continue
+                    if name == CHECKSUMS_NAME:
+                        checksums_doc = json.loads(tar.extractfile(member).read().decode("utf-8"))
+                        recorded = checksums_doc.get("members", {})
+                        skipped = checksums_doc.get("skipped", [])
+                        continue
 
-        # 2. 移动数据和卷文件
-        data_root_name = get_archive_root_dir(archive_path, inspect_path=temp_extract_dir)
-        
-        if data_root_name:
-            source_data_path = os.path.join(temp_extract_dir, data_root_name)
-            if os.path.exists(source_data_path):
-                print(_('restoring_data_to', dest_dir))
-                # 将数据文件移动到最终目标
-                for item in os.listdir(source_data_path):
-                    s = os.path.join(source_data_path, item)
-                    d = os.path.join(dest_dir, item)
-                    if os.path.exists(d):
-                        if os.path.isdir(d):
-                            shutil.rmtree(d)
+                    if parts[0] == "volumes":
+                        if len(parts) < 2 or not parts[1]:
+                            continue
+                        pg_dump = parts[1].endswith(PG_DUMP_SUFFIX)
+                        qdrant_snapshot = parts[1].endswith(QDRANT_SNAPSHOT_SUFFIX)
+                        compressed = len(parts) == 2 and parts[1].endswith(".tar.gz")
+                        if pg_dump:
+                            volume_name = parts[1][:-len(PG_DUMP_SUFFIX)]
+                        elif qdrant_snapshot:
+                            volume_name = parts[1][:-len(QDRANT_SNAPSHOT_SUFFIX)]
                         else:
-                            os.remove(d)
-                    if os.path.isdir(s):
-                        shutil.copytree(s, d)
+                            volume_name = parts[1][:-7] if compressed else parts[1]
+                        if restore_filter and not restore_filter.includes_volume(volume_name):
+                            continue
+                        if volume_name not in volume_mountpoints:
+                            if volume_name not in skipped_volumes:
+                                print(_('volume_backup_skipped', volume_name), file=sys.stderr)
+                                skipped_volumes.add(volume_name)
+                            continue
+                        if pg_dump:
+                            if not member.isreg():
+                                continue
+                            pg_stream = pg_restores.get(volume_name)
+                            if pg_stream is None:
+                                pg_stream = PostgresRestoreStream(volume_name, find_postgres_container(volume_name),
+                                                                  pending_dir=get_pending_restore_dir(archive_path))
+                                pg_restores[volume_name] = pg_stream
+                                if not pg_stream.start():
+                                    pg_stream.failed = True
+                            if len(parts) == 3 and parts[2] == PG_DUMP_COMPLETE_NAME:
+                                pg_stream.set_completion(tar.extractfile(member))
+                            elif not pg_stream.failed:
+                                pg_stream.write(tar.extractfile(member))
+                            continue
+                        if qdrant_snapshot:
+                            if not member.isreg() or len(parts) != 3:
+                                continue
+                            qdrant_stream = qdrant_restores.get(volume_name)
+                            if qdrant_stream is None:
+                                qdrant_stream = QdrantRestoreStream(
+                                    volume_name, find_qdrant_client(volume_name, os.path.join(dest_dir, ".env")),
+                                    pending_root=get_pending_restore_dir(archive_path)
+                                )
+                                qdrant_restores[volume_name] = qdrant_stream
+                            if not qdrant_stream.failed:
+                                qdrant_stream.add_snapshot(os.path.splitext(parts[2])[0],
+                                                           tar.extractfile(member), member.size)
+                            continue
+                        if volume_pool is None:
+                            volume_pool = VolumeRestorePool(
+                                BACKUP_VOLUME_WORKERS if volume_workers is None else volume_workers
+                            )
+                        volume_stream = volume_pool.get(volume_name, compressed)
+                        if volume_stream is None or volume_stream.failed:
+                            # 该卷的容器已失败，跳过其余条目，不影响其他卷
+                            continue
+                        if compressed:
+                            volume_stream.write_stream(tar.extractfile(member))
+                        else:
+                            member.name = name
+                            volume_stream.add_member(member, tar.extractfile(member) if member.isreg() else None)
+                        continue
+
+                    # 数据目录条目：旧版本归档没有清单，以遇到的第一个顶层目录作为数据根目录
+                    if data_root_name is None:
+                        data_root_name = parts[0]
+                    if parts[0] != data_root_name:
+                        print(_('multiple_root_directories_warning', {data_root_name, parts[0]}), file=sys.stderr)
+                        continue
+                    relpath = "/".join(parts[1:])
+                    if not relpath:
+                        continue
+                    if restore_filter and not restore_filter.includes_data(relpath):
+                        continue
+                    member.name = relpath
+                    if member.islnk() and member.linkname.startswith(f"{data_root_name}/"):
+                        member.linkname = member.linkname[len(data_root_name) + 1:]
+                    started = time.monotonic()
+                    if member.isdir():
+                        # 目录属性在其中的文件全部写入后再设置，与 extractall 行为一致
+                        data_dirs.append(member)
+                        tar.extract(member, staging_dir, set_attrs=False)
                     else:
-                        shutil.copy2(s, d)
+                        tar.extract(member, staging_dir)
+                    data_stats.elapsed += time.monotonic() - started
+                    data_stats.add_bytes(bytes_out=member.size if member.isreg() else 0)
+
+                # 读到流末尾，使解码器完成校验（zstd 命令的退出码在退出上下文时检查）
+                if not stopped_early and not _drain_after_end_marker(tar):
+                    raise ArchiveIntegrityError(_('verify_error_trailing_data'))
+            if stopped_early:
+                print(f"  - {_('selective_restore_stopped_early')}")
+            else:
+                integrity_errors = _compare_archive_records(manifest, recorded, tar.checksums, seen_paths, skipped)
+                if manifest is not None and recorded is None:
+                    integrity_errors.insert(0, _('verify_error_member_missing', CHECKSUMS_NAME))
+                if integrity_errors:
+                    for error in integrity_errors:
+                        print(f"  - {error}", file=sys.stderr)
+                    raise ArchiveIntegrityError(_('error_archive_integrity', len(integrity_errors)))
+            extraction.add_bytes(bytes_in=archive_size, bytes_out=stream.bytes)
+        report.get_phase("decompression").add_bytes(bytes_in=archive_size, bytes_out=stream.bytes)
+        report.bytes_in = archive_size
+        report.bytes_out = stream.bytes
+
+        # 等待卷恢复容器、pg_restore 和快照上传完成
+        with report.phase("volume_restore") as phase:
+            volume_results = volume_pool.finish_all() if volume_pool else {}
+            volume_pool = None
+            volume_methods = dict.fromkeys(volume_results, "container")
+            while pg_restores:
+                volume_name, pg_stream = pg_restores.popitem()
+                ok = pg_stream.finish()
+                volume_results[volume_name] = {"ok": ok, "bytes": pg_stream.bytes,
+                                               "elapsed": time.time() - pg_stream.started}
+                volume_methods[volume_name] = "pg_dump"
+            for volume_name, qdrant_stream in qdrant_restores.items():
+                volume_results[volume_name] = {"ok": qdrant_stream.finish(), "bytes": qdrant_stream.bytes,
+                                               "elapsed": time.time() - qdrant_stream.started}
+                volume_methods[volume_name] = "qdrant_snapshot"
+            for volume_name, result in volume_results.items():
+                report.add_volume(volume_name, volume_methods[volume_name], result["ok"],
+                                  result["elapsed"], result["bytes"])
+            phase.add_bytes(bytes_in=sum(result["bytes"] for result in volume_results.values()))
+
+        for member in reversed(data_dirs):
+            dir_path = os.path.join(staging_dir, member.name)
+            try:
+                tar.chmod(member, dir_path)
+                tar.utime(member, dir_path)
+            except tarfile.ExtractError:
+                pass
+
+        # 数据全部解压成功后才替换目标目录中的内容
+        if os.listdir(staging_dir):
+            print(_('restoring_data_to', dest_dir))
+            with report.phase("copy_back"):
+                _swap_into_place(staging_dir, dest_dir, merge=bool(restore_filter))
 
-            # 获取dest_dir绝对路径
-            dest_dir = os.path.abspath(dest_dir)
             # 更新.env文件数据目录
             env_path = os.path.join(dest_dir, ".env")
             if os.path.exists(env_path):
-                    print(_("updating_nekro_data_dir"))
-
-                    update_env_file(env_path, "NEKRO_DATA_DIR", dest_dir)
-
-        # 3. 恢复 Docker 卷
-        archived_volumes_path = os.path.join(temp_extract_dir, 'volumes')
-        if os.path.isdir(archived_volumes_path):
-            for item in os.listdir(archived_volumes_path):
-                item_path = os.path.join(archived_volumes_path, item)
-                
-                if item.endswith('.tar.gz'):
-                    # 处理 .tar.gz 格式的卷备份（容器备份方式）
-                    volume_name = item[:-7]  # 移除 .tar.gz 后缀
-                    
-                    if volume_name in volume_mountpoints:
-                        print(_('restoring_docker_volume_via_container', volume_name))
-                        restore_docker_volume_via_container(volume_name, item_path)
-                    else:
-                        print(_('volume_backup_skipped', volume_name), file=sys.stderr)
-                        
-                elif os.path.isdir(item_path):
-                    # 处理目录格式的卷备份（直接路径备份方式）
-                    volume_name = item
-                    
-                    if volume_name in volume_mountpoints:
-                        print(_('restoring_docker_volume_from_directory', volume_name))
-                        restore_docker_volume_from_directory(volume_name, item_path)
-                    else:
-                        print(_('volume_backup_skipped', volume_name), file=sys.stderr)
+                print(_("updating_nekro_data_dir"))
+                update_env_file(env_path, "NEKRO_DATA_DIR", dest_dir)
 
-        return True
+        print_volume_restore_summary(volume_results)
+        return all(result["ok"] for result in volume_results.values())
 
-    except (subprocess.CalledProcessError, FileNotFoundError, OSError) as e:
+    except (subprocess.CalledProcessError, FileNotFoundError, OSError, ValueError, tarfile.TarError) as e:
         print(_('error_archive_extraction_failed', e), file=sys.stderr)
+        report.fail(e)
+        if volume_pool:
+            volume_pool.abort_all()
+        for pg_stream in pg_restores.values():
+            pg_stream.abort()
+        for qdrant_stream in qdrant_restores.values():
+            qdrant_stream.abort()
         return False
     finally:
-        shutil.rmtree(temp_extract_dir)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def open_archive_stream(archive_path: str, check: bool = False, progress: Optional[ProgressReporter] = None):
+    """以只读数据流的形式打开备份归档，产出未压缩的 tar 数据流。
+
+    解码器根据归档后缀选择。使用 zstd 命令解压时，提前退出会终止解压进程，
+    因此只读取归档开头（例如读取清单）时不会解压整个文件。
+
+    Args:
+        archive_path (str): 归档文件（.tar / .tar.zstd / .tar.xz / .tar.gz）或快照清单路径。
+        check (bool): 调用方会读取到流末尾时传入 True，确保解码器完成全部完整性校验。
+        progress (ProgressReporter, optional): 进度显示，跟踪已读取的归档文件字节数
+            （增量快照为已还原的原始数据字节数）。
+
+    Yields:
+        可读的 tar 数据流对象。
+
+    Raises:
+        CodecError: 压缩数据损坏或被截断。
+        FileNotFoundError: 当前环境缺少该归档所需的解码器。
+        ValueError: 不支持的归档格式。
+    """
+    if archive_path.endswith(SNAPSHOT_SUFFIX):
+        reader = ChunkStoreReader(archive_path)
+        if progress:
+            progress.track(lambda: reader.position, reader.manifest.get("size"))
+        try:
+            yield reader
+        finally:
+            reader.close()
+        return
+
+    archive_codec = get_codec_for_path(archive_path)
+    if archive_codec is None:
+        raise ValueError(_('error_unsupported_file_format', archive_path))
+    if not archive_codec.available():
+        raise FileNotFoundError(_('error_codec_required_for_recovery', archive_codec.name))
+    with open(archive_path, "rb") as f:
+        if progress:
+            # 解码器（包括 zstd 子进程）与这里共享同一个文件描述符，其偏移量即为已读取的压缩数据量
+            fd = f.fileno()
+            progress.track(lambda: os.lseek(fd, 0, os.SEEK_CUR), os.fstat(fd).st_size)
+        with archive_codec.open_reader(f, check=check) as stream:
+            yield stream
+
+
+def _read_to_end(fileobj, digest=None) -> int:
+    """以固定大小的缓冲区读完一个数据流，返回读取的字节数。"""
+    total = 0
+    while True:
+        data = fileobj.read(ARCHIVE_STREAM_BUFSIZE)
+        if not data:
+            return total
+        if digest:
+            digest.update(data)
+        total += len(data)
+
+
+def _verify_nested_volume_tarball(fileobj) -> int:
+    """校验 .tar.gz 格式的卷备份：gzip 的 CRC 与长度，以及其中每个 tar 头部。
+
+    Returns:
+        int: 其中的条目数量。
+
+    Raises:
+        OSError, EOFError, tarfile.TarError: 卷备份损坏。
+    """
+    entries = 0
+    with gzip.GzipFile(fileobj=fileobj, mode="rb") as gz:
+        with tarfile.open(fileobj=gz, mode="r|") as nested:
+            for nested_member in nested:
+                if nested_member.isreg():
+                    _read_to_end(nested.extractfile(nested_member))
+                entries += 1
+        # 读到 gzip 流末尾才会校验 CRC 和长度
+        _read_to_end(gz)
+    return entries
+
+
+def _drain_after_end_marker(tar: tarfile.TarFile) -> bool:
+    """读完 tar 结束标记之后的数据，返回其中是否只有全零的填充块。
+
+    结束标记之后出现非零数据说明后续的 tar 头部已损坏。
+    """
+    while True:
+        data = tar.fileobj.read(ARCHIVE_STREAM_BUFSIZE)
+        if not data:
+            return True
+        if data.count(0) != len(data):
+            _read_to_end(tar.fileobj)
+            return False
+
+
+def _compare_archive_records(manifest: Optional[Dict], recorded: Optional[Dict[str, str]],
+                             computed: Dict[str, str], seen_paths: set,
+                             skipped: Optional[List[str]] = None) -> List[str]:
+    """将读取时计算的成员校验和与归档记录的校验和、清单比对，返回错误描述列表。
+
+    skipped 为备份时无法读取、已列入清单但未写入归档的文件，不视为缺失。
+    """
+    errors = []
+    if recorded is not None:
+        for name, digest in recorded.items():
+            if name not in computed:
+                errors.append(_('verify_error_member_missing', name))
+            elif computed[name] != digest:
+                errors.append(_('verify_error_checksum_mismatch', name))
+    if manifest is not None:
+        for entry in manifest.get("files", []):
+            if entry["path"] not in seen_paths and entry["path"] not in (skipped or ()):
+                errors.append(_('verify_error_member_missing', entry["path"]))
+    return errors
+
+
+def verify_archive(archive_path: str) -> Dict[str, Any]:
+    """以单次顺序读取校验备份归档的完整性，不解压到磁盘，内存占用与归档大小无关。
+
+    校验内容：
+    - zstd 帧（由 zstd 解压时校验内容校验和）或增量快照分块的哈希；
+    - 每个 tar 头部，以及归档结束标记之后不存在多余数据；
+    - 每个成员的 SHA-256 与归档末尾记录的校验和一致，清单中列出的文件都存在；
+    - 嵌套的 .tar.gz 卷备份的 gzip 校验和与 tar 结构。
+
+    Args:
+        archive_path (str): 归档文件或快照清单路径。
+
+    Returns:
+        dict: 校验结果，包含 ok、errors（错误描述列表）、members、bytes（未压缩字节数）、
+        archive_size、elapsed、has_checksums、has_manifest。
+    """
+    started = time.time()
+    errors: List[str] = []
+    computed: Dict[str, str] = {}
+    seen_paths = set()
+    manifest = None
+    skipped: List[str] = []
+    recorded = None
+    members = 0
+    total_bytes = 0
+
+    if archive_path.endswith(SNAPSHOT_SUFFIX):
+        with open(archive_path, "r", encoding="utf-8") as f:
+            archive_size = sum(size for _hash, size in json.load(f).get("chunks", []))
+    else:
+        archive_size = os.path.getsize(archive_path)
+
+    try:
+        with open_archive_stream(archive_path, check=True) as stream:
+            with tarfile.open(fileobj=stream, mode="r|", bufsize=ARCHIVE_STREAM_BUFSIZE) as tar:
+                for member in tar:
+                    members += 1
+                    seen_paths.add(member.name.rstrip("/"))
+                    if not member.isreg():
+                        continue
+                    if member.name in METADATA_MEMBERS:
+                        data = tar.extractfile(member).read()
+                        total_bytes += len(data)
+                        if member.name == CHECKSUMS_NAME:
+                            checksums_doc = json.loads(data.decode("utf-8"))
+                            recorded = checksums_doc.get("members", {})
+                            skipped = checksums_doc.get("skipped", [])
+                            continue
+                        if members == 1:
+                            manifest = json.loads(data.decode("utf-8"))
+                        computed[member.name] = hashlib.sha256(data).hexdigest()
+                        continue
+
+                    reader = HashingReader(tar.extractfile(member))
+                    if member.name.startswith("volumes/") and member.name.endswith(".tar.gz"):
+                        print(f"  - {_('verify_nested_volume', member.name)}")
+                        try:
+                            _verify_nested_volume_tarball(reader)
+                        except (OSError, EOFError, tarfile.TarError) as e:
+                            errors.append(_('verify_error_nested_volume', member.name, e))
+                    _read_to_end(reader)
+                    total_bytes += reader.bytes_read
+                    computed[member.name] = reader.hexdigest()
+
+                if not _drain_after_end_marker(tar):
+                    errors.append(_('verify_error_trailing_data'))
+    except CodecError as e:
+        errors.append(_('verify_error_decompression', e))
+    except (OSError, EOFError, ValueError, tarfile.TarError) as e:
+        errors.append(_('verify_error_read', e))
+
+    if manifest is not None and recorded is None and not errors:
+        # 带清单的归档总会在末尾写入校验和，缺失说明归档被截断
+        errors.append(_('verify_error_member_missing', CHECKSUMS_NAME))
+    errors.extend(_compare_archive_records(manifest, recorded, computed, seen_paths, skipped))
+
+    return {
+        "ok": not errors,
+        "errors": errors,
+        "members": members,
+        "bytes": total_bytes,
+        "archive_size": archive_size,
+        "elapsed": time.time() - started,
+        "has_checksums": recorded is not None,
+        "has_manifest": manifest is not None,
+    }
+
+
+def read_archive_manifest(archive_path: str) -> Optional[Dict]:
+    """读取归档开头的清单成员。
+
+    Args:
+        archive_path (str): 归档文件或快照清单路径。
+
+    Returns:
+        Optional[dict]: 清单内容；旧版本归档没有清单或读取失败时返回 None。
+    """
+    try:
+        with open_archive_stream(archive_path) as stream:
+            return read_manifest_from_stream(stream)
+    except (OSError, ValueError, tarfile.TarError):
+        return None
 
 
 def get_archive_root_dir(archive_path: str, inspect_path: Optional[str] = None) -> Optional[str]:
     """读取归档文件并返回其中主要的顶层目录名（非 'volumes'）。"""
-    temp_tar_path = None
-    tar_to_inspect = None
-
     try:
         if inspect_path:
             # 如果提供了已解压的路径，直接在该路径下查找
-            top_levels = {name for name in os.listdir(inspect_path) if name != 'volumes'}
+            top_levels = {name for name in os.listdir(inspect_path)
+                          if name != 'volumes' and name not in METADATA_MEMBERS}
             if len(top_levels) == 1:
                 return top_levels.pop()
             # 如果解压路径下除了volumes还有多个，就无法确定哪个是主目录
@@ -622,32 +1877,22 @@ def get_archive_root_dir(archive_path: str, inspect_path: Optional[str] = None)
             else: # 只有volumes目录
                 return None
 
-        # 如果没有提供解压路径，则需要从归档文件中读取
-        if archive_path.endswith(".tar.zstd"):
-            if not command_exists("zstd"):
-                return None
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".tar") as tmp_f:
-                temp_tar_path = tmp_f.name
-            subprocess.run(["zstd", "-d", "--quiet", "-f", archive_path, "-o", temp_tar_path], check=True)
-            tar_to_inspect = temp_tar_path
-        elif archive_path.endswith(".tar"):
-            tar_to_inspect = archive_path
-        else:
-            return None
+        # 如果没有提供解压路径，优先从归档开头的清单中读取
+        manifest = read_archive_manifest(archive_path)
+        if manifest is not None:
+            return manifest.get("root_dir")
 
-        with tarfile.open(tar_to_inspect, "r") as tar:
-            members = tar.getnames()
-            if not members:
-                return None
-            
-            top_levels = {name.split(os.path.sep)[0] for name in members if name.split(os.path.sep)[0] != 'volumes'}
-            if len(top_levels) == 1:
-                return top_levels.pop()
-            else:
-                return None
+        # 旧版本归档没有清单，顺序扫描全部成员名
+        top_levels = set()
+        with open_archive_stream(archive_path) as stream:
+            with tarfile.open(fileobj=stream, mode="r|") as tar:
+                for member in tar:
+                    top_level = member.name.split('/')[0]
+                    if top_level != 'volumes' and top_level not in METADATA_MEMBERS:
+                        top_levels.add(top_level)
+        if len(top_levels) == 1:
+            return top_levels.pop()
+        return None
 
-    except (subprocess.CalledProcessError, FileNotFoundError, OSError):
+    except (subprocess.CalledProcessError, FileNotFoundError, OSError, ValueError, tarfile.TarError):
         return None
-    finally:
-        if temp_tar_path and os.path.exists(temp_tar_path):
-            os.remove(temp_tar_path)
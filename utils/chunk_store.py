@@ -0,0 +1,373 @@
+"""
+增量备份使用的内容寻址分块仓库。
+
+备份归档的 tar 数据流按内容切分为分块，每个分块以其 SHA-256 命名保存一次，
+每次备份只额外写入一个记录分块顺序的快照清单（*.snapshot.json）。
+未变化的文件会产生与上次完全相同的 tar 字节，因此只有新分块需要写入磁盘。
+
+分块边界按 tar 的 512 字节块对齐，并由每个块内容的 CRC32 决定（内容定义分块）：
+tar 中每个成员都从块边界开始，插入或删除文件只会影响附近的少量分块。
+
+写入快照期间持有仓库锁文件的共享锁，清理不再被引用的分块时需要获得排他锁，
+因此不会删除并发进行的增量备份已写入（或复用）、但快照清单尚未保存的分块。
+"""
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from utils.i18n import get_message as _
+from conf.backup_settings import (
+    BACKUP_CHUNK_MIN_SIZE, BACKUP_CHUNK_AVG_SIZE, BACKUP_CHUNK_MAX_SIZE, BACKUP_CHUNK_GC_GRACE
+)
+
+# tar 格式的块大小，分块边界总是落在该大小的整数倍上
+TAR_BLOCK_SIZE = 512
+
+# 快照清单的文件后缀
+SNAPSHOT_SUFFIX = ".snapshot.json"
+
+# 快照清单格式版本
+SNAPSHOT_FORMAT_VERSION = 1
+
+# 分块压缩使用的 zlib 级别
+CHUNK_ZLIB_LEVEL = 6
+
+# 仓库锁文件名（位于仓库目录下）
+STORE_LOCK_NAME = ".lock"
+
+
+def get_chunk_path(store_dir: str, chunk_hash: str) -> str:
+    """返回分块在仓库中的存储路径（按哈希前两位分目录）。"""
+    return os.path.join(store_dir, "chunks", chunk_hash[:2], chunk_hash)
+
+
+def get_snapshot_path(store_dir: str, snapshot_name: str) -> str:
+    """返回快照清单在仓库中的存储路径。"""
+    return os.path.join(store_dir, "snapshots", f"{snapshot_name}{SNAPSHOT_SUFFIX}")
+
+
+def get_store_dir_from_snapshot(snapshot_path: str) -> str:
+    """根据快照清单路径推导出分块仓库目录（<store>/snapshots/<name>.snapshot.json）。"""
+    return os.path.dirname(os.path.dirname(os.path.abspath(snapshot_path)))
+
+
+def _lock_store(store_dir: str, exclusive: bool):
+    """获取仓库锁，返回持有锁的文件对象（关闭即释放）；平台不支持文件锁时返回 None。
+
+    共享锁会等待正在进行的清理结束；排他锁不等待。
+
+    Raises:
+        BlockingIOError: 请求排他锁时仓库正被其他进程使用。
+    """
+    if fcntl is None:
+        return None
+    lock_file = open(os.path.join(store_dir, STORE_LOCK_NAME), "a")
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB if exclusive else fcntl.LOCK_SH)
+    except OSError:
+        lock_file.close()
+        raise
+    return lock_file
+
+
+class ChunkStoreWriter:
+    """将写入的数据流按内容切分并存入分块仓库的类文件对象。
+
+    可直接作为 tarfile 流模式（"w|"）的 fileobj 使用。分块的哈希、压缩和落盘
+    在线程池中并行完成，正在处理的分块数量受限，内存占用与数据总量无关。
+    从创建到 commit() 或 close() 期间持有仓库的共享锁。
+    """
+
+    def __init__(self, store_dir: str, workers: int = 0):
+        """
+        Args:
+            store_dir (str): 分块仓库目录，不存在时自动创建。
+            workers (int): 处理分块的线程数，0 表示使用全部 CPU 核心。
+        """
+        self.store_dir = store_dir
+        os.makedirs(os.path.join(store_dir, "chunks"), exist_ok=True)
+        os.makedirs(os.path.join(store_dir, "snapshots"), exist_ok=True)
+        self._store_lock = _lock_store(store_dir, exclusive=False)
+
+        workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        # 限制在途分块数量，保证内存占用恒定
+        self._inflight = threading.BoundedSemaphore(workers * 2)
+        self._futures = []
+
+        avg_blocks = max(2, (BACKUP_CHUNK_AVG_SIZE - BACKUP_CHUNK_MIN_SIZE) // TAR_BLOCK_SIZE)
+        self._mask = (1 << max(1, int(round(math.log2(avg_blocks))))) - 1
+        self._buffer = bytearray()
+        self._scan_pos = 0
+        self._chunks = []
+        self._lock = threading.Lock()
+        self.total_size = 0
+        self.new_chunks = 0
+        self.new_bytes = 0
+        self.closed = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        """追加数据，并切出所有已确定边界的分块。"""
+        self._buffer.extend(data)
+        self.total_size += len(data)
+        self._cut_chunks()
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def _cut_chunks(self):
+        buf = self._buffer
+        view = memoryview(buf)
+        start = 0
+        pos = max(self._scan_pos, BACKUP_CHUNK_MIN_SIZE - TAR_BLOCK_SIZE)
+        try:
+            while pos + TAR_BLOCK_SIZE <= len(buf):
+                end = pos + TAR_BLOCK_SIZE
+                length = end - start
+                if length >= BACKUP_CHUNK_MAX_SIZE or (
+                        length >= BACKUP_CHUNK_MIN_SIZE
+                        and zlib.crc32(view[pos:end]) & self._mask == 0):
+                    self._submit(bytes(view[start:end]))
+                    start = end
+                    pos = start + BACKUP_CHUNK_MIN_SIZE - TAR_BLOCK_SIZE
+                else:
+                    pos = end
+        finally:
+            view.release()
+        if start:
+            del buf[:start]
+        self._scan_pos = pos - start
+
+    def _submit(self, data: bytes):
+        index = len(self._chunks)
+        self._chunks.append(None)
+        self._inflight.acquire()
+        future = self._executor.submit(self._store_chunk, index, data)
+        future.add_done_callback(lambda _f: self._inflight.release())
+        self._futures.append(future)
+
+    def _store_chunk(self, index: int, data: bytes):
+        chunk_hash = hashlib.sha256(data).hexdigest()
+        chunk_path = get_chunk_path(self.store_dir, chunk_hash)
+        if not os.path.exists(chunk_path):
+            os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+            compressed = zlib.compress(data, CHUNK_ZLIB_LEVEL)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(chunk_path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, chunk_path)
+            with self._lock:
+                self.new_chunks += 1
+                self.new_bytes += len(compressed)
+        self._chunks[index] = [chunk_hash, len(data)]
+
+    def _finish_chunks(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer = bytearray()
+            for future in self._futures:
+                future.result()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _release_store_lock(self):
+        if self._store_lock is not None:
+            self._store_lock.close()
+            self._store_lock = None
+
+    def close(self):
+        """写出剩余数据并等待所有分块落盘，不保存快照清单（放弃本次快照）。"""
+        try:
+            self._finish_chunks()
+        finally:
+            self._release_store_lock()
+
+    def commit(self, snapshot_name: str, extra: Optional[Dict] = None) -> str:
+        """关闭写入并保存快照清单。
+
+        Args:
+            snapshot_name (str): 快照名称（不含后缀）。
+            extra (dict, optional): 额外写入清单的元数据。
+
+        Returns:
+            str: 快照清单文件路径。
+        """
+        try:
+            self._finish_chunks()
+            return self._write_snapshot(snapshot_name, extra)
+        finally:
+            self._release_store_lock()
+
+    def _write_snapshot(self, snapshot_name: str, extra: Optional[Dict]) -> str:
+        manifest = {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "name": snapshot_name,
+            "created": int(time.time()),
+            "chunk_hash": "sha256",
+            "chunk_codec": "zlib",
+            "size": self.total_size,
+            "new_chunks": self.new_chunks,
+            "new_bytes": self.new_bytes,
+            "chunks": self._chunks,
+        }
+        if extra:
+            manifest.update(extra)
+        snapshot_path = get_snapshot_path(self.store_dir, snapshot_name)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(snapshot_path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        os.replace(tmp_path, snapshot_path)
+        print(f"  - {_('incremental_snapshot_stats', len(self._chunks), self.new_chunks, self.total_size, self.new_bytes)}")
+        return snapshot_path
+
+
+class ChunkStoreReader:
+    """按快照清单顺序拼接分块、还原出原始 tar 数据流的只读类文件对象。
+
+    可直接作为 tarfile 流模式（"r|"）的 fileobj 使用，每个分块读取后都会校验哈希。
+    """
+
+    def __init__(self, snapshot_path: str):
+        """
+        Args:
+            snapshot_path (str): 快照清单（*.snapshot.json）路径。
+        """
+        with open(snapshot_path, "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.store_dir = get_store_dir_from_snapshot(snapshot_path)
+        self._chunks: List = self.manifest.get("chunks", [])
+        self._next_chunk = 0
+        self._current = b""
+        self._offset = 0
+        # 已读出的原始数据字节数
+        self.position = 0
+        self.closed = False
+
+    def readable(self) -> bool:
+        return True
+
+    def _load_next_chunk(self) -> bool:
+        if self._next_chunk >= len(self._chunks):
+            return False
+        chunk_hash, size = self._chunks[self._next_chunk]
+        self._next_chunk += 1
+        try:
+            with open(get_chunk_path(self.store_dir, chunk_hash), "rb") as f:
+                data = zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            raise OSError(_('error_snapshot_chunk_corrupted', chunk_hash))
+        if len(data) != size or hashlib.sha256(data).hexdigest() != chunk_hash:
+            raise OSError(_('error_snapshot_chunk_corrupted', chunk_hash))
+        self._current = data
+        self._offset = 0
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        parts = []
+        remaining = size
+        while remaining != 0:
+            if self._offset >= len(self._current) and not self._load_next_chunk():
+                break
+            available = len(self._current) - self._offset
+            take = available if remaining < 0 else min(available, remaining)
+            parts.append(self._current[self._offset:self._offset + take])
+            self._offset += take
+            if remaining > 0:
+                remaining -= take
+        data = b"".join(parts)
+        self.position += len(data)
+        return data
+
+    def close(self):
+        self.closed = True
+        self._current = b""
+
+
+def collect_garbage(store_dir: str) -> Optional[Dict[str, int]]:
+    """删除分块仓库中不再被任何快照清单引用的分块。
+
+    有快照清单无法读取时不删除任何分块，避免误删仍被引用的数据。
+    需要获得仓库的排他锁，有增量备份正在写入时跳过清理，留待下次执行；
+    平台不支持文件锁时改为跳过最近 BACKUP_CHUNK_GC_GRACE 秒内写入的分块。
+
+    Args:
+        store_dir (str): 分块仓库目录。
+
+    Returns:
+        dict: 统计信息，包含 removed（删除的分块数）与 freed（释放的字节数）；无法安全清理时返回 None。
+    """
+    try:
+        store_lock = _lock_store(store_dir, exclusive=True)
+    except BlockingIOError:
+        print(_('warning_chunk_gc_busy', store_dir))
+        return None
+    except OSError as e:
+        print(_('warning_chunk_gc_skipped', STORE_LOCK_NAME, e))
+        return None
+    try:
+        return _collect_garbage_locked(store_dir, grace=BACKUP_CHUNK_GC_GRACE if store_lock is None else 0)
+    finally:
+        if store_lock is not None:
+            store_lock.close()
+
+
+def _collect_garbage_locked(store_dir: str, grace: int) -> Optional[Dict[str, int]]:
+    referenced = set()
+    snapshots_dir = os.path.join(store_dir, "snapshots")
+    try:
+        names = [n for n in os.listdir(snapshots_dir) if n.endswith(SNAPSHOT_SUFFIX)]
+    except FileNotFoundError:
+        names = []
+    for name in names:
+        try:
+            with open(os.path.join(snapshots_dir, name), "r", encoding="utf-8") as f:
+                referenced.update(chunk_hash for chunk_hash, _size in json.load(f).get("chunks", []))
+        except (OSError, ValueError, TypeError) as e:
+            print(_('warning_chunk_gc_skipped', name, e))
+            return None
+
+    removed = 0
+    freed = 0
+    cutoff = time.time() - grace
+    chunks_dir = os.path.join(store_dir, "chunks")
+    try:
+        prefixes = os.listdir(chunks_dir)
+    except FileNotFoundError:
+        prefixes = []
+    for prefix in prefixes:
+        with os.scandir(os.path.join(chunks_dir, prefix)) as it:
+            for entry in it:
+                if entry.name in referenced or entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    st = entry.stat()
+                    if grace and st.st_mtime > cutoff:
+                        continue
+                    size = st.st_size
+                    os.remove(entry.path)
+                except OSError:
+                    continue
+                removed += 1
+                freed += size
+    print(f"  - {_('chunk_gc_stats', removed, freed)}")
+    return {"removed": removed, "freed": freed}
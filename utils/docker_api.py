@@ -0,0 +1,365 @@
+"""
+Docker Engine API 客户端。
+
+直接通过 unix 套接字（默认 /var/run/docker.sock，可用 DOCKER_HOST 指定 unix:// 或 tcp:// 地址）
+向 Docker 守护进程发送 HTTP 请求，每个线程复用一条持久连接，省去每次调用 docker 命令的进程创建开销。
+未设置 DOCKER_HOST 时与 docker 命令一样使用当前 docker context（DOCKER_CONTEXT 或 docker context use 选择的上下文）
+的地址，保证 API 请求与 docker 命令访问的是同一个守护进程（如 rootless 模式或 Docker Desktop）。
+无法连接守护进程时（未安装、无权限、DOCKER_HOST 使用 ssh:// 或 TLS、上下文无法解析等）get_docker_client()
+返回 None，调用方应回退到 docker 命令。
+"""
+import hashlib
+import http.client
+import json
+import os
+import socket
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import quote, urlencode, urlsplit
+
+# 未设置 DOCKER_HOST 且使用默认上下文时的守护进程地址
+DEFAULT_DOCKER_HOST = "unix:///var/run/docker.sock"
+
+# docker 命令的默认上下文名称
+DEFAULT_DOCKER_CONTEXT = "default"
+
+# 普通 API 请求的超时时间（秒）
+DOCKER_API_TIMEOUT = 60
+
+# 读写镜像数据流时使用的块大小
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class DockerAPIError(Exception):
+    """Docker 守护进程返回错误响应。
+
+    Attributes:
+        status (int): HTTP 状态码，流式响应中途报告的错误为 0。
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """通过 unix 套接字通信的 HTTPConnection。"""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+def _split_image_ref(image: str):
+    """将镜像引用拆分为 (仓库, 标签或摘要)，供 /images/create 使用。"""
+    if "@" in image:
+        repo, digest = image.split("@", 1)
+        return repo, digest
+    name = image.rsplit("/", 1)[-1]
+    if ":" in name:
+        repo, tag = image.rsplit(":", 1)
+        return repo, tag
+    return image, "latest"
+
+
+class DockerClient:
+    """Docker Engine API 的最小客户端，只实现本工具用到的接口。
+
+    连接按线程保存，可在线程池中并发使用；响应读取完毕后连接留给下一次请求复用。
+    """
+
+    def __init__(self, host: str):
+        url = urlsplit(host)
+        if url.scheme == "unix":
+            self._socket_path = url.path
+            self._address = None
+        elif url.scheme in ("tcp", "http"):
+            self._socket_path = None
+            self._address = (url.hostname, url.port or 2375)
+        else:
+            raise ValueError(host)
+        self.host = host
+        self._local = threading.local()
+
+    def _connection(self, timeout: Optional[float]) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._socket_path:
+                conn = _UnixHTTPConnection(self._socket_path, timeout=timeout)
+            else:
+                conn = http.client.HTTPConnection(*self._address, timeout=timeout)
+            self._local.conn = conn
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _reset_connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def request(self, method: str, path: str, params: Optional[Dict] = None, body=None,
+                headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[float] = DOCKER_API_TIMEOUT) -> http.client.HTTPResponse:
+        """发送请求并返回未读取的响应，状态码不小于 400 时抛出 DockerAPIError。
+
+        调用方必须读完响应体（或调用 close）后才能在同一线程发起下一次请求。
+        复用的连接已被守护进程关闭时，会重新连接并重试一次（请求体为数据流时除外）。
+
+        Args:
+            method (str): HTTP 方法。
+            path (str): API 路径，如 "/volumes"。
+            params (dict, optional): 查询参数，值为列表时重复该参数。
+            body: 请求体，dict 会序列化为 JSON，可迭代对象以分块编码发送。
+            headers (dict, optional): 额外的请求头。
+            timeout (float, optional): 套接字超时时间，None 表示不超时（用于长时间的数据流）。
+
+        Returns:
+            http.client.HTTPResponse: 守护进程的响应。
+
+        Raises:
+            DockerAPIError: 守护进程返回错误。
+            OSError: 无法连接守护进程。
+        """
+        if params:
+            path = f"{path}?{urlencode(params, doseq=True)}"
+        headers = dict(headers or {})
+        encode_chunked = False
+        if isinstance(body, dict):
+            body = json.dumps(body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        elif body is not None and not isinstance(body, (bytes, bytearray)):
+            headers["Transfer-Encoding"] = "chunked"
+            encode_chunked = True
+        retriable = not encode_chunked
+        while True:
+            conn = self._connection(timeout)
+            reused = conn.sock is not None
+            try:
+                conn.request(method, path, body=body, headers=headers, encode_chunked=encode_chunked)
+                response = conn.getresponse()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self._reset_connection()
+                if not (reused and retriable):
+                    raise
+                retriable = False
+            except (OSError, http.client.HTTPException):
+                self._reset_connection()
+                raise
+        if response.status >= 400:
+            raw = response.read()
+            try:
+                message = json.loads(raw.decode("utf-8")).get("message", "")
+            except (ValueError, AttributeError):
+                message = raw.decode("utf-8", errors="ignore").strip()
+            raise DockerAPIError(response.status, message or response.reason)
+        return response
+
+    def request_json(self, method: str, path: str, params: Optional[Dict] = None, body=None,
+                     timeout: Optional[float] = DOCKER_API_TIMEOUT):
+        """发送请求并返回解析后的 JSON 响应体（无响应体时返回 None）。"""
+        raw = self.request(method, path, params=params, body=body, timeout=timeout).read()
+        return json.loads(raw.decode("utf-8")) if raw else None
+
+    def _read_progress(self, response: http.client.HTTPResponse,
+                       on_message: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """读取 pull/load 返回的 JSON 行进度流，遇到 error 字段时抛出 DockerAPIError。"""
+        messages = []
+        for line in response:
+            line = line.strip()
+            if not line:
+                continue
+            message = json.loads(line.decode("utf-8"))
+            if "error" in message:
+                response.read()
+                raise DockerAPIError(0, message.get("error", ""))
+            messages.append(message)
+            if on_message:
+                on_message(message)
+        # 逐行读取不会把响应标记为读完，读到末尾后连接才能被下一次请求复用
+        response.read()
+        return messages
+
+    def ping(self) -> bool:
+        """检查守护进程是否可用。"""
+        return self.request("GET", "/_ping").read().strip() == b"OK"
+
+    def list_volumes(self) -> List[Dict]:
+        """返回所有卷的信息（一次请求，与 docker volume inspect 的字段一致）。"""
+        return self.request_json("GET", "/volumes").get("Volumes") or []
+
+    def inspect_volumes(self, names: Iterable[str]) -> Dict[str, Dict]:
+        """一次请求批量查询多个卷，返回 {卷名: 卷信息}，不存在的卷不出现在结果中。"""
+        wanted = set(names)
+        return {v["Name"]: v for v in self.list_volumes() if v.get("Name") in wanted}
+
+    def inspect_volume(self, name: str) -> Optional[Dict]:
+        """查询单个卷，卷不存在时返回 None。"""
+        try:
+            return self.request_json("GET", f"/volumes/{quote(name, safe='')}")
+        except DockerAPIError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def create_volume(self, name: str) -> Dict:
+        """创建卷（已存在时守护进程直接返回现有卷）。"""
+        return self.request_json("POST", "/volumes/create", body={"Name": name})
+
+    def list_containers(self, filters: Optional[Dict[str, List[str]]] = None) -> List[Dict]:
+        """列出运行中的容器，filters 与 docker ps --filter 含义相同。"""
+        params = {"filters": json.dumps(filters)} if filters else None
+        return self.request_json("GET", "/containers/json", params=params) or []
+
+    def inspect_container(self, container: str) -> Optional[Dict]:
+        """查询容器，容器不存在时返回 None。"""
+        try:
+            return self.request_json("GET", f"/containers/{quote(container, safe='')}/json")
+        except DockerAPIError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def inspect_image(self, image: str) -> Optional[Dict]:
+        """查询本地镜像，镜像不存在时返回 None。"""
+        try:
+            return self.request_json("GET", f"/images/{quote(image, safe=':@/')}/json")
+        except DockerAPIError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def list_images(self, filters: Optional[Dict[str, List[str]]] = None) -> List[Dict]:
+        """列出本地镜像，filters 与 docker images --filter 含义相同。"""
+        params = {"filters": json.dumps(filters)} if filters else None
+        return self.request_json("GET", "/images/json", params=params) or []
+
+    def remove_image(self, image: str) -> List[Dict]:
+        """删除镜像，返回守护进程报告的 Untagged/Deleted 列表。"""
+        return self.request_json("DELETE", f"/images/{quote(image, safe=':@/')}") or []
+
+    def prune_images(self) -> Dict:
+        """清理悬空镜像，返回 ImagesDeleted 与 SpaceReclaimed。"""
+        return self.request_json("POST", "/images/prune") or {}
+
+    def disk_usage(self) -> Dict:
+        """返回 docker system df 使用的磁盘占用数据（Images、Containers、Volumes 等）。"""
+        return self.request_json("GET", "/system/df", timeout=None) or {}
+
+    def pull_image(self, image: str, on_message: Optional[Callable[[Dict], None]] = None) -> None:
+        """拉取镜像并等待完成。
+
+        Raises:
+            DockerAPIError: 拉取失败（镜像不存在、网络错误等）。
+        """
+        repo, tag = _split_image_ref(image)
+        response = self.request("POST", "/images/create", params={"fromImage": repo, "tag": tag}, timeout=None)
+        self._read_progress(response, on_message)
+
+    def tag_image(self, image: str, target: str) -> None:
+        """为镜像添加新的名称，与 docker tag 相同。"""
+        repo, tag = _split_image_ref(target)
+        self.request("POST", f"/images/{quote(image, safe=':@/')}/tag",
+                     params={"repo": repo, "tag": tag}).read()
+
+    def save_images(self, images: List[str]) -> http.client.HTTPResponse:
+        """导出镜像，返回 docker save 格式的 tar 数据流（调用方负责读完）。"""
+        return self.request("GET", "/images/get", params={"names": images}, timeout=None)
+
+    def load_images(self, chunks: Iterable[bytes]) -> List[str]:
+        """以分块编码上传 docker save 格式的 tar 数据流导入镜像，返回守护进程的输出行。"""
+        response = self.request("POST", "/images/load", params={"quiet": "1"}, body=chunks,
+                                headers={"Content-Type": "application/x-tar"}, timeout=None)
+        messages = self._read_progress(response)
+        return [m["stream"].strip() for m in messages if m.get("stream", "").strip()]
+
+
+def _docker_config_dir() -> str:
+    """返回 docker 命令使用的配置目录（DOCKER_CONFIG 或 ~/.docker）。"""
+    return os.environ.get("DOCKER_CONFIG") or os.path.join(os.path.expanduser("~"), ".docker")
+
+
+def _current_docker_context() -> str:
+    """返回 docker 命令当前使用的上下文名称，与 docker 命令相同：DOCKER_CONTEXT 优先，其次是配置文件中的 currentContext。"""
+    name = os.environ.get("DOCKER_CONTEXT")
+    if name:
+        return name
+    try:
+        with open(os.path.join(_docker_config_dir(), "config.json"), "r", encoding="utf-8") as f:
+            return json.load(f).get("currentContext") or DEFAULT_DOCKER_CONTEXT
+    except (OSError, ValueError, AttributeError):
+        return DEFAULT_DOCKER_CONTEXT
+
+
+def resolve_docker_host() -> Optional[str]:
+    """确定 docker 命令当前连接的守护进程地址。
+
+    优先级与 docker 命令一致：DOCKER_HOST，其次是当前上下文的 docker 端点，默认上下文使用
+    DEFAULT_DOCKER_HOST。非默认上下文的元数据无法读取、端点不是 unix:// 或 tcp:// 地址、
+    或上下文带有 TLS 配置时返回 None，由调用方回退到 docker 命令。
+
+    Returns:
+        str | None: 守护进程地址，无法由 API 客户端直接连接时为 None。
+    """
+    host = os.environ.get("DOCKER_HOST")
+    if host:
+        return host
+    name = _current_docker_context()
+    if name == DEFAULT_DOCKER_CONTEXT:
+        return DEFAULT_DOCKER_HOST
+    # 上下文按名称的 SHA-256 存放在 contexts/meta/<摘要>/meta.json 中
+    digest = hashlib.sha256(name.encode("utf-8")).hexdigest()
+    contexts_dir = os.path.join(_docker_config_dir(), "contexts")
+    try:
+        with open(os.path.join(contexts_dir, "meta", digest, "meta.json"), "r", encoding="utf-8") as f:
+            endpoint = json.load(f)["Endpoints"]["docker"]
+        host = endpoint["Host"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if os.path.isdir(os.path.join(contexts_dir, "tls", digest, "docker")):
+        return None
+    if urlsplit(host).scheme not in ("unix", "tcp", "http"):
+        return None
+    return host
+
+
+_client_lock = threading.Lock()
+_client: Optional[DockerClient] = None
+_client_checked = False
+
+
+def get_docker_client() -> Optional[DockerClient]:
+    """返回共享的 Docker API 客户端，守护进程不可直接访问时返回 None。
+
+    只在第一次调用时探测一次，结果在进程内缓存。地址由 resolve_docker_host() 按 DOCKER_HOST 和
+    当前 docker context 确定；地址为 ssh://、启用了 TLS 校验或上下文无法解析时不使用 API 客户端，
+    由 docker 命令处理这些连接方式。
+    """
+    global _client, _client_checked
+    with _client_lock:
+        if _client_checked:
+            return _client
+        _client_checked = True
+        host = resolve_docker_host()
+        if host is None or os.environ.get("DOCKER_TLS_VERIFY"):
+            return None
+        try:
+            client = DockerClient(host)
+            if client.ping():
+                _client = client
+        except (ValueError, OSError, http.client.HTTPException, DockerAPIError):
+            _client = None
+        return _client
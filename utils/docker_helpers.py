@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
+import json
 import os
+import re
+import shlex
+import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
 
 # 将项目根目录添加到 sys.path，确保可以正确导入本地模块
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from conf.docker_mirrors import DOCKER_MIRRORS
-from utils.helpers import run_sudo_command
+from conf.docker_mirrors import DOCKER_HUB_PREFIXES, DOCKER_MIRROR_DIGESTS_NAME
+from conf.install_settings import DOCKER_PULL_WORKERS
+from utils.helpers import run_sudo_command, get_toolkit_config_dir
+from utils.docker_api import DockerAPIError, get_docker_client
+from utils.registry_mirrors import ProbeResult, RegistryHealthCache, fetch_manifest_digest, rank_registries
 from utils.i18n import get_message as _
 
 
@@ -16,6 +26,7 @@ def parse_image_url(url):
     """
     解析 Docker 镜像 URL，分离出 tag 或 digest。
     支持格式：
+      - repository
       - repository:tag
       - repository@digest
       - registry/repository:tag
@@ -30,8 +41,8 @@ def parse_image_url(url):
     if '@' in url:
         url, digest = url.split('@', 1)
         digest = '@' + digest
-    elif ':' in url and '/' in url and url.rfind(':') > url.rfind('/'):
-        # 只有最后的 : 是 tag
+    elif url.rfind(':') > url.rfind('/'):
+        # 只有最后一个 / 之后的 : 是 tag，之前的是 registry 端口
         url, tag = url.rsplit(':', 1)
         tag = ':' + tag
     return url, tag, digest
@@ -39,46 +50,135 @@ def parse_image_url(url):
 def has_registry(url):
     """
     判断镜像 URL 是否包含 registry 信息。
-    规则：第一个 / 之前有 . 或 :，则认为有 registry。
+    规则：存在 / 且第一个 / 之前有 . 或 :，或为 localhost，则认为有 registry。
     Args:
         url (str): 镜像地址
     Returns:
         bool: 是否包含 registry
     """
     parts = url.split('/', 1)
-    return '.' in parts[0] or ':' in parts[0]
+    if len(parts) == 1:
+        # 没有 /（如 alpine:3.19），: 之后是 tag 而不是端口
+        return False
+    return '.' in parts[0] or ':' in parts[0] or parts[0] == 'localhost'
 
-def is_docker_official_reachable(timeout: int = 3) -> bool:
+def strip_docker_hub_prefix(url):
     """
-    测试 Docker 官方 registry 是否可访问。
-    对 https://registry-1.docker.io/v2/ 发起 HEAD 请求：
-      - 网络异常或超时 -> 返回 False
-      - 5xx 响应 -> 返回 False
-      - 其它响应（如 200, 301, 302, 401, 403, 429 等） -> 返回 True
-    如果环境中未安装 requests，则函数也返回 False（安全失败）。
+    去掉镜像地址中显式写出的 Docker Hub registry 前缀（docker.io/ 等），其余地址原样返回。
     Args:
-        timeout (int): 请求超时时间（秒）
+        url (str): 镜像地址
     Returns:
-        bool: 官方 registry 是否可访问
+        str: 不带 Docker Hub 前缀的镜像地址
+    """
+    for prefix in DOCKER_HUB_PREFIXES:
+        if url.startswith(prefix):
+            return url[len(prefix):]
+    return url
+
+def _pull(image_url: str, description: str, env=None):
     """
+    拉取单个镜像：Docker API 可用时直接请求守护进程，否则通过 docker pull 命令（必要时提权）。
+    Args:
+        image_url (str): 镜像地址
+        description (str): 操作描述
+        env (dict, optional): 传递给 docker 命令的环境变量
+    Raises:
+        Exception: 拉取失败时抛出异常
+    """
+    client = get_docker_client()
+    if client is None:
+        run_sudo_command("docker pull {}".format(image_url), description, env=env)
+        return
+    print(_("executing_command", description))
+    client.pull_image(image_url)
+
+def _image_key(image_url: str) -> str:
+    """返回镜像按标签引用时的规范名称（省略标签时为 :latest）。"""
+    url_base, tag, _digest = parse_image_url(image_url)
+    return "{}{}".format(url_base, tag or ':latest')
+
+def _read_mirror_digests() -> Dict[str, Dict]:
+    """读取从镜像源拉取的镜像摘要记录（镜像名称 -> {id, digest}），文件不存在或损坏时返回空字典。"""
     try:
-        import requests
-    except Exception:
-        # requests 未安装或不可用，返回 False（视为不可达）
-        return False
+        with open(os.path.join(get_toolkit_config_dir(), DOCKER_MIRROR_DIGESTS_NAME), encoding="utf-8") as f:
+            records = json.load(f)
+        return records if isinstance(records, dict) else {}
+    except (OSError, ValueError):
+        return {}
 
-    url = "https://registry-1.docker.io/v2/"
+def _write_mirror_digest(image_key: str, image_id: str, digest: str) -> None:
+    """记录镜像名称对应的镜像 ID 与拉取时的 manifest 摘要，写入失败时忽略（记录只用于跳过不必要的拉取）。"""
+    records = _read_mirror_digests()
+    records[image_key] = {"id": image_id, "digest": digest}
     try:
-        resp = requests.head(url, timeout=timeout, allow_redirects=True)
-    except requests.RequestException:
-        return False
-    return resp.status_code < 500
+        path = os.path.join(get_toolkit_config_dir(), DOCKER_MIRROR_DIGESTS_NAME)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def _retag(mirror_image: str, image_url: str, env=None):
+    """
+    将从镜像源拉取的镜像重新标记为原始名称，并去掉镜像源的名称，
+    使 docker compose 等按原始名称查找镜像时无需再次拉取。
+    去掉镜像源名称后镜像不再带有 RepoDigests，因此先记录拉取到的 manifest 摘要，供检查更新时比较。
+    Args:
+        mirror_image (str): 镜像源上的镜像地址
+        image_url (str): 原始镜像地址
+        env (dict, optional): 传递给 docker 命令的环境变量
+    """
+    if parse_image_url(image_url)[2]:
+        # 按摘要引用的镜像不能打标签，docker 按摘要查找时不区分 registry 名称之外的内容
+        return
+    target = _image_key(image_url)
+    print(_("retagging_mirror_image", target))
+    mirror_info = get_local_image(mirror_image)
+    if mirror_info and mirror_info["RepoDigests"]:
+        _write_mirror_digest(target, mirror_info["Id"], mirror_info["RepoDigests"][0].split("@", 1)[-1])
+    client = get_docker_client()
+    try:
+        if client is None:
+            # 镜像已拉取成功，标记失败只给出警告，不进入交互式的提权流程
+            cmd_env = dict(os.environ, **(env or {}))
+            subprocess.run(["docker", "tag", mirror_image, target], check=True, env=cmd_env,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+            subprocess.run(["docker", "rmi", mirror_image], env=cmd_env,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return
+        client.tag_image(mirror_image, target)
+        client.remove_image(mirror_image)
+    except subprocess.CalledProcessError as e:
+        print(_("warning_retag_failed", mirror_image, target, (e.stderr or "").strip() or e), file=sys.stderr)
+    except (OSError, DockerAPIError) as e:
+        print(_("warning_retag_failed", mirror_image, target, e), file=sys.stderr)
+
+def _print_probe_results(results: List[ProbeResult]):
+    for result in results:
+        if result.retry_after is not None:
+            minutes = max(int((result.retry_after - time.time()) // 60) + 1, 1)
+            status = _("registry_status_backoff", minutes, result.error)
+        elif result.latency is None:
+            status = _("registry_status_unreachable", result.error)
+        elif result.manifest is False:
+            status = _("registry_status_missing")
+        elif result.cached:
+            status = _("registry_status_cached")
+        elif result.manifest:
+            status = _("registry_status_available")
+        else:
+            status = _("registry_status_unknown", result.error)
+        latency = "{:.0f} ms".format(result.latency * 1000) if result.latency is not None else "-"
+        print("  - {:<45} {:>8}  {}".format(result.host, latency, status))
 
 def docker_pull_image(image_url: str, description: str, env=None):
     """
     拉取 Docker 镜像，自动选择官方源或镜像源。
-    优先尝试官方源，若不可达则依次尝试配置的镜像源，全部失败后再回退官方源。
-    拉取过程中的每一步均有详细的本地化提示。
+    Docker Hub 上的镜像（包括显式写出 docker.io/ 前缀的地址）会先并发测速官方源和所有镜像源，从最快的可用源开始拉取，失败时沿排序依次回退；
+    全部失败且官方源未尝试过时，最后再尝试一次官方源。其他 registry 上的镜像直接拉取。
+    测速结果记录在健康状态缓存中，有效期内不重复测速，探测失败的源按指数退避跳过，拉取失败的源下次重新探测。
+    从镜像源拉取后会重新标记为原始名称。拉取过程中的每一步均有详细的本地化提示。
     Args:
         image_url (str): 镜像地址
         description (str): 操作描述（用于本地化消息）
@@ -88,37 +188,342 @@ def docker_pull_image(image_url: str, description: str, env=None):
     Raises:
         Exception: 拉取镜像失败时抛出异常
     """
-    if is_docker_official_reachable(timeout=5):
+    # docker.io/ 开头的地址同样是 Docker Hub 上的镜像，可以使用镜像源
+    hub_image = strip_docker_hub_prefix(image_url)
+    if has_registry(hub_image):
+        # 镜像不在 Docker Hub 上，镜像源不适用
         print(_("pulling_image_official", description, image_url))
-        run_sudo_command("docker pull {}".format(image_url), description, env=env)
+        _pull(image_url, description, env=env)
         return
-    print(_("pulling_image_mirrors", description, image_url))
-    url_base, tag, digest = parse_image_url(image_url)
-    for mirror in DOCKER_MIRRORS:
-        if has_registry(image_url):
-            # 已有 registry，直接用原始 image_url
-            mirror_image = image_url
-        else:
-            # 拼接镜像源和 repo
-            if '/' in url_base:
-                repo = url_base
-            else:
-                repo = "library/{}".format(url_base)
-            mirror_image = "{}/{}{}{}".format(mirror.rstrip('/'), repo, tag, digest)
-        print(_("trying_mirror_pull", mirror, mirror_image))
+    url_base, tag, digest = parse_image_url(hub_image)
+    repo = url_base if '/' in url_base else "library/{}".format(url_base)
+    reference = digest[1:] or tag[1:] or "latest"
+
+    print(_("probing_registries", description, image_url))
+    cache = RegistryHealthCache()
+    results = rank_registries(repo, reference, cache=cache)
+    _print_probe_results(results)
+    official_error = None
+    for result in results:
+        if not result.healthy:
+            break
+        if result.is_official:
+            print(_("pulling_image_official", description, image_url))
+            try:
+                _pull(image_url, description, env=env)
+                print(_("official_pull_success", description, image_url))
+                return
+            except Exception as e:
+                print(_("official_pull_failed", e))
+                official_error = e
+                cache.invalidate(result.registry)
+                cache.save()
+            continue
+        mirror_image = "{}/{}{}{}".format(result.host, repo, tag, digest)
+        print(_("trying_mirror_pull", result.registry, mirror_image))
         try:
-            run_sudo_command("docker pull {}".format(mirror_image), description, env=env)
-            print(_("mirror_pull_success", description, mirror, mirror_image))
-            return
+            _pull(mirror_image, description, env=env)
+            print(_("mirror_pull_success", description, result.registry, mirror_image))
         except Exception as e:
-            print(_("mirror_pull_failed", mirror, e))
-    # 所有镜像源都失败，最后再尝试官方源一次
+            print(_("mirror_pull_failed", result.registry, e))
+            cache.invalidate(result.registry)
+            cache.save()
+            continue
+        _retag(mirror_image, image_url, env=env)
+        return
+    if official_error is not None:
+        raise official_error
+    # 所有可用的镜像源都失败，最后再尝试官方源一次
     print(_("all_mirrors_failed_try_official", image_url))
     try:
-        run_sudo_command("docker pull {}".format(image_url), description, env=env)
+        _pull(image_url, description, env=env)
         print(_("official_pull_success", description, image_url))
     except Exception as e:
         print(_("official_pull_failed", e))
+        raise
+
+def _parse_compose_config_images(text: str, services: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    从 compose config 输出的规范化 YAML 中提取各服务的 image（不依赖 YAML 库）。
+    Args:
+        text (str): compose config 的输出
+        services (list[str], optional): 只提取这些服务
+    Returns:
+        dict: 服务名到镜像地址的映射
+    """
+    images = {}
+    in_services = False
+    service = None
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        indent = len(line) - len(line.lstrip(' '))
+        if indent == 0:
+            in_services = line.rstrip() == 'services:'
+            service = None
+            continue
+        if not in_services:
+            continue
+        match = re.match(r'^ {2}([^\s:#][^:]*):\s*$', line)
+        if match and indent == 2:
+            service = match.group(1).strip('"\'')
+            continue
+        match = re.match(r'^ {4}image:\s*(\S+)\s*$', line)
+        if match and service and (services is None or service in services):
+            images[service] = match.group(1).strip('"\'')
+    return images
+
+def get_compose_service_images(docker_compose_cmd: str, env_file: str, services: Optional[List[str]] = None,
+                               env=None) -> Optional[Dict[str, str]]:
+    """
+    解析当前目录下 compose 文件（代入 .env 中的变量后）各服务使用的镜像。
+    优先使用 config --format json（Compose V2），不支持时解析 config 输出的 YAML。
+    只有 build 没有 image 的服务不包含在内。
+    Args:
+        docker_compose_cmd (str): docker compose 命令
+        env_file (str): .env 文件路径
+        services (list[str], optional): 只解析这些服务，默认为全部服务
+        env (dict, optional): 传递给 compose 命令的环境变量
+    Returns:
+        dict | None: 服务名到镜像地址的映射，无法解析 compose 文件时为 None
+    """
+    cmd_env = dict(os.environ, **(env or {}))
+    base_cmd = shlex.split(docker_compose_cmd) + ["--env-file", env_file, "config"]
+    result = subprocess.run(base_cmd + ["--format", "json"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                            universal_newlines=True, env=cmd_env)
+    images = None
+    if result.returncode == 0:
+        try:
+            config = json.loads(result.stdout)
+            images = {name: service["image"] for name, service in (config.get("services") or {}).items()
+                      if service.get("image") and (services is None or name in services)}
+        except (ValueError, AttributeError, TypeError):
+            images = None
+    if images is None:
+        result = subprocess.run(base_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                universal_newlines=True, env=cmd_env)
+        if result.returncode != 0:
+            return None
+        images = _parse_compose_config_images(result.stdout, services)
+    return images
+
+def get_compose_images(docker_compose_cmd: str, env_file: str, services: Optional[List[str]] = None,
+                       env=None) -> Optional[List[str]]:
+    """
+    返回 compose 文件中各服务使用的镜像（去重），参数与 get_compose_service_images 相同。
+    Returns:
+        list[str] | None: 镜像地址，无法解析 compose 文件时为 None
+    """
+    images = get_compose_service_images(docker_compose_cmd, env_file, services, env=env)
+    return None if images is None else list(dict.fromkeys(images.values()))
+
+def get_local_image(image_url: str) -> Optional[Dict]:
+    """
+    查询本地镜像的 ID 和 RepoDigests。
+    从镜像源拉取并重新标记的镜像没有原始名称的 RepoDigests，镜像 ID 与拉取时记录的一致时补上记录的摘要。
+    Args:
+        image_url (str): 镜像地址
+    Returns:
+        dict | None: {"Id": ..., "RepoDigests": [...]}，镜像不存在或查询失败时为 None
+    """
+    client = get_docker_client()
+    if client:
+        try:
+            info = client.inspect_image(image_url)
+        except (OSError, DockerAPIError):
+            return None
+        if not info:
+            return None
+        local = {"Id": info.get("Id"), "RepoDigests": info.get("RepoDigests") or []}
+    else:
+        result = subprocess.run(
+            ["docker", "image", "inspect", "--format", "{{json .Id}} {{json .RepoDigests}}", image_url],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True
+        )
+        if result.returncode != 0:
+            return None
+        try:
+            image_id, repo_digests = result.stdout.strip().split(" ", 1)
+            local = {"Id": json.loads(image_id), "RepoDigests": json.loads(repo_digests) or []}
+        except ValueError:
+            return None
+    record = _read_mirror_digests().get(_image_key(image_url))
+    if record and record.get("id") == local["Id"] and record.get("digest"):
+        local["RepoDigests"].append("{}@{}".format(parse_image_url(image_url)[0], record["digest"]))
+    return local
+
+def get_remote_image_digest(image_url: str) -> Optional[str]:
+    """
+    查询镜像在 registry 上当前的 manifest 摘要。
+    Docker Hub 上的镜像（包括显式写出 docker.io/ 前缀的地址）按镜像源排序（使用健康状态缓存）依次查询，第一个返回摘要的源为准；
+    其他 registry 上的镜像直接查询该 registry。按摘要引用的镜像直接返回其摘要。
+    Args:
+        image_url (str): 镜像地址
+    Returns:
+        str | None: 形如 sha256:... 的摘要，无法查询时为 None
+    """
+    # docker.io/ 开头的地址按 Docker Hub 上的镜像查询（官方镜像补上 library/）
+    hub_image = strip_docker_hub_prefix(image_url)
+    url_base, tag, digest = parse_image_url(hub_image)
+    if digest:
+        return digest[1:]
+    reference = tag[1:] or "latest"
+    if has_registry(hub_image):
+        registry, repo = url_base.split('/', 1)
+        return fetch_manifest_digest(registry, repo, reference)
+    repo = url_base if '/' in url_base else "library/{}".format(url_base)
+    for result in rank_registries(repo, reference, cache=RegistryHealthCache()):
+        if not result.healthy:
+            break
+        remote_digest = result.digest or fetch_manifest_digest(result.registry, repo, reference)
+        if remote_digest:
+            return remote_digest
+    return None
+
+def get_compose_container_images(docker_compose_cmd: str, env_file: str, env=None) -> Optional[Dict[str, str]]:
+    """
+    返回 compose 项目中现有容器所使用的镜像 ID（包括已停止的容器）。
+    Args:
+        docker_compose_cmd (str): docker compose 命令
+        env_file (str): .env 文件路径
+        env (dict, optional): 传递给 docker 命令的环境变量
+    Returns:
+        dict | None: 服务名到镜像 ID 的映射，查询失败时为 None
+    """
+    cmd_env = dict(os.environ, **(env or {}))
+    result = subprocess.run(shlex.split(docker_compose_cmd) + ["--env-file", env_file, "ps", "-a", "-q"],
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True, env=cmd_env)
+    if result.returncode != 0:
+        return None
+    container_ids = result.stdout.split()
+    images = {}
+    client = get_docker_client()
+    if client:
+        for container_id in container_ids:
+            try:
+                info = client.inspect_container(container_id) or {}
+            except (OSError, DockerAPIError):
+                return None
+            service = ((info.get("Config") or {}).get("Labels") or {}).get("com.docker.compose.service")
+            if service:
+                images[service] = info.get("Image")
+        return images
+    if not container_ids:
+        return images
+    result = subprocess.run(
+        ["docker", "inspect", "--format", '{{index .Config.Labels "com.docker.compose.service"}} {{.Image}}']
+        + container_ids, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True, env=cmd_env
+    )
+    if result.returncode != 0:
+        return None
+    for line in result.stdout.splitlines():
+        service, _sep, image_id = line.strip().partition(" ")
+        if service and image_id:
+            images[service] = image_id
+    return images
+
+def pull_images_concurrently(images: Dict[str, str], env=None, max_workers: int = DOCKER_PULL_WORKERS) -> List[str]:
+    """
+    使用有上限的线程池并发拉取多个镜像，每个镜像都经过 docker_pull_image 的镜像源选择。
+    只有 Docker API 可用时才并发：通过 docker 命令拉取时失败可能进入交互式的提权流程，此时逐个拉取。
+    Args:
+        images (dict): 镜像地址到操作描述的映射
+        env (dict, optional): 传递给 docker 命令的环境变量
+        max_workers (int): 最大并发数
+    Returns:
+        list[str]: 拉取失败的镜像
+    """
+    workers = max(1, min(max_workers, len(images))) if get_docker_client() is not None else 1
+    print(_("pulling_images_concurrently", len(images), workers, ", ".join(images)))
+    failed = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(docker_pull_image, image, description, env): image
+                   for image, description in images.items()}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(_("error_pull_image", futures[future], e), file=sys.stderr)
+                failed.append(futures[future])
+    return failed
+
+def pull_compose_images(docker_compose_cmd: str, env_file: str, description: str,
+                        services: Optional[List[str]] = None, extra_images: Optional[Dict[str, str]] = None,
+                        env=None):
+    """
+    并发拉取 compose 文件中的镜像和额外的镜像（如沙盒镜像），总耗时取决于最大的镜像而不是所有镜像之和。
+    无法解析 compose 文件中的镜像或有镜像并发拉取失败时，回退到逐个执行 compose pull / docker pull。
+    Args:
+        docker_compose_cmd (str): docker compose 命令
+        env_file (str): .env 文件路径
+        description (str): 拉取 compose 镜像的操作描述
+        services (list[str], optional): 只拉取这些服务的镜像，默认为全部服务，空列表表示不拉取 compose 镜像
+        extra_images (dict, optional): 额外的镜像地址到操作描述的映射
+        env (dict, optional): 传递给 docker 命令的环境变量
+    """
+    compose_pull = "{} --env-file {} pull {}".format(docker_compose_cmd, env_file, " ".join(services or [])).rstrip()
+    if services is not None and not services:
+        # 只拉取额外的镜像
+        compose_images = []
+    else:
+        compose_images = get_compose_images(docker_compose_cmd, env_file, services, env=env)
+    images = {}
+    if compose_images is None:
+        print(_("warning_compose_images_unresolved"))
+    else:
+        images.update((image, description) for image in compose_images)
+    for image, extra_description in (extra_images or {}).items():
+        images.setdefault(image, extra_description)
+    failed = pull_images_concurrently(images, env=env) if images else []
+
+    if compose_images is None or any(image in failed for image in compose_images):
+        run_sudo_command(compose_pull, description, env=env)
+    for image in failed:
+        if compose_images is None or image not in compose_images:
+            run_sudo_command("docker pull {}".format(image), images[image], env=env)
+
+def list_running_containers(volume_name: str) -> List[str]:
+    """
+    返回挂载了指定卷的运行中容器名称。
+    Args:
+        volume_name (str): Docker 卷名称
+    Returns:
+        list[str]: 容器名称列表，查询失败时为空
+    """
+    client = get_docker_client()
+    if client:
+        try:
+            containers = client.list_containers({"volume": [volume_name], "status": ["running"]})
+            return [c["Names"][0].lstrip("/") for c in containers if c.get("Names")]
+        except (OSError, DockerAPIError):
+            return []
+    result = subprocess.run(
+        ["docker", "ps", "--filter", f"volume={volume_name}", "--filter", "status=running", "--format", "{{.Names}}"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True
+    )
+    return result.stdout.split() if result.returncode == 0 else []
+
+def get_container_addresses(container: str) -> List[str]:
+    """
+    返回容器在各个网络中的 IP 地址（Linux 上可从宿主机直接访问）。
+    Args:
+        container (str): 容器名称
+    Returns:
+        list[str]: IP 地址列表，查询失败时为空
+    """
+    client = get_docker_client()
+    if client:
+        try:
+            info = client.inspect_container(container) or {}
+        except (OSError, DockerAPIError):
+            return []
+        networks = (info.get("NetworkSettings") or {}).get("Networks") or {}
+        return [n["IPAddress"] for n in networks.values() if n.get("IPAddress")]
+    result = subprocess.run(
+        ["docker", "inspect", "--format", "{{range .NetworkSettings.Networks}}{{.IPAddress}} {{end}}", container],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True
+    )
+    return result.stdout.split() if result.returncode == 0 else []
 
 if __name__ == "__main__":
     # 示例：拉取 hello-world 镜像
@@ -3,6 +3,7 @@
 
 包含系统、网络、Docker、.env 文件操作等相关的可重用函数。
 """
+import hashlib
 import os
 import secrets
 import shutil
@@ -20,17 +21,62 @@ import platform
 
 # --- 默认数据目录管理 ---
 
-def get_default_data_dir_config_path():
-    """获取默认数据目录配置文件的路径。
-    
+def get_toolkit_config_dir():
+    """获取工具的配置目录，不存在时自动创建。
+
     返回:
-        str: 配置文件的绝对路径
+        str: 配置目录的绝对路径
     """
     # 使用XDG Base Directory规范，将配置存放在~/.config/.nekro-agent-toolkit目录
     config_dir = os.path.expanduser("~/.config/.nekro-agent-toolkit")
     if not os.path.exists(config_dir):
         os.makedirs(config_dir, exist_ok=True)
-    return os.path.join(config_dir, "default_data_dir")
+    return config_dir
+
+def get_pending_restore_dir(archive_path=None):
+    """获取恢复时服务未运行、需在服务启动后导入的数据的存放目录，不存在时自动创建。
+
+    参数:
+        archive_path (str, optional): 产生待导入数据的备份归档。提供时返回该归档专用的子目录，
+            只有恢复同一个归档后才会导入其中的数据。
+
+    返回:
+        str: 目录的绝对路径
+    """
+    pending_dir = os.path.join(get_toolkit_config_dir(), "pending_restores")
+    if archive_path:
+        archive_path = os.path.abspath(archive_path)
+        key = hashlib.sha256(archive_path.encode("utf-8")).hexdigest()[:12]
+        pending_dir = os.path.join(pending_dir, f"{os.path.basename(archive_path)}.{key}")
+    os.makedirs(pending_dir, exist_ok=True)
+    return pending_dir
+
+def clear_pending_restores():
+    """删除之前的恢复留下、尚未导入的全部数据，返回被删除的条目名称列表（不含空目录）。
+
+    返回:
+        list[str]: 被删除的条目名称
+    """
+    pending_dir = get_pending_restore_dir()
+    removed = []
+    for name in sorted(os.listdir(pending_dir)):
+        path = os.path.join(pending_dir, name)
+        if os.path.isdir(path) and not os.path.islink(path):
+            if os.listdir(path):
+                removed.append(name)
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            removed.append(name)
+            os.remove(path)
+    return removed
+
+def get_default_data_dir_config_path():
+    """获取默认数据目录配置文件的路径。
+    
+    返回:
+        str: 配置文件的绝对路径
+    """
+    return os.path.join(get_toolkit_config_dir(), "default_data_dir")
 
 def set_default_data_dir(path: Optional[str] = None):
     """设置或清除默认数据目录。
@@ -519,4 +565,44 @@ def generate_random_string(length):
     返回:
         str: 生成的随机字符串。
     """
-    return ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(length))
\ No newline at end of file
+    return ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(length))
+
+def format_size(num):
+    """将字节数格式化为易读的大小字符串（IEC 单位）。
+
+    参数:
+        num (int): 字节数。
+
+    返回:
+        str: 例如 "1.5MiB"。
+    """
+    for unit in ["B", "KiB", "MiB", "GiB", "TiB"]:
+        if abs(num) < 1024.0:
+            return f"{num:.1f}{unit}"
+        num /= 1024.0
+    return f"{num:.1f}PiB"
+
+
+def parse_size(text: str) -> int:
+    """解析带单位的大小字符串，与 format_size 的输出格式对应。
+
+    参数:
+        text (str): 例如 "500M"、"1.5GiB"、"2T" 或纯字节数，单位按 1024 进制计算。
+
+    返回:
+        int: 字节数。
+
+    异常:
+        ValueError: 无法解析或为负数。
+    """
+    units = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+    value = text.strip().upper()
+    for suffix in ("IB", "B"):
+        if value.endswith(suffix):
+            value = value[:-len(suffix)]
+            break
+    unit = value[-1:] if value[-1:] in units else ""
+    number = float(value[:len(value) - len(unit)])
+    if number < 0:
+        raise ValueError(text)
+    return int(number * units[unit])
@@ -0,0 +1,335 @@
+"""
+按层去重的离线镜像包。
+
+镜像包是一个目录：
+- bundle.json：每个镜像的 ID，以及该镜像 docker save 输出中每个成员的元数据，文件内容以 SHA-256 引用；
+- blobs/<前两位>/<sha256>.<编解码器>：每份内容（镜像层、配置等）只保存一次，按编解码器压缩。
+
+不同镜像共用的层（例如相同的基础镜像）只存一份。刷新镜像包时，镜像 ID 未变化的镜像直接沿用、不再导出；
+标签指向了新镜像时重新导出，但只有包中还没有的层才会压缩写入。每个层以多线程压缩（zstd 优先，
+不可用时按 backup_codecs 的顺序退回 xz / gzip）。
+导入时按记录逐个镜像重建 docker save 格式的 tar 流并直接交给 docker load，同时校验每份内容的 SHA-256，
+不在磁盘上生成中间文件。
+"""
+import contextlib
+import hashlib
+import json
+import os
+import re
+import subprocess
+import tarfile
+import tempfile
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils.backup_codecs import Codec, get_codec
+from utils.docker_api import STREAM_CHUNK_SIZE, DockerAPIError, get_docker_client
+
+# 镜像包清单文件名
+BUNDLE_MANIFEST_NAME = "bundle.json"
+
+# 镜像包格式版本
+BUNDLE_FORMAT_VERSION = 1
+
+# 新格式（OCI 布局）的 docker save 中，内容以摘要命名，已存在时无需再压缩
+_OCI_BLOB_RE = re.compile(r"^blobs/sha256/([0-9a-f]{64})$")
+
+# 成员类型名称与 tar 类型的对应关系（docker save 只会产生这几种）
+_MEMBER_TYPES = {
+    "file": tarfile.REGTYPE,
+    "dir": tarfile.DIRTYPE,
+    "symlink": tarfile.SYMTYPE,
+    "link": tarfile.LNKTYPE,
+}
+
+
+class BundleError(Exception):
+    """镜像包损坏或与记录不一致。"""
+
+
+class _HashingReader:
+    """读取时计算 SHA-256 的包装。"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self.digest.update(data)
+        return data
+
+
+class ImageBundle:
+    """按层去重的离线镜像包。
+
+    Attributes:
+        path (str): 镜像包目录。
+        images (dict): 镜像名称到记录（id、members）的映射。
+        blobs (dict): 内容摘要到记录（size、stored、codec）的映射。
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): 镜像包目录，不存在时在保存时创建。
+
+        Raises:
+            BundleError: 清单文件无法解析或格式版本不受支持。
+        """
+        self.path = path
+        self.images: Dict[str, Dict] = {}
+        self.blobs: Dict[str, Dict] = {}
+        manifest_path = os.path.join(path, BUNDLE_MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            return
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise BundleError(f"{manifest_path}: {e}")
+        if data.get("format") != BUNDLE_FORMAT_VERSION:
+            raise BundleError(f"{manifest_path}: unsupported format {data.get('format')}")
+        self.images = data.get("images", {})
+        self.blobs = data.get("blobs", {})
+
+    def _blob_path(self, digest: str, codec_name: str) -> str:
+        hex_digest = digest.split(":", 1)[1]
+        return os.path.join(self.path, "blobs", hex_digest[:2], f"{hex_digest}.{codec_name}")
+
+    def has_blob(self, digest: str) -> bool:
+        blob = self.blobs.get(digest)
+        return blob is not None and os.path.exists(self._blob_path(digest, blob["codec"]))
+
+    def is_current(self, image: str, image_id: str) -> bool:
+        """镜像包中的记录是否就是该镜像 ID，且引用的内容都存在。"""
+        record = self.images.get(image)
+        if not record or record.get("id") != image_id:
+            return False
+        return all(self.has_blob(m["blob"]) for m in record["members"] if m["type"] == "file")
+
+    def _store_file(self, tar: tarfile.TarFile, member: tarfile.TarInfo, codec: Codec,
+                    level: int, threads: int) -> Tuple[str, int]:
+        """保存一个文件成员的内容，返回 (摘要, 新写入的压缩后字节数)。"""
+        match = _OCI_BLOB_RE.match(member.name)
+        if match and self.has_blob(f"sha256:{match.group(1)}"):
+            # 内容已在包中，tarfile 会在读取下一个成员时跳过这部分数据
+            return f"sha256:{match.group(1)}", 0
+
+        blob_dir = os.path.join(self.path, "blobs")
+        os.makedirs(blob_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=blob_dir, prefix=".blob.", suffix=".tmp")
+        os.close(fd)
+        reader = _HashingReader(tar.extractfile(member))
+        writer = codec.open_writer(tmp_path, level, threads)
+        try:
+            while True:
+                data = reader.read(STREAM_CHUNK_SIZE)
+                if not data:
+                    break
+                writer.write(data)
+            writer.close()
+        except BaseException:
+            writer.abort()
+            os.remove(tmp_path)
+            raise
+
+        digest = f"sha256:{reader.digest.hexdigest()}"
+        if self.has_blob(digest):
+            # 旧格式的 docker save 中，共用的层只有读完才知道摘要
+            os.remove(tmp_path)
+            return digest, 0
+        final_path = self._blob_path(digest, codec.name)
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+        os.replace(tmp_path, final_path)
+        stored = os.path.getsize(final_path)
+        self.blobs[digest] = {"size": member.size, "stored": stored, "codec": codec.name}
+        return digest, stored
+
+    def add_image(self, image: str, image_id: str, save_stream, codec: Codec,
+                  level: int, threads: int = 0) -> int:
+        """读取镜像的 docker save 数据流，把尚未保存的内容写入镜像包并记录该镜像。
+
+        调用方需在之后调用 save() 写入清单。
+
+        Args:
+            image (str): 镜像名称。
+            image_id (str): 镜像 ID。
+            save_stream: docker save 输出的 tar 数据流。
+            codec (Codec): 新内容使用的编解码器。
+            level (int): 压缩级别。
+            threads (int): 压缩线程数，0 表示使用全部 CPU 核心。
+
+        Returns:
+            int: 新写入的压缩后字节数。
+        """
+        members = []
+        new_bytes = 0
+        with tarfile.open(fileobj=save_stream, mode="r|") as tar:
+            for member in tar:
+                record = {"name": member.name, "mode": member.mode, "mtime": member.mtime,
+                          "uid": member.uid, "gid": member.gid}
+                if member.isfile():
+                    record["type"] = "file"
+                    record["size"] = member.size
+                    record["blob"], stored = self._store_file(tar, member, codec, level, threads)
+                    new_bytes += stored
+                elif member.isdir():
+                    record["type"] = "dir"
+                elif member.issym() or member.islnk():
+                    record["type"] = "symlink" if member.issym() else "link"
+                    record["linkname"] = member.linkname
+                else:
+                    continue
+                members.append(record)
+        self.images[image] = {"id": image_id, "members": members}
+        return new_bytes
+
+    def retain_images(self, images: List[str]) -> List[str]:
+        """只保留指定的镜像，返回被移除的镜像名称。"""
+        removed = [image for image in self.images if image not in images]
+        for image in removed:
+            del self.images[image]
+        return removed
+
+    def prune_blobs(self) -> int:
+        """删除不再被任何镜像引用的内容，返回释放的字节数。"""
+        referenced = {m["blob"] for record in self.images.values() for m in record["members"] if m["type"] == "file"}
+        freed = 0
+        for digest in [d for d in self.blobs if d not in referenced]:
+            blob = self.blobs.pop(digest)
+            try:
+                os.remove(self._blob_path(digest, blob["codec"]))
+                freed += blob["stored"]
+            except FileNotFoundError:
+                pass
+        return freed
+
+    def save(self) -> None:
+        """以临时文件加重命名的方式原子地写入清单（内容总是先于清单写入）。"""
+        os.makedirs(self.path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=f".{BUNDLE_MANIFEST_NAME}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"format": BUNDLE_FORMAT_VERSION, "images": self.images, "blobs": self.blobs},
+                          f, indent=1, ensure_ascii=False)
+            os.replace(tmp_path, os.path.join(self.path, BUNDLE_MANIFEST_NAME))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def image_size(self, image: str) -> int:
+        """镜像未压缩的总大小（docker save 输出中所有文件之和）。"""
+        return sum(m.get("size", 0) for m in self.images[image]["members"])
+
+    def stored_size(self) -> int:
+        """镜像包中所有内容压缩后的总大小。"""
+        return sum(blob["stored"] for blob in self.blobs.values())
+
+    def write_image_tar(self, image: str, fileobj) -> None:
+        """重建镜像的 docker save 格式 tar 流并写入 fileobj，同时校验每份内容的摘要。
+
+        Raises:
+            BundleError: 内容缺失或摘要不匹配。
+        """
+        with tarfile.open(fileobj=fileobj, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+            for record in self.images[image]["members"]:
+                info = tarfile.TarInfo(record["name"])
+                info.type = _MEMBER_TYPES[record["type"]]
+                info.mode = record["mode"]
+                info.mtime = record["mtime"]
+                info.uid = record["uid"]
+                info.gid = record["gid"]
+                info.linkname = record.get("linkname", "")
+                if record["type"] != "file":
+                    tar.addfile(info)
+                    continue
+                info.size = record["size"]
+                digest = record["blob"]
+                if not self.has_blob(digest):
+                    raise BundleError(f"missing blob {digest} ({record['name']})")
+                blob = self.blobs[digest]
+                codec = get_codec(blob["codec"])
+                with open(self._blob_path(digest, blob["codec"]), "rb") as f, \
+                        codec.open_reader(f, check=True) as stream:
+                    reader = _HashingReader(stream)
+                    tar.addfile(info, reader)
+                if f"sha256:{reader.digest.hexdigest()}" != digest:
+                    raise BundleError(f"blob {digest} is corrupted ({record['name']})")
+
+    def iter_image_tar(self, image: str) -> Iterator[bytes]:
+        """以数据块的形式生成镜像的 docker save 格式 tar 流（在后台线程中重建），用于上传到 docker load。"""
+        read_fd, write_fd = os.pipe()
+        errors = []
+
+        def produce():
+            try:
+                with os.fdopen(write_fd, "wb") as out:
+                    self.write_image_tar(image, out)
+            except BaseException as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+        with os.fdopen(read_fd, "rb") as src:
+            while True:
+                data = src.read(STREAM_CHUNK_SIZE)
+                if not data:
+                    break
+                yield data
+        thread.join()
+        if errors:
+            raise errors[0]
+
+
+def get_image_id(image: str) -> Optional[str]:
+    """返回本地镜像的 ID，镜像不存在或查询失败时返回 None。"""
+    client = get_docker_client()
+    if client:
+        try:
+            info = client.inspect_image(image)
+        except (OSError, DockerAPIError):
+            return None
+        return info.get("Id") if info else None
+    result = subprocess.run(["docker", "image", "inspect", "--format", "{{.Id}}", image],
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True)
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+@contextlib.contextmanager
+def open_image_save(image: str):
+    """以上下文管理器形式打开单个镜像的 docker save 数据流（Docker API 或 docker save 命令）。
+
+    Raises:
+        DockerAPIError: Docker API 导出失败。
+        subprocess.CalledProcessError: docker save 命令失败。
+    """
+    client = get_docker_client()
+    if client:
+        response = client.save_images([image])
+        try:
+            yield response
+            # tarfile 读到结束标记后不会读完整个响应，读完后连接才能复用
+            response.read()
+        finally:
+            response.close()
+        return
+    proc = subprocess.Popen(["docker", "save", image], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        yield proc.stdout
+        # 读完剩余的填充数据，避免 docker save 因管道关闭而失败
+        while proc.stdout.read(STREAM_CHUNK_SIZE):
+            pass
+    except BaseException:
+        proc.kill()
+        raise
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read()
+        proc.stderr.close()
+        returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, ["docker", "save", image], stderr=stderr)
@@ -12,7 +12,9 @@ from .helpers import (
     command_exists, run_sudo_command, get_remote_file,
     update_env_file, get_env_value, populate_env_secrets
 )
+from .docker_helpers import pull_compose_images
 from utils.i18n import get_message as _
+from conf.install_settings import SANDBOX_IMAGE
 
 
 def set_directory_permissions(path):
@@ -291,6 +293,8 @@ def _download_compose_file_with_backup(compose_filename, target_file, system):
 def run_docker_operations(docker_compose_cmd, env_path):
     """执行 Docker 操作，包括拉取镜像和启动服务。
 
+    compose 文件中的镜像和沙盒镜像并发拉取，全部拉取完成后再启动服务。
+
     参数:
         docker_compose_cmd (str): 要使用的 docker-compose 命令。
         env_path (str): .env 文件的路径，用于 docker-compose 的 --env-file 参数。
@@ -302,9 +306,9 @@ def run_docker_operations(docker_compose_cmd, env_path):
     if docker_host and docker_host.startswith('/'):
         print(_('detected_docker_host_correcting', docker_host, docker_host))
         docker_env['DOCKER_HOST'] = "unix://{}".format(docker_host)
-    run_sudo_command("{} {} pull".format(docker_compose_cmd, env_file_arg), _('pulling_service_images'), env=docker_env)
+    pull_compose_images(docker_compose_cmd, env_path, _('pulling_service_images'),
+                        extra_images={SANDBOX_IMAGE: _('pulling_sandbox_image')}, env=docker_env)
     run_sudo_command("{} {} up -d".format(docker_compose_cmd, env_file_arg), _('starting_main_service'), env=docker_env)
-    run_sudo_command("docker pull kromiose/nekro-agent-sandbox", _('pulling_sandbox_image'), env=docker_env)
 
 def configure_firewall(env_path, with_napcat):
     """如果 ufw 防火墙存在，则为其配置端口转发规则。
@@ -0,0 +1,379 @@
+"""
+Postgres 数据卷的逻辑备份与恢复。
+
+服务运行时直接复制 Postgres 数据卷既慢（包含死元组、WAL 和索引）也不保证一致。
+存在使用该卷的运行中 Postgres 容器时，备份改为在容器内执行 `pg_dump -Fc`，
+输出经 docker exec 的标准输出按固定大小分段写入归档（volumes/<卷名>.pgdump/part-NNNNNN），
+不经过临时文件。pg_dump 成功退出后再写入完成标记（volumes/<卷名>.pgdump/complete），
+记录全部分段的总大小和 SHA-256；pg_dump 中途失败时归档中只留下不完整的分段，没有完成标记。
+恢复时将分段依次写入容器内的临时文件，确认与完成标记一致后才以 `pg_restore -j` 并行导入，
+不完整的逻辑备份不会执行带 --clean 的 pg_restore，数据库保持不变。
+
+容器内的命令使用容器自身的 POSTGRES_USER / POSTGRES_DB 环境变量，通过本地套接字连接，
+宿主机不需要知道数据库密码。恢复时没有运行中的容器（例如 -ri 在安装前恢复），
+逻辑备份先保存到工具配置目录，服务启动后由 restore_pending_postgres_dumps() 导入。
+"""
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from utils.helpers import format_size, get_pending_restore_dir
+from utils.i18n import get_message as _
+from utils.docker_helpers import list_running_containers
+from utils.backup_manifest import add_json_member
+from conf.backup_settings import (
+    BACKUP_POSTGRES_DUMP, BACKUP_POSTGRES_VOLUME_SUFFIXES, BACKUP_PG_DUMP_PART_SIZE,
+    BACKUP_PG_RESTORE_JOBS, BACKUP_SERVICE_READY_TIMEOUT
+)
+
+# 归档中逻辑备份目录名的后缀：volumes/<卷名>.pgdump/part-NNNNNN
+PG_DUMP_SUFFIX = ".pgdump"
+
+# pg_dump 成功完成后写入的完成标记成员名（位于逻辑备份目录中，所有分段之后）
+PG_DUMP_COMPLETE_NAME = "complete"
+
+# 写入待导入文件或容器时使用的缓冲区大小
+_COPY_BUFSIZE = 1024 * 1024
+
+# 容器内执行的命令。-Z 0 关闭 pg_dump 自带的压缩，由外层归档统一压缩（增量备份时也便于分块去重）
+_PG_ENV = 'user="${POSTGRES_USER:-postgres}"; db="${POSTGRES_DB:-$user}"'
+_PG_READY_SCRIPT = f'{_PG_ENV}; command -v pg_dump >/dev/null && pg_isready -q -h 127.0.0.1 -U "$user" -d "$db"'
+_PG_DUMP_SCRIPT = f'{_PG_ENV}; exec pg_dump -Fc -Z 0 -U "$user" -d "$db"'
+_PG_RESTORE_SCRIPT = (f'{_PG_ENV}; pg_restore -j "$1" --clean --if-exists --no-owner -U "$user" -d "$db" "$2"; '
+                      'status=$?; rm -f "$2"; exit $status')
+
+
+def is_postgres_volume(volume_name: str) -> bool:
+    """判断卷是否为 Postgres 数据卷。"""
+    return any(volume_name.endswith(suffix) for suffix in BACKUP_POSTGRES_VOLUME_SUFFIXES)
+
+
+def find_postgres_container(volume_name: str) -> Optional[str]:
+    """返回使用该卷、已可接受连接的 Postgres 容器名称，找不到时返回 None。
+
+    通过 TCP 检查就绪状态：官方镜像首次初始化时启动的临时服务只监听本地套接字，
+    不会被误认为已就绪。
+    """
+    for container in list_running_containers(volume_name):
+        result = subprocess.run(["docker", "exec", container, "sh", "-c", _PG_READY_SCRIPT],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if result.returncode == 0:
+            return container
+    return None
+
+
+def find_postgres_containers(volume_names: List[str]) -> Dict[str, str]:
+    """为可以逻辑备份的 Postgres 卷查找运行中的容器。
+
+    Args:
+        volume_names (list[str]): 待备份的卷名称。
+
+    Returns:
+        dict[str, str]: 卷名到容器名称的映射，未启用逻辑备份或服务未运行的卷不包含在内。
+    """
+    if not BACKUP_POSTGRES_DUMP:
+        return {}
+    containers = {}
+    for name in volume_names:
+        if not is_postgres_volume(name):
+            continue
+        container = find_postgres_container(name)
+        if container:
+            containers[name] = container
+            print(f"  - {_('postgres_dump_container_found', name, container)}")
+    return containers
+
+
+def stream_postgres_dump_into_archive(volume_name: str, container: str, tar: tarfile.TarFile,
+                                      tar_lock: Optional[threading.Lock] = None) -> bool:
+    """在容器内执行 pg_dump，并将输出按分段直接写入主归档。
+
+    tar 成员需要预先知道大小，因此输出按 BACKUP_PG_DUMP_PART_SIZE 分段缓冲，
+    每个分段作为一个成员写入，内存占用与数据库大小无关。
+    分段在 pg_dump 结束前就已写入归档，只有 pg_dump 成功退出时才写入完成标记。
+
+    Args:
+        volume_name (str): Postgres 数据卷名称。
+        container (str): 使用该卷的运行中容器。
+        tar (tarfile.TarFile): 以写模式打开的主归档。
+        tar_lock (threading.Lock, optional): 多个卷并发写入同一归档时使用的锁。
+
+    Returns:
+        bool: 备份成功返回 True，失败返回 False。
+    """
+    arc_root = f"volumes/{volume_name}{PG_DUMP_SUFFIX}"
+    tar_lock = tar_lock or threading.Lock()
+    print(f"  - {_('streaming_postgres_dump', volume_name, container, arc_root)}")
+
+    cmd = ["docker", "exec", container, "sh", "-c", _PG_DUMP_SCRIPT]
+    proc = None
+    stderr_chunks = []
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=_COPY_BUFSIZE)
+        # 单独读取 stderr，避免管道写满导致 pg_dump 阻塞
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+        stderr_reader.start()
+
+        total = 0
+        part = 0
+        digest = hashlib.sha256()
+        while True:
+            data = proc.stdout.read(BACKUP_PG_DUMP_PART_SIZE)
+            if not data and part:
+                break
+            info = tarfile.TarInfo(f"{arc_root}/part-{part:06d}")
+            info.size = len(data)
+            info.mode = 0o600
+            info.mtime = int(time.time())
+            with tar_lock:
+                tar.addfile(info, io.BytesIO(data))
+            digest.update(data)
+            total += len(data)
+            part += 1
+            if len(data) < BACKUP_PG_DUMP_PART_SIZE:
+                break
+
+        proc.wait()
+        stderr_reader.join()
+        if proc.returncode != 0:
+            details = b"".join(stderr_chunks).decode(errors="ignore").strip()
+            print(_('postgres_dump_failed', volume_name, subprocess.CalledProcessError(proc.returncode, cmd)),
+                  file=sys.stderr)
+            if details:
+                print(_('error_details', details), file=sys.stderr)
+            return False
+
+        with tar_lock:
+            add_json_member(tar, f"{arc_root}/{PG_DUMP_COMPLETE_NAME}",
+                            {"parts": part, "size": total, "sha256": digest.hexdigest()})
+        print(f"  - {_('postgres_dump_complete', volume_name, format_size(total), part)}")
+        return True
+
+    except (OSError, tarfile.TarError) as e:
+        print(_('postgres_dump_failed', volume_name, e), file=sys.stderr)
+        return False
+    finally:
+        if proc and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+def get_pending_dump_path(volume_name: str, pending_dir: Optional[str] = None) -> str:
+    """返回卷的待导入逻辑备份文件路径，pending_dir 默认为待导入目录的根目录。"""
+    return os.path.join(pending_dir or get_pending_restore_dir(), f"{volume_name}{PG_DUMP_SUFFIX}")
+
+
+class PostgresRestoreStream:
+    """将归档中的逻辑备份分段导入 Postgres。
+
+    有运行中的容器时，分段经 `docker exec -i` 写入容器内的临时文件
+    （pg_restore 的并行模式需要可随机访问的文件，不能从标准输入读取），结束时执行 `pg_restore -j`；
+    否则写入工具配置目录下的待导入文件。
+    两种情况都只在收到与已写入数据一致的完成标记后才执行导入或保存待导入文件。
+    """
+
+    def __init__(self, volume_name: str, container: Optional[str], require_complete: bool = True,
+                 pending_dir: Optional[str] = None):
+        """
+        Args:
+            volume_name (str): Postgres 数据卷名称。
+            container (str, optional): 使用该卷的运行中容器，None 表示保存为待导入文件。
+            require_complete (bool): 是否要求完成标记。导入已校验过的待导入文件时传入 False。
+            pending_dir (str, optional): 保存待导入文件的目录（通常为归档专用的子目录）。
+        """
+        self.volume_name = volume_name
+        self.container = container
+        self.require_complete = require_complete
+        self.pending_dir = pending_dir
+        self.completion: Optional[Dict] = None
+        self.bytes = 0
+        self.started = None
+        self.failed = False
+        self.pending_path = None
+        self._digest = hashlib.sha256()
+        self._remote_path = f"/tmp/na_restore_{volume_name}{PG_DUMP_SUFFIX}"
+        self._proc = None
+        self._file = None
+        self._tmp_path = None
+        self._stderr_chunks = []
+        self._stderr_reader = None
+
+    def start(self) -> bool:
+        """打开写入目标。"""
+        self.started = time.time()
+        try:
+            if self.container is None:
+                self.pending_path = get_pending_dump_path(self.volume_name, self.pending_dir)
+                self._tmp_path = f"{self.pending_path}.{os.getpid()}.tmp"
+                self._file = open(self._tmp_path, "wb")
+                return True
+            self._proc = subprocess.Popen(
+                ["docker", "exec", "-i", self.container, "sh", "-c", 'cat > "$1"', "sh", self._remote_path],
+                stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, bufsize=_COPY_BUFSIZE
+            )
+        except OSError as e:
+            print(_('postgres_restore_failed', self.volume_name, e), file=sys.stderr)
+            return False
+        self._stderr_reader = threading.Thread(
+            target=lambda: self._stderr_chunks.append(self._proc.stderr.read()), daemon=True
+        )
+        self._stderr_reader.start()
+        return True
+
+    def write(self, fileobj) -> None:
+        """写入一个分段的数据。"""
+        target = self._file or self._proc.stdin
+        try:
+            while True:
+                data = fileobj.read(_COPY_BUFSIZE)
+                if not data:
+                    break
+                target.write(data)
+                self._digest.update(data)
+                self.bytes += len(data)
+        except BrokenPipeError:
+            # 容器提前退出导致管道断开，具体错误在 finish() 中报告
+            self.failed = True
+
+    def set_completion(self, fileobj) -> None:
+        """读取归档中的完成标记。"""
+        try:
+            self.completion = json.loads(fileobj.read().decode("utf-8"))
+        except ValueError:
+            self.completion = None
+
+    def is_complete(self) -> bool:
+        """已写入的数据是否与完成标记记录的大小和 SHA-256 一致。"""
+        if not self.require_complete:
+            return True
+        return (isinstance(self.completion, dict) and self.completion.get("size") == self.bytes
+                and self.completion.get("sha256") == self._digest.hexdigest())
+
+    def finish(self) -> bool:
+        """结束写入，并在容器内执行 pg_restore。
+
+        Returns:
+            bool: 导入成功（或已保存为待导入文件）返回 True，失败返回 False。
+        """
+        if self._file is None and self._proc is None:
+            # start() 失败，错误已报告
+            return False
+        if self._file:
+            self._file.close()
+            if not self.failed and not self.is_complete():
+                print(_('postgres_dump_incomplete', self.volume_name), file=sys.stderr)
+                self.failed = True
+            if self.failed:
+                os.remove(self._tmp_path)
+                return False
+            os.replace(self._tmp_path, self.pending_path)
+            print(f"  - {_('postgres_restore_pending', self.volume_name, self.pending_path)}")
+            return True
+
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        returncode = self._proc.wait()
+        self._stderr_reader.join()
+        if returncode != 0 or self.failed:
+            details = b"".join(self._stderr_chunks).decode(errors="ignore").strip()
+            print(_('postgres_restore_failed', self.volume_name,
+                    subprocess.CalledProcessError(returncode, self._proc.args)), file=sys.stderr)
+            if details:
+                print(_('error_details', details), file=sys.stderr)
+            self._remove_remote_file()
+            return False
+        if not self.is_complete():
+            print(_('postgres_dump_incomplete', self.volume_name), file=sys.stderr)
+            self._remove_remote_file()
+            return False
+
+        jobs = BACKUP_PG_RESTORE_JOBS or os.cpu_count() or 1
+        print(f"  - {_('restoring_postgres_dump', self.volume_name, self.container, jobs)}")
+        cmd = ["docker", "exec", self.container, "sh", "-c", _PG_RESTORE_SCRIPT, "sh", str(jobs), self._remote_path]
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            print(_('postgres_restore_failed', self.volume_name,
+                    subprocess.CalledProcessError(result.returncode, cmd)), file=sys.stderr)
+            details = result.stderr.decode(errors="ignore").strip()
+            if details:
+                print(_('error_details', details), file=sys.stderr)
+            return False
+        print(f"  - {_('postgres_restore_complete', self.volume_name)}")
+        return True
+
+    def _remove_remote_file(self) -> None:
+        """删除容器内的临时文件。"""
+        subprocess.run(["docker", "exec", self.container, "rm", "-f", self._remote_path],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def abort(self) -> None:
+        """中止导入，丢弃已写入的数据（包括容器内的临时文件）。"""
+        if self._file:
+            self._file.close()
+            if os.path.exists(self._tmp_path):
+                os.remove(self._tmp_path)
+        elif self._proc:
+            if self._proc.poll() is None:
+                self._proc.kill()
+                self._proc.wait()
+            self._remove_remote_file()
+
+
+def _wait_for_postgres_container(volume_name: str, timeout: float) -> Optional[str]:
+    """等待使用该卷的 Postgres 容器就绪，超时返回 None。"""
+    deadline = time.time() + timeout
+    while True:
+        container = find_postgres_container(volume_name)
+        if container or time.time() >= deadline:
+            return container
+        time.sleep(2)
+
+
+def restore_pending_postgres_dumps(archive_path: str) -> bool:
+    """导入恢复该归档时因服务未运行而保存的逻辑备份（在安装并启动服务后调用）。
+
+    导入成功的文件会被删除；容器在 BACKUP_SERVICE_READY_TIMEOUT 内未就绪或导入失败时保留文件。
+
+    Args:
+        archive_path (str): 本次恢复的备份归档，只导入由它产生的待导入文件。
+
+    Returns:
+        bool: 没有待导入的文件或全部导入成功返回 True。
+    """
+    pending_dir = get_pending_restore_dir(archive_path)
+    ok = True
+    for filename in sorted(os.listdir(pending_dir)):
+        if not filename.endswith(PG_DUMP_SUFFIX):
+            continue
+        volume_name = filename[:-len(PG_DUMP_SUFFIX)]
+        path = os.path.join(pending_dir, filename)
+        print(_('applying_pending_postgres_restore', volume_name))
+        print(f"  - {_('waiting_for_postgres_container', volume_name)}")
+        container = _wait_for_postgres_container(volume_name, BACKUP_SERVICE_READY_TIMEOUT)
+        if container is None:
+            print(_('postgres_container_not_ready', volume_name, BACKUP_SERVICE_READY_TIMEOUT, path), file=sys.stderr)
+            ok = False
+            continue
+        # 待导入文件只在完成标记校验通过后才会保存
+        stream = PostgresRestoreStream(volume_name, container, require_complete=False)
+        if not stream.start():
+            ok = False
+            continue
+        with open(path, "rb") as f:
+            stream.write(f)
+        if stream.finish():
+            os.remove(path)
+        else:
+            ok = False
+    if not os.listdir(pending_dir):
+        os.rmdir(pending_dir)
+    return ok
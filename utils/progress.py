@@ -0,0 +1,193 @@
+"""
+长时间备份与恢复操作的进度显示。
+
+进度由后台线程定时读取字节计数器并输出，数据流的读写路径上没有任何额外开销：
+- 终端中在 stderr 上绘制单行进度条（百分比、已处理 / 总量、速率、剩余时间），
+  期间其他输出会先清除进度条再打印，不会与进度条混在同一行；
+- 显式选择 json 时定期输出一行 JSON，便于机器解析；auto 模式下非终端（如 cron 任务或重定向到日志）不输出进度。
+总量可以是估计值，也可以稍后再设置（例如后台估算卷大小完成后），未知时只显示已处理的数据量和速率。
+"""
+import json
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+from utils.helpers import format_size
+from conf.backup_settings import BACKUP_PROGRESS_MODE, BACKUP_PROGRESS_BAR_INTERVAL, BACKUP_PROGRESS_JSON_INTERVAL
+
+# 可选的进度显示方式
+PROGRESS_MODES = ["auto", "bar", "json", "off"]
+
+# 进度条的宽度（字符数）
+_BAR_WIDTH = 24
+
+
+def _format_eta(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    return f"{hours}:{rest // 60:02d}:{rest % 60:02d}" if hours else f"{rest // 60:02d}:{rest % 60:02d}"
+
+
+class _BarAwareStream:
+    """进度条显示期间替换 sys.stdout / sys.stderr 的包装，写入前先清除进度条所在的行。"""
+
+    def __init__(self, target, progress: "ProgressReporter"):
+        self._target = target
+        self._progress = progress
+
+    def write(self, data) -> int:
+        with self._progress._lock:
+            self._progress._clear_bar()
+            if data:
+                self._progress._line_open = not data.endswith("\n")
+            return self._target.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+class ProgressReporter:
+    """按固定间隔输出一个字节计数器的进度。
+
+    用法::
+
+        with ProgressReporter("backup", lambda: stream.bytes, total) as progress:
+            ...  # 处理数据，可随时调用 progress.set_total() / progress.track()
+    """
+
+    def __init__(self, operation: str, get_done: Optional[Callable[[], int]] = None,
+                 total: Optional[int] = None, mode: Optional[str] = None, label: Optional[str] = None):
+        """
+        Args:
+            operation (str): 操作名称，写入 JSON 进度行。
+            get_done (Callable[[], int], optional): 返回已处理字节数的函数，由后台线程调用，
+                也可以稍后通过 track() 设置。
+            total (int, optional): 总字节数（可为估计值），None 表示未知。
+            mode (str, optional): 显示方式 auto/bar/json/off，None 表示使用配置默认值。
+            label (str, optional): 进度条前显示的文字，默认为 operation。
+        """
+        mode = mode or BACKUP_PROGRESS_MODE
+        if mode == "auto":
+            mode = "bar" if sys.stderr.isatty() else "off"
+        self.operation = operation
+        self.mode = mode
+        self.label = label or operation
+        self.total = total
+        self._get_done = get_done
+        self._done = 0
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+        self._bar_visible = False
+        self._line_open = False
+        self._stdout = None
+        self._stderr = None
+
+    def set_total(self, total: Optional[int]) -> None:
+        """更新总字节数（可在任意线程调用）。"""
+        self.total = total
+
+    def track(self, get_done: Callable[[], int], total: Optional[int] = None) -> None:
+        """更换字节计数器和总字节数，例如打开归档后改为跟踪归档文件的读取位置。"""
+        self._get_done = get_done
+        self.total = total
+
+    def __enter__(self) -> "ProgressReporter":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop(ok=exc_type is None)
+
+    def start(self) -> None:
+        if self.mode == "off" or self._thread is not None:
+            return
+        self._started = time.monotonic()
+        if self.mode == "bar":
+            self._stdout, self._stderr = sys.stdout, sys.stderr
+            sys.stdout = _BarAwareStream(self._stdout, self)
+            sys.stderr = _BarAwareStream(self._stderr, self)
+        interval = BACKUP_PROGRESS_BAR_INTERVAL if self.mode == "bar" else BACKUP_PROGRESS_JSON_INTERVAL
+        self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True)
+        self._thread.start()
+
+    def stop(self, ok: bool = True) -> None:
+        """停止后台线程，输出最后一次进度。"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if self.mode == "bar":
+            with self._lock:
+                self._clear_bar()
+                sys.stdout, sys.stderr = self._stdout, self._stderr
+        else:
+            self._emit_json("finished" if ok else "failed")
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            if self.mode == "bar":
+                self._draw_bar()
+            else:
+                self._emit_json("progress")
+
+    def _snapshot(self):
+        try:
+            if self._get_done is not None:
+                self._done = self._get_done()
+        except (OSError, ValueError):
+            # 被跟踪的文件已关闭，沿用最后一次的值
+            pass
+        done = self._done
+        elapsed = max(time.monotonic() - self._started, 1e-6)
+        rate = done / elapsed
+        total = self.total
+        percent = eta = None
+        if total:
+            # 总量是估计值，超过时不显示 100% 以上或负的剩余时间
+            percent = min(done / total * 100, 99.9)
+            eta = (total - done) / rate if rate > 0 and done < total else None
+        return done, total, percent, rate, eta, elapsed
+
+    def _clear_bar(self) -> None:
+        if self._bar_visible:
+            self._stderr.write("\r\033[K")
+            self._stderr.flush()
+            self._bar_visible = False
+
+    def _draw_bar(self) -> None:
+        done, total, percent, rate, eta, _elapsed = self._snapshot()
+        if percent is not None:
+            filled = int(_BAR_WIDTH * percent / 100)
+            line = (f"{self.label} [{'#' * filled}{'-' * (_BAR_WIDTH - filled)}] {percent:5.1f}%  "
+                    f"{format_size(done)} / {format_size(total)}  {format_size(rate)}/s  ETA {_format_eta(eta)}")
+        else:
+            line = f"{self.label}  {format_size(done)}  {format_size(rate)}/s"
+        with self._lock:
+            if self._line_open:
+                # 其他输出的一行尚未结束，等它结束后再绘制
+                return
+            self._stderr.write(f"\r\033[K{line}")
+            self._stderr.flush()
+            self._bar_visible = True
+
+    def _emit_json(self, event: str) -> None:
+        done, total, percent, rate, eta, elapsed = self._snapshot()
+        if event == "finished":
+            percent, eta = 100.0, 0
+        record = {
+            "event": event,
+            "operation": self.operation,
+            "bytes": done,
+            "total": total,
+            "percent": round(percent, 1) if percent is not None else None,
+            "rate": round(rate, 1),
+            "eta": round(eta, 1) if eta is not None else None,
+            "elapsed": round(elapsed, 1),
+        }
+        print(json.dumps(record), file=sys.stderr, flush=True)
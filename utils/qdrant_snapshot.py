@@ -0,0 +1,372 @@
+"""
+Qdrant 数据卷的快照备份与恢复。
+
+直接复制 Qdrant 数据卷会读到正在被修改的段文件。服务运行时，备份改为通过 Qdrant HTTP API
+为每个集合创建快照，并将快照文件从响应流直接写入归档（volumes/<卷名>.qdrant/<集合>.snapshot），
+写入后删除服务端的快照；恢复时快照先写入暂存目录，整个归档校验通过后才以快照上传接口逐个导入。
+
+API 密钥读取自数据目录 .env 中的 QDRANT_API_KEY。服务地址默认取使用该卷的运行中容器的 IP
+（Linux 上可从宿主机直接访问），也可通过 BACKUP_QDRANT_URL 指定。
+恢复时服务未运行，快照先保存到工具配置目录，服务启动后由 restore_pending_qdrant_snapshots() 导入。
+"""
+import http.client
+import json
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from utils.helpers import format_size, get_env_value, get_pending_restore_dir
+from utils.i18n import get_message as _
+from utils.docker_helpers import get_container_addresses, list_running_containers
+from utils.backup_manifest import VolumeBackupError
+from conf.backup_settings import (
+    BACKUP_QDRANT_SNAPSHOT, BACKUP_QDRANT_VOLUME_SUFFIXES, BACKUP_QDRANT_URL, BACKUP_QDRANT_PORT,
+    BACKUP_SERVICE_READY_TIMEOUT
+)
+
+# 归档中快照目录名的后缀：volumes/<卷名>.qdrant/<集合>.snapshot
+QDRANT_SNAPSHOT_SUFFIX = ".qdrant"
+
+# 单个快照文件的后缀
+_SNAPSHOT_FILE_SUFFIX = ".snapshot"
+
+# 普通 API 请求的超时时间（秒）；创建快照和上传快照不设超时
+_API_TIMEOUT = 10
+
+# 读写快照数据流时使用的块大小
+_COPY_BUFSIZE = 1024 * 1024
+
+
+class QdrantError(OSError):
+    """Qdrant API 请求失败。"""
+
+
+class QdrantClient:
+    """Qdrant HTTP API 的最小客户端，只实现快照相关的接口。"""
+
+    def __init__(self, url: str, api_key: str = ""):
+        """
+        Args:
+            url (str): 服务地址，如 http://172.18.0.3:6333。
+            api_key (str): API 密钥，为空时不发送。
+        """
+        self.url = url.rstrip("/")
+        self.api_key = api_key
+
+    def _open(self, method: str, path: str, body=None, headers: Optional[Dict[str, str]] = None,
+              timeout: Optional[float] = _API_TIMEOUT):
+        request = urllib.request.Request(f"{self.url}{path}", data=body, method=method, headers=dict(headers or {}))
+        if self.api_key:
+            request.add_header("api-key", self.api_key)
+        try:
+            return urllib.request.urlopen(request, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            detail = e.read().decode("utf-8", errors="ignore").strip()
+            raise QdrantError(f"HTTP {e.code} {method} {path}: {detail or e.reason}")
+        except urllib.error.URLError as e:
+            raise QdrantError(f"{method} {path}: {e.reason}")
+
+    def _json(self, method: str, path: str, timeout: Optional[float] = _API_TIMEOUT):
+        with self._open(method, path, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8")).get("result")
+
+    def list_collections(self) -> List[str]:
+        """返回所有集合的名称。"""
+        return sorted(c["name"] for c in (self._json("GET", "/collections") or {}).get("collections", []))
+
+    def create_snapshot(self, collection: str) -> Dict:
+        """为集合创建快照并等待完成，返回快照信息（name、size 等）。"""
+        return self._json("POST", f"/collections/{quote(collection, safe='')}/snapshots?wait=true", timeout=None)
+
+    def open_snapshot(self, collection: str, snapshot: str):
+        """以数据流形式下载快照文件（调用方负责关闭）。"""
+        return self._open("GET", f"/collections/{quote(collection, safe='')}/snapshots/{quote(snapshot, safe='')}",
+                          timeout=None)
+
+    def delete_snapshot(self, collection: str, snapshot: str) -> None:
+        """删除服务端的快照文件。"""
+        self._json("DELETE", f"/collections/{quote(collection, safe='')}/snapshots/{quote(snapshot, safe='')}")
+
+    def upload_snapshot(self, collection: str, fileobj, size: int) -> None:
+        """以 multipart 表单上传快照恢复集合（集合不存在时自动创建），数据从 fileobj 流式读取。
+
+        Args:
+            collection (str): 集合名称。
+            fileobj: 快照数据流。
+            size (int): 快照大小，用于计算 Content-Length。
+        """
+        boundary = uuid.uuid4().hex
+        head = (f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="snapshot"; filename="{collection}{_SNAPSHOT_FILE_SUFFIX}"\r\n'
+                "Content-Type: application/octet-stream\r\n\r\n").encode("utf-8")
+        tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+        def _body():
+            yield head
+            while True:
+                data = fileobj.read(_COPY_BUFSIZE)
+                if not data:
+                    break
+                yield data
+            yield tail
+
+        headers = {
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(len(head) + size + len(tail)),
+        }
+        path = f"/collections/{quote(collection, safe='')}/snapshots/upload?priority=snapshot&wait=true"
+        with self._open("POST", path, body=_body(), headers=headers, timeout=None) as response:
+            response.read()
+
+
+def is_qdrant_volume(volume_name: str) -> bool:
+    """判断卷是否为 Qdrant 数据卷。"""
+    return any(volume_name.endswith(suffix) for suffix in BACKUP_QDRANT_VOLUME_SUFFIXES)
+
+
+def find_qdrant_client(volume_name: str, env_path: str) -> Optional[QdrantClient]:
+    """返回可访问的、使用该卷的 Qdrant 服务客户端，找不到时返回 None。
+
+    Args:
+        volume_name (str): Qdrant 数据卷名称。
+        env_path (str): 读取 QDRANT_API_KEY 的 .env 文件路径。
+    """
+    api_key = get_env_value(env_path, "QDRANT_API_KEY")
+    if BACKUP_QDRANT_URL:
+        urls = [BACKUP_QDRANT_URL]
+    else:
+        urls = [f"http://{address}:{BACKUP_QDRANT_PORT}"
+                for container in list_running_containers(volume_name)
+                for address in get_container_addresses(container)]
+    for url in urls:
+        client = QdrantClient(url, api_key)
+        try:
+            client.list_collections()
+        except (QdrantError, OSError, ValueError):
+            continue
+        return client
+    return None
+
+
+def find_qdrant_clients(volume_names: List[str], env_path: str) -> Dict[str, QdrantClient]:
+    """为可以快照备份的 Qdrant 卷查找运行中的服务。
+
+    Args:
+        volume_names (list[str]): 待备份的卷名称。
+        env_path (str): 读取 QDRANT_API_KEY 的 .env 文件路径。
+
+    Returns:
+        dict[str, QdrantClient]: 卷名到服务客户端的映射，未启用快照备份或服务不可访问的卷不包含在内。
+    """
+    if not BACKUP_QDRANT_SNAPSHOT:
+        return {}
+    clients = {}
+    for name in volume_names:
+        if not is_qdrant_volume(name):
+            continue
+        client = find_qdrant_client(name, env_path)
+        if client:
+            clients[name] = client
+            print(f"  - {_('qdrant_service_found', name, client.url)}")
+    return clients
+
+
+def stream_qdrant_snapshots_into_archive(volume_name: str, client: QdrantClient, tar: tarfile.TarFile,
+                                         tar_lock: Optional[threading.Lock] = None) -> bool:
+    """为每个集合创建快照，并将快照文件直接写入主归档。
+
+    Args:
+        volume_name (str): Qdrant 数据卷名称。
+        client (QdrantClient): 使用该卷的服务客户端。
+        tar (tarfile.TarFile): 以写模式打开的主归档。
+        tar_lock (threading.Lock, optional): 多个卷并发写入同一归档时使用的锁。
+
+    快照以响应的 Content-Length 作为成员大小直接从响应流写入；响应没有 Content-Length 时
+    先写入临时文件以得到准确的大小。
+
+    Returns:
+        bool: 全部集合备份成功返回 True；尚未写入快照数据就失败时返回 False。
+
+    Raises:
+        VolumeBackupError: 快照成员的头部写入后响应中断，归档已无法对齐。
+    """
+    arc_root = f"volumes/{volume_name}{QDRANT_SNAPSHOT_SUFFIX}"
+    tar_lock = tar_lock or threading.Lock()
+    print(f"  - {_('streaming_qdrant_snapshots', volume_name, client.url, arc_root)}")
+
+    try:
+        collections = client.list_collections()
+    except (QdrantError, OSError, ValueError) as e:
+        print(_('qdrant_snapshot_failed', volume_name, e), file=sys.stderr)
+        return False
+
+    total = 0
+    for collection in collections:
+        snapshot = None
+        written = False
+        try:
+            snapshot = client.create_snapshot(collection)
+            with client.open_snapshot(collection, snapshot["name"]) as response, \
+                    tempfile.TemporaryFile() as spool:
+                info = tarfile.TarInfo(f"{arc_root}/{collection}{_SNAPSHOT_FILE_SUFFIX}")
+                info.mode = 0o600
+                info.mtime = int(time.time())
+                source = response
+                if response.headers.get("Content-Length") is not None:
+                    info.size = int(response.headers["Content-Length"])
+                else:
+                    shutil.copyfileobj(response, spool, _COPY_BUFSIZE)
+                    info.size = spool.tell()
+                    spool.seek(0)
+                    source = spool
+                with tar_lock:
+                    written = True
+                    tar.addfile(info, source)
+            total += info.size
+            print(f"  - {_('qdrant_snapshot_collection_done', collection, format_size(info.size))}")
+        except (QdrantError, OSError, ValueError, KeyError, tarfile.TarError, http.client.HTTPException) as e:
+            print(_('qdrant_snapshot_failed', f"{volume_name}/{collection}", e), file=sys.stderr)
+            if written:
+                raise VolumeBackupError(_('error_volume_backup_incomplete', volume_name)) from e
+            return False
+        finally:
+            if snapshot:
+                try:
+                    client.delete_snapshot(collection, snapshot["name"])
+                except (QdrantError, OSError):
+                    pass
+
+    print(f"  - {_('qdrant_snapshot_complete', volume_name, len(collections), format_size(total))}")
+    return True
+
+
+class QdrantRestoreStream:
+    """将归档中的集合快照导入 Qdrant。
+
+    快照先从归档流写入工具配置目录下的暂存目录，整个归档校验通过后才调用 finish()：
+    有可访问的服务时逐个上传，否则将暂存目录重命名为待导入目录。归档校验失败时调用 abort() 删除暂存目录，
+    损坏或不完整的快照不会被导入服务，也不会留作待导入文件。
+    """
+
+    def __init__(self, volume_name: str, client: Optional[QdrantClient], pending_root: Optional[str] = None):
+        """
+        Args:
+            volume_name (str): Qdrant 数据卷名称。
+            client (QdrantClient, optional): 使用该卷的服务客户端，None 表示保存为待导入文件。
+            pending_root (str, optional): 保存待导入文件的目录（通常为归档专用的子目录）。
+        """
+        self.volume_name = volume_name
+        self.client = client
+        self.bytes = 0
+        self.started = time.time()
+        self.failed = False
+        self._pending_root = pending_root or get_pending_restore_dir()
+        self.pending_dir = None
+        if client is None:
+            self.pending_dir = os.path.join(self._pending_root, f"{volume_name}{QDRANT_SNAPSHOT_SUFFIX}")
+        self._staging_dir = None
+
+    def add_snapshot(self, collection: str, fileobj, size: int) -> None:
+        """将一个集合的快照写入暂存目录。"""
+        if self._staging_dir is None:
+            self._staging_dir = tempfile.mkdtemp(prefix=f".{self.volume_name}.", dir=self._pending_root)
+        path = os.path.join(self._staging_dir, f"{collection}{_SNAPSHOT_FILE_SUFFIX}")
+        with open(path, "wb") as f:
+            shutil.copyfileobj(fileobj, f, _COPY_BUFSIZE)
+        self.bytes += size
+
+    def finish(self) -> bool:
+        """归档校验通过后导入暂存的快照（或保存为待导入文件）。
+
+        Returns:
+            bool: 全部快照导入成功（或已保存为待导入文件）返回 True。
+        """
+        if self.client is None:
+            # 替换之前未导入的快照，避免与本次恢复的集合混在一起
+            shutil.rmtree(self.pending_dir, ignore_errors=True)
+            if self._staging_dir is not None:
+                os.replace(self._staging_dir, self.pending_dir)
+                self._staging_dir = None
+            print(f"  - {_('qdrant_restore_pending', self.volume_name, self.pending_dir)}")
+            return True
+        ok = self._staging_dir is None or _upload_snapshot_dir(self.volume_name, self.client, self._staging_dir)
+        self.abort()
+        if not ok:
+            self.failed = True
+            return False
+        print(f"  - {_('qdrant_restore_complete', self.volume_name)}")
+        return True
+
+    def abort(self) -> None:
+        """删除暂存的快照。"""
+        if self._staging_dir is not None:
+            shutil.rmtree(self._staging_dir, ignore_errors=True)
+            self._staging_dir = None
+
+
+def _upload_snapshot_dir(volume_name: str, client: QdrantClient, directory: str) -> bool:
+    """按集合名称顺序上传目录中的快照文件，上传成功的文件被删除；遇到失败时停止并返回 False。"""
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(_SNAPSHOT_FILE_SUFFIX):
+            continue
+        collection = filename[:-len(_SNAPSHOT_FILE_SUFFIX)]
+        path = os.path.join(directory, filename)
+        size = os.path.getsize(path)
+        print(f"  - {_('restoring_qdrant_collection', collection, format_size(size))}")
+        try:
+            with open(path, "rb") as f:
+                client.upload_snapshot(collection, f, size)
+        except (QdrantError, OSError) as e:
+            print(_('qdrant_restore_failed', f"{volume_name}/{collection}", e), file=sys.stderr)
+            return False
+        os.remove(path)
+    return True
+
+
+def restore_pending_qdrant_snapshots(data_dir: str, archive_path: str) -> bool:
+    """导入恢复该归档时因服务未运行而保存的集合快照（在安装并启动服务后调用）。
+
+    导入成功的快照会被删除；服务在超时时间内不可访问或导入失败时保留文件。
+
+    Args:
+        data_dir (str): 数据目录，从其中的 .env 读取 QDRANT_API_KEY。
+        archive_path (str): 本次恢复的备份归档，只导入由它产生的快照。
+
+    Returns:
+        bool: 没有待导入的快照或全部导入成功返回 True。
+    """
+    pending_root = get_pending_restore_dir(archive_path)
+    ok = True
+    for dirname in sorted(os.listdir(pending_root)):
+        pending_dir = os.path.join(pending_root, dirname)
+        if not dirname.endswith(QDRANT_SNAPSHOT_SUFFIX) or not os.path.isdir(pending_dir):
+            continue
+        volume_name = dirname[:-len(QDRANT_SNAPSHOT_SUFFIX)]
+        print(_('applying_pending_qdrant_restore', volume_name))
+        print(f"  - {_('waiting_for_qdrant_service', volume_name)}")
+        deadline = time.time() + BACKUP_SERVICE_READY_TIMEOUT
+        client = find_qdrant_client(volume_name, os.path.join(data_dir, ".env"))
+        while client is None and time.time() < deadline:
+            time.sleep(2)
+            client = find_qdrant_client(volume_name, os.path.join(data_dir, ".env"))
+        if client is None:
+            print(_('qdrant_service_not_ready', volume_name, BACKUP_SERVICE_READY_TIMEOUT, pending_dir), file=sys.stderr)
+            ok = False
+            continue
+        if _upload_snapshot_dir(volume_name, client, pending_dir):
+            print(f"  - {_('qdrant_restore_complete', volume_name)}")
+            shutil.rmtree(pending_dir, ignore_errors=True)
+        else:
+            ok = False
+    if not os.listdir(pending_root):
+        os.rmdir(pending_root)
+    return ok
@@ -0,0 +1,374 @@
+"""
+Docker Hub 镜像源测速与排序。
+
+拉取 Docker Hub 上的镜像前，并发探测官方 registry 和 conf/docker_mirrors.py 中配置的所有镜像源：
+先请求 /v2/ 测量延迟，再查询该镜像的 manifest 是否存在（需要认证时按 WWW-Authenticate 获取匿名令牌）。
+结果按“manifest 可用 > 可达但无法确认 > 不可用”分组、组内按延迟排序，拉取时从最快的可用源开始依次回退，
+不再逐个等待慢速或失效的镜像源超时。
+
+测速结果保存在工具配置目录下的缓存文件中：每个 registry 记录最近几次的延迟（取中位数）和最近一次失败。
+有效期内可用的 registry 直接使用缓存的延迟，不再探测；失败的 registry 按指数退避跳过，
+退避期满后才重新探测，因此反复执行的命令和定时任务不会每次都等待网络探测。
+
+镜像源可以写作 host、host:port，也可以带 http:// 或 https:// 前缀（例如指向本地测试用的 registry），
+未写协议时使用 https。
+"""
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from utils.helpers import get_toolkit_config_dir
+from conf.docker_mirrors import (
+    DOCKER_MIRRORS, DOCKER_OFFICIAL_REGISTRY, DOCKER_MIRROR_PROBE_TIMEOUT, DOCKER_MIRROR_PROBE_DEADLINE,
+    DOCKER_MIRROR_CACHE_NAME, DOCKER_MIRROR_CACHE_TTL, DOCKER_MIRROR_BACKOFF_BASE, DOCKER_MIRROR_BACKOFF_MAX,
+    DOCKER_MIRROR_LATENCY_SAMPLES
+)
+
+# 查询 manifest 时接受的格式（多架构索引优先，与 docker pull 一致）
+_MANIFEST_ACCEPT = ", ".join([
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+    "application/vnd.oci.image.manifest.v1+json",
+    "application/vnd.docker.distribution.manifest.v2+json",
+])
+
+
+class ProbeResult:
+    """单个 registry 的探测结果。
+
+    Attributes:
+        registry (str): 配置中的 registry 地址。
+        host (str): 不含协议的主机名（及端口），用于拼接镜像引用。
+        latency (float, optional): /v2/ 请求的往返时间（秒），不可达时为 None。
+        manifest (bool, optional): 镜像的 manifest 是否存在，无法确认（如被限流）或未探测时为 None。
+        error (str, optional): 不可达或查询失败的原因。
+        digest (str, optional): manifest 的摘要（Docker-Content-Digest），未探测或 registry 未返回时为 None。
+        cached (bool): 结果来自健康状态缓存，本次未探测。
+        retry_after (float, optional): 处于失败退避中时，下次探测的时间戳。
+    """
+
+    def __init__(self, registry: str):
+        self.registry = registry
+        self.base_url, self.host = _split_registry(registry)
+        self.latency: Optional[float] = None
+        self.manifest: Optional[bool] = None
+        self.error: Optional[str] = None
+        self.digest: Optional[str] = None
+        self.cached = False
+        self.retry_after: Optional[float] = None
+
+    @property
+    def is_official(self) -> bool:
+        return self.registry == DOCKER_OFFICIAL_REGISTRY
+
+    @property
+    def healthy(self) -> bool:
+        """registry 可达，且没有明确报告镜像不存在。"""
+        return self.latency is not None and self.manifest is not False
+
+    def sort_key(self) -> Tuple[int, float]:
+        if not self.healthy:
+            return 2, 0.0
+        # 确认了 manifest 或来自缓存的排在前面，可达但查询出错（如被限流）的排在后面
+        return (0 if self.error is None else 1), self.latency
+
+
+def _split_registry(registry: str) -> Tuple[str, str]:
+    """返回 registry 的 (基础 URL, 主机名)。"""
+    registry = registry.rstrip("/")
+    for scheme in ("http://", "https://"):
+        if registry.startswith(scheme):
+            return registry, registry[len(scheme):]
+    return f"https://{registry}", registry
+
+
+def _request(url: str, method: str = "GET", headers: Optional[Dict[str, str]] = None,
+             timeout: float = DOCKER_MIRROR_PROBE_TIMEOUT):
+    """发送 HTTP 请求，返回 (状态码, 响应头, 响应体)，错误状态码不抛出异常。
+
+    Raises:
+        OSError: 网络错误或超时。
+    """
+    request = urllib.request.Request(url, method=method, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, response.headers, response.read() if method != "HEAD" else b""
+    except urllib.error.HTTPError as e:
+        with e:
+            return e.code, e.headers, b""
+
+
+def _parse_challenge(header: str) -> Dict[str, str]:
+    """解析 WWW-Authenticate: Bearer realm="...",service="...",scope="..." 的参数。"""
+    if not header or not header.lower().startswith("bearer "):
+        return {}
+    params = {}
+    for part in header[len("bearer "):].split(","):
+        key, sep, value = part.strip().partition("=")
+        if sep:
+            params[key.lower()] = value.strip('"')
+    return params
+
+
+def _fetch_token(challenge: Dict[str, str], repo: str, timeout: float) -> Optional[str]:
+    """按认证质询获取拉取该仓库的匿名令牌，失败时返回 None。"""
+    realm = challenge.get("realm")
+    if not realm:
+        return None
+    params = {"scope": f"repository:{repo}:pull"}
+    if challenge.get("service"):
+        params["service"] = challenge["service"]
+    separator = "&" if "?" in realm else "?"
+    try:
+        status, _headers, body = _request(f"{realm}{separator}{urlencode(params)}", timeout=timeout)
+        if status != 200:
+            return None
+        data = json.loads(body.decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data.get("token") or data.get("access_token")
+
+
+def _head_manifest(base_url: str, repo: str, reference: str, timeout: float):
+    """查询 manifest，需要认证时获取匿名令牌后重试，返回 (状态码, 响应头)。
+
+    Raises:
+        OSError: 网络错误或超时。
+    """
+    url = f"{base_url}/v2/{repo}/manifests/{reference}"
+    headers = {"Accept": _MANIFEST_ACCEPT}
+    status, response_headers, _body = _request(url, method="HEAD", headers=headers, timeout=timeout)
+    if status == 401:
+        token = _fetch_token(_parse_challenge(response_headers.get("WWW-Authenticate", "")), repo, timeout)
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+            status, response_headers, _body = _request(url, method="HEAD", headers=headers, timeout=timeout)
+    return status, response_headers
+
+
+def fetch_manifest_digest(registry: str, repo: str, reference: str,
+                          timeout: float = DOCKER_MIRROR_PROBE_TIMEOUT) -> Optional[str]:
+    """返回 registry 上镜像 manifest 的摘要（多架构镜像为索引的摘要，与 RepoDigests 一致）。
+
+    Args:
+        registry (str): registry 地址。
+        repo (str): 仓库名，Docker Hub 官方镜像需带 library/ 前缀。
+        reference (str): 标签。
+        timeout (float): 单个请求的超时时间（秒）。
+
+    Returns:
+        str | None: 形如 sha256:... 的摘要，镜像不存在、registry 不可达或未返回摘要时为 None。
+    """
+    base_url, _host = _split_registry(registry)
+    try:
+        status, headers = _head_manifest(base_url, repo, reference, timeout)
+    except OSError:
+        return None
+    return headers.get("Docker-Content-Digest") if status == 200 else None
+
+
+def probe_registry(registry: str, repo: str, reference: str,
+                   timeout: float = DOCKER_MIRROR_PROBE_TIMEOUT) -> ProbeResult:
+    """测量 registry 的延迟并检查镜像的 manifest 是否存在。
+
+    Args:
+        registry (str): registry 地址。
+        repo (str): 仓库名，Docker Hub 官方镜像需带 library/ 前缀。
+        reference (str): 标签或摘要。
+        timeout (float): 单个请求的超时时间（秒）。
+
+    Returns:
+        ProbeResult: 探测结果。
+    """
+    result = ProbeResult(registry)
+    started = time.monotonic()
+    try:
+        status, _headers, _body = _request(f"{result.base_url}/v2/", timeout=timeout)
+    except OSError as e:
+        result.error = str(getattr(e, "reason", None) or e)
+        return result
+    if status >= 500:
+        result.error = f"HTTP {status}"
+        return result
+    result.latency = time.monotonic() - started
+
+    try:
+        status, headers = _head_manifest(result.base_url, repo, reference, timeout)
+    except OSError as e:
+        result.error = str(getattr(e, "reason", None) or e)
+        return result
+    if status == 200:
+        result.manifest = True
+        result.digest = headers.get("Docker-Content-Digest")
+    elif status == 404:
+        result.manifest = False
+    else:
+        # 被限流或需要登录等情况，无法确认镜像是否存在，仍可尝试拉取
+        result.error = f"HTTP {status}"
+    return result
+
+
+class RegistryHealthCache:
+    """保存在磁盘上的 registry 健康状态缓存。
+
+    每个 registry 一条记录：最近几次测速的延迟、最近一次成功探测的时间、连续失败次数、
+    最近一次失败的时间和原因、退避结束的时间，以及有效期内查询过但不存在的镜像。文件损坏或无法读取时视为空缓存，
+    写入失败时忽略（缓存只用于加速）。
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path (str, optional): 缓存文件路径，默认为工具配置目录下的 DOCKER_MIRROR_CACHE_NAME。
+        """
+        self.path = path or os.path.join(get_toolkit_config_dir(), DOCKER_MIRROR_CACHE_NAME)
+        self._entries: Dict[str, Dict] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f).get("registries", {})
+            if isinstance(entries, dict):
+                self._entries = entries
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def _entry(self, registry: str) -> Dict:
+        return self._entries.setdefault(registry, {})
+
+    def lookup(self, registry: str, image: Optional[str] = None,
+               now: Optional[float] = None) -> Optional[ProbeResult]:
+        """返回仍然有效的缓存结果，需要重新探测时返回 None。
+
+        处于失败退避中的 registry 返回不可用的结果；最近一次探测成功且未超过有效期的返回缓存的延迟中位数，
+        该 registry 在有效期内报告过 image（"仓库:标签"）不存在时结果标记为镜像不存在。
+        """
+        now = time.time() if now is None else now
+        entry = self._entries.get(registry)
+        if not entry:
+            return None
+        result = ProbeResult(registry)
+        result.cached = True
+        if entry.get("failures") and entry.get("retry_after", 0) > now:
+            result.error = entry.get("last_error") or "unreachable"
+            result.retry_after = entry["retry_after"]
+            return result
+        latencies = entry.get("latencies") or []
+        if entry.get("failures") or not latencies or now - entry.get("checked", 0) > DOCKER_MIRROR_CACHE_TTL:
+            return None
+        result.latency = statistics.median(latencies)
+        if image and now - entry.get("missing", {}).get(image, 0) <= DOCKER_MIRROR_CACHE_TTL:
+            result.manifest = False
+        return result
+
+    def record(self, result: ProbeResult, image: Optional[str] = None, now: Optional[float] = None) -> None:
+        """记录一次探测结果。镜像不存在（404）不算 registry 故障，只记录在该 registry 的 missing 中。"""
+        if result.cached:
+            return
+        if result.latency is None:
+            self.record_failure(result.registry, result.error, now)
+            return
+        now = time.time() if now is None else now
+        entry = self._entry(result.registry)
+        missing = {k: v for k, v in entry.get("missing", {}).items() if now - v <= DOCKER_MIRROR_CACHE_TTL}
+        if image:
+            missing.pop(image, None)
+            if result.manifest is False:
+                missing[image] = now
+        entry["missing"] = missing
+        entry["latencies"] = (entry.get("latencies", []) + [round(result.latency, 4)])[-DOCKER_MIRROR_LATENCY_SAMPLES:]
+        entry["checked"] = now
+        entry["failures"] = 0
+        entry.pop("retry_after", None)
+
+    def record_failure(self, registry: str, error: Optional[str], now: Optional[float] = None) -> None:
+        """记录一次失败，按连续失败次数指数增加下次探测前的等待时间。"""
+        now = time.time() if now is None else now
+        entry = self._entry(registry)
+        entry["failures"] = entry.get("failures", 0) + 1
+        entry["last_failure"] = now
+        entry["last_error"] = str(error or "unreachable")[:200]
+        backoff = min(DOCKER_MIRROR_BACKOFF_BASE * 2 ** (entry["failures"] - 1), DOCKER_MIRROR_BACKOFF_MAX)
+        entry["retry_after"] = now + backoff
+
+    def invalidate(self, registry: str) -> None:
+        """使 registry 的缓存结果失效（例如从它拉取失败），下次使用前重新探测。
+
+        拉取失败可能只是该镜像不存在，因此不计入失败次数，由下次探测决定是否退避。
+        """
+        entry = self._entries.get(registry)
+        if entry:
+            entry["checked"] = 0
+
+    def save(self) -> None:
+        """以临时文件加重命名的方式原子地写入缓存文件，并发运行的命令不会读到写了一半的文件。"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".registry_health.", suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"registries": self._entries}, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def rank_registries(repo: str, reference: str, registries: Optional[List[str]] = None,
+                    timeout: float = DOCKER_MIRROR_PROBE_TIMEOUT,
+                    deadline: float = DOCKER_MIRROR_PROBE_DEADLINE,
+                    cache: Optional[RegistryHealthCache] = None) -> List[ProbeResult]:
+    """并发探测官方 registry 和所有镜像源，按可用性和延迟排序。
+
+    缓存中仍然有效的 registry 直接使用缓存结果（不确认 manifest，拉取失败时沿排序回退即可），
+    处于失败退避中的跳过，其余的并发探测后把结果写回缓存。
+
+    Args:
+        repo (str): 仓库名，Docker Hub 官方镜像需带 library/ 前缀。
+        reference (str): 标签或摘要。
+        registries (list[str], optional): 要探测的 registry，默认为官方 registry 加上配置的镜像源。
+        timeout (float): 单个请求的超时时间（秒）。
+        deadline (float): 整体等待时间（秒），届时仍未完成的 registry 视为不可达。
+        cache (RegistryHealthCache, optional): 健康状态缓存，None 表示不使用缓存、全部探测。
+
+    Returns:
+        list[ProbeResult]: 所有 registry 的结果，可用的在前、按延迟从低到高排列。
+    """
+    if registries is None:
+        registries = [DOCKER_OFFICIAL_REGISTRY] + list(DOCKER_MIRRORS)
+    results = [ProbeResult(registry) for registry in registries]
+    image = f"{repo}:{reference}"
+    pending = []
+    for index, registry in enumerate(registries):
+        cached = cache.lookup(registry, image) if cache is not None else None
+        if cached is not None:
+            results[index] = cached
+        else:
+            pending.append(index)
+
+    def worker(index: int) -> None:
+        results[index] = probe_registry(registries[index], repo, reference, timeout)
+
+    # 使用守护线程，超过整体等待时间的探测直接放弃，不阻塞拉取
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in pending]
+    for thread in threads:
+        thread.start()
+    end = time.monotonic() + deadline
+    for thread in threads:
+        thread.join(max(end - time.monotonic(), 0))
+    for thread, index in zip(threads, pending):
+        result = results[index]
+        if thread.is_alive() and result.latency is None and result.error is None:
+            result.error = "timeout"
+        if cache is not None:
+            cache.record(result, image)
+    if cache is not None and pending:
+        cache.save()
+    return sorted(results, key=ProbeResult.sort_key)
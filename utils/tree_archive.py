@@ -0,0 +1,297 @@
+"""
+将主机目录快速写入 tar 归档流。
+
+用于数据目录和 Linux 上可直接访问挂载点的 Docker 卷，替代 tarfile.add 的逐文件处理：
+- 使用 os.scandir 遍历，目录项自带的类型信息省去多余的 stat，属主名称查询带缓存；
+- 以较大的缓冲区复制文件内容，并且不为每个文件写入浮点 mtime 的 PAX 扩展头；
+- 稀疏文件（如 Postgres 的数据段）通过 SEEK_DATA/SEEK_HOLE 只读取数据段，
+  以 GNU tar 的 PAX 1.0 稀疏格式写入，归档中不包含空洞的零字节，恢复时重建空洞；
+- 多个硬链接指向同一文件时只写入一次内容，其余写为硬链接条目。
+"""
+import functools
+import hashlib
+import os
+import stat
+import tarfile
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import grp
+    import pwd
+except ImportError:
+    grp = None
+    pwd = None
+
+# 读取文件内容时使用的缓冲区大小
+COPY_BUFSIZE = 1024 * 1024
+
+# 稀疏格式条目名称中的目录标记（与 GNU tar 的 %d/GNUSparseFile.%p/%f 一致，%p 取 0）
+_SPARSE_DIR = "GNUSparseFile.0"
+
+_ZERO_BLOCK = bytes(COPY_BUFSIZE)
+
+
+@functools.lru_cache(maxsize=None)
+def _uname(uid: int) -> str:
+    try:
+        return pwd.getpwuid(uid).pw_name if pwd else ""
+    except KeyError:
+        return ""
+
+
+@functools.lru_cache(maxsize=None)
+def _gname(gid: int) -> str:
+    try:
+        return grp.getgrgid(gid).gr_name if grp else ""
+    except KeyError:
+        return ""
+
+
+def walk_tree(source: str, arcname: str,
+              is_excluded: Optional[Callable[[str], bool]] = None,
+              on_excluded: Optional[Callable[[str], None]] = None) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """以 os.scandir 遍历目录，按名称排序先序输出每个条目（包括源目录本身）。
+
+    指向目录的符号链接不会被跟随。被排除的目录不会进入，只对其本身调用一次 on_excluded。
+
+    Args:
+        source (str): 源目录路径。
+        arcname (str): 源目录在归档中的名称。
+        is_excluded (Callable[[str], bool], optional): 判断归档路径是否被排除的函数。
+        on_excluded (Callable[[str], None], optional): 条目被排除时的回调。
+
+    Yields:
+        tuple: (主机路径, 归档路径, lstat 结果)。
+    """
+    arcname = arcname.replace(os.sep, "/")
+    yield source, arcname, os.lstat(source)
+    stack = [(source, arcname)]
+    while stack:
+        dir_path, dir_arc = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            arc_path = f"{dir_arc}/{entry.name}"
+            if is_excluded and is_excluded(arc_path):
+                if on_excluded:
+                    on_excluded(arc_path)
+                continue
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            yield entry.path, arc_path, st
+            if stat.S_ISDIR(st.st_mode):
+                subdirs.append((entry.path, arc_path))
+        # 逆序压栈，保证子目录按名称顺序出栈
+        stack.extend(reversed(subdirs))
+
+
+def _make_tarinfo(path: str, arcname: str, st: os.stat_result) -> Optional[tarfile.TarInfo]:
+    """根据 lstat 结果构造 TarInfo，不支持的文件类型（如套接字）返回 None。"""
+    info = tarfile.TarInfo(arcname)
+    mode = st.st_mode
+    if stat.S_ISREG(mode):
+        info.type = tarfile.REGTYPE
+        info.size = st.st_size
+    elif stat.S_ISDIR(mode):
+        info.type = tarfile.DIRTYPE
+    elif stat.S_ISLNK(mode):
+        info.type = tarfile.SYMTYPE
+        info.linkname = os.readlink(path)
+    elif stat.S_ISFIFO(mode):
+        info.type = tarfile.FIFOTYPE
+    elif stat.S_ISCHR(mode) or stat.S_ISBLK(mode):
+        info.type = tarfile.CHRTYPE if stat.S_ISCHR(mode) else tarfile.BLKTYPE
+        info.devmajor = os.major(st.st_rdev)
+        info.devminor = os.minor(st.st_rdev)
+    else:
+        return None
+    info.mode = stat.S_IMODE(mode)
+    info.uid = st.st_uid
+    info.gid = st.st_gid
+    info.uname = _uname(st.st_uid)
+    info.gname = _gname(st.st_gid)
+    # 整数 mtime 不需要额外的 PAX 扩展头
+    info.mtime = int(st.st_mtime)
+    return info
+
+
+def _is_sparse(st: os.stat_result) -> bool:
+    """根据实际占用的块数判断文件是否含有空洞。"""
+    return hasattr(os, "SEEK_DATA") and hasattr(st, "st_blocks") and st.st_blocks * 512 < st.st_size
+
+
+def _data_segments(fd: int, size: int) -> List[Tuple[int, int]]:
+    """用 SEEK_DATA/SEEK_HOLE 列出文件中的数据段 [(偏移, 长度), ...]。"""
+    segments = []
+    offset = 0
+    while offset < size:
+        try:
+            start = os.lseek(fd, offset, os.SEEK_DATA)
+        except OSError:
+            # ENXIO：offset 之后只剩空洞
+            break
+        end = min(os.lseek(fd, start, os.SEEK_HOLE), size)
+        if end > start:
+            segments.append((start, end - start))
+        offset = end
+    if not segments or sum(segments[-1]) < size:
+        # 以空洞结尾时追加一个长度为 0 的数据段标记文件末尾（与 GNU tar 相同），解压时据此补齐文件长度
+        segments.append((size, 0))
+    return segments
+
+
+class _SparseReader:
+    """按 GNU PAX 1.0 稀疏格式输出条目数据：十进制的数据段映射（补齐到 512 字节）后接各数据段内容。
+
+    同时按文件的逻辑内容（空洞视为零字节）计算 SHA-256，与恢复后读取到的内容一致。
+    """
+
+    def __init__(self, fileobj, segments: List[Tuple[int, int]], size: int):
+        self._fileobj = fileobj
+        self._segments = segments
+        self._size = size
+        self._hash = hashlib.sha256()
+        self._logical_pos = 0
+        lines = [str(len(segments))] + [str(n) for segment in segments for n in segment]
+        header = ("\n".join(lines) + "\n").encode("ascii")
+        self._header = header + b"\0" * (-len(header) % tarfile.BLOCKSIZE)
+        self._chunks = self._iter_chunks()
+        self._buffer = bytearray()
+        self.data_size = len(self._header) + sum(length for _offset, length in segments)
+
+    def _hash_zeros(self, count: int) -> None:
+        while count > 0:
+            n = min(count, len(_ZERO_BLOCK))
+            self._hash.update(memoryview(_ZERO_BLOCK)[:n])
+            count -= n
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        yield self._header
+        for offset, length in self._segments:
+            self._hash_zeros(offset - self._logical_pos)
+            self._fileobj.seek(offset)
+            remaining = length
+            while remaining:
+                data = self._fileobj.read(min(remaining, COPY_BUFSIZE))
+                if not data:
+                    raise OSError("file shrank while being archived")
+                remaining -= len(data)
+                self._hash.update(data)
+                yield data
+            self._logical_pos = offset + length
+
+    def read(self, size: int = -1) -> bytes:
+        # tarfile 要求每次读取都返回请求的完整长度（末尾除外）
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def hexdigest(self) -> str:
+        # 让生成器走完，更新最后一个数据段之后的位置
+        for _chunk in self._chunks:
+            pass
+        self._hash_zeros(self._size - self._logical_pos)
+        self._logical_pos = self._size
+        return self._hash.hexdigest()
+
+
+def _add_sparse_file(tar: tarfile.TarFile, info: tarfile.TarInfo, fileobj,
+                     segments: List[Tuple[int, int]]) -> None:
+    """以 PAX 1.0 稀疏格式写入一个文件条目。"""
+    reader = _SparseReader(fileobj, segments, info.size)
+    real_name = info.name
+    parent, _sep, base = real_name.rpartition("/")
+    info.name = f"{parent}/{_SPARSE_DIR}/{base}" if parent else f"{_SPARSE_DIR}/{base}"
+    # path 必须排在 GNU.sparse.name 之前：读取时按顺序应用，后者才是真实路径
+    info.pax_headers = {
+        "path": info.name,
+        "GNU.sparse.major": "1",
+        "GNU.sparse.minor": "0",
+        "GNU.sparse.name": real_name,
+        "GNU.sparse.realsize": str(info.size),
+    }
+    info.size = reader.data_size
+    tar.addfile(info, reader)
+    checksums = getattr(tar, "checksums", None)
+    if checksums is not None:
+        # 校验和按文件的逻辑内容记录在真实路径下
+        checksums.pop(info.name, None)
+        checksums[real_name] = reader.hexdigest()
+    info.name = real_name
+
+
+def add_tree_to_archive(tar: tarfile.TarFile, source: str, arcname: str,
+                        is_excluded: Optional[Callable[[str], bool]] = None,
+                        on_excluded: Optional[Callable[[str], None]] = None,
+                        on_unreadable: Optional[Callable[[str, OSError], None]] = None) -> Dict[str, int]:
+    """将主机目录写入 tar 归档流。
+
+    Args:
+        tar (tarfile.TarFile): 以写模式打开的归档（可为流模式）。
+        source (str): 源目录路径。
+        arcname (str): 源目录在归档中的名称。
+        is_excluded (Callable[[str], bool], optional): 判断归档路径是否被排除的函数。
+        on_excluded (Callable[[str], None], optional): 条目被排除时的回调。
+        on_unreadable (Callable[[str, OSError], None], optional): 文件无法打开而未写入归档时的回调。
+
+    Returns:
+        dict: 统计信息，包含 entries、bytes（文件逻辑大小之和）、sparse、hardlinks、skipped。
+    """
+    stats = {"entries": 0, "bytes": 0, "sparse": 0, "hardlinks": 0, "skipped": 0}
+    links: Dict[Tuple[int, int], str] = {}
+    if getattr(tar, "copybufsize", None) is None or tar.copybufsize < COPY_BUFSIZE:
+        tar.copybufsize = COPY_BUFSIZE
+
+    for path, arc_path, st in walk_tree(source, arcname, is_excluded, on_excluded):
+        info = _make_tarinfo(path, arc_path, st)
+        if info is None:
+            continue
+        key = (st.st_dev, st.st_ino) if info.isreg() and st.st_nlink > 1 else None
+        if key is not None:
+            if key in links:
+                info.type = tarfile.LNKTYPE
+                info.linkname = links[key]
+                info.size = 0
+                tar.addfile(info)
+                stats["entries"] += 1
+                stats["hardlinks"] += 1
+                continue
+
+        if not info.isreg():
+            tar.addfile(info)
+            stats["entries"] += 1
+            continue
+
+        try:
+            f = open(path, "rb", buffering=0)
+        except OSError as e:
+            # 文件在遍历后被删除或无权限读取：不写入归档，也不作为后续硬链接的目标
+            stats["skipped"] += 1
+            if on_unreadable:
+                on_unreadable(arc_path, e)
+            continue
+        with f:
+            segments = _data_segments(f.fileno(), info.size) if _is_sparse(st) else None
+            if segments is not None:
+                _add_sparse_file(tar, info, f, segments)
+                stats["sparse"] += 1
+            else:
+                tar.addfile(info, f)
+        if key is not None:
+            links[key] = arc_path
+        stats["entries"] += 1
+        stats["bytes"] += st.st_size
+    return stats
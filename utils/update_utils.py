@@ -4,12 +4,100 @@
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from .helpers import run_sudo_command
 from utils.i18n import get_message as _
 from .docker_helpers import (
-    docker_pull_image
+    pull_compose_images, get_compose_service_images, get_compose_container_images,
+    get_local_image, get_remote_image_digest
 )
+from conf.install_settings import SANDBOX_IMAGE, DOCKER_PULL_WORKERS
+
+def plan_image_updates(docker_compose_cmd, services=None, extra_images=None):
+    """比较本地镜像与 registry 上的 manifest 摘要，找出真正需要更新的服务和镜像。
+
+    远程摘要经镜像源查询（与拉取时的镜像源排序相同），本地摘要取自镜像的 RepoDigests
+    （从镜像源拉取并重新标记的镜像使用拉取时记录的摘要）。
+    无法查询远程摘要或本地没有镜像时视为需要拉取；镜像没有变化但容器仍在使用旧镜像时只重新创建容器。
+
+    参数:
+        docker_compose_cmd (str): docker compose 命令。
+        services (list[str], optional): 只检查这些服务，默认为全部服务。
+        extra_images (list[str], optional): 不属于 compose 服务、只需拉取的镜像（如沙盒镜像）。
+
+    返回:
+        tuple | None: (需要拉取的服务, 需要重新创建的服务, 需要拉取的额外镜像)，
+            无法解析 compose 文件时返回 None。
+    """
+    service_images = get_compose_service_images(docker_compose_cmd, ".env", services)
+    if service_images is None:
+        return None
+    print(_("checking_image_updates"))
+    images = list(dict.fromkeys(list(service_images.values()) + list(extra_images or [])))
+    with ThreadPoolExecutor(max_workers=max(1, min(DOCKER_PULL_WORKERS, len(images)))) as pool:
+        remote_digests = dict(zip(images, pool.map(get_remote_image_digest, images)))
+    local_images = {image: get_local_image(image) for image in images}
+    container_images = get_compose_container_images(docker_compose_cmd, ".env") or {}
+
+    def needs_pull(image):
+        local = local_images[image]
+        if local is None:
+            print(f"  - {_('update_status_missing', image)}")
+            return True
+        remote = remote_digests[image]
+        if remote is None:
+            print(f"  - {_('update_status_unknown', image)}")
+            return True
+        if remote not in {d.split("@", 1)[-1] for d in local["RepoDigests"]}:
+            print(f"  - {_('update_status_changed', image)}")
+            return True
+        return False
+
+    pull_images = {image for image in images if needs_pull(image)}
+    pull_services, up_services = [], []
+    for service, image in service_images.items():
+        if image in pull_images:
+            pull_services.append(service)
+            up_services.append(service)
+        elif container_images.get(service) != local_images[image]["Id"]:
+            print(f"  - {_('update_status_container_outdated', service, image)}")
+            up_services.append(service)
+        else:
+            print(f"  - {_('update_status_current', service, image)}")
+    pull_extras = [image for image in (extra_images or []) if image in pull_images]
+    for image in extra_images or []:
+        if image not in pull_images:
+            print(f"  - {_('update_status_image_current', image)}")
+    return pull_services, up_services, pull_extras
+
+def _update_services(docker_compose_cmd, description, up_description, services=None, extra_images=None):
+    """只拉取有新版本的镜像，之后总是执行 up -d，使 .env、compose 文件的修改、
+    已停止的服务和需要构建的服务同样得到更新（未变化的容器由 compose 自行保留）。
+
+    参数:
+        docker_compose_cmd (str): docker compose 命令。
+        description (str): 拉取 compose 镜像的操作描述。
+        up_description (str): 重新创建服务的操作描述。
+        services (list[str], optional): 要更新的服务，默认为全部服务。
+        extra_images (dict, optional): 额外镜像地址到操作描述的映射。
+    """
+    extra_images = extra_images or {}
+    plan = plan_image_updates(docker_compose_cmd, services, list(extra_images))
+    if plan is None:
+        # 无法解析 compose 文件，按原来的方式全部拉取
+        pull_compose_images(docker_compose_cmd, ".env", description, services=services, extra_images=extra_images)
+    else:
+        pull_services, up_services, pull_extras = plan
+        if not (pull_services or up_services or pull_extras):
+            print(_("update_already_up_to_date"))
+        else:
+            print(_("update_services_changed", ", ".join(up_services + pull_extras)))
+        if pull_services or pull_extras:
+            pull_compose_images(docker_compose_cmd, ".env", description, services=pull_services,
+                                extra_images={image: extra_images[image] for image in pull_extras})
+    run_sudo_command(f"{docker_compose_cmd} --env-file .env up --build -d {' '.join(services or [])}".rstrip(),
+                     up_description)
 
 def update_nekro_agent_only(docker_compose_cmd, nekro_data_dir):
     """仅更新 Nekro Agent 和沙盒镜像 (推荐)"""
@@ -22,14 +110,9 @@ def update_nekro_agent_only(docker_compose_cmd, nekro_data_dir):
         print(_("error_env_file_not_exist"), file=sys.stderr)
         sys.exit(1)
 
-    run_sudo_command("docker pull kromiose/nekro-agent-sandbox",
-                     _("pulling_latest_sandbox"))
-
-    run_sudo_command(f"{docker_compose_cmd} --env-file .env pull nekro_agent",
-                     _("pulling_latest_nekro_agent"))
-
-    run_sudo_command(f"{docker_compose_cmd} --env-file .env up --build -d nekro_agent",
-                     _("rebuilding_nekro_agent"))
+    # 沙盒镜像和 Nekro Agent 镜像有新版本时并发拉取
+    _update_services(docker_compose_cmd, _("pulling_latest_nekro_agent"), _("rebuilding_nekro_agent"),
+                     services=["nekro_agent"], extra_images={SANDBOX_IMAGE: _("pulling_latest_sandbox")})
 
 def update_all_services(docker_compose_cmd, nekro_data_dir):
     """更新所有镜像并重启容器"""
@@ -42,11 +125,7 @@ def update_all_services(docker_compose_cmd, nekro_data_dir):
         print(_("error_env_file_not_exist"), file=sys.stderr)
         sys.exit(1)
 
-    run_sudo_command(f"{docker_compose_cmd} --env-file .env pull",
-                     _("pulling_all_services"))
-
-    run_sudo_command(f"{docker_compose_cmd} --env-file .env up --build -d",
-                     _("restarting_all_services"))
+    _update_services(docker_compose_cmd, _("pulling_all_services"), _("restarting_all_services"))
 
 
 def get_current_image_channel(docker_compose_path):